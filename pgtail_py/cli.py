@@ -30,7 +30,7 @@ from pgtail_py.cli_core import (
 )
 from pgtail_py.cli_errors import errors_command
 from pgtail_py.cli_export import export_command, pipe_command
-from pgtail_py.cli_filter import filter_command, highlight_command, levels_command
+from pgtail_py.cli_filter import filter_command, highlight_command, levels_command, where_command
 from pgtail_py.cli_notify import notify_command
 from pgtail_py.cli_slow import slow_command, stats_command
 from pgtail_py.cli_theme import theme_command
@@ -54,6 +54,8 @@ from pgtail_py.display import DisplayState, OutputFormat, format_entry
 from pgtail_py.error_stats import ErrorStats
 from pgtail_py.field_filter import FieldFilterState
 from pgtail_py.filter import LogLevel
+from pgtail_py.filter_expression import CompiledFilter
+from pgtail_py.highlighter_registry import get_registry
 from pgtail_py.highlighting_config import (
     HighlightingConfig,
     load_highlighting_config,
@@ -61,7 +63,7 @@ from pgtail_py.highlighting_config import (
 from pgtail_py.instance import Instance
 from pgtail_py.notifier import create_notifier
 from pgtail_py.notify import NotificationConfig, NotificationManager, NotificationRule, QuietHours
-from pgtail_py.regex_filter import FilterState
+from pgtail_py.regex_filter import FilterState, set_match_budget
 from pgtail_py.repl_toolbar import create_toolbar_func
 from pgtail_py.slow_query import DurationStats, SlowQueryConfig, extract_duration
 from pgtail_py.tailer import LogTailer
@@ -82,6 +84,7 @@ class AppState:
         regex_state: Regex pattern filter state
         field_filter: Field-based filter state for structured logs
         time_filter: Time-based filter state
+        filter_expression: Compiled ``where`` expression, or None
         slow_query_config: Configuration for slow query highlighting
         duration_stats: Session-scoped query duration statistics
         error_stats: Session-scoped error statistics
@@ -103,6 +106,7 @@ class AppState:
     regex_state: FilterState = field(default_factory=FilterState.empty)
     field_filter: FieldFilterState = field(default_factory=FieldFilterState)
     time_filter: TimeFilter = field(default_factory=TimeFilter.empty)
+    filter_expression: CompiledFilter | None = None
     slow_query_config: SlowQueryConfig = field(default_factory=SlowQueryConfig)
     duration_stats: DurationStats = field(default_factory=DurationStats)
     error_stats: ErrorStats = field(default_factory=ErrorStats)
@@ -146,6 +150,12 @@ class AppState:
             critical_ms=self.config.slow.critical,
         )
 
+        # Apply filter.match_budget_ms
+        set_match_budget(self.config.filter.match_budget_ms)
+
+        # Apply highlighting.time_budget_ms
+        get_registry().profile.set_budget(self.config.highlighting.time_budget_ms)
+
         # Apply theme from config (fallback to dark if saved theme is unavailable)
         if self.config.theme.name and not self.theme_manager.switch_theme(self.config.theme.name):
             self.theme_manager.switch_theme("dark")
@@ -266,6 +276,9 @@ def handle_command(state: AppState, line: str) -> bool:
         levels_command(state, args)
     elif cmd == "filter":
         filter_command(state, args)
+    elif cmd == "where":
+        # Pass the raw expression: shlex would strip regex backslashes
+        where_command(state, line.strip()[len(parts[0]) :].strip())
     elif cmd == "highlight":
         highlight_command(state, args)
     elif cmd == "slow":
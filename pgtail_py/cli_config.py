@@ -16,6 +16,7 @@ from pgtail_py.config import (
     get_config_path,
     get_default_value,
     load_config,
+    parse_memory_size,
     parse_value,
     reset_config,
     save_config,
@@ -231,6 +232,18 @@ def apply_setting(state: AppState, key: str) -> None:
             slow_ms=state.config.slow.error,
             critical_ms=state.config.slow.critical,
         )
+    elif key == "buffer.max_memory":
+        # Takes effect on the running tailer's store; tail mode reads it at start
+        if state.tailer:
+            state.tailer.store.max_bytes = parse_memory_size(state.config.buffer.max_memory)
+    elif key == "filter.match_budget_ms":
+        from pgtail_py.regex_filter import set_match_budget
+
+        set_match_budget(state.config.filter.match_budget_ms)
+    elif key == "highlighting.time_budget_ms":
+        from pgtail_py.highlighter_registry import get_registry
+
+        get_registry().profile.set_budget(state.config.highlighting.time_budget_ms)
     elif key.startswith("highlighting.duration."):
         # Update highlighting config duration thresholds
         from pgtail_py.tail_rich import reset_highlighter_chain
@@ -302,6 +315,10 @@ def config_command(state: AppState, args: list[str]) -> None:
     print(f'timestamp_format = "{state.config.display.timestamp_format}"')
     print(f"show_pid = {str(state.config.display.show_pid).lower()}")
     print(f"show_level = {str(state.config.display.show_level).lower()}")
+    print(f"frame_rate = {state.config.display.frame_rate}")
+    print(f"adaptive_highlighting = {str(state.config.display.adaptive_highlighting).lower()}")
+    print(f"rehighlight = {str(state.config.display.rehighlight).lower()}")
+    print(f"background_highlighting = {str(state.config.display.background_highlighting).lower()}")
     print()
 
     print("[theme]")
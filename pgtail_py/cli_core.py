@@ -448,6 +448,7 @@ def tail_stream_mode(state: AppState, instance: Instance) -> None:
         state.time_filter if state.time_filter.is_active() else None,
         state.field_filter if state.field_filter.is_active() else None,
         on_entry=on_entry_callback,
+        filter_expression=state.filter_expression,
         data_dir=instance.data_dir,
         log_directory=instance.log_directory,
         on_file_change=on_file_change,
@@ -559,6 +560,7 @@ def tail_file_stream_mode(state: AppState, log_path: Path) -> None:
         state.time_filter if state.time_filter.is_active() else None,
         state.field_filter if state.field_filter.is_active() else None,
         on_entry=on_entry_callback,
+        filter_expression=state.filter_expression,
         data_dir=file_instance.data_dir,
         log_directory=file_instance.log_directory,
     )
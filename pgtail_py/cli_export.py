@@ -113,6 +113,7 @@ def export_command(state: AppState, args: list[str]) -> None:
         state.active_levels,
         state.regex_state,
         since,
+        expression=state.filter_expression,
     )
 
     # Export to file
@@ -226,6 +227,7 @@ def pipe_command(state: AppState, args: list[str]) -> None:
         state.tailer.get_buffer(),
         state.active_levels,
         state.regex_state,
+        expression=state.filter_expression,
     )
 
     # Pipe to command
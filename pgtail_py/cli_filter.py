@@ -9,6 +9,7 @@ from prompt_toolkit import print_formatted_text
 
 from pgtail_py.cli_highlight import (
     format_highlight_list,
+    format_highlight_stats,
     handle_highlight_add,
     handle_highlight_disable,
     handle_highlight_enable,
@@ -19,6 +20,7 @@ from pgtail_py.cli_highlight import (
     handle_highlight_preview,
     handle_highlight_remove,
     handle_highlight_reset,
+    handle_highlight_stats,
 )
 from pgtail_py.cli_utils import warn
 from pgtail_py.colors import get_style
@@ -28,11 +30,14 @@ from pgtail_py.field_filter import (
     resolve_field_name,
 )
 from pgtail_py.filter import LogLevel, parse_levels
+from pgtail_py.filter_expression import CompiledFilter, FilterExpressionError
+from pgtail_py.filter_plan import format_filter_stats
 from pgtail_py.format_detector import LogFormat
 from pgtail_py.regex_filter import (
     FilterType,
     Highlight,
     RegexFilter,
+    has_nested_quantifier,
     parse_filter_arg,
 )
 from pgtail_py.tail_rich import reset_highlighter_chain
@@ -180,6 +185,7 @@ def filter_command(state: AppState, args: list[str]) -> None:
         print("       filter /pattern/c      Case-sensitive match")
         print("       filter field=value     Filter by field (CSV/JSON only)")
         print("       filter clear           Clear all filters")
+        print("       filter stats           Show per-filter hit rates")
         print()
         print(f"Available fields: {', '.join(get_available_field_names())}")
         return
@@ -195,6 +201,15 @@ def filter_command(state: AppState, args: list[str]) -> None:
         print("All filters cleared")
         return
 
+    # Handle 'stats' subcommand
+    if arg.lower() == "stats":
+        if not state.tailer:
+            print("No log file loaded. Use 'tail <instance>' first.")
+            return
+        for line in format_filter_stats(state.tailer.filter_plan, state.regex_state):
+            print(line)
+        return
+
     # Check if this is a field filter (field=value syntax)
     if _is_field_filter_arg(arg):
         handle_filter_field(state, arg)
@@ -232,6 +247,12 @@ def filter_command(state: AppState, args: list[str]) -> None:
         print(f"Invalid regex pattern: {e}")
         return
 
+    if has_nested_quantifier(regex_filter.pattern):
+        warn(
+            "pattern has nested quantifiers and may backtrack catastrophically "
+            "(use a++ or (?>...) to prevent it, or set filter.match_budget_ms)"
+        )
+
     # Apply the filter
     if filter_type == FilterType.INCLUDE and arg.startswith("/"):
         # Plain /pattern/ sets single include filter (replaces previous includes)
@@ -250,6 +271,51 @@ def filter_command(state: AppState, args: list[str]) -> None:
         state.tailer.update_regex_state(state.regex_state)
 
 
+def where_command(state: AppState, expression: str) -> None:
+    """Handle the 'where' command - set or display a filter expression.
+
+    The expression is combined (AND) with the level, regex, field and time
+    filters and also applies to export and pipe.
+
+    Args:
+        state: Current application state.
+        expression: Raw expression text after 'where', or empty to show current.
+    """
+    if not expression:
+        if state.filter_expression is None:
+            print("No filter expression active")
+        else:
+            print(f"Filter expression: {state.filter_expression.source}")
+        print()
+        print("Usage: where <expression>   Filter by a combined expression")
+        print("       where clear          Remove the filter expression")
+        print()
+        print("Example: where level>=ERROR and db in (orders, billing)")
+        print("               and duration>500ms and message ~ /timeout/")
+        return
+
+    if expression.lower() == "clear":
+        state.filter_expression = None
+        if state.tailer:
+            state.tailer.update_filter_expression(None)
+        print("Filter expression cleared")
+        return
+
+    try:
+        compiled = CompiledFilter.parse(expression)
+    except FilterExpressionError as e:
+        print(f"Invalid expression: {e}")
+        return
+
+    state.filter_expression = compiled
+
+    # Update tailer if currently tailing
+    if state.tailer:
+        state.tailer.update_filter_expression(compiled)
+
+    print(f"Filter expression set: {compiled.source}")
+
+
 def highlight_command(state: AppState, args: list[str]) -> None:
     """Handle the 'highlight' command - semantic highlighters and regex patterns.
 
@@ -260,6 +326,8 @@ def highlight_command(state: AppState, args: list[str]) -> None:
         add <name> <pattern> [--style <style>] [--priority <num>]
                           Add a custom regex highlighter
         remove <name>     Remove a custom highlighter
+        stats [on|off|reset]
+                          Show or control per-highlighter timings
         /pattern/         Add regex highlight pattern (legacy)
         clear             Clear regex highlight patterns (legacy)
 
@@ -382,6 +450,15 @@ def highlight_command(state: AppState, args: list[str]) -> None:
         print(message)
         return
 
+    # Handle 'stats' subcommand - per-highlighter timings
+    if arg == "stats":
+        if len(args) < 2:
+            print_formatted_text(format_highlight_stats(), style=get_style(state.theme_manager))
+            return
+        success, message = handle_highlight_stats(args[1:])
+        print(message)
+        return
+
     # Legacy: Parse regex pattern
     original_arg = args[0]  # Use original case for pattern
     if not original_arg.startswith("/"):
@@ -398,6 +475,7 @@ def highlight_command(state: AppState, args: list[str]) -> None:
         print("       highlight import <path>    Import config from TOML")
         print("       highlight preview          Preview with sample lines")
         print("       highlight reset            Reset all settings to defaults")
+        print("       highlight stats [on|off|reset]  Per-highlighter timings")
         print("       highlight /pattern/        Add regex highlight (legacy)")
         print("       highlight clear            Clear regex highlights (legacy)")
         return
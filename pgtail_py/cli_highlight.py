@@ -1,7 +1,7 @@
 """Highlight CLI command handlers.
 
 Provides commands for managing semantic highlighting:
-- highlight list: Show all highlighters with status
+- highlight list: Show all highlighters with status and match cache counters
 - highlight enable <name>: Enable a specific highlighter
 - highlight disable <name>: Disable a specific highlighter
 - highlight add <name> <pattern>: Add a custom regex highlighter
@@ -10,6 +10,7 @@ Provides commands for managing semantic highlighting:
 - highlight import <path>: Import config from TOML file
 - highlight preview: Preview highlighting with sample log lines
 - highlight reset: Reset all settings to defaults
+- highlight stats [on|off|reset]: Show or control per-highlighter timings
 """
 
 from __future__ import annotations
@@ -32,6 +33,7 @@ from pgtail_py.highlighting_config import (
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from pgtail_py.highlighter import HighlighterProfile
     from pgtail_py.highlighting_config import HighlightingConfig
     from pgtail_py.theme import Theme
 
@@ -151,6 +153,22 @@ HIGHLIGHTER_METADATA: dict[str, tuple[str, str]] = {
 # =============================================================================
 
 
+def format_cache_stats() -> str:
+    """Describe the shared match cache and its template hit rate.
+
+    Returns:
+        One line such as "Match cache: 812/4,096 entries, 9,120 template
+        hits, 480 misses (95.0% hit rate)".
+    """
+    layers = get_registry().span_layers
+    lookups = layers.hits + layers.misses
+    rate = f" ({layers.hits / lookups:.1%} hit rate)" if lookups else ""
+    return (
+        f"Match cache: {len(layers):,}/{layers.capacity:,} entries, "
+        f"{layers.hits:,} template hits, {layers.misses:,} misses{rate}"
+    )
+
+
 def format_highlight_list(config: HighlightingConfig) -> FormattedText:
     """Format the list of all highlighters with their status.
 
@@ -229,6 +247,8 @@ def format_highlight_list(config: HighlightingConfig) -> FormattedText:
             result.append(("class:dim", f" Pattern: {custom.pattern}\n"))
         result.append(("", "\n"))
 
+    result.append(("class:dim", f"{format_cache_stats()}\n"))
+
     return FormattedText(result)
 
 
@@ -315,9 +335,134 @@ def format_highlight_list_rich(config: HighlightingConfig) -> Text:
             result.append("\n")
         result.append("\n")
 
+    append_line(format_cache_stats(), style="dim")
+
     return result
 
 
+# =============================================================================
+# Highlight Stats Command
+# =============================================================================
+
+
+def _highlight_stats_lines(profile: HighlighterProfile) -> list[tuple[str, str]]:
+    """Lay out the per-highlighter profile as a table.
+
+    Args:
+        profile: Profile to describe.
+
+    Returns:
+        (kind, text) lines, where kind is "bold" for headings, "row" for a
+        highlighter, "over" for one disabled over budget, and "dim" for notes.
+    """
+    recording = "on" if profile.recording else "off"
+    budget = (
+        f"{profile.budget_ns / 1_000_000:g} ms per line"
+        if profile.budget_ns is not None
+        else "none"
+    )
+    lines = [("bold", f"Highlighter profile (recording {recording}, budget {budget})"), ("", "")]
+
+    if not profile.stats:
+        if profile.active:
+            lines.append(("dim", "No highlighter scans recorded yet."))
+        else:
+            lines.append(
+                ("dim", "No highlighter timings. Use 'highlight stats on' to start recording.")
+            )
+        return lines
+
+    lines.append(
+        (
+            "bold",
+            f"  {'Name':20} {'Scans':>9} {'Total ms':>10} {'µs/scan':>9} "
+            f"{'Matches':>9} {'Discarded':>9}",
+        )
+    )
+    ranked = sorted(profile.stats.items(), key=lambda item: item[1].ns, reverse=True)
+    for name, stats in ranked:
+        row = (
+            f"  {name:20} {stats.calls:>9,} {stats.ns / 1_000_000:>10,.1f} "
+            f"{stats.mean_ns / 1_000:>9,.1f} {stats.matches:>9,} {stats.discarded:>9,}"
+        )
+        if name in profile.over_budget:
+            lines.append(("over", f"{row}  over budget, disabled"))
+        else:
+            lines.append(("row", row))
+
+    lines.append(("", ""))
+    if not profile.recording:
+        lines.append(("dim", "Matches and discards are only counted while recording."))
+    if profile.over_budget:
+        lines.append(("dim", "Use 'highlight stats reset' to re-enable disabled highlighters."))
+    lines.append(("dim", format_cache_stats()))
+    return lines
+
+
+def format_highlight_stats() -> FormattedText:
+    """Format per-highlighter timings for REPL mode.
+
+    Returns:
+        FormattedText table of scans, time and matches per highlighter.
+    """
+    styles = {"bold": "class:bold", "over": "class:error", "dim": "class:dim"}
+    profile = get_registry().profile
+    return FormattedText(
+        [(styles.get(kind, ""), f"{text}\n") for kind, text in _highlight_stats_lines(profile)]
+    )
+
+
+def format_highlight_stats_rich() -> Text:
+    """Format per-highlighter timings for Rich/Textual.
+
+    Returns:
+        Rich Text table of scans, time and matches per highlighter.
+    """
+    styles = {"bold": "bold", "over": "red", "dim": "dim"}
+    result = Text()
+    for kind, text in _highlight_stats_lines(get_registry().profile):
+        result.append(text, style=styles.get(kind))
+        result.append("\n")
+    return result
+
+
+def handle_highlight_stats(args: list[str]) -> tuple[bool, str]:
+    """Control per-highlighter profiling.
+
+    ``on`` and ``off`` start and stop recording. ``reset`` clears the
+    counters and re-enables highlighters disabled for exceeding
+    highlighting.time_budget_ms.
+
+    Args:
+        args: Arguments after 'highlight stats'.
+
+    Returns:
+        Tuple of (success, message).
+    """
+    profile = get_registry().profile
+    action = args[0].lower() if args else ""
+
+    if action == "on":
+        profile.recording = True
+        return True, "Highlighter profiling on. Use 'highlight stats' to see timings."
+
+    if action == "off":
+        profile.recording = False
+        return True, "Highlighter profiling off."
+
+    if action == "reset":
+        restored = sorted(profile.over_budget)
+        profile.clear()
+        if not restored:
+            return True, "Highlighter timings cleared."
+        from pgtail_py.tail_rich import reset_highlighter_chain
+
+        reset_highlighter_chain()
+        return True, f"Highlighter timings cleared; re-enabled {', '.join(restored)}."
+
+    return False, "Usage: highlight stats [on|off|reset]"
+
+
 # =============================================================================
 # Highlight Enable/Disable Commands
 # =============================================================================
@@ -496,6 +641,7 @@ def handle_highlight_add(
         Tuple of (success, message).
     """
     from pgtail_py.highlighter import validate_custom_pattern
+    from pgtail_py.regex_filter import has_nested_quantifier
 
     name, pattern, style, priority = parse_add_args(args)
 
@@ -511,6 +657,11 @@ def handle_highlight_add(
     pattern_valid, pattern_error = validate_custom_pattern(pattern)
     if not pattern_valid:
         return False, pattern_error or "Invalid pattern"
+    if has_nested_quantifier(pattern) and warn_func is not None:
+        warn_func(
+            "pattern has nested quantifiers and may backtrack catastrophically "
+            "(use a++ or (?>...) to prevent it)"
+        )
 
     # Use provided priority or default (1050 + count)
     final_priority = priority if priority is not None else 1050 + len(config.custom_highlighters)
@@ -722,6 +873,7 @@ def validate_imported_config(
         If valid, error_message is None.
     """
     from pgtail_py.highlighter import validate_custom_pattern
+    from pgtail_py.regex_filter import has_nested_quantifier
 
     warnings: list[str] = []
 
@@ -813,6 +965,11 @@ def validate_imported_config(
                     f"Custom highlighter '{name}' has invalid pattern: {pattern_error}",
                     warnings,
                 )
+            if has_nested_quantifier(pattern):
+                warnings.append(
+                    f"Custom highlighter '{name}' has nested quantifiers and may "
+                    "backtrack catastrophically (use a++ or (?>...) to prevent it)"
+                )
 
             # Check for conflict with built-in names
             if name in BUILTIN_HIGHLIGHTER_NAMES:
@@ -1722,9 +1879,14 @@ def handle_highlight_command(
     elif subcommand == "reset":
         return handle_highlight_reset(config)
 
+    elif subcommand == "stats":
+        if len(args) < 2:
+            return True, format_highlight_stats()
+        return handle_highlight_stats(args[1:])
+
     else:
         # Unknown subcommand
         return False, (
             f"Unknown subcommand '{subcommand}'. Available: "
-            "list, on, off, enable, disable, add, remove, export, import, preview, reset."
+            "list, on, off, enable, disable, add, remove, export, import, preview, reset, stats."
         )
@@ -38,6 +38,7 @@ TAIL_MODE_COMMANDS: list[str] = [
     # Filter commands (modify what's shown)
     "level",  # level error,warning
     "filter",  # filter /pattern/
+    "where",  # where level>=ERROR and duration>500ms
     "since",  # since 5m
     "until",  # until 14:30
     "between",  # between 14:00 14:30
@@ -112,6 +112,7 @@ def handle_highlight_command(
         disable <name>    Disable a highlighter
         add <name> <pattern> [--style <style>]  Add custom highlighter
         remove <name>     Remove custom highlighter
+        stats [on|off|reset]  Show or control per-highlighter timings
 
     Args:
         args: Command arguments (e.g., ['list'], ['enable', 'timestamp'])
@@ -268,8 +269,23 @@ def handle_highlight_command(
             log_widget.write_text_line(Text(message, style=color))
         return True
 
+    # Handle 'stats' subcommand
+    if subcommand == "stats":
+        from pgtail_py.cli_highlight import format_highlight_stats_rich, handle_highlight_stats
+
+        if len(args) < 2:
+            if log_widget is not None:
+                log_widget.write_text_lines(format_highlight_stats_rich().split("\n"))
+            return True
+
+        success, message = handle_highlight_stats(args[1:])
+        if log_widget is not None:
+            color = "green" if success else "red"
+            log_widget.write_text_line(Text(message, style=color))
+        return True
+
     # Unknown subcommand
-    msg = f"Unknown subcommand: {subcommand}. Use: list, on, off, enable, disable, add, remove, export, import, preview, reset"
+    msg = f"Unknown subcommand: {subcommand}. Use: list, on, off, enable, disable, add, remove, export, import, preview, reset, stats"
     if log_widget is not None:
         log_widget.write_text_line(Text(msg, style="red"))
     return True
@@ -1,7 +1,7 @@
 """Filter command handlers for tail mode.
 
-This module provides handlers for filter commands (level, filter, since,
-until, between, slow, clear) executed within the tail mode interface.
+This module provides handlers for filter commands (level, filter, where,
+since, until, between, slow, clear) executed within the tail mode interface.
 """
 
 from __future__ import annotations
@@ -98,6 +98,7 @@ def handle_filter_command(
     - /pattern/c    Case-sensitive match
     - field=value   Filter by field (CSV/JSON only)
     - clear         Clear all filters
+    - stats         Show per-filter hit rates
 
     Args:
         args: Pattern argument (e.g., ['/deadlock/'], ['-/noise/'], ['app=myapp'])
@@ -114,6 +115,7 @@ def handle_filter_command(
     from pgtail_py.regex_filter import (
         FilterType,
         RegexFilter,
+        has_nested_quantifier,
         parse_filter_arg,
     )
 
@@ -155,6 +157,15 @@ def handle_filter_command(
             log_widget.write_markup_line("[bold green]✓[/] All filters cleared")
         return True
 
+    # Handle 'stats' subcommand (read-only, no rebuild)
+    if arg.lower() == "stats":
+        if log_widget is not None:
+            from pgtail_py.filter_plan import format_filter_stats
+
+            for line in format_filter_stats(tailer.filter_plan, state.regex_state):
+                log_widget.write_line(line)
+        return True
+
     # Check if this is a field filter (field=value syntax)
     if _is_field_filter_arg(arg):
         # Warn about text format
@@ -240,6 +251,11 @@ def handle_filter_command(
 
         # Show confirmation in Textual mode
         if log_widget is not None:
+            if has_nested_quantifier(pattern):
+                log_widget.write_markup_line(
+                    "[yellow]Warning:[/] pattern has nested quantifiers and may backtrack "
+                    "catastrophically (use a++ or (?>...), or set filter.match_budget_ms)"
+                )
             type_str = {
                 FilterType.INCLUDE: "include",
                 FilterType.EXCLUDE: "exclude",
@@ -259,6 +275,64 @@ def handle_filter_command(
     return True
 
 
+def handle_where_command(
+    expression: str,
+    status: TailStatus,
+    state: AppState,
+    tailer: LogTailer,
+    log_widget: TailLog | None = None,
+) -> bool:
+    """Handle 'where' command for expression filtering.
+
+    Args:
+        expression: Raw expression text after 'where' (e.g., 'level>=ERROR and db=orders')
+        status: TailStatus instance
+        state: AppState instance
+        tailer: LogTailer instance
+        log_widget: TailLog widget or None
+
+    Returns:
+        True if command was handled
+    """
+    from rich.markup import escape
+
+    from pgtail_py.filter_expression import CompiledFilter, FilterExpressionError
+
+    if not expression:
+        if log_widget is not None:
+            if state.filter_expression is None:
+                log_widget.write_markup_line("[dim]No filter expression active[/]")
+            else:
+                log_widget.write_markup_line(
+                    f"[dim]where:[/] [cyan]{escape(state.filter_expression.source)}[/]"
+                )
+        return True
+
+    if expression.lower() == "clear":
+        state.filter_expression = None
+        tailer.update_filter_expression(None)
+        status.set_where_filter(None)
+        if log_widget is not None:
+            log_widget.write_markup_line("[bold green]✓[/] Filter expression cleared")
+        return True
+
+    try:
+        compiled = CompiledFilter.parse(expression)
+    except FilterExpressionError as e:
+        if log_widget is not None:
+            log_widget.write_markup_line(f"[bold red]✗[/] Invalid expression: {escape(str(e))}")
+        return True
+
+    state.filter_expression = compiled
+    tailer.update_filter_expression(compiled)
+    status.set_where_filter(compiled.source)
+    if log_widget is not None:
+        log_widget.write_markup_line(f"[bold green]✓[/] where [cyan]{escape(compiled.source)}[/]")
+
+    # Note: Textual mode rebuilds log in tail_command_handler after this returns
+    return True
+
+
 def handle_since_command(
     args: list[str],
     status: TailStatus,
@@ -467,17 +541,20 @@ def handle_clear_command(
     state.regex_state = FilterState.empty()
     state.time_filter = TimeFilter.empty()
     state.field_filter.clear()  # Also clear field filters
+    state.filter_expression = None
 
     # Update tailer
     tailer.update_levels(None)
     tailer.update_regex_state(None)
     tailer.update_time_filter(None)
     tailer.update_field_filter(state.field_filter)  # Also update field filter
+    tailer.update_filter_expression(None)
 
     # Update status
     status.set_level_filter(LogLevel.all_levels())
     status.set_regex_filter(None)
     status.set_time_filter(None)
+    status.set_where_filter(None)
     status.set_slow_threshold(None)
 
     # Textual mode: clear the log widget content
@@ -37,8 +37,40 @@ COMMAND_HELP: dict[str, dict[str, str | list[str]]] = {
             "filter /error/i     Match 'error' case-insensitively",
             "filter /user_\\d+/   Match 'user_' followed by digits",
             "filter clear        Remove regex filter",
+            "filter stats        Show per-filter hit rates and plan order",
         ],
     },
+    "where": {
+        "usage": "where <expression>",
+        "short": "Filter log entries by a combined expression",
+        "description": (
+            "Combine level, time, duration, field and regex conditions with and/or/not. "
+            "Applies on top of other filters and to export."
+        ),
+        "examples": [
+            "where level>=ERROR and duration>500ms",
+            "where db in (orders, billing) and message ~ /timeout/",
+            "where not user = postgres or code = 40P01",
+            "where time >= 14:30 and time < 15:00",
+            "where clear                Remove the filter expression",
+        ],
+        "aliases": "fields: level, time, duration, message, raw, db, user, app, pid, host, code",
+    },
+    "search": {
+        "usage": "/pattern[/c]",
+        "short": "Search the scrollback without filtering it",
+        "description": (
+            "Search the lines shown in the log. Jumps to the newest match; "
+            "n/N move between matches and the status bar shows the match count."
+        ),
+        "examples": [
+            "/timeout           Find lines containing 'timeout' (case-insensitive)",
+            "/Timeout/c         Case-sensitive search",
+            "/duration: \\d{4,}  Regex search (4+ digit durations)",
+            "/                  Clear the search",
+        ],
+        "see_also": "filter (hides non-matching lines)",
+    },
     "since": {
         "usage": "since <time>",
         "short": "Show entries from a specific time onward",
@@ -131,6 +163,9 @@ COMMAND_HELP: dict[str, dict[str, str | list[str]]] = {
             "highlight import /tmp/hl.toml   Import config from file",
             "highlight preview      Preview highlighting with sample log lines",
             "highlight reset        Reset all settings to defaults",
+            "highlight stats on     Start timing each highlighter",
+            "highlight stats        Show scans, time and matches per highlighter",
+            "highlight stats reset  Clear timings, re-enable over-budget highlighters",
         ],
     },
     "set": {
@@ -315,6 +350,8 @@ def handle_help_command(
             ("follow", "Resume FOLLOW mode"),
             ("level <lvl>", "Filter by level (e.g., 'level error,warning')"),
             ("filter /re/", "Filter by regex pattern"),
+            ("where <expr>", "Filter by expression (e.g., 'where level>=ERROR')"),
+            ("/pattern", "Search scrollback (n/N next/prev match)"),
             ("since <time>", "Show entries since time (e.g., '5m', '14:30')"),
             ("until <time>", "Show entries until time"),
             ("between s e", "Show entries in time range"),
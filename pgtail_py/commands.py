@@ -21,6 +21,7 @@ COMMANDS: dict[str, str] = {
     "tail": "Tail logs for an instance (by ID or path)",
     "levels": "Set log level filter (e.g., 'levels ERROR WARNING')",
     "filter": "Set regex filter (e.g., 'filter /pattern/')",
+    "where": "Filter by expression (e.g., 'where level>=ERROR and duration>500ms')",
     "highlight": "Highlight text matching regex (e.g., 'highlight /pattern/')",
     "since": "Filter logs since time (e.g., 'since 5m', 'since 14:30')",
     "until": "Filter logs until time (e.g., 'until 15:00', 'until 30m')",
@@ -330,6 +331,13 @@ class PgtailCompleter(Completer):
                 display_meta="Clear all filters",
             )
 
+        if "stats".startswith(prefix_lower):
+            yield Completion(
+                "stats",
+                start_position=-len(prefix),
+                display_meta="Show per-filter hit rates",
+            )
+
         # Complete field names for field=value syntax
         # Check if user is typing a field name (before the =)
         if "=" not in prefix:
@@ -377,6 +385,7 @@ class PgtailCompleter(Completer):
                 "import": "Import highlighting config from TOML file",
                 "preview": "Preview highlighting with sample log lines",
                 "reset": "Reset all highlighting settings to defaults",
+                "stats": "Show or control per-highlighter timings",
                 "clear": "Clear all regex highlight patterns (legacy)",
             }
             for name, description in subcommands.items():
@@ -111,6 +111,10 @@ class DisplaySection:
     timestamp_format: str = "%H:%M:%S.%f"
     show_pid: bool = True
     show_level: bool = True
+    frame_rate: int = 30  # Tail mode display updates per second
+    adaptive_highlighting: bool = True  # Reduce highlighting under load
+    rehighlight: bool = True  # Re-highlight visible rows when load drops
+    background_highlighting: bool = True  # Highlight rows in a worker thread
 
 
 @dataclass
@@ -140,6 +144,15 @@ class BufferSection:
     error_stats_max: int = 10000  # ErrorStats event buffer
     connection_stats_max: int = 10000  # ConnectionStats event buffer
     tail_log_max: int = 10000  # TailLog line buffer
+    max_memory: str | None = None  # Tail mode scrollback byte budget, e.g. "256MB"
+    spill: bool = False  # Keep tail mode entries evicted from memory on disk
+
+
+@dataclass
+class FilterSection:
+    """Regex filter settings."""
+
+    match_budget_ms: int | None = None  # Per-line regex match time budget
 
 
 @dataclass
@@ -157,6 +170,7 @@ class HighlightingSection:
 
     enabled: bool = True  # Global toggle
     max_length: int = 10240  # Depth limit in bytes
+    time_budget_ms: int | None = None  # Mean per-line time allowed per highlighter
 
 
 @dataclass
@@ -227,6 +241,7 @@ class ConfigSchema:
     theme: ThemeSection = field(default_factory=ThemeSection)
     notifications: NotificationsSection = field(default_factory=NotificationsSection)
     buffer: BufferSection = field(default_factory=BufferSection)
+    filter: FilterSection = field(default_factory=FilterSection)
     updates: UpdatesSection = field(default_factory=UpdatesSection)
     highlighting: HighlightingSection = field(default_factory=HighlightingSection)
     highlighting_duration: HighlightingDurationSection = field(
@@ -382,6 +397,44 @@ def validate_optional_positive_int(value: Any) -> int | None:
     raise ValueError("must be a positive integer or null")
 
 
+# Multipliers for memory size units (binary, as in PostgreSQL's "256MB")
+_MEMORY_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+
+
+def parse_memory_size(value: str | None) -> int | None:
+    """Convert a memory size like "256MB" to bytes.
+
+    Args:
+        value: Size with an optional B/KB/MB/GB unit, or None.
+
+    Returns:
+        Size in bytes, or None if value is None.
+
+    Raises:
+        ValueError: If the size is malformed or not positive.
+    """
+    if value is None:
+        return None
+    import re
+
+    match = re.fullmatch(r"\s*(\d+)\s*([KMG]?B)?\s*", value, re.IGNORECASE)
+    if not match or int(match.group(1)) <= 0:
+        raise ValueError("must be a positive size like '256MB' (units: B, KB, MB, GB)")
+    return int(match.group(1)) * _MEMORY_UNITS[(match.group(2) or "").upper()]
+
+
+def validate_memory_size(value: Any) -> str | None:
+    """Validate optional memory size (e.g. "256MB"); bare integers are bytes."""
+    if value is None:
+        return None
+    if isinstance(value, int) and not isinstance(value, bool):
+        value = str(value)
+    if not isinstance(value, str):
+        raise ValueError("must be a size like '256MB'")
+    parse_memory_size(value)
+    return value.strip()
+
+
 def validate_iso8601(value: Any) -> str:
     """Validate ISO 8601 datetime string.
 
@@ -430,6 +483,10 @@ SETTINGS_SCHEMA: dict[str, SettingDef] = {
     "display.timestamp_format": ("%H:%M:%S.%f", validate_strftime, "str"),
     "display.show_pid": (True, validate_bool, "bool"),
     "display.show_level": (True, validate_bool, "bool"),
+    "display.frame_rate": (30, validate_positive_int, "int"),
+    "display.adaptive_highlighting": (True, validate_bool, "bool"),
+    "display.rehighlight": (True, validate_bool, "bool"),
+    "display.background_highlighting": (True, validate_bool, "bool"),
     "theme.name": ("dark", validate_theme, "str"),
     "notifications.enabled": (False, validate_bool, "bool"),
     "notifications.levels": (["FATAL", "PANIC"], validate_log_levels, "list"),
@@ -441,12 +498,16 @@ SETTINGS_SCHEMA: dict[str, SettingDef] = {
     "buffer.error_stats_max": (10000, validate_positive_int, "int"),
     "buffer.connection_stats_max": (10000, validate_positive_int, "int"),
     "buffer.tail_log_max": (10000, validate_positive_int, "int"),
+    "buffer.max_memory": (None, validate_memory_size, "str"),
+    "buffer.spill": (False, validate_bool, "bool"),
+    "filter.match_budget_ms": (None, validate_optional_positive_int, "int"),
     "updates.check": (True, validate_bool, "bool"),
     "updates.last_check": ("", validate_iso8601, "str"),
     "updates.last_version": ("", validate_semver, "str"),
     # Highlighting settings
     "highlighting.enabled": (True, validate_bool, "bool"),
     "highlighting.max_length": (10240, validate_positive_int, "int"),
+    "highlighting.time_budget_ms": (None, validate_optional_positive_int, "int"),
     "highlighting.duration.slow": (100, validate_positive_int, "int"),
     "highlighting.duration.very_slow": (500, validate_positive_int, "int"),
     "highlighting.duration.critical": (5000, validate_positive_int, "int"),
@@ -573,6 +634,10 @@ DEFAULT_CONFIG_TEMPLATE = """\
 # timestamp_format = "%H:%M:%S.%f"  # strftime format for timestamps
 # show_pid = true                    # Show process ID in output
 # show_level = true                  # Show log level in output
+# frame_rate = 30                    # Tail mode display updates per second
+# adaptive_highlighting = true       # Reduce highlighting while lines arrive too fast
+# rehighlight = true                 # Re-highlight visible rows once load drops
+# background_highlighting = true     # Highlight rows off the UI thread
 
 [theme]
 # name = "dark"  # Options: dark, light, high-contrast, monokai, solarized-dark, solarized-light
@@ -590,6 +655,11 @@ DEFAULT_CONFIG_TEMPLATE = """\
 # error_stats_max = 10000      # Max events in error statistics
 # connection_stats_max = 10000 # Max events in connection statistics
 # tail_log_max = 10000         # Max lines in tail mode display
+# max_memory = "256MB"         # Tail mode scrollback memory budget (B, KB, MB, GB)
+# spill = false                # Keep older tail mode entries on disk for scrollback
+
+[filter]
+# match_budget_ms = 50         # Skip lines where a regex filter takes longer than this
 
 [updates]
 # check = true                 # Enable startup update check (set to false to disable)
@@ -599,6 +669,7 @@ DEFAULT_CONFIG_TEMPLATE = """\
 [highlighting]
 # enabled = true              # Enable semantic highlighting (global toggle)
 # max_length = 10240          # Stop highlighting after this many bytes (depth limit)
+# time_budget_ms = 2          # Turn off highlighters averaging more than this per line
 
 [highlighting.duration]
 # slow = 100                  # Slow query threshold (ms) - yellow
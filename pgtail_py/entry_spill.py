@@ -0,0 +1,294 @@
+"""Append-only disk segments for log entries evicted from an EntryStore.
+
+An EntryStore with a spill writes each entry it evicts to an EntrySpill
+instead of dropping it, so scrollback is bounded by disk rather than RAM.
+Entries are pickled into segment files in a private temporary directory.
+The record offsets of the segment being written are kept in memory. Once a
+segment reaches ``SEGMENT_BYTES`` it is sealed: its offsets are written to an
+index file, and both files are memory-mapped read-only. Reading an entry back
+is then two offset lookups and an unpickle, and resident memory does not grow
+with the number of spilled entries beyond a small per-block time index.
+
+The files are private to the process and removed by ``close()`` (or when the
+spill is garbage collected).
+
+Classes:
+    EntrySpill: Sequence-addressed, append-only store of entries on disk.
+"""
+
+from __future__ import annotations
+
+import bisect
+import mmap
+import pickle
+import shutil
+import struct
+import tempfile
+import weakref
+from array import array
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from pgtail_py.time_filter import TimeBlockIndex
+
+if TYPE_CHECKING:
+    from pgtail_py.parser import LogEntry
+    from pgtail_py.time_filter import TimeFilter
+
+# Data file size at which a segment is sealed and memory-mapped
+SEGMENT_BYTES = 64 * 1024 * 1024
+
+# Start and end offsets of one record in a sealed segment's index file
+_OFFSET_PAIR = struct.Struct("=2Q")
+
+
+class _Segment:
+    """One data file of pickled entries plus its record offsets."""
+
+    def __init__(self, path: Path, first_seq: int) -> None:
+        """Create an empty segment file.
+
+        Args:
+            path: Data file path; the index is written next to it.
+            first_seq: Sequence number of the segment's first record.
+        """
+        self.path = path
+        self.first_seq = first_seq
+        self.count = 0
+        self.size = 0
+        self._file: BinaryIO | None = open(path, "a+b")  # noqa: SIM115
+        # Offsets of the records being written; n + 1 values for n records
+        self._offsets: array[int] | None = array("Q", [0])
+        self._data: mmap.mmap | None = None
+        self._index: mmap.mmap | None = None
+
+    @property
+    def sealed(self) -> bool:
+        """True once the segment is read-only and memory-mapped."""
+        return self._data is not None
+
+    def append(self, record: bytes) -> None:
+        """Append one record to an unsealed segment.
+
+        Args:
+            record: Pickled entry.
+        """
+        assert self._file is not None and self._offsets is not None
+        self._file.write(record)
+        self.size += len(record)
+        self.count += 1
+        self._offsets.append(self.size)
+
+    def seal(self) -> None:
+        """Write the offset index and memory-map both files read-only."""
+        assert self._file is not None and self._offsets is not None
+        self._file.flush()
+        index_path = self.path.with_suffix(".idx")
+        with open(index_path, "w+b") as index_file:
+            self._offsets.tofile(index_file)
+            index_file.flush()
+            self._index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._file.close()
+        self._file = None
+        self._offsets = None
+
+    def read(self, i: int) -> LogEntry:
+        """Load the ``i``-th record of the segment.
+
+        Args:
+            i: Record number within the segment.
+
+        Returns:
+            A new LogEntry equal to the one that was spilled.
+        """
+        if self._data is not None and self._index is not None:
+            start, end = _OFFSET_PAIR.unpack_from(self._index, i * 8)
+            return pickle.loads(self._data[start:end])
+        assert self._file is not None and self._offsets is not None
+        start = self._offsets[i]
+        # Seeking flushes pending writes; appends still go to the end
+        self._file.seek(start)
+        return pickle.loads(self._file.read(self._offsets[i + 1] - start))
+
+    def close(self) -> None:
+        """Release file handles and mappings."""
+        for handle in (self._data, self._index, self._file):
+            if handle is not None:
+                handle.close()
+        self._data = self._index = self._file = None
+
+
+class EntrySpill:
+    """Sequence-addressed, append-only store of log entries on disk.
+
+    Entries must be appended in sequence order; entries with sequence
+    numbers in ``[first_seq, next_seq)`` are retained. An entry whose number
+    does not follow the last one (after the owning store was cleared) starts
+    a new history.
+    """
+
+    def __init__(
+        self, directory: str | Path | None = None, segment_bytes: int = SEGMENT_BYTES
+    ) -> None:
+        """Create an empty spill in a new private directory.
+
+        Args:
+            directory: Parent of the spill directory, or None for the
+                system temporary directory.
+            segment_bytes: Data file size at which segments are sealed.
+        """
+        self._dir = Path(tempfile.mkdtemp(prefix="pgtail-spill-", dir=directory))
+        self._segment_bytes = segment_bytes
+        self._segments: list[_Segment] = []
+        self._first_seq = 0
+        self._next_seq = 0
+        self._disk_usage = 0
+        self._time_blocks = TimeBlockIndex()
+        self._closed = False
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self._dir, ignore_errors=True)
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the segment files."""
+        return self._dir
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest spilled entry."""
+        return self._first_seq
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next spilled entry is expected to have."""
+        return self._next_seq
+
+    @property
+    def disk_usage(self) -> int:
+        """Bytes of record data written to the segment files."""
+        return self._disk_usage
+
+    def __len__(self) -> int:
+        """Return the number of spilled entries."""
+        return self._next_seq - self._first_seq
+
+    def append(self, entry: LogEntry) -> None:
+        """Write an entry to the current segment.
+
+        Entries appended after ``close()`` are dropped.
+
+        Args:
+            entry: Entry with ``seq`` set by the owning store.
+        """
+        if self._closed:
+            return
+        seq = entry.seq
+        assert seq is not None
+        if seq != self._next_seq:
+            self.clear()
+            self._first_seq = self._next_seq = seq
+        record = pickle.dumps(entry, pickle.HIGHEST_PROTOCOL)
+        segment = self._segments[-1] if self._segments else None
+        if segment is None or segment.sealed:
+            segment = _Segment(self._dir / f"{seq:020d}.seg", seq)
+            self._segments.append(segment)
+        segment.append(record)
+        self._disk_usage += len(record)
+        self._next_seq = seq + 1
+        self._time_blocks.append(entry.epoch)
+        if segment.size >= self._segment_bytes:
+            segment.seal()
+
+    def get(self, seq: int) -> LogEntry | None:
+        """Load an entry by sequence number.
+
+        Args:
+            seq: Sequence number.
+
+        Returns:
+            The entry, or None if it was never spilled or was cleared.
+        """
+        if not self._first_seq <= seq < self._next_seq:
+            return None
+        segment = self._segments[self._segment_for(seq)]
+        return segment.read(seq - segment.first_seq)
+
+    def entries(
+        self,
+        start_seq: int | None = None,
+        stop_seq: int | None = None,
+        time_filter: TimeFilter | None = None,
+    ) -> list[LogEntry]:
+        """Load spilled entries in sequence order.
+
+        Args:
+            start_seq: First sequence number to include, or None for the oldest.
+            stop_seq: Sequence number to stop before, or None for all.
+            time_filter: If active, skip blocks whose timestamps all fall
+                outside it. Returned entries still need ``matches()``.
+
+        Returns:
+            Entries in the requested range.
+        """
+        start = self._first_seq if start_seq is None else max(start_seq, self._first_seq)
+        stop = self._next_seq if stop_seq is None else min(stop_seq, self._next_seq)
+        if start >= stop:
+            return []
+        if time_filter is None or not time_filter.is_active():
+            return self._load(start, stop)
+        return list(
+            chain.from_iterable(
+                self._load(max(lo, start), min(hi, stop))
+                for lo, hi in self.candidate_ranges(time_filter)
+            )
+        )
+
+    def candidate_ranges(self, time_filter: TimeFilter) -> list[tuple[int, int]]:
+        """Find the sequence ranges that may hold entries matching a filter.
+
+        Args:
+            time_filter: Active time filter.
+
+        Returns:
+            (start_seq, stop_seq) pairs in ascending order.
+        """
+        first = self._first_seq
+        return [
+            (first + lo, first + hi) for lo, hi in self._time_blocks.candidate_ranges(time_filter)
+        ]
+
+    def clear(self) -> None:
+        """Delete all segments. Sequence numbers keep increasing."""
+        for segment in self._segments:
+            segment.close()
+            segment.path.unlink(missing_ok=True)
+            segment.path.with_suffix(".idx").unlink(missing_ok=True)
+        self._segments.clear()
+        self._first_seq = self._next_seq
+        self._disk_usage = 0
+        self._time_blocks.clear()
+
+    def close(self) -> None:
+        """Delete all segments and the spill directory."""
+        self._closed = True
+        self.clear()
+        self._finalizer()
+
+    def _segment_for(self, seq: int) -> int:
+        """Return the index of the segment holding a live sequence number."""
+        return bisect.bisect_right(self._segments, seq, key=lambda s: s.first_seq) - 1
+
+    def _load(self, start: int, stop: int) -> list[LogEntry]:
+        """Load live entries ``[start, stop)``."""
+        result: list[LogEntry] = []
+        i = self._segment_for(start)
+        segments = self._segments
+        seq = start
+        while seq < stop:
+            segment = segments[i]
+            end = min(stop, segment.first_seq + segment.count)
+            result.extend(segment.read(n - segment.first_seq) for n in range(seq, end))
+            seq = end
+            i += 1
+        return result
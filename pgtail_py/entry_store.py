@@ -0,0 +1,334 @@
+"""Fixed-capacity ring store of log entries addressed by sequence number.
+
+A reader (LogTailer, MultiFileTailer, StdinReader) appends every entry it
+queues to an EntryStore, and tail mode shares that same store instead of
+keeping its own copy. Each appended entry gets a monotonically increasing
+sequence number (``LogEntry.seq``); once the store is full the oldest entry
+is overwritten in O(1). Consumers refer to entries by sequence number, so a
+stale number simply resolves to None after eviction.
+
+Besides the entry count, a store can have a byte budget. Each entry's
+footprint (the object, its attribute dict and the strings and datetimes it
+references) is measured once on append, and the oldest entries are evicted
+while the total is over budget, so a scrollback of multi-KB csvlog queries
+uses the same memory as one of short lines.
+
+The entries are not the only memory a scrollback holds: tail mode also keeps
+display rows and a search index for them. ``release()`` lets the owner of
+that memory evict the oldest entries until enough of both is freed, charging
+each entry with the bytes held on its behalf.
+
+A store can also be given an EntrySpill. Evicted entries are then written to
+disk instead of dropped, and ``get()`` and ``entries()`` read them back when
+asked for sequence numbers older than ``first_seq``.
+
+The store is appended from a reader thread and read from the UI thread, so
+all access goes through one lock.
+
+Classes:
+    EntryStore: Thread-safe ring buffer of LogEntry objects.
+
+Functions:
+    entry_size: Approximate memory footprint of a LogEntry in bytes.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections.abc import Iterator, Mapping
+from datetime import datetime
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from pgtail_py.time_filter import TimeBlockIndex
+
+if TYPE_CHECKING:
+    from pgtail_py.entry_spill import EntrySpill
+    from pgtail_py.parser import LogEntry
+    from pgtail_py.time_filter import TimeFilter
+
+# Default number of entries retained
+DEFAULT_CAPACITY = 10000
+
+
+def entry_size(entry: LogEntry) -> int:
+    """Approximate the memory a log entry holds on to.
+
+    Counts the entry object, its attribute dict, and the strings and
+    datetimes it references. Small ints, None and enum members are shared
+    and not counted.
+
+    Args:
+        entry: Entry to measure.
+
+    Returns:
+        Size in bytes.
+    """
+    getsizeof = sys.getsizeof
+    attributes = vars(entry)
+    size = getsizeof(entry) + getsizeof(attributes)
+    for value in attributes.values():
+        if isinstance(value, (str, datetime)):
+            size += getsizeof(value)
+    return size
+
+
+class EntryStore:
+    """Thread-safe ring buffer of log entries with sequence numbers.
+
+    Sequence numbers start at 0 and never repeat. Entries with sequence
+    numbers in ``[first_seq, next_seq)`` are live; with a spill, entries
+    from ``oldest_seq`` up to ``first_seq`` are on disk.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        max_bytes: int | None = None,
+        spill: EntrySpill | None = None,
+    ) -> None:
+        """Initialize an empty store.
+
+        Args:
+            capacity: Maximum number of entries retained.
+            max_bytes: Memory budget for retained entries, or None for no
+                limit besides ``capacity``. The newest entry is always kept.
+            spill: Disk store that receives evicted entries, or None to
+                drop them.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._capacity = capacity
+        self._slots: list[LogEntry | None] = [None] * capacity
+        self._sizes: list[int] = [0] * capacity
+        self._bytes = 0
+        self._max_bytes = max_bytes
+        self._spill = spill
+        self._first_seq = 0
+        self._next_seq = 0
+        # Per-block timestamp ranges, for skipping blocks in time-filtered scans
+        self._time_blocks = TimeBlockIndex()
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of entries retained."""
+        return self._capacity
+
+    @property
+    def max_bytes(self) -> int | None:
+        """Memory budget in bytes, or None for no byte limit."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int | None) -> None:
+        with self._lock:
+            self._max_bytes = value
+            self._enforce_limits()
+
+    @property
+    def memory_usage(self) -> int:
+        """Approximate bytes held by live entries (see ``entry_size``)."""
+        return self._bytes
+
+    @property
+    def spill(self) -> EntrySpill | None:
+        """Disk store receiving evicted entries, if any."""
+        return self._spill
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest live entry."""
+        return self._first_seq
+
+    @property
+    def oldest_seq(self) -> int:
+        """Sequence number of the oldest entry in memory or spilled to disk."""
+        spill = self._spill
+        return spill.first_seq if spill is not None and len(spill) else self._first_seq
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next appended entry will get."""
+        return self._next_seq
+
+    def __len__(self) -> int:
+        """Return the number of live entries."""
+        return self._next_seq - self._first_seq
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        """Iterate over a snapshot of live entries, oldest first."""
+        return iter(self.entries())
+
+    def append(self, entry: LogEntry) -> int:
+        """Append an entry, evicting the oldest if the store is full.
+
+        Sets ``entry.seq``. Oldest entries are evicted while the store is
+        over its capacity or byte budget.
+
+        Args:
+            entry: Entry to store.
+
+        Returns:
+            The entry's sequence number.
+        """
+        size = entry_size(entry)
+        with self._lock:
+            if self._next_seq - self._first_seq == self._capacity:
+                self._evict_oldest()
+            seq = self._next_seq
+            entry.seq = seq
+            slot = seq % self._capacity
+            self._slots[slot] = entry
+            self._sizes[slot] = size
+            self._bytes += size
+            self._next_seq = seq + 1
+            self._time_blocks.append(entry.epoch)
+            self._enforce_limits()
+            return seq
+
+    def get(self, seq: int) -> LogEntry | None:
+        """Look up an entry by sequence number.
+
+        Args:
+            seq: Sequence number.
+
+        Returns:
+            The entry, or None if it was evicted (and not spilled), cleared
+            or not yet stored.
+        """
+        with self._lock:
+            if self._first_seq <= seq < self._next_seq:
+                return self._slots[seq % self._capacity]
+            if self._spill is not None and seq < self._first_seq:
+                return self._spill.get(seq)
+            return None
+
+    def entries(
+        self,
+        start_seq: int | None = None,
+        stop_seq: int | None = None,
+        time_filter: TimeFilter | None = None,
+    ) -> list[LogEntry]:
+        """Return a snapshot of entries in sequence order.
+
+        Spilled entries are only included when ``start_seq`` is older than
+        ``first_seq``; they are read back from disk.
+
+        Args:
+            start_seq: First sequence number to include, or None for the
+                oldest live entry.
+            stop_seq: Sequence number to stop before, or None for all.
+            time_filter: If active, skip blocks whose timestamps all fall
+                outside it. Returned entries still need ``matches()``.
+
+        Returns:
+            Entries in the requested range.
+        """
+        with self._lock:
+            first = self._first_seq
+            stop = self._next_seq if stop_seq is None else min(stop_seq, self._next_seq)
+            spilled: list[LogEntry] = []
+            if start_seq is not None and start_seq < first and self._spill is not None:
+                spilled = self._spill.entries(start_seq, min(stop, first), time_filter)
+            start = first if start_seq is None else max(start_seq, first)
+            if start >= stop:
+                return spilled
+            if time_filter is None or not time_filter.is_active():
+                return spilled + self._slice(start, stop)
+            return spilled + list(
+                chain.from_iterable(
+                    self._slice(max(first + lo, start), min(first + hi, stop))
+                    for lo, hi in self._time_blocks.candidate_ranges(time_filter)
+                )
+            )
+
+    def first_candidate_seq(self, time_filter: TimeFilter) -> int | None:
+        """Find where entries matching a time filter may start.
+
+        Args:
+            time_filter: Active time filter.
+
+        Returns:
+            Sequence number of the first block, in memory or spilled, whose
+            timestamps overlap the filter, or None if there is none.
+        """
+        with self._lock:
+            if self._spill is not None:
+                spilled = self._spill.candidate_ranges(time_filter)
+                if spilled:
+                    return spilled[0][0]
+            ranges = self._time_blocks.candidate_ranges(time_filter)
+            return self._first_seq + ranges[0][0] if ranges else None
+
+    def clear(self) -> None:
+        """Drop all entries, including spilled ones. Sequence numbers keep increasing."""
+        with self._lock:
+            if self._spill is not None:
+                self._spill.clear()
+            self._slots = [None] * self._capacity
+            self._sizes = [0] * self._capacity
+            self._bytes = 0
+            self._first_seq = self._next_seq
+            self._time_blocks.clear()
+
+    def release(self, nbytes: int, charges: Mapping[int, int] | None = None) -> int:
+        """Evict (or spill) the oldest entries until ``nbytes`` are freed.
+
+        Used to hold memory kept elsewhere for the entries, such as the rows
+        showing them, to the same budget. The newest entry is always kept.
+
+        Args:
+            nbytes: Bytes to free.
+            charges: Bytes held elsewhere on behalf of each entry, by
+                sequence number, freed along with it.
+
+        Returns:
+            Number of entries evicted.
+        """
+        charges = charges or {}
+        evicted = 0
+        with self._lock:
+            while nbytes > 0 and self._next_seq - self._first_seq > 1:
+                seq = self._first_seq
+                nbytes -= self._sizes[seq % self._capacity] + charges.get(seq, 0)
+                self._evict_oldest()
+                evicted += 1
+        return evicted
+
+    def _evict_oldest(self) -> None:
+        """Drop (or spill) the oldest live entry; caller holds the lock."""
+        slot = self._first_seq % self._capacity
+        if self._spill is not None:
+            self._spill.append(self._slots[slot])  # type: ignore[arg-type]
+        self._slots[slot] = None
+        self._bytes -= self._sizes[slot]
+        self._sizes[slot] = 0
+        self._first_seq += 1
+        self._time_blocks.prune(1)
+
+    def _enforce_limits(self) -> None:
+        """Evict oldest entries while over budget; caller holds the lock."""
+        max_bytes = self._max_bytes
+        if max_bytes is None:
+            return
+        while self._bytes > max_bytes and self._next_seq - self._first_seq > 1:
+            self._evict_oldest()
+
+    def _slice(self, start: int, stop: int) -> list[LogEntry]:
+        """Copy live entries ``[start, stop)``; caller holds the lock."""
+        if start >= stop:
+            return []
+        capacity = self._capacity
+        lo = start % capacity
+        hi = lo + (stop - start)
+        slots = self._slots
+        if hi <= capacity:
+            result = slots[lo:hi]
+        else:
+            result = slots[lo:] + slots[: hi - capacity]
+        return result  # type: ignore[return-value]
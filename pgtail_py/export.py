@@ -22,6 +22,7 @@ _RICH_MARKUP_PATTERN = re.compile(r"\[/?[^\]]*\]")
 
 if TYPE_CHECKING:
     from pgtail_py.filter import LogLevel
+    from pgtail_py.filter_expression import CompiledFilter
     from pgtail_py.parser import LogEntry
     from pgtail_py.regex_filter import FilterState
     from pgtail_py.tailer import LogTailer
@@ -220,6 +221,7 @@ def get_filtered_entries(
     levels: "set[LogLevel] | None",
     regex_state: "FilterState",
     since: datetime | None = None,
+    expression: "CompiledFilter | None" = None,
 ) -> Generator["LogEntry", None, None]:
     """Generator that yields filtered entries.
 
@@ -228,25 +230,35 @@ def get_filtered_entries(
         levels: Set of levels to include, or None for all.
         regex_state: Regex filter state.
         since: Only include entries after this time.
+        expression: Compiled ``where`` expression, or None.
 
     Yields:
         Filtered log entries.
     """
     from pgtail_py.filter import should_show
 
+    since_epoch = since.timestamp() if since is not None else None
+
     for entry in entries:
         # Filter by time
-        if since is not None and entry.timestamp is not None and entry.timestamp < since:
+        if since_epoch is not None and entry.epoch is not None and entry.epoch < since_epoch:
             continue
 
         # Filter by level
         if not should_show(entry.level, levels):
             continue
 
+        # Cheap where terms before the regex filter, expensive ones after
+        if expression is not None and not expression.matches_pushdown(entry):
+            continue
+
         # Filter by regex
         if not regex_state.should_show(entry.raw):
             continue
 
+        if expression is not None and not expression.matches_residual(entry):
+            continue
+
         yield entry
 
 
@@ -0,0 +1,613 @@
+"""Filter expression language for combined log filtering.
+
+Provides the ``where`` command's expression language, which combines level,
+time, duration, field and regex conditions in a single boolean expression:
+
+    where level>=ERROR and db in (orders, billing) and duration>500ms
+          and message ~ /timeout/
+
+An expression is parsed once into a typed AST (values are converted to
+LogLevel sets, UTC datetimes, milliseconds and compiled regexes at parse
+time) and compiled into a chain of specialized predicates. Top-level AND
+terms are ordered cheapest first and split into a pushdown part (level,
+time window and field equality) and a residual part (duration extraction
+and regex matching), so tailers can run the cheap checks alongside their
+other cheap filters and defer the expensive ones.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from pgtail_py.field_filter import FIELD_ALIASES, FIELD_ATTRIBUTES
+from pgtail_py.filter import LogLevel
+from pgtail_py.regex_filter import compile_pattern, parse_filter_arg
+from pgtail_py.slow_query import extract_duration
+from pgtail_py.time_filter import parse_time
+
+if TYPE_CHECKING:
+    from pgtail_py.parser import LogEntry
+
+Predicate = Callable[["LogEntry"], bool]
+
+
+class FilterExpressionError(ValueError):
+    """Raised when a filter expression cannot be parsed."""
+
+
+# Field kinds determine which operators are valid and how values are typed
+_LEVEL = "level"
+_TIME = "time"
+_DURATION = "duration"
+_STRING = "string"
+
+# Expression field name -> (kind, LogEntry attribute)
+_FIELDS: dict[str, tuple[str, str]] = {
+    "level": (_LEVEL, "level"),
+    "time": (_TIME, "timestamp"),
+    "timestamp": (_TIME, "timestamp"),
+    "ts": (_TIME, "timestamp"),
+    "duration": (_DURATION, "message"),
+    "message": (_STRING, "message"),
+    "msg": (_STRING, "message"),
+    "raw": (_STRING, "raw"),
+    "detail": (_STRING, "detail"),
+    "hint": (_STRING, "hint"),
+    "query": (_STRING, "query"),
+    "context": (_STRING, "context"),
+    "sql_state": (_STRING, "sql_state"),
+    "sqlstate": (_STRING, "sql_state"),
+    "code": (_STRING, "sql_state"),
+    **{alias: (_STRING, FIELD_ATTRIBUTES[canonical]) for alias, canonical in FIELD_ALIASES.items()},
+}
+
+_COMPARISON_OPS = ("=", "!=", "<", "<=", ">", ">=")
+
+# Operators accepted by each field kind
+_KIND_OPS: dict[str, tuple[str, ...]] = {
+    _LEVEL: (*_COMPARISON_OPS, "in", "not in"),
+    _TIME: ("<", "<=", ">", ">="),
+    _DURATION: _COMPARISON_OPS,
+    _STRING: ("=", "!=", "~", "!~", "in", "not in"),
+}
+
+# Relative evaluation cost; terms at or below PUSHDOWN_COST are pushed down
+_COST_LEVEL = 1
+_COST_TIME = 2
+_COST_FIELD = 3
+_COST_DURATION = 4
+_COST_REGEX = 5
+PUSHDOWN_COST = _COST_FIELD
+
+# Duration literal: number with optional unit (milliseconds by default)
+_DURATION_VALUE = re.compile(r"^(\d+(?:\.\d+)?)(us|ms|s|m|h)?$", re.IGNORECASE)
+_DURATION_UNITS_MS = {"us": 0.001, "ms": 1.0, "s": 1000.0, "m": 60_000.0, "h": 3_600_000.0}
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    \s*(?:
+        (?P<regex>/(?:\\.|[^/\\])*/c?)(?=[\s(),]|$)
+      | (?P<string>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')
+      | (?P<op>>=|<=|!=|==|!~|=|<|>|~)
+      | (?P<punct>[(),])
+      | (?P<word>[^\s(),=<>!~"']+)
+    )
+    """,
+    re.VERBOSE,
+)
+
+_KEYWORDS = frozenset({"and", "or", "not", "in"})
+
+
+# =============================================================================
+# AST
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """A single ``field op value`` condition with a typed value.
+
+    Attributes:
+        field: Field name as written (lowercased).
+        kind: Field kind (level, time, duration or string).
+        attr: LogEntry attribute the field reads.
+        op: Operator (=, !=, <, <=, >, >=, ~, !~, in, not in).
+        value: Typed value: set of LogLevel for level fields, UTC datetime
+            for time, milliseconds for duration, compiled regex for ~ and !~,
+            lowercased string (or tuple of strings for in) otherwise.
+    """
+
+    field: str
+    kind: str
+    attr: str
+    op: str
+    value: Any
+
+
+@dataclass(frozen=True)
+class BoolOp:
+    """AND/OR over two or more sub-expressions.
+
+    Attributes:
+        op: "and" or "or".
+        operands: Sub-expressions.
+    """
+
+    op: str
+    operands: tuple[Node, ...]
+
+
+@dataclass(frozen=True)
+class Not:
+    """Negation of a sub-expression.
+
+    Attributes:
+        operand: Negated sub-expression.
+    """
+
+    operand: Node
+
+
+Node = Comparison | BoolOp | Not
+
+
+# =============================================================================
+# Parser
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _Token:
+    kind: str
+    text: str
+    pos: int
+
+
+def _tokenize(source: str) -> list[_Token]:
+    """Split an expression into tokens.
+
+    Raises:
+        FilterExpressionError: On characters that start no valid token.
+    """
+    tokens: list[_Token] = []
+    pos = 0
+    length = len(source)
+    while pos < length and not source[pos:].isspace():
+        match = _TOKEN_PATTERN.match(source, pos)
+        if match is None or match.end() == pos:
+            raise FilterExpressionError(f"Unexpected character at position {pos + 1}")
+        kind = match.lastgroup or "word"
+        text = match.group(kind)
+        tokens.append(_Token(kind, text, match.start(kind)))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser: or_expr > and_expr > not_expr > primary."""
+
+    def __init__(self, source: str) -> None:
+        self._tokens = _tokenize(source)
+        self._index = 0
+
+    def parse(self) -> Node:
+        if not self._tokens:
+            raise FilterExpressionError("Empty expression")
+        node = self._parse_or()
+        if self._index < len(self._tokens):
+            token = self._tokens[self._index]
+            raise FilterExpressionError(f"Unexpected '{token.text}' at position {token.pos + 1}")
+        return node
+
+    def _peek(self) -> _Token | None:
+        return self._tokens[self._index] if self._index < len(self._tokens) else None
+
+    def _next(self, expected: str) -> _Token:
+        token = self._peek()
+        if token is None:
+            raise FilterExpressionError(f"Expected {expected} at end of expression")
+        self._index += 1
+        return token
+
+    def _at_keyword(self, keyword: str) -> bool:
+        token = self._peek()
+        return token is not None and token.kind == "word" and token.text.lower() == keyword
+
+    def _parse_or(self) -> Node:
+        operands = [self._parse_and()]
+        while self._at_keyword("or"):
+            self._index += 1
+            operands.append(self._parse_and())
+        return operands[0] if len(operands) == 1 else BoolOp("or", tuple(operands))
+
+    def _parse_and(self) -> Node:
+        operands = [self._parse_not()]
+        while self._at_keyword("and"):
+            self._index += 1
+            operands.append(self._parse_not())
+        return operands[0] if len(operands) == 1 else BoolOp("and", tuple(operands))
+
+    def _parse_not(self) -> Node:
+        if self._at_keyword("not"):
+            self._index += 1
+            return Not(self._parse_not())
+        return self._parse_primary()
+
+    def _parse_primary(self) -> Node:
+        token = self._next("condition")
+        if token.kind == "punct" and token.text == "(":
+            node = self._parse_or()
+            closing = self._next("')'")
+            if closing.text != ")":
+                raise FilterExpressionError(f"Expected ')' at position {closing.pos + 1}")
+            return node
+        if token.kind != "word" or token.text.lower() in _KEYWORDS:
+            raise FilterExpressionError(
+                f"Expected field name at position {token.pos + 1}, got '{token.text}'"
+            )
+        return self._parse_comparison(token)
+
+    def _parse_comparison(self, field_token: _Token) -> Comparison:
+        name = field_token.text.lower()
+        if name not in _FIELDS:
+            valid = ", ".join(sorted(_FIELDS))
+            raise FilterExpressionError(
+                f"Unknown field '{field_token.text}'. Valid fields: {valid}"
+            )
+        kind, attr = _FIELDS[name]
+
+        op_token = self._next(f"operator after '{field_token.text}'")
+        if op_token.kind == "op":
+            op = "=" if op_token.text == "==" else op_token.text
+        elif self._matches_word(op_token, "in"):
+            op = "in"
+        elif self._matches_word(op_token, "not") and self._at_keyword("in"):
+            self._index += 1
+            op = "not in"
+        else:
+            raise FilterExpressionError(
+                f"Expected operator after '{field_token.text}' at position {op_token.pos + 1}"
+            )
+
+        if op not in _KIND_OPS[kind]:
+            allowed = ", ".join(_KIND_OPS[kind])
+            raise FilterExpressionError(
+                f"Operator '{op}' not supported for {name}. Use one of: {allowed}"
+            )
+
+        if op in ("in", "not in"):
+            raw_values = self._parse_list()
+        else:
+            raw_values = [self._parse_scalar(op)]
+
+        try:
+            value = _typed_value(kind, op, raw_values)
+        except (ValueError, re.error) as e:
+            raise FilterExpressionError(f"Invalid value for {name}: {e}") from None
+        return Comparison(name, kind, attr, op, value)
+
+    @staticmethod
+    def _matches_word(token: _Token, word: str) -> bool:
+        return token.kind == "word" and token.text.lower() == word
+
+    def _parse_scalar(self, op: str) -> str:
+        token = self._next(f"value after '{op}'")
+        if token.kind == "string":
+            return _unquote(token.text)
+        if token.kind == "regex" or (token.kind == "word" and token.text.lower() not in _KEYWORDS):
+            return token.text
+        raise FilterExpressionError(f"Expected value at position {token.pos + 1}")
+
+    def _parse_list(self) -> list[str]:
+        opening = self._next("'('")
+        if opening.text != "(":
+            raise FilterExpressionError(f"Expected '(' at position {opening.pos + 1}")
+        values: list[str] = []
+        while True:
+            values.append(self._parse_scalar("in"))
+            token = self._next("')'")
+            if token.text == ")":
+                return values
+            if token.text != ",":
+                raise FilterExpressionError(f"Expected ',' or ')' at position {token.pos + 1}")
+
+
+def _unquote(text: str) -> str:
+    """Strip quotes and backslash escapes from a quoted string token."""
+    return re.sub(r"\\(.)", r"\1", text[1:-1])
+
+
+def _parse_duration_ms(value: str) -> float:
+    """Parse a duration literal like ``500ms``, ``1.5s`` or ``250`` into milliseconds."""
+    match = _DURATION_VALUE.match(value)
+    if not match:
+        raise ValueError(f"'{value}' is not a duration (e.g. 500ms, 1.5s, 2m)")
+    unit = (match.group(2) or "ms").lower()
+    return float(match.group(1)) * _DURATION_UNITS_MS[unit]
+
+
+def _level_set(op: str, level: LogLevel) -> frozenset[LogLevel]:
+    """Translate a level comparison into the set of matching levels.
+
+    Comparisons are by severity: ``level>=ERROR`` means ERROR or more severe.
+    """
+    if op == "=":
+        return frozenset({level})
+    if op == "!=":
+        return frozenset(LogLevel.all_levels() - {level})
+    if op == ">=":
+        return frozenset(LogLevel.at_or_above(level))
+    if op == "<=":
+        return frozenset(LogLevel.at_or_below(level))
+    if op == ">":
+        return frozenset(LogLevel.at_or_above(level) - {level})
+    return frozenset(LogLevel.at_or_below(level) - {level})
+
+
+def _typed_value(kind: str, op: str, raw_values: list[str]) -> Any:
+    """Convert raw token values into the typed value stored on a Comparison.
+
+    Raises:
+        ValueError: If a value cannot be converted for the field kind.
+        re.error: If a regex value is invalid.
+    """
+    if kind == _LEVEL:
+        levels = [LogLevel.from_string(v) for v in raw_values]
+        if op in ("in", "not in"):
+            selected = frozenset(levels)
+            return selected if op == "in" else frozenset(LogLevel.all_levels() - selected)
+        return _level_set(op, levels[0])
+    if kind == _TIME:
+        return parse_time(raw_values[0])
+    if kind == _DURATION:
+        return _parse_duration_ms(raw_values[0])
+    if op in ("~", "!~"):
+        raw = raw_values[0]
+        if raw.startswith("/"):
+            pattern, case_sensitive = parse_filter_arg(raw)
+        else:
+            pattern, case_sensitive = raw, False
+        return compile_pattern(pattern, 0 if case_sensitive else re.IGNORECASE)
+    if op in ("in", "not in"):
+        return tuple(v.lower() for v in raw_values)
+    return raw_values[0].lower()
+
+
+def parse_expression(source: str) -> Node:
+    """Parse a filter expression into a typed AST.
+
+    Args:
+        source: Expression text, e.g. ``level>=ERROR and db=orders``.
+
+    Returns:
+        Root AST node.
+
+    Raises:
+        FilterExpressionError: If the expression is invalid.
+    """
+    return _Parser(source).parse()
+
+
+# =============================================================================
+# Compiler
+# =============================================================================
+
+
+def node_cost(node: Node) -> int:
+    """Estimate the relative cost of evaluating a node.
+
+    Args:
+        node: AST node.
+
+    Returns:
+        Cost rank; compound nodes cost as much as their dearest operand.
+    """
+    if isinstance(node, Not):
+        return node_cost(node.operand)
+    if isinstance(node, BoolOp):
+        return max(node_cost(operand) for operand in node.operands)
+    if node.kind == _LEVEL:
+        return _COST_LEVEL
+    if node.kind == _TIME:
+        return _COST_TIME
+    if node.kind == _DURATION:
+        return _COST_DURATION
+    return _COST_REGEX if node.op in ("~", "!~") else _COST_FIELD
+
+
+def _compile_comparison(node: Comparison) -> Predicate:
+    """Compile a comparison into a specialized predicate."""
+    op = node.op
+    value = node.value
+    attr = node.attr
+
+    if node.kind == _LEVEL:
+        levels: frozenset[LogLevel] = value
+        return lambda entry: entry.level in levels
+
+    if node.kind == _TIME:
+        bound = value.timestamp()
+        compare = _ORDERING[op]
+
+        def time_predicate(entry: LogEntry) -> bool:
+            epoch = entry.epoch
+            return epoch is not None and compare(epoch, bound)
+
+        return time_predicate
+
+    if node.kind == _DURATION:
+        threshold: float = value
+        compare_ms = _ORDERING[op]
+
+        def duration_predicate(entry: LogEntry) -> bool:
+            duration = extract_duration(entry.message)
+            return duration is not None and compare_ms(duration, threshold)
+
+        return duration_predicate
+
+    if op in ("~", "!~"):
+        search = value.search
+        if op == "~":
+
+            def regex_predicate(entry: LogEntry) -> bool:
+                text = getattr(entry, attr)
+                return text is not None and search(str(text)) is not None
+
+            return regex_predicate
+
+        def not_regex_predicate(entry: LogEntry) -> bool:
+            text = getattr(entry, attr)
+            return text is None or search(str(text)) is None
+
+        return not_regex_predicate
+
+    # String equality and membership (case-insensitive, like field filters)
+    if op in ("in", "not in"):
+        targets = frozenset(value)
+    else:
+        targets = frozenset({value})
+    negate = op in ("!=", "not in")
+
+    def field_predicate(entry: LogEntry) -> bool:
+        field_value = getattr(entry, attr)
+        found = field_value is not None and str(field_value).lower() in targets
+        return found != negate
+
+    return field_predicate
+
+
+_ORDERING: dict[str, Callable[[Any, Any], bool]] = {
+    "=": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+def _conjunction(predicates: tuple[Predicate, ...]) -> Predicate:
+    """Combine predicates with short-circuit AND, avoiding wrappers when possible."""
+    if not predicates:
+        return lambda entry: True
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def match_all(entry: LogEntry) -> bool:
+        return all(predicate(entry) for predicate in predicates)
+
+    return match_all
+
+
+def compile_node(node: Node) -> Predicate:
+    """Compile an AST node into a predicate.
+
+    AND/OR operands are reordered cheapest first; short-circuiting then
+    skips the expensive checks for most entries.
+
+    Args:
+        node: AST node.
+
+    Returns:
+        Predicate taking a LogEntry.
+    """
+    if isinstance(node, Comparison):
+        return _compile_comparison(node)
+    if isinstance(node, Not):
+        inner = compile_node(node.operand)
+        return lambda entry: not inner(entry)
+    ordered = tuple(compile_node(n) for n in sorted(node.operands, key=node_cost))
+    if node.op == "and":
+        return _conjunction(ordered)
+
+    def match_any(entry: LogEntry) -> bool:
+        return any(predicate(entry) for predicate in ordered)
+
+    return match_any
+
+
+class CompiledFilter:
+    """A parsed and compiled filter expression.
+
+    Attributes:
+        source: Expression text as entered.
+        tree: Typed AST.
+        pushdown: Predicate over the cheap top-level AND terms (level, time,
+            field equality), or None if there are none.
+        residual: Predicate over the remaining terms (duration, regex,
+            compound terms containing them), or None if there are none.
+    """
+
+    def __init__(self, source: str, tree: Node) -> None:
+        """Compile an AST.
+
+        Args:
+            source: Expression text as entered.
+            tree: AST returned by parse_expression().
+        """
+        self.source = source
+        self.tree = tree
+
+        terms = tree.operands if isinstance(tree, BoolOp) and tree.op == "and" else (tree,)
+        ranked = sorted(terms, key=node_cost)
+        cheap = tuple(compile_node(t) for t in ranked if node_cost(t) <= PUSHDOWN_COST)
+        costly = tuple(compile_node(t) for t in ranked if node_cost(t) > PUSHDOWN_COST)
+        self.pushdown: Predicate | None = _conjunction(cheap) if cheap else None
+        self.residual: Predicate | None = _conjunction(costly) if costly else None
+        self._matches = _conjunction(cheap + costly)
+
+    @classmethod
+    def parse(cls, source: str) -> CompiledFilter:
+        """Parse and compile an expression.
+
+        Args:
+            source: Expression text.
+
+        Returns:
+            Compiled filter.
+
+        Raises:
+            FilterExpressionError: If the expression is invalid.
+        """
+        source = source.strip()
+        return cls(source, parse_expression(source))
+
+    def matches(self, entry: LogEntry) -> bool:
+        """Check if an entry satisfies the whole expression.
+
+        Args:
+            entry: Log entry to check.
+
+        Returns:
+            True if the entry matches.
+        """
+        return self._matches(entry)
+
+    def matches_pushdown(self, entry: LogEntry) -> bool:
+        """Check only the cheap pushed-down terms.
+
+        Args:
+            entry: Log entry to check.
+
+        Returns:
+            True if the entry passes the pushdown terms (or there are none).
+        """
+        return self.pushdown is None or self.pushdown(entry)
+
+    def matches_residual(self, entry: LogEntry) -> bool:
+        """Check only the residual (expensive) terms.
+
+        Args:
+            entry: Log entry to check.
+
+        Returns:
+            True if the entry passes the residual terms (or there are none).
+        """
+        return self.residual is None or self.residual(entry)
+
+    def __repr__(self) -> str:
+        return f"CompiledFilter({self.source!r})"
@@ -0,0 +1,259 @@
+"""Instrumented, self-ordering filter pipeline for the log readers.
+
+Each reader (LogTailer, MultiFileTailer, StdinReader) checks every parsed
+entry against the active filters. A FilterPlan holds those filters as
+stages and counts, per stage, how many entries it evaluated, how many it
+rejected and how long it took. The plan periodically reorders itself so
+stages that reject the most entries per nanosecond of work run first:
+a regex that rejects 99.9% of lines moves ahead of a field filter that
+rejects 1%. All stages are side-effect-free conjuncts, so the order never
+changes which entries are shown.
+
+Timing every evaluation would cost more than cheap stages themselves, so
+only one entry in ``SAMPLE_INTERVAL`` is timed.
+
+Classes:
+    FilterStage: One named predicate with its counters.
+    FilterPlan: Ordered stages with sampling and periodic reordering.
+
+Functions:
+    build_filter_plan: Build a plan from the reader's filter settings.
+    format_filter_stats: Format plan counters as table lines.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pgtail_py.regex_filter import get_match_budget
+
+if TYPE_CHECKING:
+    from pgtail_py.field_filter import FieldFilterState
+    from pgtail_py.filter import LogLevel
+    from pgtail_py.filter_expression import CompiledFilter
+    from pgtail_py.parser import LogEntry
+    from pgtail_py.regex_filter import FilterState
+    from pgtail_py.time_filter import TimeFilter
+
+# Time one entry in this many (must be a power of two)
+SAMPLE_INTERVAL = 16
+
+# Re-rank stages after this many entries
+REORDER_INTERVAL = 4096
+
+
+@dataclass(eq=False)
+class FilterStage:
+    """A named filter predicate with hit-rate counters.
+
+    Attributes:
+        name: Display name (e.g. "level", "regex").
+        predicate: Returns True if the entry passes the stage.
+        source: Filter object the predicate was built from; counters are
+            carried over to a rebuilt plan while this stays the same.
+        evaluations: Entries checked by this stage.
+        rejections: Entries this stage rejected.
+        sampled: Evaluations that were timed.
+        sampled_ns: Total nanoseconds spent in timed evaluations.
+    """
+
+    name: str
+    predicate: Callable[[LogEntry], bool]
+    source: object = None
+    evaluations: int = 0
+    rejections: int = 0
+    sampled: int = 0
+    sampled_ns: int = 0
+
+    @property
+    def rejection_rate(self) -> float:
+        """Fraction of evaluated entries this stage rejected."""
+        return self.rejections / self.evaluations if self.evaluations else 0.0
+
+    @property
+    def avg_ns(self) -> float | None:
+        """Mean nanoseconds per evaluation, or None if never timed."""
+        return self.sampled_ns / self.sampled if self.sampled else None
+
+    @property
+    def score(self) -> float:
+        """Rejections per nanosecond; higher runs earlier."""
+        avg = self.avg_ns
+        return self.rejection_rate / max(avg, 1.0) if avg is not None else 0.0
+
+
+class FilterPlan:
+    """Conjunctive filter stages evaluated in adaptive order.
+
+    Attributes:
+        reorders: Number of times the stage order changed.
+    """
+
+    def __init__(self, stages: list[FilterStage] | None = None) -> None:
+        """Initialize the plan.
+
+        Args:
+            stages: Stages in initial (static cost) order.
+        """
+        self._stages: tuple[FilterStage, ...] = tuple(stages or ())
+        self._entries = 0
+        self._next_reorder = REORDER_INTERVAL
+        self.reorders = 0
+
+    @property
+    def stages(self) -> tuple[FilterStage, ...]:
+        """Stages in current evaluation order."""
+        return self._stages
+
+    @property
+    def entries(self) -> int:
+        """Entries checked by the plan since it was built."""
+        return self._entries
+
+    def should_show(self, entry: LogEntry) -> bool:
+        """Check an entry against every stage, updating counters.
+
+        Args:
+            entry: Parsed log entry.
+
+        Returns:
+            True if the entry passes all stages.
+        """
+        self._entries += 1
+        if self._entries >= self._next_reorder:
+            self._next_reorder = self._entries + REORDER_INTERVAL
+            self.reorder()
+
+        if self._entries & (SAMPLE_INTERVAL - 1):
+            for stage in self._stages:
+                stage.evaluations += 1
+                if not stage.predicate(entry):
+                    stage.rejections += 1
+                    return False
+            return True
+
+        clock = time.perf_counter_ns
+        for stage in self._stages:
+            stage.evaluations += 1
+            start = clock()
+            passed = stage.predicate(entry)
+            stage.sampled_ns += clock() - start
+            stage.sampled += 1
+            if not passed:
+                stage.rejections += 1
+                return False
+        return True
+
+    def reorder(self) -> None:
+        """Sort stages by rejections per nanosecond, best first."""
+        ranked = tuple(sorted(self._stages, key=lambda s: s.score, reverse=True))
+        if any(a is not b for a, b in zip(ranked, self._stages, strict=True)):
+            self._stages = ranked
+            self.reorders += 1
+
+    def reset_stats(self) -> None:
+        """Zero all counters, keeping the current order."""
+        for stage in self._stages:
+            stage.evaluations = stage.rejections = stage.sampled = stage.sampled_ns = 0
+        self._entries = 0
+        self._next_reorder = REORDER_INTERVAL
+        self.reorders = 0
+
+
+def build_filter_plan(
+    active_levels: set[LogLevel] | None,
+    regex_state: FilterState | None,
+    time_filter: TimeFilter | None,
+    field_filter: FieldFilterState | None,
+    filter_expression: CompiledFilter | None,
+    previous: FilterPlan | None = None,
+) -> FilterPlan:
+    """Build a plan from a reader's filter settings.
+
+    The initial order is the static cost ranking (time, level, field,
+    cheap ``where`` terms, regex, costly ``where`` terms). Stages built
+    from the same filter objects as in ``previous`` keep their counters
+    and relative order, so updating one filter doesn't reset the others.
+
+    Args:
+        active_levels: Levels to show, or None for all.
+        regex_state: Regex filter state, or None.
+        time_filter: Time filter, or None.
+        field_filter: Field filter state, or None.
+        filter_expression: Compiled ``where`` expression, or None.
+        previous: Plan being replaced, or None.
+
+    Returns:
+        New filter plan.
+    """
+    stages: list[FilterStage] = []
+
+    if time_filter is not None and time_filter.is_active():
+        stages.append(FilterStage("time", time_filter.matches, time_filter))
+
+    if active_levels is not None:
+        levels = active_levels
+        stages.append(FilterStage("level", lambda entry: entry.level in levels, active_levels))
+
+    # Field and regex states are mutated in place by commands, so their
+    # stages check for active filters on every call
+    if field_filter is not None:
+        stages.append(FilterStage("field", field_filter.matches, field_filter))
+
+    if filter_expression is not None and filter_expression.pushdown is not None:
+        stages.append(FilterStage("where", filter_expression.pushdown, filter_expression.pushdown))
+
+    if regex_state is not None:
+        regex = regex_state
+
+        def regex_stage(entry: LogEntry) -> bool:
+            return not regex.has_filters() or regex.should_show(entry.raw)
+
+        stages.append(FilterStage("regex", regex_stage, regex_state))
+
+    if filter_expression is not None and filter_expression.residual is not None:
+        stages.append(FilterStage("where+", filter_expression.residual, filter_expression.residual))
+
+    if previous is not None:
+        old = {id(s.source): s for s in previous.stages if s.source is not None}
+        carried = [old.get(id(s.source), s) for s in stages]
+        # Keep the learned order for carried stages, new stages after them
+        rank = {id(s): i for i, s in enumerate(previous.stages)}
+        stages = sorted(carried, key=lambda s: rank.get(id(s), len(rank)))
+
+    return FilterPlan(stages)
+
+
+def format_filter_stats(plan: FilterPlan, regex_state: FilterState | None = None) -> list[str]:
+    """Format a plan's counters as aligned table lines.
+
+    Args:
+        plan: Filter plan to report.
+        regex_state: Regex filters whose match-budget skips to report, or None.
+
+    Returns:
+        Lines of text, header first, stages in evaluation order, then any
+        lines skipped by the regex match budget.
+    """
+    if not plan.stages:
+        return ["No filters active"]
+
+    lines = [
+        f"{plan.entries} entries checked, plan reordered {plan.reorders} times",
+        f"  {'Filter':<8} {'Evaluated':>10} {'Rejected':>10} {'Reject%':>8} {'ns/eval':>8}",
+    ]
+    for stage in plan.stages:
+        avg = stage.avg_ns
+        avg_text = f"{avg:.0f}" if avg is not None else "-"
+        lines.append(
+            f"  {stage.name:<8} {stage.evaluations:>10} {stage.rejections:>10} "
+            f"{stage.rejection_rate:>8.1%} {avg_text:>8}"
+        )
+    if regex_state is not None:
+        budget = get_match_budget()
+        for pattern, skipped in regex_state.budget_skip_counts():
+            lines.append(f"  /{pattern}/ skipped {skipped} lines over the {budget} ms match budget")
+    return lines
@@ -7,21 +7,38 @@ This module provides:
 - RegexHighlighter: Base class for simple regex-based highlighters
 - GroupedRegexHighlighter: Base class for regex with named groups
 - KeywordHighlighter: Base class for Aho-Corasick keyword matching
+- KeywordIndex: One merged automaton for many keyword highlighters
 - HighlighterChain: Compositor that applies multiple highlighters
+- SpanLayers: Per-highlighter matches of recent texts, shared between chains,
+  keyed by message template for highlighters that ignore digit values
+- HighlighterProfile: Optional per-highlighter cost counters and time budget
+- HighlightSpans: Renderer-neutral highlighting of one text, with adapters
+  for prompt_toolkit, Rich and ANSI output
 - Rich Text builders for Textual rendering
+- ThemeKey / StyleTable: Theme-independent spans and each theme's pre-parsed styles
 """
 
 from __future__ import annotations
 
 import os
 import re
+from dataclasses import dataclass
+from operator import itemgetter
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, runtime_checkable
 
 import ahocorasick  # type: ignore[import-untyped]
 from prompt_toolkit.formatted_text import FormattedText
-from rich.text import Text
+from rich.color import ColorSystem
+from rich.errors import StyleSyntaxError
+from rich.style import Style
+from rich.text import Span, Text
+
+from pgtail_py.regex_filter import is_digit_invariant
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from pgtail_py.theme import Theme
 
 
@@ -49,6 +66,55 @@ class Match(NamedTuple):
     text: str
 
 
+# A highlighter's matches as (start, end, style, priority) tuples. Highlighters
+# with a find_spans() method produce these directly, without a Match or a
+# copy of the matched text per match.
+_Layer = list[tuple[int, int, str, int]]
+
+
+def _spans_to_matches(text: str, spans: _Layer) -> list[Match]:
+    """Turn span tuples into Match objects carrying the matched text.
+
+    Args:
+        text: Text the spans were found in.
+        spans: (start, end, style, priority) tuples.
+
+    Returns:
+        Match objects in the same order.
+    """
+    return [Match(start, end, style, text[start:end]) for start, end, style, _ in spans]
+
+
+class ThemeKey(str):
+    """Style key left unresolved in a Rich Text span.
+
+    Text highlighted without a theme carries ThemeKey span styles. They are
+    mapped to Rich styles through a StyleTable when the text is drawn, so
+    the same spans serve every theme.
+    """
+
+    __slots__ = ()
+
+
+# One ThemeKey per style key, shared by every span that uses it
+_theme_keys: dict[str, ThemeKey] = {}
+
+
+def _theme_key(style: str) -> ThemeKey:
+    """Return the shared ThemeKey for a style key.
+
+    Args:
+        style: Theme style key.
+
+    Returns:
+        ThemeKey equal to ``style``.
+    """
+    key = _theme_keys.get(style)
+    if key is None:
+        key = _theme_keys[style] = ThemeKey(style)
+    return key
+
+
 # =============================================================================
 # OccupancyTracker
 # =============================================================================
@@ -188,7 +254,10 @@ class Highlighter(Protocol):
     """Protocol for semantic highlighters.
 
     All highlighters must implement this interface to be used
-    with HighlighterChain.
+    with HighlighterChain. The built-in base classes also provide
+    ``find_spans(text)``, which HighlighterChain prefers: it returns the
+    same matches as (start, end, style, priority) tuples without copying
+    the matched text.
     """
 
     @property
@@ -290,6 +359,11 @@ class RegexHighlighter:
 
     Subclasses can override find_matches() for more complex behavior,
     but the default implementation uses a single pattern with a single style.
+
+    Patterns that begin with ``\\b`` or an alternation of words are tried at
+    every position of every message. Passing ``first_chars`` guards the
+    pattern with a one-character lookahead, so the regex engine rejects
+    most positions before entering the pattern.
     """
 
     def __init__(
@@ -299,6 +373,7 @@ class RegexHighlighter:
         pattern: str,
         style: str,
         flags: int = 0,
+        first_chars: str | None = None,
     ) -> None:
         """Initialize regex highlighter.
 
@@ -308,6 +383,9 @@ class RegexHighlighter:
             pattern: Regex pattern to match.
             style: Theme style key to apply.
             flags: Regex flags (e.g., re.IGNORECASE).
+            first_chars: Body of a character class (e.g., "0-9A-F") holding
+                every character a match can start with, or None. Matches
+                are unchanged; it only speeds up the search.
 
         Raises:
             ValueError: If pattern is invalid or matches empty string.
@@ -317,12 +395,18 @@ class RegexHighlighter:
         self._style = style
 
         try:
-            self._pattern = re.compile(pattern, flags)
+            compiled = re.compile(pattern, flags)
+            if first_chars is not None:
+                # Newline ends a trailing comment in verbose patterns
+                end = "\n)" if flags & re.VERBOSE else ")"
+                self._pattern = re.compile(f"(?=[{first_chars}])(?:{pattern}{end}", flags)
+            else:
+                self._pattern = compiled
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}") from e
 
         # Check for zero-length match
-        if self._pattern.match("") is not None:
+        if compiled.match("") is not None:
             raise ValueError("Pattern matches zero-length strings")
 
     @property
@@ -350,17 +434,20 @@ class RegexHighlighter:
         Returns:
             List of Match objects.
         """
-        matches: list[Match] = []
-        for m in self._pattern.finditer(text):
-            matches.append(
-                Match(
-                    start=m.start(),
-                    end=m.end(),
-                    style=self._style,
-                    text=m.group(),
-                )
-            )
-        return matches
+        return _spans_to_matches(text, self.find_spans(text))
+
+    def find_spans(self, text: str) -> _Layer:
+        """Find all pattern matches in text as span tuples.
+
+        Args:
+            text: Input text to search.
+
+        Returns:
+            (start, end, style, priority) tuples.
+        """
+        style = self._style
+        priority = self._priority
+        return [(*m.span(), style, priority) for m in self._pattern.finditer(text)]
 
     def apply(self, text: str, theme: Theme) -> FormattedText:
         """Apply highlighting for prompt_toolkit.
@@ -468,26 +555,33 @@ class GroupedRegexHighlighter:
         Returns:
             List of Match objects for each group in each overall match.
         """
-        matches: list[Match] = []
+        return _spans_to_matches(text, self.find_spans(text))
+
+    def find_spans(self, text: str) -> _Layer:
+        """Find all named-group matches in text as span tuples.
+
+        Args:
+            text: Input text to search.
+
+        Returns:
+            (start, end, style, priority) tuples, one per matched group.
+        """
+        spans: _Layer = []
+        append = spans.append
+        priority = self._priority
+        group_styles = self._group_styles.items()
 
         for m in self._pattern.finditer(text):
-            for group_name, style in self._group_styles.items():
+            for group_name, style in group_styles:
                 try:
                     start, end = m.span(group_name)
                     if start != -1 and end != -1:
-                        matches.append(
-                            Match(
-                                start=start,
-                                end=end,
-                                style=style,
-                                text=m.group(group_name),
-                            )
-                        )
+                        append((start, end, style, priority))
                 except IndexError:
                     # Group not in pattern
                     continue
 
-        return matches
+        return spans
 
     def apply(self, text: str, theme: Theme) -> FormattedText:
         """Apply highlighting for prompt_toolkit.
@@ -602,34 +696,42 @@ class KeywordHighlighter:
         Returns:
             List of Match objects for each keyword found.
         """
+        return _spans_to_matches(text, self.find_spans(text))
+
+    def find_spans(self, text: str) -> _Layer:
+        """Find all keyword matches in text as span tuples.
+
+        Args:
+            text: Input text to search.
+
+        Returns:
+            (start, end, style, priority) tuples.
+        """
         if not text:
             return []
 
         automaton = self._ensure_automaton()
         search_text = text if self._case_sensitive else text.lower()
-        matches: list[Match] = []
+        text_len = len(search_text)
+        word_boundary = self._word_boundary
+        priority = self._priority
+        spans: _Layer = []
+        append = spans.append
 
         for end_pos, (length, style, _keyword) in automaton.iter(search_text):
             start = end_pos - length + 1
             end = end_pos + 1
 
             # Check word boundaries if required
-            if self._word_boundary:
+            if word_boundary:
                 if start > 0 and search_text[start - 1].isalnum():
                     continue
-                if end < len(search_text) and search_text[end].isalnum():
+                if end < text_len and search_text[end].isalnum():
                     continue
 
-            matches.append(
-                Match(
-                    start=start,
-                    end=end,
-                    style=style,
-                    text=text[start:end],
-                )
-            )
+            append((start, end, style, priority))
 
-        return matches
+        return spans
 
     def apply(self, text: str, theme: Theme) -> FormattedText:
         """Apply highlighting for prompt_toolkit.
@@ -670,35 +772,432 @@ class KeywordHighlighter:
         return _build_rich_text(text, matches, theme)
 
 
+# =============================================================================
+# KeywordIndex (merged keyword automaton)
+# =============================================================================
+
+
+def uses_base_keyword_scan(highlighter: Highlighter) -> bool:
+    """Check that a highlighter matches only through KeywordHighlighter's scan.
+
+    Args:
+        highlighter: Highlighter to check.
+
+    Returns:
+        True for KeywordHighlighters that override neither ``find_spans``
+        nor ``find_matches``, whose matches a KeywordIndex can produce.
+    """
+    if not isinstance(highlighter, KeywordHighlighter):
+        return False
+    cls = type(highlighter)
+    return (
+        cls.find_spans is KeywordHighlighter.find_spans
+        and cls.find_matches is KeywordHighlighter.find_matches
+    )
+
+
+class KeywordIndex:
+    """One Aho-Corasick pass for the keywords of many KeywordHighlighters.
+
+    Every highlighter's keywords go into one automaton per case mode (one
+    searched over the text, one over its lowercase form). Each keyword's
+    payload lists the (highlighter, style) pairs it belongs to, so a single
+    pass yields every highlighter's layer, the same matches in the same
+    order as the highlighter's own ``find_spans``.
+    """
+
+    def __init__(self, highlighters: Iterable[KeywordHighlighter]) -> None:
+        """Build the automata.
+
+        Args:
+            highlighters: Keyword highlighters to index; see
+                ``uses_base_keyword_scan``.
+        """
+        self._highlighters = list(highlighters)
+        self._slots = {h: slot for slot, h in enumerate(self._highlighters)}
+        # Per case mode: keyword -> {slot: (length, style)}; a later keyword
+        # folding to the same key replaces the earlier, as in add_word()
+        payloads: dict[bool, dict[str, dict[int, tuple[int, str]]]] = {False: {}, True: {}}
+        for slot, h in enumerate(self._highlighters):
+            keys = payloads[h._case_sensitive]
+            for keyword, style in h._keywords.items():
+                key = keyword if h._case_sensitive else keyword.lower()
+                keys.setdefault(key, {})[slot] = (len(key), style)
+        self._automata: list[tuple[bool, Any]] = []
+        for case_sensitive, keys in payloads.items():
+            if not keys:
+                continue
+            automaton = ahocorasick.Automaton()  # type: ignore[no-untyped-call]
+            for key, by_slot in keys.items():
+                automaton.add_word(key, tuple((slot, *entry) for slot, entry in by_slot.items()))
+            automaton.make_automaton()
+            self._automata.append((case_sensitive, automaton))
+
+    def __contains__(self, highlighter: object) -> bool:
+        """Return True if the highlighter's keywords are indexed."""
+        return highlighter in self._slots
+
+    def __len__(self) -> int:
+        """Return the number of indexed highlighters."""
+        return len(self._highlighters)
+
+    def scan(self, text: str, highlighters: Iterable[Highlighter]) -> dict[Highlighter, _Layer]:
+        """Match the keywords of some indexed highlighters in one pass per case mode.
+
+        Args:
+            text: Text to search.
+            highlighters: Indexed highlighters whose layers are wanted.
+
+        Returns:
+            Non-empty layers by highlighter.
+        """
+        if not text:
+            return {}
+        slots = self._slots
+        highlighters_by_slot = self._highlighters
+        wanted = [False] * len(highlighters_by_slot)
+        for h in highlighters:
+            wanted[slots[h]] = True
+        layers: list[_Layer] = [[] for _ in highlighters_by_slot]
+
+        for case_sensitive, automaton in self._automata:
+            search_text = text if case_sensitive else text.lower()
+            text_len = len(search_text)
+            for end_pos, entries in automaton.iter(search_text):
+                end = end_pos + 1
+                for slot, length, style in entries:
+                    if not wanted[slot]:
+                        continue
+                    start = end - length
+                    h = highlighters_by_slot[slot]
+                    # Check word boundaries if required
+                    if h._word_boundary:
+                        if start > 0 and search_text[start - 1].isalnum():
+                            continue
+                        if end < text_len and search_text[end].isalnum():
+                            continue
+                    layers[slot].append((start, end, style, h._priority))
+
+        return {highlighters_by_slot[slot]: layer for slot, layer in enumerate(layers) if layer}
+
+
+# =============================================================================
+# SpanLayers (per-highlighter match cache)
+# =============================================================================
+
+# Number of texts whose per-highlighter matches SpanLayers keeps
+SPAN_LAYER_CACHE_SIZE = 4096
+
+# Maps every ASCII digit to "0", turning a message into its template key
+_TEMPLATE_DIGITS = str.maketrans("123456789", "000000000")
+
+
+def template_key(text: str) -> str:
+    """Return the template of a message: the text with every ASCII digit made "0".
+
+    Messages that differ only in their numbers (pids, durations, ports,
+    timestamps) share a template, and its characters sit at the same
+    positions as theirs.
+
+    Args:
+        text: Message text.
+
+    Returns:
+        Template key of the same length.
+    """
+    return text.translate(_TEMPLATE_DIGITS)
+
+
+def is_template_safe(highlighter: Highlighter) -> bool:
+    """Check that a highlighter's matches can be shared across a template.
+
+    A template-safe highlighter finds the same spans with the same styles
+    in any two texts that differ only in their ASCII digits, so its matches
+    for one text serve every text with the same ``template_key``. Regex and
+    keyword highlighters are checked by their patterns and keywords.
+    Subclasses that override ``find_spans`` or ``find_matches`` must also
+    declare ``DIGIT_INVARIANT = True``, promising that the override does not
+    look at digit values (as a duration threshold or SQLSTATE class would).
+
+    Args:
+        highlighter: Highlighter to check.
+
+    Returns:
+        True if the highlighter's matches can be cached per template.
+    """
+    if isinstance(highlighter, KeywordHighlighter):
+        base: type = KeywordHighlighter
+    elif isinstance(highlighter, RegexHighlighter):
+        base = RegexHighlighter
+    elif isinstance(highlighter, GroupedRegexHighlighter):
+        base = GroupedRegexHighlighter
+    else:
+        return False
+    cls = type(highlighter)
+    overridden = cls.find_spans is not base.find_spans or cls.find_matches is not base.find_matches
+    if overridden and not getattr(highlighter, "DIGIT_INVARIANT", False):
+        return False
+    if isinstance(highlighter, KeywordHighlighter):
+        return not any(c in "0123456789" for keyword in highlighter._keywords for c in keyword)
+    pattern = highlighter._pattern
+    return is_digit_invariant(pattern.pattern, pattern.flags)
+
+
+class SpanLayers:
+    """Per-highlighter matches of recently highlighted texts.
+
+    For each text, records which highlighters have scanned it and the
+    matches each one found (empty layers are not stored). Chains sharing a
+    SpanLayers only scan a text with highlighters that have not seen it, so
+    enabling or disabling one highlighter re-runs overlap resolution over
+    the cached layers instead of every highlighter. Layers are keyed by
+    highlighter object and evicted least recently used first.
+
+    Chains store the layers of template-safe highlighters (see
+    ``is_template_safe``) under the message's ``template_key`` rather than
+    the message itself, so a message that repeats a known shape with new
+    numbers only runs the highlighters that depend on digit values.
+    ``hits`` and ``misses`` count these template lookups.
+    """
+
+    def __init__(self, capacity: int = SPAN_LAYER_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            capacity: Maximum number of texts kept.
+        """
+        self._capacity = capacity
+        self._texts: dict[str, tuple[frozenset[Highlighter], dict[Highlighter, _Layer]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached texts."""
+        return len(self._texts)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of texts kept."""
+        return self._capacity
+
+    def get(self, text: str) -> tuple[frozenset[Highlighter], dict[Highlighter, _Layer]] | None:
+        """Look up the layers of a text, marking it recently used.
+
+        Args:
+            text: Highlighted text or template key.
+
+        Returns:
+            Highlighters that scanned the text and their non-empty layers,
+            or None if the text is not cached.
+        """
+        cached = self._texts.pop(text, None)
+        if cached is not None:
+            self._texts[text] = cached
+        return cached
+
+    def set(
+        self, text: str, scanned: frozenset[Highlighter], layers: dict[Highlighter, _Layer]
+    ) -> None:
+        """Store the layers of a text, evicting the least recently used.
+
+        Args:
+            text: Highlighted text.
+            scanned: Highlighters that scanned the text.
+            layers: Non-empty layers by highlighter.
+        """
+        texts = self._texts
+        texts.pop(text, None)
+        texts[text] = (scanned, layers)
+        while len(texts) > self._capacity:
+            del texts[next(iter(texts))]
+
+    def clear(self) -> None:
+        """Drop all cached layers and reset the hit and miss counts."""
+        self._texts.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# =============================================================================
+# HighlighterProfile (per-highlighter instrumentation)
+# =============================================================================
+
+# Scans a highlighter must have run before its mean is held to a time budget
+PROFILE_MIN_CALLS = 10
+
+
+@dataclass(slots=True)
+class HighlighterStats:
+    """Cost counters of one highlighter.
+
+    Attributes:
+        calls: Texts the highlighter scanned (cached layers are not scans).
+        ns: Cumulative scan time in nanoseconds.
+        matches: Matches contributed to highlighted lines, cached or not.
+        discarded: Matches dropped because a higher-priority match overlapped.
+    """
+
+    calls: int = 0
+    ns: int = 0
+    matches: int = 0
+    discarded: int = 0
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean scan time in nanoseconds, or 0 before the first scan."""
+        return self.ns / self.calls if self.calls else 0.0
+
+
+class HighlighterProfile:
+    """Per-highlighter cost counters, shared by the chains of a registry.
+
+    Chains only time their highlighters while the profile is ``active``:
+    while recording (``highlight stats on``) or while a time budget is set.
+    Match and discard counts are only kept while recording. Counters are
+    keyed by highlighter name, so they carry over when a chain is rebuilt.
+    SQL highlighters share one lexer pass, whose time is split evenly among
+    them.
+
+    With a budget, a highlighter whose mean scan time exceeds it (after
+    ``PROFILE_MIN_CALLS`` scans) is put in ``over_budget``; chains drop it
+    and the registry leaves it out of new chains until ``clear()``.
+    """
+
+    def __init__(self, recording: bool = False, budget_ms: float | None = None) -> None:
+        """Initialize empty counters.
+
+        Args:
+            recording: Record timings even without a budget, and count
+                matches and discarded matches.
+            budget_ms: Mean per-line time allowed per highlighter, or None.
+        """
+        self.recording = recording
+        self.budget_ns: int | None = None
+        self.stats: dict[str, HighlighterStats] = {}
+        # Mean scan time (ns) of each highlighter disabled for exceeding the budget
+        self.over_budget: dict[str, float] = {}
+        # Bumped whenever a highlighter goes over budget
+        self.generation = 0
+        self.set_budget(budget_ms)
+
+    @property
+    def active(self) -> bool:
+        """True if chains should time their highlighters."""
+        return self.recording or self.budget_ns is not None
+
+    def set_budget(self, budget_ms: float | None) -> None:
+        """Set the mean per-line time allowed per highlighter.
+
+        Args:
+            budget_ms: Budget in milliseconds, or None/0 for no budget.
+        """
+        self.budget_ns = int(budget_ms * 1_000_000) if budget_ms else None
+
+    def record(self, name: str, ns: int) -> None:
+        """Add one scan to a highlighter's counters, checking the budget.
+
+        Args:
+            name: Highlighter name.
+            ns: Scan time in nanoseconds.
+        """
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = HighlighterStats()
+        stats.calls += 1
+        stats.ns += ns
+        budget = self.budget_ns
+        if (
+            budget is not None
+            and stats.calls >= PROFILE_MIN_CALLS
+            and stats.ns > budget * stats.calls
+            and name not in self.over_budget
+        ):
+            self.over_budget[name] = stats.mean_ns
+            self.generation += 1
+
+    def count(self, name: str, matches: int, discarded: int) -> None:
+        """Add a highlighted line's matches to a highlighter's counters.
+
+        Args:
+            name: Highlighter name.
+            matches: Matches the highlighter contributed.
+            discarded: How many of them overlapping matches displaced.
+        """
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = HighlighterStats()
+        stats.matches += matches
+        stats.discarded += discarded
+
+    def clear(self) -> None:
+        """Reset all counters and re-admit highlighters that went over budget."""
+        self.stats.clear()
+        self.over_budget.clear()
+        self.generation += 1
+
+
 # =============================================================================
 # HighlighterChain Compositor
 # =============================================================================
 
 
+# Number of texts whose highlighted spans each HighlighterChain keeps
+HIGHLIGHT_CACHE_SIZE = 4096
+
+
 class HighlighterChain:
     """Composes multiple highlighters with overlap prevention.
 
     Collects matches from all highlighters, sorts by position and priority,
-    and builds output with OccupancyTracker preventing overlaps.
+    and builds output keeping the higher-priority match of each overlap.
+
+    With a KeywordIndex, the indexed keyword highlighters share one
+    Aho-Corasick pass per text instead of one pass each.
+
+    With an active HighlighterProfile, each scan is timed and counted, and a
+    highlighter that goes over the profile's time budget is unregistered.
+
+    Each text is highlighted once into HighlightSpans, cached by text, and
+    turned into prompt_toolkit, Rich or ANSI output from there.
     """
 
     def __init__(
         self,
         highlighters: list[Highlighter] | None = None,
         max_length: int = 10240,
+        layers: SpanLayers | None = None,
+        profile: HighlighterProfile | None = None,
+        keywords: KeywordIndex | None = None,
+        cache_size: int = HIGHLIGHT_CACHE_SIZE,
     ) -> None:
         """Initialize highlighter chain.
 
         Args:
             highlighters: Initial list of highlighters.
             max_length: Depth limit for highlighting (default 10KB).
+            layers: Per-highlighter match cache, possibly shared with other
+                chains, or None to scan every text with every highlighter.
+            profile: Per-highlighter cost counters, possibly shared with
+                other chains, or None for no instrumentation.
+            keywords: Merged automaton for keyword highlighters, possibly
+                shared with other chains, or None to scan each separately.
+            cache_size: Number of recent texts whose highlighting is kept,
+                or 0 to highlight every call.
         """
         self._highlighters: dict[str, Highlighter] = {}
+        self._keywords = keywords
         self._max_length = max_length
+        self._layers = layers
+        self._profile = profile
+        self._profile_generation = profile.generation if profile is not None else 0
         # Cached sorted lists for performance
         self._sorted_highlighters: list[Highlighter] | None = None
         self._non_sql_highlighters: list[Highlighter] | None = None
         self._sql_highlighters: list[Highlighter] | None = None
+        self._layer_groups: tuple[frozenset[Highlighter], frozenset[Highlighter]] | None = None
+        # Highlighted results of recent texts, least recently used first
+        self._results: dict[str, HighlightSpans] = {}
+        self._cache_size = cache_size
 
         if highlighters:
             for h in highlighters:
@@ -709,6 +1208,8 @@ class HighlighterChain:
         self._sorted_highlighters = None
         self._non_sql_highlighters = None
         self._sql_highlighters = None
+        self._layer_groups = None
+        self._results.clear()
 
     @property
     def highlighters(self) -> list[Highlighter]:
@@ -733,11 +1234,37 @@ class HighlighterChain:
             self._sql_highlighters = [h for h in self.highlighters if h.name.startswith("sql_")]
         return self._sql_highlighters
 
+    def _get_layer_groups(self) -> tuple[frozenset[Highlighter], frozenset[Highlighter]]:
+        """Split highlighters by how their layers are cached (cached).
+
+        SQL highlighters share one lexer pass whose hex rule tells digits
+        apart, so they are never cached per template.
+
+        Returns:
+            Highlighters cached per template key, and per exact text.
+        """
+        if self._layer_groups is None:
+            templated = frozenset(
+                h for h in self._get_non_sql_highlighters() if is_template_safe(h)
+            )
+            self._layer_groups = (templated, frozenset(self._highlighters.values()) - templated)
+        return self._layer_groups
+
     @property
     def max_length(self) -> int:
         """Return depth limit."""
         return self._max_length
 
+    @property
+    def layers(self) -> SpanLayers | None:
+        """Per-highlighter match cache, if any."""
+        return self._layers
+
+    @property
+    def profile(self) -> HighlighterProfile | None:
+        """Per-highlighter cost counters, if any."""
+        return self._profile
+
     def register(self, highlighter: Highlighter) -> None:
         """Add highlighter to chain.
 
@@ -766,77 +1293,79 @@ class HighlighterChain:
         del self._highlighters[name]
         self._invalidate_cache()
 
-    def apply(self, text: str, theme: Theme) -> FormattedText:
-        """Apply all highlighters for prompt_toolkit.
+    def highlight(self, text: str, theme: Theme | None = None) -> HighlightSpans:
+        """Run all highlighters once, for any output format.
+
+        Results for texts up to ``max_length`` characters are cached by text
+        (least recently used evicted), so the same message shown in stream
+        mode, tail mode and an export is only highlighted once. The cache is
+        bypassed while the profile records match counts.
 
         Args:
-            text: Input text to highlight.
-            theme: Current theme for style lookups.
+            text: Input text to highlight. Only the first ``max_length``
+                characters are highlighted.
+            theme: Passed to highlighters that take one. Matches do not
+                depend on it, so the result serves every theme.
 
         Returns:
-            FormattedText for prompt_toolkit rendering.
+            Spans left after overlap resolution.
         """
         if is_color_disabled() or not text or not self._highlighters:
-            return FormattedText([("", text)])
-
-        # Apply depth limiting
-        truncated = False
-        if len(text) > self._max_length:
-            process_text = text[: self._max_length]
-            truncated = True
-        else:
-            process_text = text
-
-        # Collect all matches from all highlighters
-        all_matches = self._collect_matches(process_text, theme)
-        if not all_matches:
-            return FormattedText([("", text)])
-
-        # Apply overlap prevention and build output
-        result = _build_formatted_text_with_tracker(process_text, all_matches, theme)
+            return HighlightSpans(text, ())
 
-        # Append truncated portion if needed
-        if truncated:
-            result = FormattedText(list(result) + [("", text[self._max_length :])])
+        profile = self._profile
+        recording = profile is not None and profile.recording
+        results = self._results
+        if not recording:
+            cached = results.pop(text, None)
+            if cached is not None:
+                results[text] = cached
+                return cached
 
+        # Apply depth limiting (FR-006, FR-012)
+        process_text = text[: self._max_length]
+        if recording:
+            by_highlighter = self._collect_layers(process_text, theme)
+            kept = _resolve_overlaps(self._ordered_matches(by_highlighter), len(process_text))
+            self._count_matches(by_highlighter, kept)
+        else:
+            kept = _resolve_overlaps(self._collect_matches(process_text, theme), len(process_text))
+
+        result = HighlightSpans(text, tuple((start, end, style) for start, end, style, _ in kept))
+        # Texts past the depth limit are not kept, so the cache stays within
+        # cache_size * max_length characters and never outlives a large entry
+        if self._cache_size and len(text) <= self._max_length:
+            results[text] = result
+            if len(results) > self._cache_size:
+                del results[next(iter(results))]
         return result
 
-    def apply_rich_text(self, text: str, theme: Theme) -> Text:
-        """Apply all highlighters for Rich/Textual.
+    def apply(self, text: str, theme: Theme) -> FormattedText:
+        """Apply all highlighters for prompt_toolkit.
 
         Args:
             text: Input text to highlight.
             theme: Current theme for style lookups.
 
         Returns:
-            Rich Text with literal content and style spans.
+            FormattedText for prompt_toolkit rendering.
         """
-        if is_color_disabled() or not text or not self._highlighters:
-            return Text(text)
-
-        # Apply depth limiting (FR-006, FR-012)
-        truncated = False
-        if len(text) > self._max_length:
-            process_text = text[: self._max_length]
-            truncated = True
-        else:
-            process_text = text
-
-        # Collect all matches from all highlighters
-        all_matches = self._collect_matches(process_text, theme)
-        if not all_matches:
-            return Text(text)
+        return self.highlight(text, theme).to_formatted_text(theme)
 
-        # Apply overlap prevention and build output
-        result = _build_rich_text_with_tracker(process_text, all_matches, theme)
+    def apply_rich_text(self, text: str, theme: Theme | None) -> Text:
+        """Apply all highlighters for Rich/Textual.
 
-        # Append truncated portion if needed
-        if truncated:
-            result.append(text[self._max_length :])
+        Args:
+            text: Input text to highlight.
+            theme: Current theme for style lookups, or None to leave span
+                styles as ThemeKey values for a StyleTable to resolve.
 
-        return result
+        Returns:
+            Rich Text with literal content and style spans.
+        """
+        return self.highlight(text, theme).to_rich_text(theme)
 
-    def _collect_matches(self, text: str, theme: Theme) -> list[tuple[int, int, str, int]]:
+    def _collect_matches(self, text: str, theme: Theme | None) -> list[tuple[int, int, str, int]]:
         """Collect all matches from all highlighters.
 
         SQL highlighters (names starting with "sql_") are only applied
@@ -845,40 +1374,315 @@ class HighlighterChain:
 
         Args:
             text: Text to search.
-            theme: Current theme.
+            theme: Current theme. Highlighters match independently of it.
 
         Returns:
             List of (start, end, style, priority) tuples.
         """
-        from pgtail_py.highlighters.sql import detect_sql_content
+        profile = self._profile
+        if (
+            self._layers is not None
+            or self._keywords is not None
+            or (profile is not None and profile.active)
+        ):
+            return self._ordered_matches(self._collect_layers(text, theme))
 
         all_matches: list[tuple[int, int, str, int]] = []
-        append = all_matches.append  # Avoid attribute lookup in inner loop
 
         # Process non-SQL highlighters first (they always run)
         for h in self._get_non_sql_highlighters():
-            pri = h.priority  # Cache property outside inner loop
-            for m in h.find_matches(text, theme):
-                append((m.start, m.end, m.style, pri))
+            all_matches.extend(_find_spans(h, text, theme))
 
-        # Detect SQL context - SQL highlighters only apply within SQL region
+        # SQL highlighters only apply within the detected SQL region
         sql_highlighters = self._get_sql_highlighters()
         if sql_highlighters:
-            sql_result = detect_sql_content(text)
-            if sql_result is not None:
-                # SQL detected - apply SQL highlighters within the SQL region
-                sql_start = len(sql_result.prefix)
-                sql_end = sql_start + len(sql_result.sql)
+            for layer in _scan_sql_region(text, theme, sql_highlighters).values():
+                all_matches.extend(layer)
 
-                for h in sql_highlighters:
-                    pri = h.priority
-                    for m in h.find_matches(text, theme):
-                        # Only include matches within SQL context
-                        if m.start >= sql_start and m.end <= sql_end:
-                            append((m.start, m.end, m.style, pri))
+        return all_matches
 
+    def _collect_layers(self, text: str, theme: Theme | None) -> dict[Highlighter, _Layer]:
+        """Collect each highlighter's matches, from cached layers where possible.
+
+        Args:
+            text: Text to search.
+            theme: Current theme. Highlighters match independently of it.
+
+        Returns:
+            Layers by highlighter, including those of every highlighter in
+            the chain; cached layers may hold others too.
+        """
+        by_highlighter: dict[Highlighter, _Layer] = {}
+        layers = self._layers
+        if layers is None:
+            self._scan_layers(text, theme, self.highlighters, by_highlighter)
+            return by_highlighter
+        templated, exact = self._get_layer_groups()
+        if templated:
+            key = text.translate(_TEMPLATE_DIGITS)
+            by_highlighter.update(
+                self._cached_layers(key, text, theme, templated, layers, count=True)
+            )
+        if exact:
+            by_highlighter.update(self._cached_layers(text, text, theme, exact, layers))
+        return by_highlighter
+
+    def _ordered_matches(
+        self, by_highlighter: dict[Highlighter, _Layer]
+    ) -> list[tuple[int, int, str, int]]:
+        """Concatenate the layers of the chain's highlighters in scan order.
+
+        Args:
+            by_highlighter: Layers by highlighter; others are ignored.
+
+        Returns:
+            List of (start, end, style, priority) tuples, non-SQL
+            highlighters first, each group by priority.
+        """
+        all_matches: list[tuple[int, int, str, int]] = []
+        for h in self._get_non_sql_highlighters():
+            layer = by_highlighter.get(h)
+            if layer:
+                all_matches.extend(layer)
+        for h in self._get_sql_highlighters():
+            layer = by_highlighter.get(h)
+            if layer:
+                all_matches.extend(layer)
         return all_matches
 
+    def _cached_layers(
+        self,
+        key: str,
+        text: str,
+        theme: Theme | None,
+        highlighters: frozenset[Highlighter],
+        layers: SpanLayers,
+        count: bool = False,
+    ) -> dict[Highlighter, _Layer]:
+        """Look up layers under a key, scanning the text with highlighters not cached.
+
+        Args:
+            key: Cache key, the text itself or its template key.
+            text: Text to scan on a miss.
+            theme: Current theme.
+            highlighters: Highlighters whose layers are needed.
+            layers: Per-highlighter match cache.
+            count: Add the lookup to the cache's hit and miss counts.
+
+        Returns:
+            Cached layers under the key, including those of ``highlighters``.
+        """
+        cached = layers.get(key)
+        if cached is None:
+            scanned, by_highlighter = frozenset(), {}
+        else:
+            scanned, by_highlighter = cached
+        if highlighters <= scanned:
+            if count:
+                layers.hits += 1
+            return by_highlighter
+        if count:
+            layers.misses += 1
+        self._scan_layers(text, theme, highlighters - scanned, by_highlighter)
+        layers.set(key, highlighters if not scanned else scanned | highlighters, by_highlighter)
+        return by_highlighter
+
+    def _scan_layers(
+        self,
+        text: str,
+        theme: Theme | None,
+        highlighters: Iterable[Highlighter],
+        by_highlighter: dict[Highlighter, _Layer],
+    ) -> None:
+        """Scan a text with some highlighters, storing each one's matches.
+
+        SQL highlighter matches are limited to the detected SQL region, as
+        in ``_collect_matches``. Keyword highlighters in the chain's
+        KeywordIndex are matched together in one pass. With an active
+        profile, each scan is timed; shared passes are split evenly.
+
+        Args:
+            text: Text to search.
+            theme: Current theme.
+            highlighters: Highlighters to run.
+            by_highlighter: Layers to add non-empty results to.
+        """
+        profile = self._profile
+        if profile is not None and not profile.active:
+            profile = None
+        keywords = self._keywords
+        sql_highlighters: list[Highlighter] = []
+        keyword_highlighters: list[Highlighter] = []
+        for h in highlighters:
+            if h.name.startswith("sql_"):
+                sql_highlighters.append(h)
+                continue
+            if keywords is not None and h in keywords:
+                keyword_highlighters.append(h)
+                continue
+            if profile is None:
+                layer = _find_spans(h, text, theme)
+            else:
+                started = perf_counter_ns()
+                layer = _find_spans(h, text, theme)
+                profile.record(h.name, perf_counter_ns() - started)
+            if layer:
+                by_highlighter[h] = layer
+        if keyword_highlighters:
+            assert keywords is not None
+            if profile is None:
+                by_highlighter.update(keywords.scan(text, keyword_highlighters))
+            else:
+                started = perf_counter_ns()
+                keyword_layers = keywords.scan(text, keyword_highlighters)
+                share = (perf_counter_ns() - started) // len(keyword_highlighters)
+                for h in keyword_highlighters:
+                    profile.record(h.name, share)
+                by_highlighter.update(keyword_layers)
+        if sql_highlighters:
+            if profile is None:
+                by_highlighter.update(_scan_sql_region(text, theme, sql_highlighters))
+            else:
+                started = perf_counter_ns()
+                sql_layers = _scan_sql_region(text, theme, sql_highlighters)
+                share = (perf_counter_ns() - started) // len(sql_highlighters)
+                for h in sql_highlighters:
+                    profile.record(h.name, share)
+                by_highlighter.update(sql_layers)
+        if profile is not None and profile.generation != self._profile_generation:
+            self._drop_over_budget(profile)
+
+    def _drop_over_budget(self, profile: HighlighterProfile) -> None:
+        """Unregister highlighters the profile has put over budget.
+
+        Args:
+            profile: The chain's profile.
+        """
+        self._profile_generation = profile.generation
+        over_budget = [name for name in profile.over_budget if name in self._highlighters]
+        for name in over_budget:
+            del self._highlighters[name]
+        if over_budget:
+            self._invalidate_cache()
+
+    def _count_matches(
+        self, by_highlighter: dict[Highlighter, _Layer], kept: list[tuple[int, int, str, int]]
+    ) -> None:
+        """Add a line's match and discard counts to the profile.
+
+        Matches are attributed by the layer they came from, so highlighters
+        sharing a priority are counted apart.
+
+        Args:
+            by_highlighter: The line's layers by highlighter.
+            kept: Matches left after overlap resolution.
+        """
+        profile = self._profile
+        if profile is None:
+            return
+        kept_ids = {id(m) for m in kept}
+        for h in self.highlighters:
+            layer = by_highlighter.get(h)
+            if layer:
+                discarded = sum(1 for m in layer if id(m) not in kept_ids)
+                profile.count(h.name, len(layer), discarded)
+
+
+# Whether each highlighter class is run through find_spans (see _find_spans)
+_uses_find_spans: dict[type, bool] = {}
+
+
+def _prefers_find_spans(cls: type) -> bool:
+    """Check whether a class's most derived match method is ``find_spans``.
+
+    Args:
+        cls: Highlighter class.
+
+    Returns:
+        True if ``find_spans`` is defined on the class or a base no further
+        up than the nearest ``find_matches``.
+    """
+    for klass in cls.__mro__:
+        attributes = vars(klass)
+        if "find_spans" in attributes:
+            return True
+        if "find_matches" in attributes:
+            return False
+    return False
+
+
+def _find_spans(highlighter: Highlighter, text: str, theme: Theme | None) -> _Layer:
+    """Return a highlighter's matches as span tuples.
+
+    Uses the highlighter's ``find_spans`` if it has one, so no Match or
+    matched-text copy is made per match. A subclass that overrides only
+    ``find_matches`` below a ``find_spans`` is run through the override.
+
+    Args:
+        highlighter: Highlighter to run.
+        text: Text to search.
+        theme: Current theme, for highlighters with only ``find_matches``.
+
+    Returns:
+        (start, end, style, priority) tuples.
+    """
+    cls = type(highlighter)
+    uses_spans = _uses_find_spans.get(cls)
+    if uses_spans is None:
+        uses_spans = _uses_find_spans[cls] = _prefers_find_spans(cls)
+    if uses_spans:
+        return highlighter.find_spans(text)  # type: ignore[attr-defined]
+    priority = highlighter.priority
+    return [
+        (m.start, m.end, m.style, priority)
+        for m in highlighter.find_matches(text, theme)  # type: ignore[arg-type]
+    ]
+
+
+def _scan_sql_region(
+    text: str, theme: Theme | None, highlighters: list[Highlighter]
+) -> dict[Highlighter, _Layer]:
+    """Match SQL highlighters within the SQL detected in a text.
+
+    SQL highlighters are only applied within detected SQL contexts to avoid
+    highlighting common English words like "for", "with", "at" that happen
+    to be SQL keywords. The SQL is lexed once with SQLTokenizer, and
+    highlighters with a TOKEN_TYPE take their matches from that pass.
+    Others run ``find_matches`` over the text, keeping matches inside the
+    SQL.
+
+    Args:
+        text: Text to search.
+        theme: Current theme.
+        highlighters: SQL highlighters, in the order to return their layers.
+
+    Returns:
+        Non-empty layers by highlighter.
+    """
+    from pgtail_py.highlighters.sql import SQLTokenizer, detect_sql_content
+
+    sql_result = detect_sql_content(text)
+    if sql_result is None:
+        return {}
+    lo = len(sql_result.prefix)
+    hi = lo + len(sql_result.sql)
+
+    token_spans = None
+    by_highlighter: dict[Highlighter, _Layer] = {}
+    for h in highlighters:
+        pri = h.priority
+        token_type = getattr(h, "TOKEN_TYPE", None)
+        if token_type is not None:
+            if token_spans is None:
+                token_spans = SQLTokenizer().token_spans(text, lo, hi)
+            style = h.TOKEN_STYLE  # type: ignore[attr-defined]
+            layer = [(start, end, style, pri) for start, end in token_spans.get(token_type, ())]
+        else:
+            layer = [m for m in _find_spans(h, text, theme) if m[0] >= lo and m[1] <= hi]
+        if layer:
+            by_highlighter[h] = layer
+    return by_highlighter
+
 
 # =============================================================================
 # Helper Functions for Building Output
@@ -916,15 +1720,8 @@ def _convert_ansi_color_to_rich(color: str) -> str:
     return color
 
 
-# Style cache to avoid repeated theme lookups
-# Key: (theme_name, style_key), Value: rich_style_string
-_rich_style_cache: dict[tuple[str, str], str] = {}
-
-
-def _get_rich_style(theme: Theme, style_key: str) -> str:
-    """Convert theme style key to Rich markup style.
-
-    Uses caching to avoid repeated theme lookups.
+def _rich_style_string(theme: Theme, style_key: str) -> str:
+    """Convert a theme style key to a Rich style string.
 
     Args:
         theme: Theme to look up style in.
@@ -933,16 +1730,10 @@ def _get_rich_style(theme: Theme, style_key: str) -> str:
     Returns:
         Rich style string (e.g., "bold red") or empty string for default.
     """
-    cache_key = (theme.name, style_key)
-    cached = _rich_style_cache.get(cache_key)
-    if cached is not None:
-        return cached
-
     color_style = theme.get_style(style_key)
     if color_style is None:
         # Not a theme key - treat as literal color/style for custom highlighters
         # Rich accepts colors like "magenta", "bold red", "#ff00ff"
-        _rich_style_cache[cache_key] = style_key
         return style_key
 
     parts: list[str] = []
@@ -958,21 +1749,140 @@ def _get_rich_style(theme: Theme, style_key: str) -> str:
         parts.append("italic")
     if color_style.underline:
         parts.append("underline")
+    return " ".join(parts)
 
-    result = " ".join(parts)
-    _rich_style_cache[cache_key] = result
-    return result
 
+def _prompt_toolkit_style_string(theme: Theme, style_key: str) -> str:
+    """Convert a theme style key to a prompt_toolkit style string.
 
-# Cache for prompt_toolkit style lookups
-_prompt_toolkit_style_cache: dict[tuple[str, str], str] = {}
+    Args:
+        theme: Theme to look up style in.
+        style_key: Style key (e.g., "hl_timestamp_date") or literal color (e.g., "magenta").
+
+    Returns:
+        Style class string (e.g., "class:hl_timestamp_date") or inline style (e.g., "fg:magenta").
+    """
+    if theme.get_style(style_key) is not None:
+        return f"class:{style_key}"
+
+    # Not a theme key - treat as literal color/style for custom highlighters
+    # prompt_toolkit uses "fg:color" format for foreground colors
+    # Support formats: "magenta", "bold magenta", "#ff00ff", "bold #ff00ff"
+    result_parts: list[str] = []
+    for part in style_key.split():
+        if part in ("bold", "italic", "underline"):
+            result_parts.append(part)
+        elif part.startswith("#") or part.startswith("ansi"):
+            # Hex color or ansi color
+            result_parts.append(f"fg:{part}")
+        else:
+            # Named color like "magenta", "red", etc.
+            result_parts.append(f"fg:ansi{part}")
+    return " ".join(result_parts)
+
+
+class StyleTable(dict[str, Style]):
+    """Pre-parsed styles for the style keys of one theme.
+
+    Maps style keys (theme keys such as ThemeKey span styles, or literal
+    styles of custom highlighters) to parsed Rich ``Style`` objects, so
+    spans built from it are never parsed again when drawn. Every key the
+    theme defines is compiled when the table is built; literal styles are
+    parsed once on first use. A key that is neither a theme key nor a valid
+    Rich style maps to the null style. The table also holds the matching
+    prompt_toolkit style strings.
+    """
+
+    def __init__(self, theme: Theme) -> None:
+        """Compile the theme's styles.
+
+        Args:
+            theme: Theme whose styles the table holds.
+        """
+        super().__init__()
+        self.theme = theme
+        self._markup: dict[str, str] = {}
+        self._prompt_toolkit: dict[str, str] = {}
+        for key in theme.ui:
+            self[key] = self._parse(key)
+
+    def __missing__(self, key: str) -> Style:
+        style = self[key] = self._parse(key)
+        return style
+
+    def _parse(self, key: str) -> Style:
+        """Parse the Rich style of a key, falling back to the null style."""
+        try:
+            return Style.parse(self.markup(key))
+        except StyleSyntaxError:
+            return Style.null()
+
+    def markup(self, key: str) -> str:
+        """Get the Rich style string of a key.
+
+        Args:
+            key: Style key or literal style.
+
+        Returns:
+            Rich style string, empty for the default style.
+        """
+        markup = self._markup.get(key)
+        if markup is None:
+            markup = self._markup[key] = _rich_style_string(self.theme, key)
+        return markup
+
+    def prompt_toolkit(self, key: str) -> str:
+        """Get the prompt_toolkit style string of a key.
+
+        Args:
+            key: Style key or literal style.
+
+        Returns:
+            Style class string or inline prompt_toolkit style.
+        """
+        style = self._prompt_toolkit.get(key)
+        if style is None:
+            style = self._prompt_toolkit[key] = _prompt_toolkit_style_string(self.theme, key)
+        return style
+
+    def resolve(self, text: Text) -> None:
+        """Replace ThemeKey span styles of a Text in place.
+
+        Args:
+            text: Text whose spans to resolve.
+        """
+        text.spans = [
+            Span(span.start, span.end, self[span.style])
+            if isinstance(span.style, ThemeKey)
+            else span
+            for span in text.spans
+        ]
+
+
+# Style tables by theme name
+_style_tables: dict[str, StyleTable] = {}
+
+
+def get_style_table(theme: Theme) -> StyleTable:
+    """Get the shared StyleTable for a theme.
+
+    A theme reloaded under the same name gets a new table.
+
+    Args:
+        theme: Theme to resolve styles with.
+
+    Returns:
+        StyleTable cached by theme name.
+    """
+    table = _style_tables.get(theme.name)
+    if table is None or table.theme is not theme:
+        table = _style_tables[theme.name] = StyleTable(theme)
+    return table
 
 
 def _get_prompt_toolkit_style(theme: Theme, style_key: str) -> str:
     """Convert theme style key to prompt_toolkit style class.
 
-    Uses caching to avoid repeated lookups.
-
     Args:
         theme: Theme to look up style in.
         style_key: Style key (e.g., "hl_timestamp_date") or literal color (e.g., "magenta").
@@ -980,38 +1890,7 @@ def _get_prompt_toolkit_style(theme: Theme, style_key: str) -> str:
     Returns:
         Style class string (e.g., "class:hl_timestamp_date") or inline style (e.g., "fg:magenta").
     """
-    cache_key = (theme.name, style_key)
-    cached = _prompt_toolkit_style_cache.get(cache_key)
-    if cached is not None:
-        return cached
-
-    color_style = theme.get_style(style_key)
-    if color_style is None:
-        # Not a theme key - treat as literal color/style for custom highlighters
-        # prompt_toolkit uses "fg:color" format for foreground colors
-        # Support formats: "magenta", "bold magenta", "#ff00ff", "bold #ff00ff"
-        parts = style_key.split()
-        result_parts: list[str] = []
-        for part in parts:
-            if part == "bold":
-                result_parts.append("bold")
-            elif part == "italic":
-                result_parts.append("italic")
-            elif part == "underline":
-                result_parts.append("underline")
-            elif part.startswith("#") or part.startswith("ansi"):
-                # Hex color or ansi color
-                result_parts.append(f"fg:{part}")
-            else:
-                # Named color like "magenta", "red", etc.
-                result_parts.append(f"fg:ansi{part}")
-        result = " ".join(result_parts)
-        _prompt_toolkit_style_cache[cache_key] = result
-        return result
-
-    result = f"class:{style_key}"
-    _prompt_toolkit_style_cache[cache_key] = result
-    return result
+    return get_style_table(theme).prompt_toolkit(style_key)
 
 
 def _build_formatted_text(text: str, matches: list[Match], theme: Theme) -> FormattedText:
@@ -1076,6 +1955,7 @@ def _build_rich_text(text: str, matches: list[Match], theme: Theme) -> Text:
     # Sort by start position
     sorted_matches = sorted(matches, key=lambda m: m.start)
 
+    styles = get_style_table(theme)
     result = Text()
     pos = 0
 
@@ -1089,7 +1969,7 @@ def _build_rich_text(text: str, matches: list[Match], theme: Theme) -> Text:
             result.append(text[pos : m.start])
 
         # Add styled match
-        style = _get_rich_style(theme, m.style)
+        style = styles[m.style]
         if style:
             result.append(text[m.start : m.end], style=style)
         else:
@@ -1103,103 +1983,140 @@ def _build_rich_text(text: str, matches: list[Match], theme: Theme) -> Text:
     return result
 
 
-def _build_formatted_text_with_tracker(
-    text: str,
+# Sort key putting matches in text order, higher priority first on a tie
+_START_THEN_PRIORITY = itemgetter(0, 3)
+
+
+def _resolve_overlaps(
     matches: list[tuple[int, int, str, int]],
-    theme: Theme,
-) -> FormattedText:
-    """Build FormattedText with OccupancyTracker for overlap prevention.
+    text_len: int,
+) -> list[tuple[int, int, str, int]]:
+    """Keep the matches that win their overlaps, in text order.
+
+    Matches are sorted by start position, then priority (lower wins on a
+    tie), and swept once. Kept matches never overlap and come in start
+    order, so a match is free exactly when it starts at or after the end
+    of the last one kept.
 
     Args:
-        text: Original text.
-        matches: List of (start, end, style, priority) tuples.
-        theme: Current theme.
+        matches: (start, end, style, priority) tuples; sorted in place.
+        text_len: Length of the text, bounding valid matches.
 
     Returns:
-        FormattedText for prompt_toolkit.
+        Kept matches in start order.
     """
-    if not matches:
-        return FormattedText([("", text)])
+    matches.sort(key=_START_THEN_PRIORITY)
+    kept: list[tuple[int, int, str, int]] = []
+    append = kept.append
+    pos = 0
+    for match in matches:
+        start, end = match[0], match[1]
+        if pos <= start < end <= text_len:
+            append(match)
+            pos = end
+    return kept
 
-    # Sort by start position, then by priority (lower priority wins on tie)
-    # Use in-place sort for performance
-    matches.sort(key=lambda m: (m[0], m[3]))
 
-    # Apply overlap prevention and build output in single pass
-    # Since matches are already sorted by start position, accepted matches
-    # will also be in sorted order - no need for second sort
-    tracker = OccupancyTracker(len(text))
-    result: list[tuple[str, str]] = []
-    pos = 0
+class HighlightSpans(NamedTuple):
+    """Renderer-neutral highlighting of one text.
+
+    Holds the non-overlapping spans left after priority resolution, as
+    (start, end, style key) in text order. Style keys are resolved only by
+    the adapters, so one result serves prompt_toolkit, Rich and ANSI output
+    under any theme.
+
+    Attributes:
+        text: The highlighted text.
+        spans: (start, end, style key) tuples in text order.
+    """
+
+    text: str
+    spans: tuple[tuple[int, int, str], ...]
 
-    for start, end, style, _priority in matches:
-        if tracker.is_available(start, end):
-            tracker.mark_occupied(start, end)
+    def to_formatted_text(self, theme: Theme) -> FormattedText:
+        """Build FormattedText for prompt_toolkit.
+
+        Args:
+            theme: Theme resolving style keys to style classes.
+
+        Returns:
+            FormattedText covering the whole text.
+        """
+        text = self.text
+        if not self.spans:
+            return FormattedText([("", text)])
+
+        styles = get_style_table(theme)
+        result: list[tuple[str, str]] = []
+        pos = 0
+        for start, end, style in self.spans:
             # Output unstyled text before this match
             if pos < start:
                 result.append(("", text[pos:start]))
             # Output styled match
-            style_class = _get_prompt_toolkit_style(theme, style)
-            result.append((style_class, text[start:end]))
+            result.append((styles.prompt_toolkit(style), text[start:end]))
             pos = end
+        if pos < len(text):
+            result.append(("", text[pos:]))
+        return FormattedText(result)
 
-    if pos < len(text):
-        result.append(("", text[pos:]))
-
-    return FormattedText(result)
+    def to_rich_text(self, theme: Theme | None) -> Text:
+        """Build Rich Text over the unsplit text, without a substring per span.
 
+        Args:
+            theme: Theme whose pre-parsed styles to use, or None to emit
+                ThemeKey span styles for a StyleTable to resolve.
 
-def _build_rich_text_with_tracker(
-    text: str,
-    matches: list[tuple[int, int, str, int]],
-    theme: Theme,
-) -> Text:
-    """Build Rich Text with OccupancyTracker for overlap prevention.
+        Returns:
+            Rich Text with literal content and style spans.
+        """
+        text = self.text
+        if not self.spans:
+            return Text(text)
 
-    Args:
-        text: Original text.
-        matches: List of (start, end, style, priority) tuples.
-        theme: Current theme.
+        # Pre-parsed styles for the theme, or shared ThemeKeys resolved when drawn
+        lookup: Callable[[str], Style | ThemeKey] = (
+            get_style_table(theme).__getitem__ if theme is not None else _theme_key
+        )
+        spans: list[Span] = []
+        append = spans.append
+        for start, end, style in self.spans:
+            rich_style = lookup(style)
+            if rich_style:
+                append(Span(start, end, rich_style))
+
+        result = Text(text, spans=spans)
+        if len(result) != len(text):
+            # Rich dropped control characters, shifting the text under the spans
+            result = Text()
+            pos = 0
+            for start, end, rich_style in spans:
+                result.append(text[pos:start])
+                result.append(text[start:end], style=rich_style)
+                pos = end
+            result.append(text[pos:])
+        return result
 
-    Returns:
-        Rich Text with literal content and style spans.
-    """
-    if not matches:
-        return Text(text)
+    def to_ansi(self, theme: Theme, color_system: ColorSystem = ColorSystem.TRUECOLOR) -> str:
+        """Build a string with ANSI escape sequences, e.g. for a terminal or file.
 
-    # Sort by start position, then by priority (lower priority wins on tie)
-    # Use in-place sort for performance
-    matches.sort(key=lambda m: (m[0], m[3]))
-
-    # Apply overlap prevention and build output in single pass
-    # Since matches are already sorted by start position, accepted matches
-    # will also be in sorted order - no need for second sort
-    text_len = len(text)
-    tracker = OccupancyTracker(text_len)
-    is_available = tracker.is_available  # Avoid attribute lookup in loop
-    mark_occupied = tracker.mark_occupied
-    result = Text()
-    append = result.append
-    pos = 0
+        Args:
+            theme: Theme whose pre-parsed styles to use.
+            color_system: Colors the escape sequences may use.
 
-    for start, end, style, _priority in matches:
-        if is_available(start, end):
-            mark_occupied(start, end)
-            # Output unhighlighted text before this match
-            if pos < start:
-                append(text[pos:start])
-            # Output highlighted match
-            rich_style = _get_rich_style(theme, style)
-            if rich_style:
-                append(text[start:end], style=rich_style)
-            else:
-                append(text[start:end])
+        Returns:
+            The text with each span wrapped in its style's escape sequences.
+        """
+        text = self.text
+        styles = get_style_table(theme)
+        parts: list[str] = []
+        pos = 0
+        for start, end, style in self.spans:
+            parts.append(text[pos:start])
+            parts.append(styles[style].render(text[start:end], color_system=color_system))
             pos = end
-
-    if pos < text_len:
-        append(text[pos:])
-
-    return result
+        parts.append(text[pos:])
+        return "".join(parts)
 
 
 # =============================================================================
@@ -1258,6 +2175,9 @@ def validate_custom_pattern(pattern: str) -> tuple[bool, str | None]:
     1. Pattern is valid regex
     2. Pattern does not match zero-length strings
 
+    Nested quantifiers are not rejected here; callers warn about them with
+    ``has_nested_quantifier``.
+
     Args:
         pattern: Regex pattern to validate.
 
@@ -4,15 +4,28 @@ Provides:
 - Singleton registry for built-in and custom highlighters
 - Category-based organization
 - Factory method to create HighlighterChain from HighlightingConfig
+- SpanLayers shared by the chains it creates, so reconfigured chains reuse
+  the matches of highlighters they have in common
+- HighlighterProfile shared by the same chains, so per-highlighter cost
+  counters survive reconfiguration
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pgtail_py.highlighter import Highlighter, HighlighterChain
+from pgtail_py.highlighter import (
+    Highlighter,
+    HighlighterChain,
+    HighlighterProfile,
+    KeywordIndex,
+    SpanLayers,
+    uses_base_keyword_scan,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from pgtail_py.highlighting_config import HighlightingConfig
 
 
@@ -45,8 +58,41 @@ class HighlighterRegistry:
         self._highlighters: dict[str, Highlighter] = {}
         self._categories: dict[str, list[str]] = {}
         self._highlighter_categories: dict[str, str] = {}
+        # Match cache shared by created chains, and the configured highlighter
+        # instances (duration thresholds, custom patterns) it is keyed by
+        self._span_layers = SpanLayers()
+        self._configured: dict[tuple[object, ...], Highlighter] = {}
+        self._profile = HighlighterProfile()
+        # Merged automaton over the registered keyword highlighters, built on
+        # first use after the registrations change
+        self._keyword_index: KeywordIndex | None = None
         self._initialized = True
 
+    @property
+    def span_layers(self) -> SpanLayers:
+        """Match cache shared by the chains this registry creates."""
+        return self._span_layers
+
+    @property
+    def keyword_index(self) -> KeywordIndex:
+        """Merged keyword automaton shared by the chains this registry creates.
+
+        Covers every registered keyword highlighter outside SQL (those are
+        matched by the SQL lexer) that does not override its scan.
+        """
+        if self._keyword_index is None:
+            self._keyword_index = KeywordIndex(
+                h  # type: ignore[misc]
+                for name, h in self._highlighters.items()
+                if not name.startswith("sql_") and uses_base_keyword_scan(h)
+            )
+        return self._keyword_index
+
+    @property
+    def profile(self) -> HighlighterProfile:
+        """Per-highlighter cost counters shared by the chains this registry creates."""
+        return self._profile
+
     def register(
         self,
         highlighter: Highlighter,
@@ -78,6 +124,7 @@ class HighlighterRegistry:
         # Register highlighter
         self._highlighters[name] = highlighter
         self._highlighter_categories[name] = category
+        self._keyword_index = None
 
         # Add to category
         if category not in self._categories:
@@ -105,6 +152,7 @@ class HighlighterRegistry:
         # Remove highlighter
         del self._highlighters[name]
         del self._highlighter_categories[name]
+        self._keyword_index = None
 
     def get(self, name: str) -> Highlighter | None:
         """Get a highlighter by name.
@@ -164,8 +212,14 @@ class HighlighterRegistry:
         self._highlighters.clear()
         self._categories.clear()
         self._highlighter_categories.clear()
-
-    def create_chain(self, config: HighlightingConfig) -> HighlighterChain:
+        self._span_layers.clear()
+        self._configured.clear()
+        self._profile.clear()
+        self._keyword_index = None
+
+    def create_chain(
+        self, config: HighlightingConfig, categories: Collection[str] | None = None
+    ) -> HighlighterChain:
         """Create a HighlighterChain from configuration.
 
         Filters highlighters based on enabled/disabled state in config.
@@ -173,9 +227,15 @@ class HighlighterRegistry:
 
         For DurationHighlighter, creates a new instance with config thresholds
         so that user-configured duration.slow/very_slow/critical are respected.
+        Configured instances are reused while their settings are unchanged,
+        so the chain's cached match layers (see SpanLayers) stay valid.
+        Highlighters the shared profile has put over its time budget are
+        left out.
 
         Args:
             config: Highlighting configuration.
+            categories: Only include built-in highlighters in these
+                categories, and no custom highlighters. None for all.
 
         Returns:
             HighlighterChain with enabled highlighters.
@@ -186,36 +246,54 @@ class HighlighterRegistry:
         # Collect enabled built-in highlighters
         enabled_highlighters: list[Highlighter] = []
 
+        over_budget = self._profile.over_budget
         for name, highlighter in self._highlighters.items():
-            if config.is_highlighter_enabled(name):
+            if categories is not None and self._highlighter_categories[name] not in categories:
+                continue
+            if config.is_highlighter_enabled(name) and name not in over_budget:
                 # For duration highlighter, create a new instance with config thresholds
                 if name == "duration":
-                    highlighter = DurationHighlighter(
-                        slow=config.duration_slow,
-                        very_slow=config.duration_very_slow,
-                        critical=config.duration_critical,
+                    key = (
+                        name,
+                        config.duration_slow,
+                        config.duration_very_slow,
+                        config.duration_critical,
                     )
+                    if key not in self._configured:
+                        self._configured[key] = DurationHighlighter(
+                            slow=config.duration_slow,
+                            very_slow=config.duration_very_slow,
+                            critical=config.duration_critical,
+                        )
+                    highlighter = self._configured[key]
                 enabled_highlighters.append(highlighter)
 
         # Add custom highlighters from config (priority 1050+)
-        for custom in config.custom_highlighters:
-            if custom.enabled:
-                try:
-                    custom_highlighter = CustomRegexHighlighter(
-                        name=custom.name,
-                        priority=custom.priority,
-                        pattern=custom.pattern,
-                        style=custom.style,
-                        description=f"Custom pattern: {custom.pattern}",
-                    )
-                    enabled_highlighters.append(custom_highlighter)
-                except ValueError:
-                    # Invalid custom pattern - skip silently
-                    pass
+        for custom in config.custom_highlighters if categories is None else ():
+            if custom.enabled and custom.name not in over_budget:
+                key = ("custom", custom.name, custom.priority, custom.pattern, custom.style)
+                custom_highlighter = self._configured.get(key)
+                if custom_highlighter is None:
+                    try:
+                        custom_highlighter = CustomRegexHighlighter(
+                            name=custom.name,
+                            priority=custom.priority,
+                            pattern=custom.pattern,
+                            style=custom.style,
+                            description=f"Custom pattern: {custom.pattern}",
+                        )
+                    except ValueError:
+                        # Invalid custom pattern - skip silently
+                        continue
+                    self._configured[key] = custom_highlighter
+                enabled_highlighters.append(custom_highlighter)
 
         return HighlighterChain(
             highlighters=enabled_highlighters,
             max_length=config.max_length,
+            layers=self._span_layers,
+            profile=self._profile,
+            keywords=self.keyword_index,
         )
 
 
@@ -9,13 +9,9 @@ Highlighters in this module:
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
-
-from pgtail_py.highlighter import KeywordHighlighter, Match, RegexHighlighter
-
-if TYPE_CHECKING:
-    from pgtail_py.theme import Theme
+from typing import ClassVar
 
+from pgtail_py.highlighter import KeywordHighlighter, RegexHighlighter
 
 # =============================================================================
 # ConnectionHighlighter
@@ -36,6 +32,9 @@ class ConnectionHighlighter(RegexHighlighter):
     # Pattern: key=value pairs for connection info
     PATTERN = r'\b(host|port|user|database|application_name)=("[^"]*"|[^\s,]+)'
 
+    # find_matches() picks the style by field name, not by value
+    DIGIT_INVARIANT: ClassVar[bool] = True
+
     def __init__(self) -> None:
         """Initialize connection highlighter."""
         super().__init__(
@@ -43,27 +42,27 @@ class ConnectionHighlighter(RegexHighlighter):
             priority=600,
             pattern=self.PATTERN,
             style="hl_connection",
+            flags=re.IGNORECASE,
+            first_chars="hpuda",
         )
-        self._extract_pattern = re.compile(self.PATTERN, re.IGNORECASE)
 
     @property
     def description(self) -> str:
         """Return human-readable description."""
         return "Connection info (host, port, user, database)"
 
-    def find_matches(self, text: str, theme: Theme) -> list[Match]:
+    def find_spans(self, text: str) -> list[tuple[int, int, str, int]]:
         """Find all connection info matches with specific styling per field.
 
         Args:
             text: Input text to search.
-            theme: Current theme (unused).
 
         Returns:
-            List of Match objects with field-specific styles.
+            (start, end, style, priority) tuples with field-specific styles.
         """
-        matches: list[Match] = []
+        spans: list[tuple[int, int, str, int]] = []
 
-        for m in self._extract_pattern.finditer(text):
+        for m in self._pattern.finditer(text):
             field = m.group(1).lower()
 
             # Map field to specific style
@@ -77,16 +76,9 @@ class ConnectionHighlighter(RegexHighlighter):
 
             style = style_map.get(field, "hl_connection")
 
-            matches.append(
-                Match(
-                    start=m.start(),
-                    end=m.end(),
-                    style=style,
-                    text=m.group(),
-                )
-            )
+            spans.append((m.start(), m.end(), style, self._priority))
 
-        return matches
+        return spans
 
 
 # =============================================================================
@@ -119,6 +111,7 @@ class IPHighlighter(RegexHighlighter):
             priority=610,
             pattern=self.PATTERN,
             style="hl_ip",
+            first_chars="0-9A-Fa-f:",
         )
 
     @property
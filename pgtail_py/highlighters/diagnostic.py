@@ -7,13 +7,7 @@ Highlighters in this module:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from pgtail_py.highlighter import KeywordHighlighter, Match, RegexHighlighter
-
-if TYPE_CHECKING:
-    from pgtail_py.theme import Theme
-
+from pgtail_py.highlighter import KeywordHighlighter, RegexHighlighter
 
 # =============================================================================
 # SQLStateHighlighter
@@ -48,6 +42,7 @@ class SQLStateHighlighter(RegexHighlighter):
             priority=200,
             pattern=self.PATTERN,
             style="hl_sqlstate_error",  # Default, overridden in find_matches
+            first_chars="0-9A-Z",
         )
 
     @property
@@ -55,21 +50,19 @@ class SQLStateHighlighter(RegexHighlighter):
         """Return human-readable description."""
         return "SQLSTATE error codes with class-based coloring"
 
-    def find_matches(self, text: str, theme: Theme) -> list[Match]:
+    def find_spans(self, text: str) -> list[tuple[int, int, str, int]]:
         """Find all SQLSTATE code matches with appropriate styling.
 
         Args:
             text: Input text to search.
-            theme: Current theme (unused).
 
         Returns:
-            List of Match objects with severity-based styles.
+            (start, end, style, priority) tuples with severity-based styles.
         """
-        matches: list[Match] = []
+        spans: list[tuple[int, int, str, int]] = []
 
         for m in self._pattern.finditer(text):
-            code = m.group(1)
-            class_prefix = code[:2]
+            class_prefix = m.group(1)[:2]
 
             # Determine style based on SQLSTATE class
             if class_prefix in self.SUCCESS_CLASSES:
@@ -81,16 +74,9 @@ class SQLStateHighlighter(RegexHighlighter):
             else:
                 style = "hl_sqlstate_error"
 
-            matches.append(
-                Match(
-                    start=m.start(1),
-                    end=m.end(1),
-                    style=style,
-                    text=code,
-                )
-            )
+            spans.append((m.start(1), m.end(1), style, self._priority))
 
-        return matches
+        return spans
 
 
 # =============================================================================
@@ -84,6 +84,7 @@ class LockWaitHighlighter(RegexHighlighter):
             pattern=self.PATTERN,
             style="hl_lock_wait",
             flags=re.IGNORECASE,
+            first_chars="wasdpl",
         )
 
     @property
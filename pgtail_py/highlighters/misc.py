@@ -10,13 +10,9 @@ Highlighters in this module:
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
-
-from pgtail_py.highlighter import Match, RegexHighlighter
-
-if TYPE_CHECKING:
-    from pgtail_py.theme import Theme
+from typing import ClassVar
 
+from pgtail_py.highlighter import RegexHighlighter
 
 # =============================================================================
 # BooleanHighlighter
@@ -38,6 +34,9 @@ class BooleanHighlighter(RegexHighlighter):
     # Pattern: boolean keywords with word boundaries
     PATTERN = r"\b(on|off|true|false|yes|no)\b"
 
+    # find_matches() picks the style from a word without digits
+    DIGIT_INVARIANT: ClassVar[bool] = True
+
     # Values that represent "true"
     TRUE_VALUES = frozenset({"on", "true", "yes"})
 
@@ -49,6 +48,7 @@ class BooleanHighlighter(RegexHighlighter):
             pattern=self.PATTERN,
             style="hl_bool_true",  # Default, overridden in find_matches
             flags=re.IGNORECASE,
+            first_chars="otfyn",
         )
 
     @property
@@ -56,32 +56,24 @@ class BooleanHighlighter(RegexHighlighter):
         """Return human-readable description."""
         return "Boolean values (on/off, true/false, yes/no)"
 
-    def find_matches(self, text: str, theme: Theme) -> list[Match]:
+    def find_spans(self, text: str) -> list[tuple[int, int, str, int]]:
         """Find all boolean value matches with appropriate styling.
 
         Args:
             text: Input text to search.
-            theme: Current theme (unused).
 
         Returns:
-            List of Match objects with true/false-based styles.
+            (start, end, style, priority) tuples with true/false-based styles.
         """
-        matches: list[Match] = []
+        spans: list[tuple[int, int, str, int]] = []
 
         for m in self._pattern.finditer(text):
             value = m.group(1).lower()
             style = "hl_bool_true" if value in self.TRUE_VALUES else "hl_bool_false"
 
-            matches.append(
-                Match(
-                    start=m.start(1),
-                    end=m.end(1),
-                    style=style,
-                    text=m.group(1),
-                )
-            )
+            spans.append((m.start(1), m.end(1), style, self._priority))
 
-        return matches
+        return spans
 
 
 # =============================================================================
@@ -105,6 +97,7 @@ class NullHighlighter(RegexHighlighter):
             pattern=self.PATTERN,
             style="hl_null",
             flags=re.IGNORECASE,
+            first_chars="n",
         )
 
     @property
@@ -138,6 +131,7 @@ class OIDHighlighter(RegexHighlighter):
             pattern=self.PATTERN,
             style="hl_oid",
             flags=re.IGNORECASE,
+            first_chars="or",
         )
 
     @property
@@ -176,6 +170,7 @@ class PathHighlighter(RegexHighlighter):
             priority=1030,
             pattern=self.PATTERN,
             style="hl_path",
+            first_chars="/",
         )
 
     @property
@@ -9,13 +9,9 @@ Highlighters in this module:
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
-
-from pgtail_py.highlighter import Match, RegexHighlighter
-
-if TYPE_CHECKING:
-    from pgtail_py.theme import Theme
+from typing import ClassVar
 
+from pgtail_py.highlighter import RegexHighlighter
 
 # =============================================================================
 # IdentifierHighlighter
@@ -71,6 +67,9 @@ class RelationHighlighter(RegexHighlighter):
     # Pattern: keyword followed by quoted or unquoted identifier
     PATTERN = r'\b(relation|table|index|sequence|constraint|view|materialized view|foreign table)\s+"?([a-zA-Z_][a-zA-Z0-9_]*)"?'
 
+    # find_matches() only narrows the match to the name group
+    DIGIT_INVARIANT: ClassVar[bool] = True
+
     def __init__(self) -> None:
         """Initialize relation highlighter."""
         super().__init__(
@@ -79,43 +78,35 @@ class RelationHighlighter(RegexHighlighter):
             pattern=self.PATTERN,
             style="hl_relation",
             flags=re.IGNORECASE,
+            first_chars="rtiscvmf",
         )
-        # Compiled pattern for extracting the relation name
-        self._extract_pattern = re.compile(self.PATTERN, re.IGNORECASE)
 
     @property
     def description(self) -> str:
         """Return human-readable description."""
         return "Table/index/sequence names (relation X, table Y)"
 
-    def find_matches(self, text: str, theme: Theme) -> list[Match]:
+    def find_spans(self, text: str) -> list[tuple[int, int, str, int]]:
         """Find all relation name matches.
 
         Args:
             text: Input text to search.
-            theme: Current theme (unused).
 
         Returns:
-            List of Match objects for relation names only (not the keyword).
+            (start, end, style, priority) tuples for relation names only
+            (not the keyword).
         """
-        matches: list[Match] = []
+        spans: list[tuple[int, int, str, int]] = []
 
-        for m in self._extract_pattern.finditer(text):
+        for m in self._pattern.finditer(text):
             # Get the relation name (group 2)
             name_start = m.start(2)
             name_end = m.end(2)
 
             if name_start != -1 and name_end != -1:
-                matches.append(
-                    Match(
-                        start=name_start,
-                        end=name_end,
-                        style=self._style,
-                        text=m.group(2),
-                    )
-                )
-
-        return matches
+                spans.append((name_start, name_end, self._style, self._priority))
+
+        return spans
 
 
 # =============================================================================
@@ -9,13 +9,8 @@ Highlighters in this module:
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
-
-from pgtail_py.highlighter import GroupedRegexHighlighter, Match, RegexHighlighter
-
-if TYPE_CHECKING:
-    from pgtail_py.theme import Theme
 
+from pgtail_py.highlighter import GroupedRegexHighlighter, RegexHighlighter
 
 # =============================================================================
 # DurationHighlighter
@@ -65,6 +60,7 @@ class DurationHighlighter(RegexHighlighter):
             priority=300,
             pattern=self.PATTERN,
             style="hl_duration_fast",  # Default, overridden in find_matches
+            first_chars="0-9",
         )
         self._slow = slow
         self._very_slow = very_slow
@@ -90,17 +86,16 @@ class DurationHighlighter(RegexHighlighter):
         """Return human-readable description."""
         return f"Query durations (slow: {self._slow}ms, critical: {self._critical}ms)"
 
-    def find_matches(self, text: str, theme: Theme) -> list[Match]:
+    def find_spans(self, text: str) -> list[tuple[int, int, str, int]]:
         """Find all duration matches with severity-based styling.
 
         Args:
             text: Input text to search.
-            theme: Current theme (unused).
 
         Returns:
-            List of Match objects with threshold-based styles.
+            (start, end, style, priority) tuples with threshold-based styles.
         """
-        matches: list[Match] = []
+        spans: list[tuple[int, int, str, int]] = []
 
         for m in self._pattern.finditer(text):
             try:
@@ -118,16 +113,9 @@ class DurationHighlighter(RegexHighlighter):
             else:
                 style = "hl_duration_fast"
 
-            matches.append(
-                Match(
-                    start=m.start(),
-                    end=m.end(),
-                    style=style,
-                    text=m.group(),
-                )
-            )
+            spans.append((m.start(), m.end(), style, self._priority))
 
-        return matches
+        return spans
 
 
 # =============================================================================
@@ -8,6 +8,11 @@ Highlighters in this module:
 - SQLOperatorHighlighter: SQL operators (priority 740)
 - SQLContextDetector: Detects SQL context in log messages
 
+Each highlighter's TOKEN_TYPE names the SQLTokenizer tokens it styles. The
+highlighter chain lexes the detected SQL of a message once with
+SQLTokenizer.token_spans() and gives each highlighter its spans, instead of
+running every pattern over the whole message.
+
 Also provides legacy compatibility exports:
 - SQLTokenType, SQLToken, SQLTokenizer (from sql_tokenizer.py)
 - SQLHighlighter, highlight_sql, highlight_sql_text (from sql_highlighter.py)
@@ -21,12 +26,17 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, NamedTuple
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
 
 from prompt_toolkit.formatted_text import FormattedText
 from rich.text import Text
 
-from pgtail_py.highlighter import KeywordHighlighter, RegexHighlighter
+from pgtail_py.highlighter import (
+    KeywordHighlighter,
+    RegexHighlighter,
+    ThemeKey,
+    get_style_table,
+)
 from pgtail_py.theme import ColorStyle, Theme
 from pgtail_py.utils import is_color_disabled
 
@@ -341,7 +351,8 @@ class SQLTokenType(Enum):
     IDENTIFIER = "identifier"  # Table/column names (unquoted)
     QUOTED_IDENTIFIER = "quoted_identifier"  # Double-quoted identifiers ("MyTable")
     STRING = "string"  # String literals ('value', $$value$$)
-    NUMBER = "number"  # Numeric literals (42, 3.14)
+    NUMBER = "number"  # Numeric literals (42, 3.14, 1e10, 0x1F)
+    PARAM = "param"  # Query parameters ($1, $2)
     OPERATOR = "operator"  # Operators (=, <>, ||, ::, etc.)
     COMMENT = "comment"  # Comments (-- line, /* block */)
     FUNCTION = "function"  # Function names followed by (
@@ -374,49 +385,73 @@ class SQLToken:
             raise ValueError(f"end must be > start, got end={self.end}, start={self.start}")
 
 
-# Compiled regex patterns for tokenization
-# Order matters: comments → strings → numbers → keywords → functions → operators → identifiers
-
-# Whitespace pattern
-_WHITESPACE_PATTERN = re.compile(r"\s+")
-
-# Comment patterns (must match before operators containing - or /)
-_BLOCK_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)  # /* ... */
-_LINE_COMMENT_PATTERN = re.compile(r"--[^\n]*")  # -- to end of line
-
-# String patterns (must match before other patterns that could match inside strings)
-# Dollar-quoted strings: $$...$$ or $tag$...$tag$
-_DOLLAR_EMPTY_STRING_PATTERN = re.compile(r"\$\$.*?\$\$", re.DOTALL)  # $$...$$
-_DOLLAR_TAG_STRING_PATTERN = re.compile(
-    r"\$([a-zA-Z_][a-zA-Z0-9_]*)\$.*?\$\1\$", re.DOTALL
-)  # $tag$...$tag$
-# Single-quoted strings with '' escape handling
-_SINGLE_STRING_PATTERN = re.compile(r"'(?:[^']|'')*'")
-
-# Quoted identifier pattern: "..." with "" for escaped quotes
-_QUOTED_IDENTIFIER_PATTERN = re.compile(r'"(?:[^"]|"")*"')
+# Token rules as (group name, regex), in matching order:
+# whitespace → comments → strings → params → quoted identifiers → numbers →
+# words → operators → punctuation → unknown. Group names other than "word"
+# are SQLTokenType values.
+_TOKEN_RULES: tuple[tuple[str, str], ...] = (
+    ("whitespace", r"\s+"),
+    # Comments must match before operators containing - or /
+    ("comment", r"/\*.*?\*/|--[^\n]*"),
+    # Strings: $tag$...$tag$, $$...$$, then '...' with '' escapes
+    ("string", r"\$(?P<tag>[a-zA-Z_][a-zA-Z0-9_]*)\$.*?\$(?P=tag)\$|\$\$.*?\$\$|'(?:[^']|'')*'"),
+    ("param", r"\$[0-9]+"),
+    ("quoted_identifier", r'"(?:[^"]|"")*"'),
+    ("number", r"0[xX][0-9A-Fa-f]+|[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?"),
+    # Keywords, functions and identifiers
+    ("word", r"[a-zA-Z_][a-zA-Z0-9_]*"),
+    # Multi-character operators before single-character ones
+    ("operator", r"<>|!=|<=|>=|\|\||::|[=<>+\-*/%!|:&^~@#]"),
+    ("punctuation", r"[(),;.\[\]]"),
+    ("unknown", r"."),
+)
 
-# Number pattern: integers and decimals
-_NUMBER_PATTERN = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+# Token types SQLTokenizer.token_spans() reports
+_SPAN_TOKEN_TYPES = frozenset(
+    {
+        SQLTokenType.KEYWORD,
+        SQLTokenType.STRING,
+        SQLTokenType.PARAM,
+        SQLTokenType.NUMBER,
+        SQLTokenType.OPERATOR,
+    }
+)
 
-# Keyword/identifier pattern (word characters)
-_WORD_PATTERN = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
 
-# Multi-character operators (must match before single-char operators)
-_MULTI_OP_PATTERN = re.compile(r"<>|!=|<=|>=|\|\||::")
+def _compile_lexer(names: frozenset[str] | None = None) -> re.Pattern[str]:
+    """Combine token rules into one alternation of named groups.
 
-# Single-character operators
-_SINGLE_OP_PATTERN = re.compile(r"[=<>+\-*/%!|:&^~]")
+    Args:
+        names: Rules to include, or None for all of them.
 
-# Punctuation characters
-_PUNCTUATION_PATTERN = re.compile(r"[(),;.\[\]]")
+    Returns:
+        Compiled pattern whose ``lastgroup`` names the matched rule.
+    """
+    return re.compile(
+        "|".join(
+            f"(?P<{name}>{rule})" for name, rule in _TOKEN_RULES if names is None or name in names
+        ),
+        re.DOTALL,
+    )
+
+
+# Every token, so that tokens cover the whole input
+_TOKEN_PATTERN = _compile_lexer()
+
+# Only rules that can contain a highlighted token or hide one. Other
+# characters are skipped by the search, which never lands inside a word,
+# string, comment or quoted identifier.
+_SPAN_PATTERN = _compile_lexer(
+    frozenset({"comment", "string", "param", "quoted_identifier", "number", "word", "operator"})
+)
 
 
 class SQLTokenizer:
     """Tokenizes SQL text into a sequence of SQLToken objects.
 
     Stateless class that can be reused for multiple tokenization calls.
-    Regex patterns are compiled at class level for performance.
+    All token rules are combined into one compiled alternation, so the
+    input is lexed in a single regex pass.
     """
 
     def tokenize(self, sql: str) -> list[SQLToken]:
@@ -428,13 +463,14 @@ class SQLTokenizer:
         3. Line comments (--)
         4. Dollar-quoted strings ($$...$$ or $tag$...$tag$)
         5. Single-quoted strings ('...')
-        6. Quoted identifiers ("...")
-        7. Numbers
-        8. Words (keywords, functions, identifiers)
-        9. Multi-character operators (<>, !=, etc.)
-        10. Single-character operators
-        11. Punctuation
-        12. Unknown
+        6. Query parameters ($1, $2)
+        7. Quoted identifiers ("...")
+        8. Numbers
+        9. Words (keywords, functions, identifiers)
+        10. Multi-character operators (<>, !=, etc.)
+        11. Single-character operators
+        12. Punctuation
+        13. Unknown
 
         Args:
             sql: SQL text to tokenize.
@@ -442,198 +478,62 @@ class SQLTokenizer:
         Returns:
             List of SQLToken objects covering the entire input.
         """
-        if not sql:
-            return []
-
         tokens: list[SQLToken] = []
-        pos = 0
         length = len(sql)
 
-        while pos < length:
-            # 1. Try whitespace
-            match = _WHITESPACE_PATTERN.match(sql, pos)
-            if match:
-                tokens.append(
-                    SQLToken(
-                        type=SQLTokenType.WHITESPACE,
-                        text=match.group(),
-                        start=pos,
-                        end=match.end(),
-                    )
-                )
-                pos = match.end()
-                continue
-
-            # 2. Try block comment (/* ... */)
-            match = _BLOCK_COMMENT_PATTERN.match(sql, pos)
-            if match:
-                tokens.append(
-                    SQLToken(
-                        type=SQLTokenType.COMMENT,
-                        text=match.group(),
-                        start=pos,
-                        end=match.end(),
-                    )
-                )
-                pos = match.end()
-                continue
-
-            # 3. Try line comment (--)
-            match = _LINE_COMMENT_PATTERN.match(sql, pos)
-            if match:
-                tokens.append(
-                    SQLToken(
-                        type=SQLTokenType.COMMENT,
-                        text=match.group(),
-                        start=pos,
-                        end=match.end(),
-                    )
-                )
-                pos = match.end()
-                continue
-
-            # 4. Try dollar-quoted string ($$...$$ or $tag$...$tag$)
-            # Try tagged version first ($tag$...$tag$), then empty ($$...$$)
-            match = _DOLLAR_TAG_STRING_PATTERN.match(sql, pos)
-            if not match:
-                match = _DOLLAR_EMPTY_STRING_PATTERN.match(sql, pos)
-            if match:
-                tokens.append(
-                    SQLToken(
-                        type=SQLTokenType.STRING,
-                        text=match.group(),
-                        start=pos,
-                        end=match.end(),
-                    )
-                )
-                pos = match.end()
-                continue
-
-            # 5. Try single-quoted string ('...')
-            match = _SINGLE_STRING_PATTERN.match(sql, pos)
-            if match:
-                tokens.append(
-                    SQLToken(
-                        type=SQLTokenType.STRING,
-                        text=match.group(),
-                        start=pos,
-                        end=match.end(),
-                    )
-                )
-                pos = match.end()
-                continue
-
-            # 6. Try quoted identifier ("...")
-            match = _QUOTED_IDENTIFIER_PATTERN.match(sql, pos)
-            if match:
-                tokens.append(
-                    SQLToken(
-                        type=SQLTokenType.QUOTED_IDENTIFIER,
-                        text=match.group(),
-                        start=pos,
-                        end=match.end(),
-                    )
-                )
-                pos = match.end()
-                continue
-
-            # 7. Try number
-            match = _NUMBER_PATTERN.match(sql, pos)
-            if match:
-                tokens.append(
-                    SQLToken(
-                        type=SQLTokenType.NUMBER,
-                        text=match.group(),
-                        start=pos,
-                        end=match.end(),
-                    )
-                )
-                pos = match.end()
-                continue
-
-            # 8. Try word (keyword, function, or identifier)
-            match = _WORD_PATTERN.match(sql, pos)
-            if match:
-                word = match.group()
-                word_end = match.end()
-
+        for match in _TOKEN_PATTERN.finditer(sql):
+            kind = match.lastgroup
+            text = match.group()
+            start, end = match.span()
+            if kind == "word":
                 # Look ahead to see if followed by ( to detect function
-                is_function = word_end < length and sql[word_end] == "("
-
-                # Check if it's a keyword (case-insensitive)
-                if word.upper() in SQL_KEYWORDS and not is_function:
-                    token_type = SQLTokenType.KEYWORD
-                elif is_function:
+                if end < length and sql[end] == "(":
                     token_type = SQLTokenType.FUNCTION
+                elif text.upper() in SQL_KEYWORDS:
+                    token_type = SQLTokenType.KEYWORD
                 else:
                     token_type = SQLTokenType.IDENTIFIER
-
-                tokens.append(
-                    SQLToken(
-                        type=token_type,
-                        text=word,
-                        start=pos,
-                        end=word_end,
-                    )
-                )
-                pos = word_end
-                continue
-
-            # 9. Try multi-character operators
-            match = _MULTI_OP_PATTERN.match(sql, pos)
-            if match:
-                tokens.append(
-                    SQLToken(
-                        type=SQLTokenType.OPERATOR,
-                        text=match.group(),
-                        start=pos,
-                        end=match.end(),
-                    )
-                )
-                pos = match.end()
-                continue
-
-            # 10. Try single-character operators
-            match = _SINGLE_OP_PATTERN.match(sql, pos)
-            if match:
-                tokens.append(
-                    SQLToken(
-                        type=SQLTokenType.OPERATOR,
-                        text=match.group(),
-                        start=pos,
-                        end=match.end(),
-                    )
-                )
-                pos = match.end()
-                continue
-
-            # 11. Try punctuation
-            match = _PUNCTUATION_PATTERN.match(sql, pos)
-            if match:
-                tokens.append(
-                    SQLToken(
-                        type=SQLTokenType.PUNCTUATION,
-                        text=match.group(),
-                        start=pos,
-                        end=match.end(),
-                    )
-                )
-                pos = match.end()
-                continue
-
-            # 12. Unknown character - consume one character
-            tokens.append(
-                SQLToken(
-                    type=SQLTokenType.UNKNOWN,
-                    text=sql[pos],
-                    start=pos,
-                    end=pos + 1,
-                )
-            )
-            pos += 1
+            else:
+                token_type = SQLTokenType(kind)
+            tokens.append(SQLToken(type=token_type, text=text, start=start, end=end))
 
         return tokens
 
+    def token_spans(
+        self, text: str, start: int = 0, end: int | None = None
+    ) -> dict[SQLTokenType, list[tuple[int, int]]]:
+        """Find keyword, string, param, number and operator spans in one pass.
+
+        Lexes ``text[start:end]`` without building tokens or copying the
+        slice. Unlike ``tokenize()``, keywords followed by ``(`` (such as
+        ``COALESCE(``) are reported as keywords, as SQLKeywordHighlighter
+        highlights them.
+
+        Args:
+            text: Text containing the SQL.
+            start: Start of the SQL in text.
+            end: End of the SQL in text, or None for the end of text.
+
+        Returns:
+            (start, end) spans in text positions for each of KEYWORD,
+            STRING, PARAM, NUMBER and OPERATOR.
+        """
+        spans: dict[SQLTokenType, list[tuple[int, int]]] = {t: [] for t in _SPAN_TOKEN_TYPES}
+        add = {t.value: spans[t].append for t in _SPAN_TOKEN_TYPES}
+        add_keyword = spans[SQLTokenType.KEYWORD].append
+        keywords = SQL_KEYWORDS
+
+        matches = _SPAN_PATTERN.finditer(text, start, len(text) if end is None else end)
+        for match in matches:
+            kind = match.lastgroup
+            if kind == "word":
+                if match.group().upper() in keywords:
+                    add_keyword(match.span())
+            elif kind in add:
+                add[kind](match.span())
+
+        return spans
+
 
 # =============================================================================
 # SQLParamHighlighter
@@ -648,6 +548,8 @@ class SQLParamHighlighter(RegexHighlighter):
     """
 
     PATTERN = r"\$\d+"
+    TOKEN_TYPE: ClassVar[SQLTokenType] = SQLTokenType.PARAM
+    TOKEN_STYLE: ClassVar[str] = "hl_param"
 
     def __init__(self) -> None:
         """Initialize param highlighter."""
@@ -655,7 +557,7 @@ class SQLParamHighlighter(RegexHighlighter):
             name="sql_param",
             priority=700,
             pattern=self.PATTERN,
-            style="hl_param",
+            style=self.TOKEN_STYLE,
         )
 
     @property
@@ -681,6 +583,9 @@ class SQLKeywordHighlighter(KeywordHighlighter):
     - Other: sql_keyword
     """
 
+    TOKEN_TYPE: ClassVar[SQLTokenType] = SQLTokenType.KEYWORD
+    TOKEN_STYLE: ClassVar[str] = "sql_keyword"
+
     def __init__(self) -> None:
         """Initialize keyword highlighter with all SQL keywords."""
         # Build keyword -> style mapping
@@ -734,6 +639,8 @@ class SQLStringHighlighter(RegexHighlighter):
     # Combined pattern for all string types
     # Order: tagged dollar quotes first, then empty dollar quotes, then single quotes
     PATTERN = r"\$([a-zA-Z_][a-zA-Z0-9_]*)?\$.*?\$\1?\$|'(?:[^']|'')*'"
+    TOKEN_TYPE: ClassVar[SQLTokenType] = SQLTokenType.STRING
+    TOKEN_STYLE: ClassVar[str] = "sql_string"
 
     def __init__(self) -> None:
         """Initialize string highlighter."""
@@ -741,7 +648,7 @@ class SQLStringHighlighter(RegexHighlighter):
             name="sql_string",
             priority=720,
             pattern=self.PATTERN,
-            style="sql_string",
+            style=self.TOKEN_STYLE,
             flags=re.DOTALL,
         )
 
@@ -768,6 +675,8 @@ class SQLNumberHighlighter(RegexHighlighter):
 
     # Pattern for various numeric formats
     PATTERN = r"\b(?:0x[0-9A-Fa-f]+|[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?)\b"
+    TOKEN_TYPE: ClassVar[SQLTokenType] = SQLTokenType.NUMBER
+    TOKEN_STYLE: ClassVar[str] = "sql_number"
 
     def __init__(self) -> None:
         """Initialize number highlighter."""
@@ -775,7 +684,8 @@ class SQLNumberHighlighter(RegexHighlighter):
             name="sql_number",
             priority=730,
             pattern=self.PATTERN,
-            style="sql_number",
+            style=self.TOKEN_STYLE,
+            first_chars="0-9",
         )
 
     @property
@@ -801,6 +711,8 @@ class SQLOperatorHighlighter(RegexHighlighter):
 
     # Pattern: multi-char operators first, then single-char
     PATTERN = r"<>|!=|<=|>=|\|\||::|[=<>+\-*/%!|:&^~@#]"
+    TOKEN_TYPE: ClassVar[SQLTokenType] = SQLTokenType.OPERATOR
+    TOKEN_STYLE: ClassVar[str] = "sql_operator"
 
     def __init__(self) -> None:
         """Initialize operator highlighter."""
@@ -808,7 +720,7 @@ class SQLOperatorHighlighter(RegexHighlighter):
             name="sql_operator",
             priority=740,
             pattern=self.PATTERN,
-            style="sql_operator",
+            style=self.TOKEN_STYLE,
         )
 
     @property
@@ -868,34 +780,55 @@ class SQLDetectionResult(NamedTuple):
     suffix: str
 
 
-# Combined SQL detection pattern for fast matching
-# Uses alternation with named groups to identify which pattern matched
-# Order: duration (most specific) -> statement -> execute -> parse -> bind -> DETAIL
-_SQL_DETECTION_PATTERN = re.compile(
-    r"^(?:"
-    # Duration with SQL command (most specific)
-    r"(?P<dur_prefix>.*?duration:\s*[\d.]+\s*ms\s+(?:statement|parse|bind|execute)\s*(?:\S+)?:\s*)(?P<dur_sql>.*?)(?P<dur_suffix>\s*)$"
-    r"|"
-    # Plain statement
-    r"(?P<stmt_prefix>.*?statement:\s*)(?P<stmt_sql>.*?)(?P<stmt_suffix>\s*)$"
-    r"|"
-    # Execute prepared statement
-    r"(?P<exec_prefix>.*?execute\s+\S+:\s*)(?P<exec_sql>.*?)(?P<exec_suffix>\s*)$"
-    r"|"
-    # Parse prepared statement
-    r"(?P<parse_prefix>.*?parse\s+\S+:\s*)(?P<parse_sql>.*?)(?P<parse_suffix>\s*)$"
-    r"|"
-    # Bind prepared statement
-    r"(?P<bind_prefix>.*?bind\s+\S+:\s*)(?P<bind_sql>.*?)(?P<bind_suffix>\s*)$"
-    r"|"
-    # DETAIL line
-    r"(?P<detail_prefix>DETAIL:\s*)(?P<detail_sql>.*?)(?P<detail_suffix>\s*)$"
-    r")",
-    re.IGNORECASE | re.DOTALL,
+# Patterns ending the prefix before the SQL, in detection order:
+# duration (most specific) -> statement -> execute -> parse -> bind. Each is
+# paired with the lowercase literal it starts with; detection finds that
+# literal with str.find() and tries the pattern anchored at each occurrence.
+_SQL_PREFIX_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    (
+        "duration:",
+        re.compile(
+            r"duration:\s*[\d.]+\s*ms\s+(?:statement|parse|bind|execute)\s*(?:\S+)?:\s*",
+            re.IGNORECASE,
+        ),
+    ),
+    ("statement:", re.compile(r"statement:\s*", re.IGNORECASE)),
+    ("execute", re.compile(r"execute\s+\S+:\s*", re.IGNORECASE)),
+    ("parse", re.compile(r"parse\s+\S+:\s*", re.IGNORECASE)),
+    ("bind", re.compile(r"bind\s+\S+:\s*", re.IGNORECASE)),
 )
 
-# Group name prefixes for extraction
-_SQL_GROUP_PREFIXES = ("dur", "stmt", "exec", "parse", "bind", "detail")
+# DETAIL lines only count at the start of the message
+_SQL_DETAIL_PATTERN = re.compile(r"DETAIL:\s*", re.IGNORECASE)
+
+
+def _find_sql_prefix(message: str) -> re.Match[str] | None:
+    """Find the first prefix pattern that matches, at its leftmost position.
+
+    Args:
+        message: Log message to search.
+
+    Returns:
+        Match of the prefix, or None.
+    """
+    lowered = message.lower()
+    # Lowercasing a few characters changes the length, and with it the
+    # positions; fall back to searching with each pattern
+    if len(lowered) != len(message):
+        for _literal, pattern in _SQL_PREFIX_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                return match
+        return None
+
+    for literal, pattern in _SQL_PREFIX_PATTERNS:
+        pos = lowered.find(literal)
+        while pos >= 0:
+            match = pattern.match(message, pos)
+            if match:
+                return match
+            pos = lowered.find(literal, pos + 1)
+    return None
 
 
 def detect_sql_content(message: str) -> SQLDetectionResult | None:
@@ -909,7 +842,8 @@ def detect_sql_content(message: str) -> SQLDetectionResult | None:
     - LOG: duration: ... ms statement/parse/bind/execute: <SQL>
     - DETAIL: <SQL context>
 
-    Uses a single combined regex for performance.
+    Each pattern is only tried where its leading literal occurs, so
+    messages without SQL cost a few substring searches.
 
     Args:
         message: Log message to analyze.
@@ -921,22 +855,20 @@ def detect_sql_content(message: str) -> SQLDetectionResult | None:
     if not message:
         return None
 
-    match = _SQL_DETECTION_PATTERN.match(message)
+    match = _find_sql_prefix(message) or _SQL_DETAIL_PATTERN.match(message)
     if not match:
         return None
 
-    # Find which group matched
-    groups = match.groupdict()
-    for prefix_name in _SQL_GROUP_PREFIXES:
-        sql = groups.get(f"{prefix_name}_sql")
-        if sql is not None and sql.strip():
-            return SQLDetectionResult(
-                prefix=groups[f"{prefix_name}_prefix"],
-                sql=sql,
-                suffix=groups[f"{prefix_name}_suffix"],
-            )
-
-    return None
+    sql_start = match.end()
+    sql = message[sql_start:].rstrip()
+    if not sql:
+        return None
+    sql_end = sql_start + len(sql)
+    return SQLDetectionResult(
+        prefix=message[:sql_start],
+        sql=sql,
+        suffix=message[sql_end:],
+    )
 
 
 # =============================================================================
@@ -951,6 +883,7 @@ TOKEN_TO_STYLE: dict[SQLTokenType, str] = {
     SQLTokenType.QUOTED_IDENTIFIER: "class:sql_identifier",
     SQLTokenType.STRING: "class:sql_string",
     SQLTokenType.NUMBER: "class:sql_number",
+    SQLTokenType.PARAM: "class:hl_param",
     SQLTokenType.OPERATOR: "class:sql_operator",
     SQLTokenType.COMMENT: "class:sql_comment",
     SQLTokenType.FUNCTION: "class:sql_function",
@@ -966,6 +899,7 @@ TOKEN_TYPE_TO_THEME_KEY: dict[SQLTokenType, str] = {
     SQLTokenType.QUOTED_IDENTIFIER: "sql_identifier",
     SQLTokenType.STRING: "sql_string",
     SQLTokenType.NUMBER: "sql_number",
+    SQLTokenType.PARAM: "hl_param",
     SQLTokenType.OPERATOR: "sql_operator",
     SQLTokenType.COMMENT: "sql_comment",
     SQLTokenType.FUNCTION: "sql_function",
@@ -1050,7 +984,7 @@ def _color_style_to_rich_markup(style: ColorStyle) -> str:
     return " ".join(parts)
 
 
-def highlight_sql_text(sql: str, theme: Theme | None = None) -> Text:
+def highlight_sql_text(sql: str, theme: Theme | None = None, theme_keys: bool = False) -> Text:
     """Convert SQL text to styled Rich Text.
 
     Tokenizes SQL and appends each token as literal text with Rich style
@@ -1059,6 +993,8 @@ def highlight_sql_text(sql: str, theme: Theme | None = None) -> Text:
     Args:
         sql: SQL text to highlight.
         theme: Theme for color lookup. If None, uses global ThemeManager.
+        theme_keys: Use ThemeKey span styles, resolved later by a
+            StyleTable, instead of looking colors up in a theme.
 
     Returns:
         Rich Text with styled tokens. If NO_COLOR is set, returns unstyled Text.
@@ -1077,30 +1013,31 @@ def highlight_sql_text(sql: str, theme: Theme | None = None) -> Text:
     if is_color_disabled():
         return Text(sql)
 
+    # Tokenize SQL
+    tokens = SQLTokenizer().tokenize(sql)
+
+    if theme_keys:
+        text = Text()
+        for token in tokens:
+            theme_key = TOKEN_TYPE_TO_THEME_KEY.get(token.type, "")
+            text.append(token.text, style=ThemeKey(theme_key) if theme_key else None)
+        return text
+
     # Get theme for color lookup
     if theme is None:
         theme = _get_theme_manager().current_theme
 
-    # Tokenize SQL
-    tokens = SQLTokenizer().tokenize(sql)
+    if theme is None:
+        return Text(sql)
 
-    # Build Rich Text
+    # Build Rich Text with the theme's pre-parsed styles
+    styles = get_style_table(theme)
     text = Text()
     for token in tokens:
         # Get theme key for this token type
         theme_key = TOKEN_TYPE_TO_THEME_KEY.get(token.type, "")
-
-        if theme_key and theme:
-            # Get color style from theme
-            style = theme.get_ui_style(theme_key)
-            markup = _color_style_to_rich_markup(style)
-
-            if markup:
-                text.append(token.text, style=markup)
-            else:
-                text.append(token.text)
-        else:
-            text.append(token.text)
+        style = styles[theme_key] if theme_key else None
+        text.append(token.text, style=style or None)
 
     return text
 
@@ -9,13 +9,9 @@ Highlighters in this module:
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
-
-from pgtail_py.highlighter import GroupedRegexHighlighter, Match, RegexHighlighter
-
-if TYPE_CHECKING:
-    from pgtail_py.theme import Theme
+from typing import ClassVar
 
+from pgtail_py.highlighter import GroupedRegexHighlighter, RegexHighlighter
 
 # =============================================================================
 # TimestampHighlighter
@@ -119,6 +115,9 @@ class ContextLabelHighlighter(RegexHighlighter):
     # Must be at start of line or preceded by whitespace
     PATTERN = r"(?:^|\s)(DETAIL|HINT|CONTEXT|STATEMENT|QUERY|LOCATION):"
 
+    # find_matches() only narrows the match to the label
+    DIGIT_INVARIANT: ClassVar[bool] = True
+
     def __init__(self) -> None:
         """Initialize context label highlighter."""
         super().__init__(
@@ -137,27 +136,18 @@ class ContextLabelHighlighter(RegexHighlighter):
         """Return human-readable description."""
         return "Context labels (DETAIL:, HINT:, CONTEXT:, etc.)"
 
-    def find_matches(self, text: str, theme: Theme) -> list[Match]:
+    def find_spans(self, text: str) -> list[tuple[int, int, str, int]]:
         """Find all context label matches in text.
 
         Args:
             text: Input text to search.
-            theme: Current theme (unused).
 
         Returns:
-            List of Match objects.
+            (start, end, style, priority) tuples.
         """
-        matches: list[Match] = []
-        for m in self._label_pattern.finditer(text):
-            matches.append(
-                Match(
-                    start=m.start(),
-                    end=m.end(),
-                    style=self._style,
-                    text=m.group(),
-                )
-            )
-        return matches
+        style = self._style
+        priority = self._priority
+        return [(*m.span(), style, priority) for m in self._label_pattern.finditer(text)]
 
 
 # =============================================================================
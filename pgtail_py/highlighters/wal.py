@@ -9,13 +9,9 @@ Highlighters in this module:
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
-
-from pgtail_py.highlighter import GroupedRegexHighlighter, Match, RegexHighlighter
-
-if TYPE_CHECKING:
-    from pgtail_py.theme import Theme
+from typing import ClassVar
 
+from pgtail_py.highlighter import GroupedRegexHighlighter, RegexHighlighter
 
 # =============================================================================
 # LSNHighlighter
@@ -119,6 +115,9 @@ class TxidHighlighter(RegexHighlighter):
     # Pattern: transaction ID keywords followed by number
     PATTERN = r"\b(xid|xmin|xmax|transaction)\s*:?\s*(\d+)\b"
 
+    # find_matches() styles every ID alike
+    DIGIT_INVARIANT: ClassVar[bool] = True
+
     def __init__(self) -> None:
         """Initialize txid highlighter."""
         super().__init__(
@@ -127,38 +126,14 @@ class TxidHighlighter(RegexHighlighter):
             pattern=self.PATTERN,
             style="hl_txid",
             flags=re.IGNORECASE,
+            first_chars="xt",
         )
-        self._extract_pattern = re.compile(self.PATTERN, re.IGNORECASE)
 
     @property
     def description(self) -> str:
         """Return human-readable description."""
         return "Transaction IDs (xid, xmin, xmax, transaction N)"
 
-    def find_matches(self, text: str, theme: Theme) -> list[Match]:
-        """Find all transaction ID matches.
-
-        Args:
-            text: Input text to search.
-            theme: Current theme (unused).
-
-        Returns:
-            List of Match objects for the full match including keyword and ID.
-        """
-        matches: list[Match] = []
-
-        for m in self._extract_pattern.finditer(text):
-            matches.append(
-                Match(
-                    start=m.start(),
-                    end=m.end(),
-                    style=self._style,
-                    text=m.group(),
-                )
-            )
-
-        return matches
-
 
 # =============================================================================
 # Module-level registration
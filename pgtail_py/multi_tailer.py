@@ -18,8 +18,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from queue import Empty, Queue
 
+from pgtail_py.entry_store import EntryStore
 from pgtail_py.field_filter import FieldFilterState
 from pgtail_py.filter import LogLevel
+from pgtail_py.filter_expression import CompiledFilter
+from pgtail_py.filter_plan import FilterPlan, build_filter_plan
 from pgtail_py.format_detector import LogFormat, detect_format
 from pgtail_py.parser import LogEntry, parse_log_line
 from pgtail_py.regex_filter import FilterState
@@ -28,6 +31,9 @@ from pgtail_py.time_filter import TimeFilter
 # Default maximum buffer size for storing entries
 DEFAULT_BUFFER_MAX_SIZE = 10000
 
+# Sort key for entries without a timestamp (sorted before all others)
+_NO_EPOCH = float("-inf")
+
 
 @dataclass
 class GlobPattern:
@@ -148,6 +154,8 @@ class MultiFileTailer:
         poll_interval: float = 0.1,
         on_entry: Callable[[LogEntry], None] | None = None,
         buffer_max_size: int = DEFAULT_BUFFER_MAX_SIZE,
+        filter_expression: CompiledFilter | None = None,
+        store: EntryStore | None = None,
     ) -> None:
         """Initialize the multi-file tailer.
 
@@ -161,6 +169,10 @@ class MultiFileTailer:
             poll_interval: How often to check for new content (seconds).
             on_entry: Callback for ALL parsed entries (before filtering).
             buffer_max_size: Maximum number of entries to store in buffer.
+            filter_expression: Compiled ``where`` expression. None means no
+                expression filtering.
+            store: Entry store to append shown entries to, shared with the
+                consumer. None creates one holding ``buffer_max_size`` entries.
         """
         self._initial_paths = list(paths)
         self._glob_pattern = glob_pattern
@@ -168,9 +180,12 @@ class MultiFileTailer:
         self._regex_state = regex_state
         self._time_filter = time_filter
         self._field_filter = field_filter
+        self._filter_expression = filter_expression
+        self._filter_plan = build_filter_plan(
+            active_levels, regex_state, time_filter, field_filter, filter_expression
+        )
         self._poll_interval = poll_interval
         self._on_entry = on_entry
-        self._buffer_max_size = buffer_max_size
 
         # Per-file state
         self._file_states: dict[Path, FileTailerState] = {}
@@ -179,8 +194,7 @@ class MultiFileTailer:
         self._queue: Queue[LogEntry] = Queue()
 
         # Buffer of all entries (for filtering replay)
-        self._buffer: list[LogEntry] = []
-        self._buffer_lock = threading.Lock()
+        self._store = store if store is not None else EntryStore(buffer_max_size)
 
         # Control
         self._running = False
@@ -307,31 +321,33 @@ class MultiFileTailer:
     def _should_show(self, entry: LogEntry) -> bool:
         """Check if a log entry should be displayed based on filters.
 
+        Delegates to the filter plan, which orders the filters by observed
+        rejection rate per unit of cost and keeps per-filter counters.
+
         Args:
             entry: Log entry to check.
 
         Returns:
             True if entry passes all filters.
         """
-        # Check time filter first
-        if self._time_filter is not None and not self._time_filter.matches(entry):
-            return False
-
-        # Check level filter
-        if self._active_levels is not None and entry.level not in self._active_levels:
-            return False
-
-        # Check field filter
-        if self._field_filter is not None and not self._field_filter.matches(entry):
-            return False
-
-        # Check regex filter
-        return not (
-            self._regex_state is not None
-            and self._regex_state.has_filters()
-            and not self._regex_state.should_show(entry.raw)
+        return self._filter_plan.should_show(entry)
+
+    def _rebuild_filter_plan(self) -> None:
+        """Rebuild the filter plan after a filter setting changed."""
+        self._filter_plan = build_filter_plan(
+            self._active_levels,
+            self._regex_state,
+            self._time_filter,
+            self._field_filter,
+            self._filter_expression,
+            previous=self._filter_plan,
         )
 
+    @property
+    def filter_plan(self) -> FilterPlan:
+        """Filter plan with per-filter hit-rate counters."""
+        return self._filter_plan
+
     def _check_for_new_files(self) -> None:
         """Check for new files matching the glob pattern.
 
@@ -374,19 +390,15 @@ class MultiFileTailer:
             # Use secondary sort by source_file for consistent ordering
             all_entries.sort(
                 key=lambda e: (
-                    e.timestamp or e.timestamp,  # None timestamps go first
+                    e.epoch if e.epoch is not None else _NO_EPOCH,  # None timestamps go first
                     e.source_file or "",
                 )
             )
 
             # Queue sorted entries
             for entry in all_entries:
+                self._store.append(entry)
                 self._queue.put(entry)
-                with self._buffer_lock:
-                    self._buffer.append(entry)
-                    # Trim buffer if needed
-                    while len(self._buffer) > self._buffer_max_size:
-                        self._buffer.pop(0)
 
             time.sleep(self._poll_interval)
 
@@ -447,13 +459,16 @@ class MultiFileTailer:
         Returns:
             List of log entries in chronological order.
         """
-        with self._buffer_lock:
-            return list(self._buffer)
+        return self._store.entries()
 
     def clear_buffer(self) -> None:
         """Clear the buffer of collected entries."""
-        with self._buffer_lock:
-            self._buffer.clear()
+        self._store.clear()
+
+    @property
+    def store(self) -> EntryStore:
+        """Entry store holding the buffered entries."""
+        return self._store
 
     @property
     def is_running(self) -> bool:
@@ -481,18 +496,27 @@ class MultiFileTailer:
     def update_levels(self, levels: set[LogLevel] | None) -> None:
         """Update the active log levels filter."""
         self._active_levels = levels
+        self._rebuild_filter_plan()
 
     def update_regex_state(self, regex_state: FilterState | None) -> None:
         """Update the regex filter state."""
         self._regex_state = regex_state
+        self._rebuild_filter_plan()
 
     def update_time_filter(self, time_filter: TimeFilter | None) -> None:
         """Update the time filter."""
         self._time_filter = time_filter
+        self._rebuild_filter_plan()
 
     def update_field_filter(self, field_filter: FieldFilterState | None) -> None:
         """Update the field filter state."""
         self._field_filter = field_filter
+        self._rebuild_filter_plan()
+
+    def update_filter_expression(self, filter_expression: CompiledFilter | None) -> None:
+        """Update the where expression filter."""
+        self._filter_expression = filter_expression
+        self._rebuild_filter_plan()
 
     @property
     def files_unavailable(self) -> list[Path]:
@@ -67,6 +67,12 @@ class LogEntry:
         func_name: Error location function name - JSON only
         file_name: Error location file name - JSON only
         file_line_num: Error location line number - JSON only
+
+    Derived fields:
+        epoch: POSIX timestamp of ``timestamp`` (naive times are local), or
+            None. Computed once so time filters compare floats per entry.
+        seq: Sequence number assigned by the EntryStore it was appended to,
+            or None if it has not been stored.
     """
 
     # Core fields (always present)
@@ -109,6 +115,16 @@ class LogEntry:
     file_name: str | None = None
     file_line_num: int | None = None
 
+    # Derived from timestamp in __post_init__
+    epoch: float | None = field(default=None, init=False, repr=False, compare=False)
+    # Set by EntryStore.append()
+    seq: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the epoch timestamp used by time filters."""
+        if self.timestamp is not None:
+            self.epoch = self.timestamp.timestamp()
+
     def get_field(self, name: str) -> str | int | datetime | None:
         """Get a field value by canonical name.
 
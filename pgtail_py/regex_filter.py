@@ -3,13 +3,322 @@
 Provides pattern-based filtering and highlighting that works alongside
 level-based filtering. Supports include, exclude, AND/OR logic, and
 visual highlighting of matched text.
+
+User-supplied patterns are compiled through a shared LRU cache, checked
+for nested quantifiers (the usual cause of catastrophic backtracking),
+and can be given a per-line match time budget.
 """
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
+import time
 from dataclasses import dataclass, field
 from enum import Enum
+from re import _constants as _sre_constants  # type: ignore[attr-defined]
+from re import _parser as _sre_parser  # type: ignore[attr-defined]
+from typing import Any
+
+# Compiled patterns kept by compile_pattern()
+PATTERN_CACHE_SIZE = 256
+
+# Per-line match time budget in nanoseconds, or None for no budget
+_match_budget_ns: int | None = None
+
+# Overruns within BUDGET_WINDOW_LINES lines before a filter skips long lines
+BUDGET_OVERRUNS = 3
+
+# Lines after which a filter forgets its overruns and stops skipping
+BUDGET_WINDOW_LINES = 1000
+
+# Repeats that backtrack; possessive repeats and atomic groups don't
+_BACKTRACKING_REPEATS = (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT)
+
+# Parsed atoms that match exactly one character
+_SINGLE_CHAR_OPS = frozenset(
+    {
+        _sre_constants.LITERAL,
+        _sre_constants.NOT_LITERAL,
+        _sre_constants.ANY,
+        _sre_constants.IN,
+        _sre_constants.CATEGORY,
+    }
+)
+
+# Character class categories, as patterns that test one character
+_CATEGORY_PATTERNS = {
+    _sre_constants.CATEGORY_DIGIT: re.compile(r"\d"),
+    _sre_constants.CATEGORY_NOT_DIGIT: re.compile(r"\D"),
+    _sre_constants.CATEGORY_SPACE: re.compile(r"\s"),
+    _sre_constants.CATEGORY_NOT_SPACE: re.compile(r"\S"),
+    _sre_constants.CATEGORY_WORD: re.compile(r"\w"),
+    _sre_constants.CATEGORY_NOT_WORD: re.compile(r"\W"),
+}
+
+# Widest character range still treated as a delimiter, e.g. [,;]
+_MAX_DELIMITER_RANGE = 256
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile a regex through the shared LRU cache.
+
+    Filters, highlights, searches and ``where`` expressions all compile
+    user patterns here, so re-entering a pattern reuses its compiled form.
+
+    Args:
+        pattern: Regex pattern string.
+        flags: re module flags.
+
+    Returns:
+        Compiled pattern.
+
+    Raises:
+        re.error: If pattern is invalid.
+    """
+    return re.compile(pattern, flags)
+
+
+def _children(op: object, av: Any) -> list[Any]:
+    """Return the nested subpatterns of a parsed regex node."""
+    if op in _BACKTRACKING_REPEATS or op == _sre_constants.POSSESSIVE_REPEAT:
+        return [av[2]]
+    if op == _sre_constants.SUBPATTERN:
+        return [av[-1]]
+    if op in (_sre_constants.ASSERT, _sre_constants.ASSERT_NOT):
+        return [av[1]]
+    if op == _sre_constants.ATOMIC_GROUP:
+        return [av]
+    if op == _sre_constants.BRANCH:
+        return list(av[1])
+    if op == _sre_constants.GROUPREF_EXISTS:
+        return [branch for branch in av[1:] if branch is not None]
+    return []
+
+
+def _contains_unbounded_repeat(items: Any) -> bool:
+    """Check if a parsed subpattern contains a backtracking unbounded repeat."""
+    for op, av in items:
+        if op in _BACKTRACKING_REPEATS and av[1] == _sre_constants.MAXREPEAT:
+            return True
+        # Atomic and possessive contents are never re-entered by backtracking
+        if op == _sre_constants.ATOMIC_GROUP or op == _sre_constants.POSSESSIVE_REPEAT:
+            continue
+        if any(_contains_unbounded_repeat(child) for child in _children(op, av)):
+            return True
+    return False
+
+
+def _repeated_atoms(items: Any, inside: bool = False) -> list[tuple[object, Any]]:
+    """Collect the single-character atoms under backtracking unbounded repeats."""
+    atoms: list[tuple[object, Any]] = []
+    for op, av in items:
+        if op in _SINGLE_CHAR_OPS:
+            if inside:
+                atoms.append((op, av))
+            continue
+        if op == _sre_constants.ATOMIC_GROUP or op == _sre_constants.POSSESSIVE_REPEAT:
+            continue
+        if op in (_sre_constants.GROUPREF, _sre_constants.GROUPREF_IGNORE) and inside:
+            # A backreference can match anything its group did
+            atoms.append((_sre_constants.ANY, None))
+            continue
+        nested = inside or (op in _BACKTRACKING_REPEATS and av[1] == _sre_constants.MAXREPEAT)
+        for child in _children(op, av):
+            atoms.extend(_repeated_atoms(child, nested))
+    return atoms
+
+
+def _atom_matches(op: object, av: Any, char: str) -> bool:
+    """Check if a single-character atom can match char, ignoring case."""
+    if op == _sre_constants.IN:
+        negate = False
+        matched = False
+        for item_op, item_av in av:
+            if item_op == _sre_constants.NEGATE:
+                negate = True
+            elif item_op in (_sre_constants.LITERAL, _sre_constants.RANGE) or (
+                item_op == _sre_constants.CATEGORY and item_av in _CATEGORY_PATTERNS
+            ):
+                matched = matched or _atom_matches(item_op, item_av, char)
+            else:
+                return True
+        return matched != negate
+    codes = {ord(variant) for variant in (char, char.lower(), char.upper())}
+    if op in (_sre_constants.LITERAL, _sre_constants.LITERAL_IGNORE):
+        return av in codes
+    if op == _sre_constants.RANGE:
+        return any(av[0] <= code <= av[1] for code in codes)
+    if op == _sre_constants.CATEGORY:
+        return any(_CATEGORY_PATTERNS[av].match(chr(code)) for code in codes)
+    if op in (_sre_constants.NOT_LITERAL, _sre_constants.NOT_LITERAL_IGNORE):
+        return codes != {av}
+    return True
+
+
+def _delimiter_chars(op: object, av: Any) -> str | None:
+    """Return the characters a delimiter atom can match, or None if unbounded."""
+    if op == _sre_constants.LITERAL:
+        return chr(av)
+    if op != _sre_constants.IN:
+        return None
+    chars: list[str] = []
+    for item_op, item_av in av:
+        if item_op == _sre_constants.LITERAL:
+            chars.append(chr(item_av))
+        elif item_op == _sre_constants.RANGE and item_av[1] - item_av[0] < _MAX_DELIMITER_RANGE:
+            chars.extend(chr(code) for code in range(item_av[0], item_av[1] + 1))
+        else:
+            return None
+    return "".join(chars)
+
+
+def _has_delimiter(items: Any, atoms: list[tuple[object, Any]]) -> bool:
+    """Check if a repeat body has a mandatory atom none of its inner repeats can match."""
+    for op, av in items:
+        if op == _sre_constants.SUBPATTERN:
+            if _has_delimiter(av[-1], atoms):
+                return True
+            continue
+        chars = _delimiter_chars(op, av)
+        if chars and not any(
+            _atom_matches(atom_op, atom_av, char) for atom_op, atom_av in atoms for char in chars
+        ):
+            return True
+    return False
+
+
+def _find_nested(items: Any) -> bool:
+    """Walk a parsed pattern looking for an unbounded repeat of a repeat.
+
+    A repeat whose body has a mandatory delimiter that none of its inner
+    repeats can match, like ``(\\d+\\.)+``, has only one way to split the
+    input between iterations, so it is not reported.
+    """
+    for op, av in items:
+        if (
+            op in _BACKTRACKING_REPEATS
+            and av[1] == _sre_constants.MAXREPEAT
+            and _contains_unbounded_repeat(av[2])
+            and not _has_delimiter(av[2], _repeated_atoms(av[2]))
+        ):
+            return True
+        if any(_find_nested(child) for child in _children(op, av)):
+            return True
+    return False
+
+
+def has_nested_quantifier(pattern: str, flags: int = 0) -> bool:
+    """Check a pattern for nested unbounded quantifiers like ``(a+)+``.
+
+    Such patterns can backtrack exponentially on lines that almost match,
+    which would stall the tailer thread. Possessive quantifiers (``a++``)
+    and atomic groups (``(?>...)``) don't backtrack and are not flagged.
+
+    Args:
+        pattern: Regex pattern string.
+        flags: re module flags.
+
+    Returns:
+        True if an unbounded repeat contains another unbounded repeat.
+
+    Raises:
+        re.error: If pattern is invalid.
+    """
+    return _find_nested(_sre_parser.parse(pattern, flags))
+
+
+# Code points of the ASCII digits
+_DIGIT_CODES = range(ord("0"), ord("9") + 1)
+
+# Character class categories that match every ASCII digit, and none
+_ALL_DIGIT_CATEGORIES = frozenset(
+    {_sre_constants.CATEGORY_DIGIT, _sre_constants.CATEGORY_WORD, _sre_constants.CATEGORY_NOT_SPACE}
+)
+_NO_DIGIT_CATEGORIES = frozenset(
+    {
+        _sre_constants.CATEGORY_NOT_DIGIT,
+        _sre_constants.CATEGORY_NOT_WORD,
+        _sre_constants.CATEGORY_SPACE,
+    }
+)
+
+
+def _class_is_digit_uniform(items: Any) -> bool:
+    """Check that a parsed character class matches all ASCII digits or none."""
+    digits: set[int] = set()
+    for op, av in items:
+        if op == _sre_constants.NEGATE:
+            continue
+        if op == _sre_constants.LITERAL:
+            if av in _DIGIT_CODES:
+                digits.add(av)
+        elif op == _sre_constants.RANGE:
+            digits.update(c for c in _DIGIT_CODES if av[0] <= c <= av[1])
+        elif op == _sre_constants.CATEGORY and av in _ALL_DIGIT_CATEGORIES:
+            digits.update(_DIGIT_CODES)
+        elif op != _sre_constants.CATEGORY or av not in _NO_DIGIT_CATEGORIES:
+            return False
+    return len(digits) in (0, len(_DIGIT_CODES))
+
+
+def _is_digit_uniform(items: Any) -> bool:
+    """Walk a parsed pattern checking that every atom treats digits alike."""
+    for op, av in items:
+        if op in (_sre_constants.LITERAL, _sre_constants.NOT_LITERAL):
+            if av in _DIGIT_CODES:
+                return False
+        elif op == _sre_constants.IN:
+            if not _class_is_digit_uniform(av):
+                return False
+        elif op == _sre_constants.GROUPREF:
+            return False
+        if not all(_is_digit_uniform(child) for child in _children(op, av)):
+            return False
+    return True
+
+
+def is_digit_invariant(pattern: str, flags: int = 0) -> bool:
+    """Check that a pattern treats all ASCII digits alike.
+
+    A pattern is digit-invariant when none of its literals or character
+    classes singles out some digits (``0x``, ``[1-5]``) and it has no
+    backreferences. It then matches at the same positions in two texts
+    that differ only in which ASCII digits they contain, such as
+    ``pid=123`` and ``pid=456``.
+
+    Args:
+        pattern: Regex pattern string.
+        flags: re module flags.
+
+    Returns:
+        True if the pattern cannot tell ASCII digits apart.
+
+    Raises:
+        re.error: If pattern is invalid.
+    """
+    return _is_digit_uniform(_sre_parser.parse(pattern, flags))
+
+
+def set_match_budget(budget_ms: int | None) -> None:
+    """Set the per-line regex filter match time budget.
+
+    Args:
+        budget_ms: Budget in milliseconds, or None to disable.
+    """
+    global _match_budget_ns
+    _match_budget_ns = budget_ms * 1_000_000 if budget_ms else None
+
+
+def get_match_budget() -> int | None:
+    """Return the per-line match time budget in milliseconds, or None."""
+    return _match_budget_ns // 1_000_000 if _match_budget_ns is not None else None
+
+
+class MatchBudgetExceeded(Exception):
+    """Raised when a filter pattern exceeds the per-line match time budget."""
 
 
 class FilterType(Enum):
@@ -29,12 +338,21 @@ class RegexFilter:
         filter_type: How this filter is applied
         case_sensitive: True if /pattern/c was used
         compiled: Pre-compiled regex for performance
+        budget_skips: Lines skipped because matching exceeded the budget
+        skip_length: Once the budget was exceeded BUDGET_OVERRUNS times in a
+            window, the shortest length that exceeded it; lines at least
+            this long are skipped without running the regex
     """
 
     pattern: str
     filter_type: FilterType
     case_sensitive: bool
     compiled: re.Pattern[str]
+    budget_skips: int = field(default=0, compare=False, repr=False)
+    skip_length: int = field(default=sys.maxsize, compare=False, repr=False)
+    _overruns: int = field(default=0, compare=False, repr=False)
+    _overrun_length: int = field(default=sys.maxsize, compare=False, repr=False)
+    _window_left: int = field(default=0, compare=False, repr=False)
 
     @classmethod
     def create(
@@ -57,7 +375,7 @@ class RegexFilter:
             re.error: If pattern is invalid
         """
         flags = 0 if case_sensitive else re.IGNORECASE
-        compiled = re.compile(pattern, flags)
+        compiled = compile_pattern(pattern, flags)
         return cls(
             pattern=pattern,
             filter_type=filter_type,
@@ -66,8 +384,51 @@ class RegexFilter:
         )
 
     def matches(self, text: str) -> bool:
-        """Check if text matches this filter's pattern."""
-        return bool(self.compiled.search(text))
+        """Check if text matches this filter's pattern.
+
+        A single overrun only fails its own line, so a GC pause or a stall
+        does not affect later lines. After BUDGET_OVERRUNS overruns within
+        BUDGET_WINDOW_LINES lines, lines at least as long as the shortest
+        of them are skipped until the window ends.
+
+        Raises:
+            MatchBudgetExceeded: If a match budget is set and this line
+                exceeded it (or is being skipped for its length).
+        """
+        budget = _match_budget_ns
+        if budget is None:
+            return bool(self.compiled.search(text))
+
+        if self._overruns:
+            self._window_left -= 1
+            if self._window_left <= 0:
+                self._forget_overruns()
+        if len(text) >= self.skip_length:
+            self.budget_skips += 1
+            raise MatchBudgetExceeded(self.pattern)
+        start = time.perf_counter_ns()
+        found = self.compiled.search(text) is not None
+        if time.perf_counter_ns() - start > budget:
+            self._record_overrun(len(text))
+            self.budget_skips += 1
+            raise MatchBudgetExceeded(self.pattern)
+        return found
+
+    def _record_overrun(self, length: int) -> None:
+        """Count an overrun, skipping long lines once they repeat."""
+        if not self._overruns:
+            self._window_left = BUDGET_WINDOW_LINES
+        self._overruns += 1
+        self._overrun_length = min(self._overrun_length, length)
+        if self._overruns >= BUDGET_OVERRUNS:
+            # Backtracking grows with input length, so skip lines at least this long
+            self.skip_length = self._overrun_length
+            self._window_left = BUDGET_WINDOW_LINES
+
+    def _forget_overruns(self) -> None:
+        """Start matching every line again."""
+        self._overruns = 0
+        self._overrun_length = self.skip_length = sys.maxsize
 
 
 @dataclass
@@ -99,7 +460,7 @@ class Highlight:
             re.error: If pattern is invalid
         """
         flags = 0 if case_sensitive else re.IGNORECASE
-        compiled = re.compile(pattern, flags)
+        compiled = compile_pattern(pattern, flags)
         return cls(
             pattern=pattern,
             case_sensitive=case_sensitive,
@@ -179,17 +540,38 @@ class FilterState:
         1. If includes exist, at least one must match (OR)
         2. If any exclude matches, hide the line
         3. If ANDs exist, all must match
+
+        A pattern that exceeds the match budget on a line counts as not
+        matching it: the line is hidden by an include or AND filter but not
+        by an exclude filter. Such lines are counted in the filter's
+        ``budget_skips``.
         """
         # Check includes (OR logic) - at least one must match
-        if self.includes and not any(f.matches(text) for f in self.includes):
+        if self.includes and not any(_matches(f, text) for f in self.includes):
             return False
 
         # Check excludes (any match hides)
-        if any(f.matches(text) for f in self.excludes):
+        if any(_matches(f, text) for f in self.excludes):
             return False
 
         # Check ANDs (all must match)
-        return not (self.ands and not all(f.matches(text) for f in self.ands))
+        return not (self.ands and not all(_matches(f, text) for f in self.ands))
+
+    def budget_skip_counts(self) -> list[tuple[str, int]]:
+        """Return (pattern, skipped lines) for filters that hit the budget."""
+        return [
+            (f.pattern, f.budget_skips)
+            for f in (*self.includes, *self.excludes, *self.ands)
+            if f.budget_skips
+        ]
+
+
+def _matches(f: RegexFilter, text: str) -> bool:
+    """Match a filter, treating a line over the match budget as no match."""
+    try:
+        return f.matches(text)
+    except MatchBudgetExceeded:
+        return False
 
 
 def parse_filter_arg(arg: str) -> tuple[str, bool]:
@@ -10,13 +10,15 @@ from __future__ import annotations
 import sys
 import threading
 import time
-from collections import deque
 from collections.abc import Callable
 from queue import Empty, Queue
 from typing import TYPE_CHECKING, TextIO
 
+from pgtail_py.entry_store import EntryStore
 from pgtail_py.field_filter import FieldFilterState
 from pgtail_py.filter import LogLevel
+from pgtail_py.filter_expression import CompiledFilter
+from pgtail_py.filter_plan import FilterPlan, build_filter_plan
 from pgtail_py.format_detector import LogFormat, detect_format
 from pgtail_py.parser import LogEntry, parse_log_line
 from pgtail_py.regex_filter import FilterState
@@ -56,6 +58,8 @@ class StdinReader:
         on_eof: Callable[[], None] | None = None,
         buffer_max_size: int = DEFAULT_BUFFER_MAX_SIZE,
         stdin: TextIO | None = None,
+        filter_expression: CompiledFilter | None = None,
+        store: EntryStore | None = None,
     ) -> None:
         """Initialize the stdin reader.
 
@@ -68,11 +72,19 @@ class StdinReader:
             on_eof: Callback when EOF is reached on stdin.
             buffer_max_size: Maximum number of entries to store in buffer.
             stdin: Optional stdin stream for testing. Defaults to sys.stdin.
+            filter_expression: Compiled ``where`` expression. None means no
+                expression filtering.
+            store: Entry store to append shown entries to, shared with the
+                consumer. None creates one holding ``buffer_max_size`` entries.
         """
         self._active_levels = active_levels
         self._regex_state = regex_state
         self._time_filter = time_filter
         self._field_filter = field_filter
+        self._filter_expression = filter_expression
+        self._filter_plan = build_filter_plan(
+            active_levels, regex_state, time_filter, field_filter, filter_expression
+        )
         self._on_entry = on_entry
         self._on_eof = on_eof
         self._stdin = stdin or sys.stdin
@@ -81,7 +93,7 @@ class StdinReader:
         self._queue: Queue[LogEntry] = Queue()
         self._stop_event = threading.Event()
         self._read_thread: threading.Thread | None = None
-        self._buffer: deque[LogEntry] = deque(maxlen=buffer_max_size)
+        self._store = store if store is not None else EntryStore(buffer_max_size)
         self._detected_format: LogFormat | None = None
         self._format_callback: Callable[[LogFormat], None] | None = None
         self._eof_reached = False
@@ -101,31 +113,33 @@ class StdinReader:
     def _should_show(self, entry: LogEntry) -> bool:
         """Check if a log entry should be displayed based on filters.
 
+        Delegates to the filter plan, which orders the filters by observed
+        rejection rate per unit of cost and keeps per-filter counters.
+
         Args:
             entry: Log entry to check.
 
         Returns:
             True if entry passes all filters.
         """
-        # Check time filter first
-        if self._time_filter is not None and not self._time_filter.matches(entry):
-            return False
-
-        # Check level filter
-        if self._active_levels is not None and entry.level not in self._active_levels:
-            return False
-
-        # Check field filter
-        if self._field_filter is not None and not self._field_filter.matches(entry):
-            return False
-
-        # Check regex filter
-        return not (
-            self._regex_state is not None
-            and self._regex_state.has_filters()
-            and not self._regex_state.should_show(entry.raw)
+        return self._filter_plan.should_show(entry)
+
+    def _rebuild_filter_plan(self) -> None:
+        """Rebuild the filter plan after a filter setting changed."""
+        self._filter_plan = build_filter_plan(
+            self._active_levels,
+            self._regex_state,
+            self._time_filter,
+            self._field_filter,
+            self._filter_expression,
+            previous=self._filter_plan,
         )
 
+    @property
+    def filter_plan(self) -> FilterPlan:
+        """Filter plan with per-filter hit-rate counters."""
+        return self._filter_plan
+
     def _read_loop(self) -> None:
         """Background thread that reads lines from stdin."""
         try:
@@ -153,8 +167,8 @@ class StdinReader:
 
                 # Check filters and queue if passes
                 if self._should_show(entry):
+                    self._store.append(entry)
                     self._queue.put(entry)
-                    self._buffer.append(entry)
 
         except OSError:
             # Stdin closed or error - treat as EOF
@@ -215,11 +229,16 @@ class StdinReader:
         Returns:
             List of log entries in chronological order.
         """
-        return list(self._buffer)
+        return self._store.entries()
 
     def clear_buffer(self) -> None:
         """Clear the buffer of collected entries."""
-        self._buffer.clear()
+        self._store.clear()
+
+    @property
+    def store(self) -> EntryStore:
+        """Entry store holding the buffered entries."""
+        return self._store
 
     @property
     def is_running(self) -> bool:
@@ -252,18 +271,27 @@ class StdinReader:
     def update_levels(self, levels: set[LogLevel] | None) -> None:
         """Update the active log levels filter."""
         self._active_levels = levels
+        self._rebuild_filter_plan()
 
     def update_regex_state(self, regex_state: FilterState | None) -> None:
         """Update the regex filter state."""
         self._regex_state = regex_state
+        self._rebuild_filter_plan()
 
     def update_time_filter(self, time_filter: TimeFilter | None) -> None:
         """Update the time filter."""
         self._time_filter = time_filter
+        self._rebuild_filter_plan()
 
     def update_field_filter(self, field_filter: FieldFilterState | None) -> None:
         """Update the field filter state."""
         self._field_filter = field_filter
+        self._rebuild_filter_plan()
+
+    def update_filter_expression(self, filter_expression: CompiledFilter | None) -> None:
+        """Update the where expression filter."""
+        self._filter_expression = filter_expression
+        self._rebuild_filter_plan()
 
 
 def is_stdin_pipe() -> bool:
@@ -17,6 +17,7 @@ from pgtail_py.tail_rich import format_entry_compact
 
 if TYPE_CHECKING:
     from pgtail_py.cli import AppState
+    from pgtail_py.entry_store import EntryStore
     from pgtail_py.parser import LogEntry
     from pgtail_py.tail_log import TailLog
     from pgtail_py.tail_status import TailStatus
@@ -35,7 +36,7 @@ class TailCommandContext:
     state: AppState
     tailer: LogTailer | None
     log_widget: TailLog
-    entries: list[LogEntry]
+    entries: EntryStore
     stop_callback: Callable[[], None]
     set_paused: Callable[[bool], None]
     rebuild_log: Callable[..., None]
@@ -138,6 +139,41 @@ def handle_export_command(
         ctx.log_widget.write_markup_line(f"[bold red]✗[/] Export failed: {e}")
 
 
+def handle_search_command(command_text: str, ctx: TailCommandContext) -> None:
+    """Handle a ``/pattern`` scrollback search in tail mode.
+
+    Sets the log widget's search; the match count is shown in the status
+    bar. A bare ``/`` clears the active search.
+
+    Args:
+        command_text: Input text starting with ``/``.
+        ctx: Command execution context.
+    """
+    import re
+
+    from rich.text import Text
+
+    from pgtail_py.tail_search import parse_search
+
+    log_widget = ctx.log_widget
+    try:
+        pattern = parse_search(command_text)
+    except re.error as e:
+        log_widget.write_text_line(
+            Text.assemble(("✗", "bold red"), f" Invalid search pattern: {e}")
+        )
+        return
+
+    if pattern is None:
+        log_widget.search(None)
+        return
+
+    # Match counts appear in the status bar. A miss is reported as a toast,
+    # since a line written to the log would be indexed by the search.
+    if not log_widget.search(pattern):
+        log_widget.notify(f"No matches for /{pattern.pattern}/", severity="warning", markup=False)
+
+
 def handle_command(command_text: str, ctx: TailCommandContext) -> None:
     """Handle a command entered in the tail mode input line.
 
@@ -147,6 +183,12 @@ def handle_command(command_text: str, ctx: TailCommandContext) -> None:
     """
     from pgtail_py.cli_tail import handle_tail_command
 
+    # /pattern searches the scrollback; handled before shlex so regex
+    # backslashes and quotes are kept verbatim
+    if command_text.lstrip().startswith("/"):
+        handle_search_command(command_text, ctx)
+        return
+
     # Use shlex to properly handle quoted arguments
     try:
         parts = shlex.split(command_text.strip())
@@ -200,7 +242,7 @@ def handle_command(command_text: str, ctx: TailCommandContext) -> None:
         ctx.update_status()
         return
 
-    # Handle theme command - switch theme and rebuild log with new colors
+    # Handle theme command - switch theme and restyle the visible rows
     if cmd == "theme":
         if not args:
             current = ctx.state.theme_manager.current_theme
@@ -211,10 +253,13 @@ def handle_command(command_text: str, ctx: TailCommandContext) -> None:
         else:
             theme_name = args[0]
             if ctx.state.theme_manager.switch_theme(theme_name):
-                ctx.rebuild_log(
-                    on_complete=lambda: log_widget.write_markup_line(
-                        f"[bold green]✓[/] Switched to theme [bold cyan]{theme_name}[/]"
-                    )
+                from pgtail_py.highlighter import get_style_table
+
+                theme = ctx.state.theme_manager.current_theme
+                # Rows keep theme-independent spans; only rendering changes
+                log_widget.set_style_table(get_style_table(theme) if theme is not None else None)
+                log_widget.write_markup_line(
+                    f"[bold green]✓[/] Switched to theme [bold cyan]{theme_name}[/]"
                 )
             else:
                 available = ", ".join(sorted(ctx.state.theme_manager._themes.keys()))
@@ -225,6 +270,19 @@ def handle_command(command_text: str, ctx: TailCommandContext) -> None:
         ctx.update_status()
         return
 
+    # Handle where command - takes the raw expression text, since shlex
+    # would strip backslashes from regex values
+    if cmd == "where" and not (args and args[0].lower() in ("help", "?")):
+        from pgtail_py.cli_tail_filters import handle_where_command
+
+        expression = command_text.strip()[len(parts[0]) :].strip()
+        previous = ctx.state.filter_expression
+        handle_where_command(expression, ctx.status, ctx.state, ctx.tailer, log_widget)
+        if ctx.state.filter_expression is not previous:
+            ctx.rebuild_log()
+        ctx.update_status()
+        return
+
     # Handle export command - needs access to entries
     if cmd == "export":
         handle_export_command(args, ctx)
@@ -235,7 +293,8 @@ def handle_command(command_text: str, ctx: TailCommandContext) -> None:
 
     # Track if this is a filter command that needs log rebuild
     filter_commands = {"level", "filter", "since", "until", "between"}
-    needs_rebuild = cmd in filter_commands and not is_help_request
+    is_stats_request = cmd == "filter" and args and args[0].lower() == "stats"
+    needs_rebuild = cmd in filter_commands and not is_help_request and not is_stats_request
 
     # Highlight commands that modify state need rebuild + cache reset
     highlight_modifies = {"enable", "disable", "add", "remove", "on", "off"}
@@ -273,6 +332,15 @@ def handle_command(command_text: str, ctx: TailCommandContext) -> None:
         else None
     )
 
+    # 'highlight stats reset' re-enables highlighters disabled over budget
+    restores_highlighters = False
+    if cmd == "highlight" and len(args) >= 2 and args[0].lower() == "stats":
+        from pgtail_py.highlighter_registry import get_registry
+
+        restores_highlighters = args[1].lower() == "reset" and bool(
+            get_registry().profile.over_budget
+        )
+
     handle_tail_command(
         cmd=cmd,
         args=args,
@@ -338,4 +406,8 @@ def handle_command(command_text: str, ctx: TailCommandContext) -> None:
             msg = f"[green]Set[/green] [cyan]{key}[/cyan] = [magenta]{value}[/magenta]"
             ctx.rebuild_log(on_complete=lambda: log_widget.write_markup_line(msg))
 
+    # The stats handler already reset the chain; re-render with the restored highlighters
+    if restores_highlighters:
+        ctx.rebuild_log()
+
     ctx.update_status()
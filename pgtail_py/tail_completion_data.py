@@ -121,6 +121,9 @@ TAIL_COMPLETION_DATA: dict[str, CompletionSpec] = {
     "filter": CompletionSpec(
         positionals=[None],  # free-form regex
     ),
+    "where": CompletionSpec(
+        positionals=[None],  # free-form expression
+    ),
     "since": CompletionSpec(
         positionals=[CompletionSpec(static_values=TIME_PRESETS)],
     ),
@@ -184,6 +187,9 @@ TAIL_COMPLETION_DATA: dict[str, CompletionSpec] = {
             ),
             "preview": CompletionSpec(no_args=True),
             "reset": CompletionSpec(no_args=True),
+            "stats": CompletionSpec(
+                positionals=[CompletionSpec(static_values=["off", "on", "reset"])],
+            ),
         },
     ),
     # -- Config commands ----------------------------------------------------
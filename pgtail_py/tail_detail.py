@@ -0,0 +1,146 @@
+"""Detail pane for pgtail tail mode.
+
+This module provides the DetailScreen shown when the user presses 'e' on a
+log row. It displays the whole entry, however long, in a scrollable pane.
+Long lines are split into rows of the pane's width up front, so a
+multi-megabyte statement scrolls like any other log instead of being
+measured and rendered as one line.
+
+Classes:
+    DetailScreen: Modal screen showing the full text of one log entry.
+
+Functions:
+    chunk_lines: Split text into rows no wider than a given width.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from textual.app import ComposeResult
+from textual.binding import Binding, BindingType
+from textual.containers import Container
+from textual.screen import ModalScreen
+from textual.widgets import Log, Static
+
+# Narrowest row the detail pane wraps text to
+MIN_DETAIL_WIDTH = 20
+
+
+def chunk_lines(text: str, width: int) -> list[str]:
+    """Split text into rows of at most ``width`` characters.
+
+    Lines are split at newlines first, then cut every ``width`` characters.
+
+    Args:
+        text: Text to split.
+        width: Maximum characters per row.
+
+    Returns:
+        Rows in order.
+    """
+    rows: list[str] = []
+    for line in text.split("\n"):
+        if len(line) <= width:
+            rows.append(line)
+        else:
+            rows.extend(line[i : i + width] for i in range(0, len(line), width))
+    return rows
+
+
+class DetailScreen(ModalScreen[None]):
+    """Modal screen showing the full text of one log entry.
+
+    Scroll with j/k, arrows, PgUp/PgDn, g/G. Dismiss with Escape, q, or e.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("escape", "dismiss", "Close", show=False),
+        Binding("q", "dismiss", "Close", show=False),
+        Binding("e", "dismiss", "Close", show=False),
+        Binding("j", "scroll_down", "Down", show=False),
+        Binding("k", "scroll_up", "Up", show=False),
+        Binding("g", "scroll_home", "Top", show=False),
+        Binding("G", "scroll_end", "Bottom", show=False),
+    ]
+
+    CSS: ClassVar[str] = """
+    DetailScreen {
+        align: center middle;
+    }
+
+    #detail-container {
+        width: 90%;
+        height: 90%;
+        background: $surface;
+        border: solid $primary;
+        padding: 0 1;
+    }
+
+    #detail-title {
+        text-style: bold;
+        color: $primary;
+    }
+
+    #detail-log {
+        height: 1fr;
+    }
+
+    #detail-footer {
+        text-align: center;
+        color: $text-muted;
+    }
+    """
+
+    def __init__(self, text: str, title: str = "Entry") -> None:
+        """Initialize the detail screen.
+
+        Args:
+            text: Full text to show.
+            title: Title shown above the text.
+        """
+        super().__init__()
+        self._text = text
+        self._title = title
+
+    def compose(self) -> ComposeResult:
+        """Compose the detail pane layout.
+
+        Yields:
+            Widgets in layout order.
+        """
+        with Container(id="detail-container"):
+            yield Static(self._title, id="detail-title", markup=False)
+            yield Log(id="detail-log")
+            yield Static(
+                f"{len(self._text):,} characters - Escape, q, or e to close",
+                id="detail-footer",
+            )
+
+    def on_mount(self) -> None:
+        """Fill the pane with the entry text wrapped to its width."""
+        log = self.query_one("#detail-log", Log)
+        # Container width less border, padding and scrollbar
+        width = max(MIN_DETAIL_WIDTH, self.app.size.width * 9 // 10 - 6)
+        log.write_lines(chunk_lines(self._text, width), scroll_end=False)
+        log.focus()
+
+    def action_scroll_down(self) -> None:
+        """Scroll the text down one row."""
+        self.query_one("#detail-log", Log).scroll_down(animate=False)
+
+    def action_scroll_up(self) -> None:
+        """Scroll the text up one row."""
+        self.query_one("#detail-log", Log).scroll_up(animate=False)
+
+    def action_scroll_home(self) -> None:
+        """Scroll to the start of the text."""
+        self.query_one("#detail-log", Log).scroll_home(animate=False)
+
+    def action_scroll_end(self) -> None:
+        """Scroll to the end of the text."""
+        self.query_one("#detail-log", Log).scroll_end(animate=False)
+
+    async def action_dismiss(self, result: None = None) -> None:
+        """Dismiss the detail screen."""
+        self.dismiss(result)
@@ -31,6 +31,14 @@ KEYBINDINGS: dict[str, list[tuple[str, str]]] = {
         ("Ctrl+b / PgUp", "Full page up"),
         ("p", "Pause (freeze display)"),
         ("f", "Resume FOLLOW mode"),
+        ("e", "Expand entry in a detail pane"),
+    ],
+    "Search": [
+        ("/pattern", "Search scrollback (type in input)"),
+        ("/pattern/c", "Case-sensitive search"),
+        ("n", "Next (newer) match"),
+        ("N", "Previous (older) match"),
+        ("/", "Clear search (empty pattern)"),
     ],
     "Selection": [
         ("v", "Visual mode (character)"),
@@ -46,6 +54,7 @@ KEYBINDINGS: dict[str, list[tuple[str, str]]] = {
         ("/ or Tab", "Focus command input"),
         ("level <lvl>", "Filter by level"),
         ("filter /re/", "Filter by regex"),
+        ("where <expr>", "Filter by expression"),
         ("since <time>", "Filter by time"),
         ("pause", "Pause log updates"),
         ("follow", "Resume updates"),
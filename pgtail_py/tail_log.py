@@ -5,35 +5,97 @@ This module provides TailLog, a subclass of Textual's Log widget that adds:
 - Visual mode selection (v/V) with keyboard-based text selection
 - Clipboard integration with OSC 52 and pyperclip fallback
 - Standard shortcuts (Ctrl+A, Ctrl+C)
+- Scrollback search with n/N navigation between matches
+- Windowed rendering of very long rows, and an expand action (e) that asks
+  the app to show the full entry
+- Optional background formatting: rows are drawn plain at first and
+  redrawn once a worker thread has formatted them, so highlighting never
+  holds up key handling
 
 Classes:
     TailLog: Log widget with vim-style navigation and visual mode.
     SelectionCopied: Message emitted when text is copied to clipboard.
     VisualModeChanged: Message emitted when visual mode state changes.
+    SearchUpdated: Message emitted when the search or match position changes.
+    ExpandRequested: Message emitted to show the full entry at the cursor.
 """
 
 from __future__ import annotations
 
 import sys
-from collections.abc import Iterable
-from typing import Any, ClassVar
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
 
 from rich.cells import cell_len
 from rich.style import Style
-from rich.text import Text
+from rich.text import Span, Text
 from textual import events
 from textual.binding import Binding, BindingType
+from textual.cache import LRUCache
 from textual.geometry import Offset, Size
 from textual.message import Message
 from textual.selection import Selection
 from textual.strip import Strip
 from textual.widgets import Log
 
+from pgtail_py.tail_search import SearchIndex, SearchPattern
+
+if TYPE_CHECKING:
+    from pgtail_py.highlighter import StyleTable
+    from pgtail_py.parser import LogEntry
+
 # Sentinel value for "end of line" in column positions.
 # Using sys.maxsize instead of a magic number ensures correct behavior
 # even for extremely long lines.
 END_OF_LINE = sys.maxsize
 
+# Number of formatted entries kept for lazily rendered rows
+FORMATTED_ROW_CACHE_SIZE = 2048
+
+# Rows longer than this many characters are measured by length and rendered
+# (and highlighted on demand) only around the visible columns
+LONG_LINE_CHARS = 10_000
+
+# Characters styled on either side of the visible columns of a long row, so
+# highlights cut at the window edges fall outside the view
+LONG_LINE_MARGIN = 256
+
+# Most entries waiting for the background formatter; older requests are
+# dropped (rows still on screen ask again when redrawn)
+FORMAT_QUEUE_LIMIT = 512
+
+# Seconds of formatting the background worker batches before handing rows back
+FORMAT_BATCH_SECONDS = 0.005
+
+# Bytes of the two list slots (plain and styled store) each row takes
+_ROW_SLOT_BYTES = 16
+
+
+class _EntryRow(NamedTuple):
+    """A display row stored by reference and formatted on render."""
+
+    entry: LogEntry
+    row: int
+
+
+def _split_formatted(formatted: Text) -> list[Text]:
+    """Split a formatted entry into its display rows."""
+    return formatted.split("\n") if formatted.plain else [formatted]
+
+
+def _row_size(plain: str, stored: Text | _EntryRow) -> int:
+    """Approximate the bytes a row holds, besides the entry it refers to.
+
+    A styled Text row keeps its own copy of the text, so it is counted twice.
+    """
+    size = sys.getsizeof(plain) + sys.getsizeof(stored) + _ROW_SLOT_BYTES
+    if isinstance(stored, Text):
+        size += sys.getsizeof(plain)
+    return size
+
 
 class TailLog(Log):
     """Log widget with vim-style navigation and visual mode selection.
@@ -44,6 +106,7 @@ class TailLog(Log):
     - Visual mode (v/V) for keyboard-based selection
     - Clipboard copy with OSC 52 + pyperclip fallback
     - Standard shortcuts (Ctrl+A, Ctrl+C)
+    - Scrollback search (n/N jump to next/previous match)
 
     Attributes:
         _visual_mode: True if currently in visual mode.
@@ -79,6 +142,11 @@ class TailLog(Log):
         # Standard shortcuts
         Binding("ctrl+a", "select_all", "Select all", show=False),
         Binding("ctrl+c", "copy_selection", "Copy", show=False),
+        # Search navigation
+        Binding("n", "search_next", "Next match", show=False),
+        Binding("N", "search_prev", "Previous match", show=False),
+        # Full entry in a detail pane
+        Binding("e", "expand", "Expand", show=False),
     ]
 
     class SelectionCopied(Message):
@@ -119,6 +187,27 @@ class TailLog(Log):
             self.line_mode = line_mode
             super().__init__()
 
+    class SearchUpdated(Message):
+        """Emitted when the search pattern, matches, or match position changes."""
+
+        pass
+
+    class RowsFormatted(Message, bubble=False):
+        """Posted by the background formatter with entries it has formatted.
+
+        Attributes:
+            rows: (cache key, entry, display rows) in the order requested.
+        """
+
+        def __init__(self, rows: list[tuple[tuple[int, Hashable], LogEntry, list[Text]]]) -> None:
+            """Initialize RowsFormatted message.
+
+            Args:
+                rows: Formatted entries in the order requested.
+            """
+            self.rows = rows
+            super().__init__()
+
     class PauseRequested(Message):
         """Emitted when user requests pause mode (p key)."""
 
@@ -129,11 +218,35 @@ class TailLog(Log):
 
         pass
 
+    class ExpandRequested(Message):
+        """Emitted when the user asks to see the full entry at the cursor (e key).
+
+        Attributes:
+            text: Plain text of the whole entry (all of its rows).
+            entry: The entry, or None for rows written as text.
+        """
+
+        def __init__(self, text: str, entry: LogEntry | None) -> None:
+            """Initialize ExpandRequested message.
+
+            Args:
+                text: Plain text of the whole entry.
+                entry: The entry, or None for rows written as text.
+            """
+            self.text = text
+            self.entry = entry
+            super().__init__()
+
     def __init__(
         self,
         max_lines: int | None = 10000,
         auto_scroll: bool = True,
         *,
+        entry_formatter: Callable[[LogEntry], Text] | None = None,
+        entry_plain: Callable[[LogEntry], str] | None = None,
+        format_key: Callable[[], Hashable] | None = None,
+        highlight_window: Callable[[LogEntry, int, str, int], Text] | None = None,
+        format_in_background: bool = False,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -143,6 +256,24 @@ class TailLog(Log):
         Args:
             max_lines: Maximum lines to retain (default 10,000).
             auto_scroll: Auto-scroll to new content (default True).
+            entry_formatter: Formats a LogEntry as styled text for
+                ``write_entries()``. Called only for rows being rendered.
+            entry_plain: Returns the plain text ``entry_formatter`` would
+                produce, without styling.
+            format_key: Returns a value that changes whenever
+                ``entry_formatter`` output would (e.g. highlighting). With
+                it, formatted entries are cached by sequence number and key
+                and reused across ``clear()``.
+            highlight_window: Styles a slice of a long entry row, given the
+                entry, its display row, the slice's plain text and the
+                column it starts at. Rows over ``LONG_LINE_CHARS`` are
+                highlighted with it around the visible columns; it should
+                only style columns past those the entry formatter
+                highlighted (highlighting of long messages is truncated).
+            format_in_background: Call ``entry_formatter`` from a worker
+                thread. Rows not formatted yet are drawn plain and redrawn
+                when their formatting arrives. The formatter must then be
+                safe to call from another thread.
             name: Widget name.
             id: Widget ID for CSS/queries.
             classes: CSS classes.
@@ -163,8 +294,61 @@ class TailLog(Log):
         # Track mouse down position to detect drag vs click
         self._mouse_down_pos: tuple[int, int] | None = None
         # Rich renderables parallel Textual Log._lines. _lines stores plain text
-        # for sizing, navigation, and copying; _rich_lines stores style spans.
-        self._rich_lines: list[Text] = []
+        # for sizing, navigation, and copying; _rich_lines stores style spans,
+        # or an entry reference for rows written with write_entries().
+        self._rich_lines: list[Text | _EntryRow] = []
+        self._entry_formatter = entry_formatter
+        self._entry_plain = entry_plain
+        self._format_key = format_key
+        self._highlight_window = highlight_window
+        # Formatted rows of recently rendered entries, keyed by store sequence
+        # number (or id() for unstored entries) and format key
+        self._formatted_rows: LRUCache[tuple[int, Hashable], tuple[LogEntry, list[Text]]] = (
+            LRUCache(FORMATTED_ROW_CACHE_SIZE)
+        )
+        # Entries waiting for the background formatter, by cache key. The
+        # lock guards the queue and the running flag shared with the worker.
+        self._format_in_background = format_in_background
+        self._format_queue: deque[tuple[tuple[int, Hashable], LogEntry]] = deque()
+        self._format_queued: set[tuple[int, Hashable]] = set()
+        self._format_lock = threading.Lock()
+        self._format_running = False
+        # Resolves ThemeKey span styles when rows are drawn
+        self._style_table: StyleTable | None = None
+        # Search index kept in lockstep with _lines (see tail_search)
+        self._search_index = SearchIndex()
+        # Bytes held by rows in _lines and _rich_lines (see _row_size)
+        self._row_bytes = 0
+
+    @property
+    def style_table(self) -> StyleTable | None:
+        """Table resolving ThemeKey span styles, or None."""
+        return self._style_table
+
+    def set_style_table(self, table: StyleTable | None) -> None:
+        """Restyle the log for a new theme.
+
+        Stored and cached rows keep their theme-independent spans, so only
+        the rendered lines are dropped and the visible rows redrawn.
+
+        Args:
+            table: Table resolving ThemeKey span styles, or None to leave
+                them unstyled.
+        """
+        if table is self._style_table:
+            return
+        self._style_table = table
+        self._render_line_cache.clear()
+        self.refresh()
+
+    def reformat(self) -> None:
+        """Redraw the visible rows after the entry formatter's output changed.
+
+        Call once ``format_key`` returns a new value, so rows already drawn
+        are formatted again instead of reusing their rendered lines.
+        """
+        self._render_line_cache.clear()
+        self.refresh()
 
     def write_text_line(
         self,
@@ -193,9 +377,6 @@ class TailLog(Log):
         This mirrors Textual Log.write_lines(), but stores a parallel rich-text
         representation so rendering can avoid Rich markup parsing.
         """
-        is_vertical_scroll_end = self.is_vertical_scroll_end
-        auto_scroll = self.auto_scroll if scroll_end is None else scroll_end
-
         new_rich_lines: list[Text] = []
         for line in lines:
             if not line.plain:
@@ -205,22 +386,211 @@ class TailLog(Log):
         if not new_rich_lines:
             return self
 
-        start_line = len(self._lines)
         new_plain_lines = [line.plain for line in new_rich_lines]
-        self._lines.extend(new_plain_lines)
-        self._rich_lines.extend(new_rich_lines)
+        self._update_size(self._updates, new_plain_lines)
+        self._append_rows(new_plain_lines, new_rich_lines, scroll_end)
+        return self
+
+    def write_entries(
+        self,
+        entries: Iterable[LogEntry],
+        scroll_end: bool | None = None,
+    ) -> TailLog:
+        """Write log entries as rows that are formatted when rendered.
+
+        Only the plain text is built here. Styled text comes from the
+        ``entry_formatter`` when a row is first drawn, so entries that are
+        never scrolled into view are never highlighted. Line width is
+        approximated from the plain text length.
+
+        Args:
+            entries: Entries to append.
+            scroll_end: Scroll to the end after writing, or ``None`` to use auto-scroll.
+
+        Returns:
+            This widget.
+
+        Raises:
+            RuntimeError: If the widget has no entry formatter.
+        """
+        new_plain_lines, new_rows = self._entry_rows(entries)
+        if new_rows:
+            self._append_rows(new_plain_lines, new_rows, scroll_end)
+        return self
+
+    def prepend_entries(self, entries: Iterable[LogEntry], max_rows: int | None = None) -> int:
+        """Insert log entries above the existing rows, keeping the view in place.
+
+        Used to page older entries back in when scrolling up past the
+        oldest row, and to backfill a rebuild. ``max_lines`` is not applied;
+        the caller trims rows or passes ``max_rows``.
+
+        Args:
+            entries: Entries older than every row, oldest first.
+            max_rows: Total row count not to exceed; the oldest inserted
+                rows beyond it are dropped. None inserts every row.
+
+        Returns:
+            Number of rows inserted.
+
+        Raises:
+            RuntimeError: If the widget has no entry formatter.
+        """
+        new_plain_lines, new_rows = self._entry_rows(entries)
+        if max_rows is not None:
+            room = max(0, max_rows - len(self._lines))
+            if len(new_rows) > room:
+                del new_plain_lines[: len(new_rows) - room]
+                del new_rows[: len(new_rows) - room]
+        count = len(new_rows)
+        if not count:
+            return 0
+        self._lines[:0] = new_plain_lines
+        self._rich_lines[:0] = new_rows
+        self._row_bytes += sum(map(_row_size, new_plain_lines, new_rows))
+        self._shift_render_cache(count)
+        self._cursor_line += count
+        if self._visual_anchor_line is not None:
+            self._visual_anchor_line += count
+        self._search_index.prepend(new_plain_lines)
+        self.virtual_size = Size(self._width, len(self._lines))
+        self.scroll_to(y=self.scroll_y + count, animate=False, immediate=True)
+        self.refresh()
+        return count
+
+    def remove_last_rows(self, count: int) -> None:
+        """Remove rows from the bottom of the log.
+
+        Args:
+            count: Number of rows to remove.
+        """
+        count = min(count, len(self._lines))
+        if count <= 0:
+            return
+        self._row_bytes -= sum(map(_row_size, self._lines[-count:], self._rich_lines[-count:]))
+        del self._lines[-count:]
+        del self._rich_lines[-count:]
+        self._shift_render_cache(0)
+        self._cursor_line = max(0, min(self._cursor_line, len(self._lines) - 1))
+        self._search_index.drop_last(count)
+        self.virtual_size = Size(self._width, len(self._lines))
+        self.refresh()
+
+    @property
+    def memory_usage(self) -> int:
+        """Approximate bytes held by rows and the search index, besides entries."""
+        return self._row_bytes + self._search_index.memory_usage
+
+    def front_entry_bytes(self, nbytes: int) -> dict[int, int]:
+        """Charge the memory of the oldest rows to the entries they show.
+
+        Rows are walked from the top until ``nbytes`` are charged. Each row
+        also carries its share of the search index. Styled message rows are
+        charged to the next entry, since ``prune_entries_before`` drops them
+        with it.
+
+        Args:
+            nbytes: Bytes to charge.
+
+        Returns:
+            Bytes charged to each entry, by store sequence number.
+        """
+        scale = self.memory_usage / self._row_bytes if self._row_bytes else 1.0
+        charged: dict[int, int] = {}
+        pending = 0
+        total = 0
+        for plain, stored in zip(self._lines, self._rich_lines, strict=True):
+            if total >= nbytes:
+                break
+            pending += int(_row_size(plain, stored) * scale)
+            if isinstance(stored, _EntryRow) and stored.entry.seq is not None:
+                seq = stored.entry.seq
+                charged[seq] = charged.get(seq, 0) + pending
+                total += pending
+                pending = 0
+        return charged
+
+    @property
+    def first_entry_seq(self) -> int | None:
+        """Store sequence number of the oldest entry row, or None."""
+        for stored in self._rich_lines:
+            if isinstance(stored, _EntryRow):
+                return stored.entry.seq
+        return None
 
+    @property
+    def last_entry_seq(self) -> int | None:
+        """Store sequence number of the newest entry row, or None."""
+        for stored in reversed(self._rich_lines):
+            if isinstance(stored, _EntryRow):
+                return stored.entry.seq
+        return None
+
+    def _entry_rows(self, entries: Iterable[LogEntry]) -> tuple[list[str], list[_EntryRow]]:
+        """Build the plain text and row references of entries.
+
+        Also widens the virtual size to the longest new row.
+
+        Args:
+            entries: Entries to lay out.
+
+        Returns:
+            Plain text and entry reference of each row.
+
+        Raises:
+            RuntimeError: If the widget has no entry formatter.
+        """
+        if self._entry_formatter is None or self._entry_plain is None:
+            raise RuntimeError("TailLog has no entry formatter")
+
+        new_plain_lines: list[str] = []
+        new_rows: list[_EntryRow] = []
+        entry_plain = self._entry_plain
+        for entry in entries:
+            rows = _split_rows(entry_plain(entry))
+            new_plain_lines.extend(rows)
+            new_rows.extend(_EntryRow(entry, i) for i in range(len(rows)))
+
+        if new_plain_lines:
+            self._update_maximum_width(self._updates, max(map(len, new_plain_lines)))
+        return new_plain_lines, new_rows
+
+    def _append_rows(
+        self,
+        plain_lines: list[str],
+        rows: list[Text] | list[_EntryRow],
+        scroll_end: bool | None,
+    ) -> None:
+        """Append rows to the plain and styled stores and refresh.
+
+        Args:
+            plain_lines: Plain text of each row.
+            rows: Styled text or entry reference for each row.
+            scroll_end: Scroll to the end after writing, or ``None`` to use auto-scroll.
+        """
+        is_vertical_scroll_end = self.is_vertical_scroll_end
+        auto_scroll = self.auto_scroll if scroll_end is None else scroll_end
+
+        start_line = len(self._lines)
+        self._lines.extend(plain_lines)
+        self._rich_lines.extend(rows)
+        self._row_bytes += sum(map(_row_size, plain_lines, rows))
+        self._search_index.append(plain_lines)
+
+        pruned = 0
         if self.max_lines is not None and len(self._lines) > self.max_lines:
+            pruned = len(self._lines) - self.max_lines
             self._prune_max_lines()
 
         self.virtual_size = Size(self._width, len(self._lines))
-        self._update_size(self._updates, new_plain_lines)
-        self.refresh_lines(start_line, len(new_plain_lines))
+        self.refresh_lines(start_line, len(plain_lines))
         if auto_scroll and not self.is_vertical_scrollbar_grabbed and is_vertical_scroll_end:
             self.scroll_end(animate=False, immediate=True, x_axis=False)
         else:
+            if pruned and self.scroll_y > 0:
+                # Keep the rows being read in view as older rows are dropped
+                self.scroll_to(y=max(0, self.scroll_y - pruned), animate=False, immediate=True)
             self.refresh()
-        return self
 
     def write_line(
         self,
@@ -258,29 +628,96 @@ class TailLog(Log):
         return self
 
     def clear(self) -> TailLog:
-        """Clear stored plain and styled lines."""
+        """Clear stored plain and styled lines.
+
+        Formatted entries stay cached when the widget has a ``format_key``,
+        so rows written again after a filter change are not re-highlighted.
+        """
         super().clear()
         self._rich_lines.clear()
+        self._row_bytes = 0
+        if self._format_key is None:
+            self._formatted_rows.clear()
+        self._search_index.clear()
         return self
 
+    def prune_entries_before(self, seq: int) -> int:
+        """Drop leading rows whose entries were evicted from the entry store.
+
+        Rows hold references to their entries, so the log has to let go of
+        them for the store's memory budget to take effect. Styled message
+        lines older than the last evicted entry row are dropped with it.
+
+        Args:
+            seq: Sequence number of the oldest entry still in the store.
+
+        Returns:
+            Number of rows removed.
+        """
+        remove_lines = 0
+        for i, stored in enumerate(self._rich_lines):
+            if isinstance(stored, _EntryRow):
+                entry_seq = stored.entry.seq
+                if entry_seq is None or entry_seq >= seq:
+                    break
+                remove_lines = i + 1
+        if remove_lines:
+            self._remove_front(remove_lines)
+            self.virtual_size = Size(self._width, len(self._lines))
+            self.refresh()
+        return remove_lines
+
     def _prune_max_lines(self) -> None:
         """Prune plain and styled line stores together."""
         if self.max_lines is None:
             return
         remove_lines = len(self._lines) - self.max_lines
         if remove_lines > 0:
-            del self._rich_lines[:remove_lines]
-        super()._prune_max_lines()
+            self._remove_front(remove_lines)
+
+    def _remove_front(self, count: int) -> None:
+        """Remove the first ``count`` rows from every line store.
+
+        Args:
+            count: Number of rows to remove.
+        """
+        self._row_bytes -= sum(map(_row_size, self._lines[:count], self._rich_lines[:count]))
+        del self._rich_lines[:count]
+        self._search_index.prune(count)
+        self._shift_render_cache(-count)
+        del self._lines[:count]
+
+    def _shift_render_cache(self, offset: int) -> None:
+        """Move rendered strips after rows were inserted or removed.
+
+        Rendered strips are keyed by line index. Strips that no longer map
+        to a row are dropped.
+
+        Args:
+            offset: Rows inserted (positive) or removed (negative) at the top.
+        """
+        cache = self._render_line_cache
+        lines = cache.keys()
+        limit = len(self._rich_lines)
+        shifted = {y + offset: cache[y] for y in lines if 0 <= y + offset < limit}
+        cache.clear()
+        for y, strip in shifted.items():
+            cache[y] = strip
 
     def _update_size(self, updates: int, lines: list[str]) -> None:
         """Update width synchronously from plain lines.
 
         Textual's base implementation runs this in a worker thread. Keeping the
         width update local avoids touching Rich Text objects across threads.
+        Rows over ``LONG_LINE_CHARS`` count one cell per character.
         """
         if lines:
             _process_line = self._process_line
-            max_length = max(cell_len(_process_line(line)) for line in lines)
+            # Long rows are measured by length rather than scanned for cell widths
+            max_length = max(
+                len(line) if len(line) > LONG_LINE_CHARS else cell_len(_process_line(line))
+                for line in lines
+            )
             self._update_maximum_width(updates, max_length)
 
     @property
@@ -526,6 +963,75 @@ class TailLog(Log):
         if success:
             self.post_message(self.SelectionCopied(plain_text, len(plain_text)))
 
+    def action_expand(self) -> None:
+        """Ask the app to show the whole entry at the cursor line (e key)."""
+        if self.line_count == 0:
+            return
+        y = min(self._cursor_line, self.line_count - 1)
+        stored = self._rich_lines[y] if y < len(self._rich_lines) else None
+        if isinstance(stored, _EntryRow) and self._entry_plain is not None:
+            self.post_message(self.ExpandRequested(self._entry_plain(stored.entry), stored.entry))
+        else:
+            self.post_message(self.ExpandRequested(self._lines[y], None))
+
+    # Search
+
+    @property
+    def search_pattern(self) -> SearchPattern | None:
+        """Active search pattern, or None when no search is active."""
+        return self._search_index.pattern
+
+    @property
+    def search_match_count(self) -> int:
+        """Number of lines matching the active search."""
+        return self._search_index.match_count
+
+    @property
+    def search_position(self) -> int:
+        """1-based ordinal of the match at or before the cursor (0 if none)."""
+        return self._search_index.position(self._cursor_line)
+
+    def search(self, pattern: SearchPattern | None) -> int:
+        """Set the active search and jump to the most recent match.
+
+        Lines written afterwards are matched incrementally, so the match
+        count stays current while tailing. Passing None clears the search.
+
+        Args:
+            pattern: Pattern to search for, or None to clear the search.
+
+        Returns:
+            Number of matching lines.
+        """
+        count = self._search_index.search(pattern, self._lines)
+        if count:
+            self._jump_to_match(self._search_index.next_match(self.line_count, forward=False))
+        self.post_message(self.SearchUpdated())
+        return count
+
+    def action_search_next(self) -> None:
+        """Move cursor to the next (newer) search match, wrapping around."""
+        self._jump_to_match(self._search_index.next_match(self._cursor_line, forward=True))
+        self.post_message(self.SearchUpdated())
+
+    def action_search_prev(self) -> None:
+        """Move cursor to the previous (older) search match, wrapping around."""
+        self._jump_to_match(self._search_index.next_match(self._cursor_line, forward=False))
+        self.post_message(self.SearchUpdated())
+
+    def _jump_to_match(self, line: int | None) -> None:
+        """Move the cursor to a match line and keep it visible.
+
+        Args:
+            line: Line index of the match, or None for no-op.
+        """
+        if line is None or not 0 <= line < self.line_count:
+            return
+        self._cursor_line = line
+        self._cursor_col = 0
+        self._select_cursor_line()
+        self._scroll_cursor_visible()
+
     # Event handlers
 
     def on_mouse_down(self, event: events.MouseDown) -> None:
@@ -799,7 +1305,10 @@ class TailLog(Log):
         The cache is bypassed whenever a text selection is active (selection
         styling varies per-render) and is cleared automatically by the parent on
         ``clear()``, ``notify_style_update()``, ``selection_updated()``,
-        and ``_prune_max_lines()``.
+        and ``_prune_max_lines()``, and by ``set_style_table()``.
+
+        ThemeKey span styles are resolved through the style table here, so
+        a theme switch never reformats entries.
 
         Args:
             y: Y offset of line.
@@ -812,10 +1321,62 @@ class TailLog(Log):
         if selection is None and y in self._render_line_cache:
             return self._render_line_cache[y]
 
-        if y < len(self._rich_lines):
-            line_text = self._rich_lines[y].copy()
+        stored = self._rich_lines[y] if y < len(self._rich_lines) else None
+        pending = False
+        if isinstance(stored, Text):
+            line_text = stored.copy()
+        elif stored is not None:
+            formatted = self._format_row(stored, y)
+            # Drawn plain until the background formatter hands the row back
+            pending = formatted is None
+            line_text = Text(self._lines[y]) if formatted is None else formatted
         else:
             line_text = Text(self._lines[y])
+        line = self._finish_line(line_text, y, rich_style)
+
+        if selection is None and not pending:
+            self._render_line_cache[y] = line
+        return line
+
+    def _render_line(self, y: int, scroll_x: int, width: int) -> Strip:
+        """Render a line into a cropped strip.
+
+        Rows over ``LONG_LINE_CHARS`` characters are styled and rendered only
+        around the visible columns, counting one cell per character (tabs
+        and wide characters make their horizontal position approximate).
+
+        Args:
+            y: Y offset of line.
+            scroll_x: Current horizontal scroll.
+            width: Width of the widget.
+
+        Returns:
+            A Strip suitable for rendering.
+        """
+        if y < len(self._lines) and len(self._lines[y]) > LONG_LINE_CHARS:
+            rich_style = self.rich_style
+            start = max(0, scroll_x - LONG_LINE_MARGIN)
+            stop = scroll_x + width + LONG_LINE_MARGIN
+            line = self._finish_line(self._row_window(y, start, stop), y, rich_style, start)
+            line = line.crop_extend(scroll_x - start, scroll_x - start + width, rich_style)
+            return line.apply_offsets(scroll_x, y)
+        return super()._render_line(y, scroll_x, width)
+
+    def _finish_line(self, line_text: Text, y: int, rich_style: Style, offset: int = 0) -> Strip:
+        """Resolve styles, apply background and selection, and render a row.
+
+        Args:
+            line_text: Styled text of the row (or of a window of it), which
+                is modified in place.
+            y: Line index.
+            rich_style: Base Rich style for line.
+            offset: Column of the row at which ``line_text`` starts.
+
+        Returns:
+            Strip with the rendered text.
+        """
+        if self._style_table is not None:
+            self._style_table.resolve(line_text)
         line_text.expand_tabs()
         line_text.no_wrap = True
 
@@ -825,20 +1386,185 @@ class TailLog(Log):
             bg_only = Style(bgcolor=rich_style.bgcolor)
             line_text.stylize(bg_only, 0, len(line_text))
 
+        selection = self.text_selection
         if (
             selection is not None
             and (select_span := selection.get_span(y - self._clear_y)) is not None
         ):
             start, end = select_span
             if end == -1:
-                end = len(line_text)
+                end = offset + len(line_text)
 
             selection_style = self.screen.get_component_rich_style("screen--selection")
-            line_text.stylize(selection_style, start, end)
+            line_text.stylize(selection_style, start - offset, end - offset)
 
         app: Any = self.app  # type: ignore[assignment]
-        line = Strip(line_text.render(app.console), line_text.cell_len)
+        return Strip(line_text.render(app.console), line_text.cell_len)
 
-        if selection is None:
-            self._render_line_cache[y] = line
-        return line
+    def _row_window(self, y: int, start: int, stop: int) -> Text:
+        """Style columns ``[start, stop)`` of a long row.
+
+        Slices the row's styled text, then adds ``highlight_window`` spans
+        for the part of an entry row its formatting did not highlight.
+
+        Args:
+            y: Line index.
+            start: First column.
+            stop: Column to stop before.
+
+        Returns:
+            Styled text of the window, safe to stylize.
+        """
+        stored = self._rich_lines[y] if y < len(self._rich_lines) else None
+        if isinstance(stored, Text):
+            styled = stored
+        elif stored is not None:
+            formatted = self._formatted_row(stored, y, wait=not self._format_in_background)
+            styled = Text(self._lines[y]) if formatted is None else formatted
+        else:
+            styled = Text(self._lines[y])
+        window = _slice_text(styled, start, stop)
+
+        if self._highlight_window is not None and isinstance(stored, _EntryRow):
+            highlighted = self._highlight_window(stored.entry, stored.row, window.plain, start)
+            window.spans.extend(highlighted.spans)
+        return window
+
+    def _format_row(self, stored: _EntryRow, y: int) -> Text | None:
+        """Format an entry row, reusing recently formatted entries.
+
+        Args:
+            stored: Entry reference for the row.
+            y: Line index, used for a plain fallback.
+
+        Returns:
+            A copy of the row's styled text, safe to stylize, or None if the
+            entry was handed to the background formatter.
+        """
+        formatted = self._formatted_row(stored, y, wait=not self._format_in_background)
+        return formatted.copy() if formatted is not None else None
+
+    def _formatted_row(self, stored: _EntryRow, y: int, wait: bool = True) -> Text | None:
+        """Look up (or format) the styled text of an entry row.
+
+        Args:
+            stored: Entry reference for the row.
+            y: Line index, used for a plain fallback.
+            wait: Format an uncached entry here. Otherwise it is queued for
+                the background formatter and None is returned.
+
+        Returns:
+            The cached row text, which must not be modified.
+        """
+        entry = stored.entry
+        seq = entry.seq
+        key = (
+            seq if seq is not None else -id(entry),
+            self._format_key() if self._format_key is not None else None,
+        )
+        cached = self._formatted_rows.get(key)
+        # Sequence numbers are unique; the identity check guards against
+        # id() reuse after pruning
+        if cached is None or (seq is None and cached[0] is not entry):
+            if not wait:
+                self._queue_format(key, entry)
+                return None
+            assert self._entry_formatter is not None
+            cached = (entry, _split_formatted(self._entry_formatter(entry)))
+            self._formatted_rows.set(key, cached)
+        rows = cached[1]
+        if stored.row < len(rows):
+            return rows[stored.row]
+        return Text(self._lines[y])
+
+    # Background formatting
+
+    def _queue_format(self, key: tuple[int, Hashable], entry: LogEntry) -> None:
+        """Ask the background formatter for an entry, starting it if idle.
+
+        Args:
+            key: Formatted-row cache key of the entry.
+            entry: Entry to format.
+        """
+        if key in self._format_queued:
+            return
+        self._format_queued.add(key)
+        with self._format_lock:
+            queue = self._format_queue
+            queue.append((key, entry))
+            while len(queue) > FORMAT_QUEUE_LIMIT:
+                self._format_queued.discard(queue.popleft()[0])
+            if self._format_running:
+                return
+            self._format_running = True
+        self.run_worker(self._format_queued_entries, thread=True, group="format")
+
+    def _format_queued_entries(self) -> None:
+        """Format queued entries in order until the queue is empty.
+
+        Runs in a worker thread. Finished rows are posted back in batches of
+        about ``FORMAT_BATCH_SECONDS`` of work.
+        """
+        assert self._entry_formatter is not None
+        formatter = self._entry_formatter
+        batch: list[tuple[tuple[int, Hashable], LogEntry, list[Text]]] = []
+        deadline = time.perf_counter() + FORMAT_BATCH_SECONDS
+        while True:
+            with self._format_lock:
+                if not self._format_queue:
+                    self._format_running = False
+                    break
+                key, entry = self._format_queue.popleft()
+            batch.append((key, entry, _split_formatted(formatter(entry))))
+            if time.perf_counter() >= deadline:
+                self.post_message(self.RowsFormatted(batch))
+                batch = []
+                deadline = time.perf_counter() + FORMAT_BATCH_SECONDS
+        if batch:
+            self.post_message(self.RowsFormatted(batch))
+
+    def on_tail_log_rows_formatted(self, message: RowsFormatted) -> None:
+        """Cache rows from the background formatter and redraw them."""
+        for key, entry, rows in message.rows:
+            self._format_queued.discard(key)
+            self._formatted_rows.set(key, (entry, rows))
+        self.refresh()
+
+
+def _split_rows(plain: str) -> list[str]:
+    """Split plain text into rows the way Text.split("\\n") does.
+
+    Args:
+        plain: Plain text of one entry.
+
+    Returns:
+        Rows, without a trailing blank row.
+    """
+    rows = plain.split("\n")
+    if len(rows) > 1 and not rows[-1]:
+        rows.pop()
+    return rows
+
+
+def _slice_text(text: Text, start: int, stop: int) -> Text:
+    """Copy characters ``[start, stop)`` of a Text with their spans.
+
+    Unlike ``Text.__getitem__``, only the spans are scanned, not split
+    copies of the whole text.
+
+    Args:
+        text: Styled text.
+        start: First character.
+        stop: Character to stop before.
+
+    Returns:
+        New Text for the slice.
+    """
+    plain = text.plain[start:stop]
+    end = start + len(plain)
+    spans = [
+        Span(max(span.start, start) - start, min(span.end, end) - start, span.style)
+        for span in text.spans
+        if span.end > start and span.start < end
+    ]
+    return Text(plain, style=text.style, spans=spans)
@@ -0,0 +1,120 @@
+"""Adaptive highlighting quality for tail mode.
+
+During a burst, semantic highlighting of every row drawn is the dominant
+cost of the Textual display. A QualityController watches the ingest rate
+and the time spent formatting rows each frame and steps highlighting down
+one tier at a time while either stays over its limit, then back up once
+both have been well under it for a while:
+
+    full     every enabled highlighter
+    reduced  structural and SQL highlighters only
+    levels   level colors only, message left plain
+    plain    no styling at all
+
+Classes:
+    HighlightTier: Highlighting quality levels, best first.
+    QualityController: Picks a tier from per-frame load measurements.
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum
+
+# Registry categories kept by the reduced tier
+REDUCED_CATEGORIES = frozenset({"structural", "sql"})
+
+# Lines per second above which a frame counts as overloaded
+DEFAULT_INGEST_LIMIT = 5000.0
+
+# Share of the frame interval formatting may take before a frame is overloaded
+DEFAULT_BUSY_SHARE = 0.5
+
+# Consecutive overloaded frames before stepping down a tier
+STEP_DOWN_FRAMES = 3
+
+# Consecutive calm frames before stepping up a tier
+STEP_UP_FRAMES = 30
+
+
+class HighlightTier(IntEnum):
+    """Highlighting quality levels, from best to cheapest."""
+
+    FULL = 0
+    REDUCED = 1
+    LEVELS = 2
+    PLAIN = 3
+
+    @property
+    def label(self) -> str:
+        """Lowercase name shown in the status bar."""
+        return self.name.lower()
+
+
+class QualityController:
+    """Pick a highlighting tier from ingest rate and formatting time.
+
+    A frame is overloaded when lines arrive faster than ``ingest_limit``
+    per second or formatting took more than ``busy_limit`` seconds. It is
+    calm when both are under half their limit. After ``down_frames``
+    overloaded frames in a row the tier drops one level; after ``up_frames``
+    calm frames in a row it rises one level. Frames in between reset both
+    streaks, so the tier does not flap around a limit.
+    """
+
+    def __init__(
+        self,
+        busy_limit: float,
+        ingest_limit: float = DEFAULT_INGEST_LIMIT,
+        down_frames: int = STEP_DOWN_FRAMES,
+        up_frames: int = STEP_UP_FRAMES,
+    ) -> None:
+        """Initialize the controller at the full tier.
+
+        Args:
+            busy_limit: Seconds of formatting per frame before it is overloaded.
+            ingest_limit: Lines per second before a frame is overloaded.
+            down_frames: Overloaded frames in a row before stepping down.
+            up_frames: Calm frames in a row before stepping up.
+        """
+        self.busy_limit = busy_limit
+        self.ingest_limit = ingest_limit
+        self.down_frames = down_frames
+        self.up_frames = up_frames
+        self.tier = HighlightTier.FULL
+        self._overloaded = 0
+        self._calm = 0
+
+    def observe(self, lines: int, elapsed: float, busy: float) -> HighlightTier | None:
+        """Record one frame's load.
+
+        Args:
+            lines: Lines written to the log during the frame.
+            elapsed: Seconds the frame lasted.
+            busy: Seconds spent formatting rows during the frame.
+
+        Returns:
+            The new tier if it changed, otherwise None.
+        """
+        rate = lines / elapsed if elapsed > 0 else 0.0
+        if rate > self.ingest_limit or busy > self.busy_limit:
+            self._calm = 0
+            self._overloaded += 1
+            if self._overloaded >= self.down_frames and self.tier < HighlightTier.PLAIN:
+                self._overloaded = 0
+                self.tier = HighlightTier(self.tier + 1)
+                return self.tier
+        elif rate < self.ingest_limit / 2 and busy < self.busy_limit / 2:
+            self._overloaded = 0
+            self._calm += 1
+            if self._calm >= self.up_frames and self.tier > HighlightTier.FULL:
+                self._calm = 0
+                self.tier = HighlightTier(self.tier - 1)
+                return self.tier
+        else:
+            self._overloaded = self._calm = 0
+        return None
+
+    def reset(self) -> None:
+        """Return to the full tier."""
+        self.tier = HighlightTier.FULL
+        self._overloaded = self._calm = 0
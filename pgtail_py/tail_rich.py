@@ -8,6 +8,8 @@ and secondary field formatting (DETAIL, HINT, CONTEXT, STATEMENT).
 Functions:
     format_entry_as_rich: Convert LogEntry to styled Rich Text object.
     format_entry_compact: Convert LogEntry to styled Rich Text for TailLog.
+    format_entry_plain: Plain text of format_entry_compact without styling.
+    get_format_generation: Counter bumped whenever highlighting changes.
     get_highlighter_chain: Get (or create) the cached HighlighterChain.
     register_all_highlighters: Register all built-in highlighters with registry.
 """
@@ -16,6 +18,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from rich.style import Style
 from rich.text import Text
 
 from pgtail_py.filter import LogLevel
@@ -23,6 +26,7 @@ from pgtail_py.highlighter import HighlighterChain
 from pgtail_py.highlighter_registry import get_registry
 from pgtail_py.highlighters.sql import detect_sql_content, highlight_sql_text
 from pgtail_py.highlighting_config import HighlightingConfig
+from pgtail_py.tail_quality import REDUCED_CATEGORIES, HighlightTier
 
 if TYPE_CHECKING:
     from pgtail_py.parser import LogEntry
@@ -31,8 +35,13 @@ if TYPE_CHECKING:
 
 # Module-level cache for highlighter chain
 _highlighter_chain: HighlighterChain | None = None
+# Chain of the reduced highlighting tier, built for the same config
+_reduced_chain: HighlighterChain | None = None
 _highlighting_config: HighlightingConfig | None = None
 _highlighters_registered: bool = False
+# Bumped by reset_highlighter_chain(), so text formatted under an older
+# highlighting configuration can be told apart from current output
+_format_generation: int = 0
 
 
 # Rich styles for log levels - maps LogLevel to Rich style string
@@ -67,6 +76,15 @@ LEVEL_MARKUP: dict[LogLevel, str] = {
     LogLevel.DEBUG5: "dim",
 }
 
+# LEVEL_MARKUP and the fixed field styles of format_entry_compact, parsed once
+# so compact rows carry Style objects that are not parsed again when drawn
+_LEVEL_COMPACT_STYLES: dict[LogLevel, Style] = {
+    level: Style.parse(markup) for level, markup in LEVEL_MARKUP.items()
+}
+_SOURCE_FILE_STYLE = Style.parse("magenta")
+_DIM_STYLE = Style.parse("dim")
+_SQL_STATE_STYLE = Style.parse("cyan")
+
 
 # =============================================================================
 # Highlighter Chain Management
@@ -119,18 +137,23 @@ def register_all_highlighters() -> None:
     _highlighters_registered = True
 
 
-def get_highlighter_chain(config: HighlightingConfig | None = None) -> HighlighterChain:
+def get_highlighter_chain(
+    config: HighlightingConfig | None = None, tier: HighlightTier = HighlightTier.FULL
+) -> HighlighterChain:
     """Get or create the highlighter chain.
 
     Uses a cached chain if config matches, otherwise creates a new one.
 
     Args:
         config: Highlighting configuration. If None, uses default config.
+        tier: Highlighting quality. The reduced tier gets a chain of the
+            structural and SQL highlighters only; lower tiers get the full
+            chain but format_entry_compact() does not use it.
 
     Returns:
         HighlighterChain ready for use.
     """
-    global _highlighter_chain, _highlighting_config
+    global _highlighter_chain, _highlighting_config, _reduced_chain
 
     # Ensure highlighters are registered
     register_all_highlighters()
@@ -139,29 +162,47 @@ def get_highlighter_chain(config: HighlightingConfig | None = None) -> Highlight
     if config is None:
         config = HighlightingConfig()
 
-    # Reuse cached chain if config unchanged
-    if _highlighter_chain is not None and _highlighting_config == config:
-        return _highlighter_chain
-
-    # Create new chain from registry
-    registry = get_registry()
-    _highlighter_chain = registry.create_chain(config)
-    _highlighting_config = config
+    # Reuse cached chains if config unchanged
+    if _highlighter_chain is None or _highlighting_config != config:
+        # Create new chain from registry
+        _highlighter_chain = get_registry().create_chain(config)
+        _highlighting_config = config
+        _reduced_chain = None
 
-    return _highlighter_chain
+    if tier != HighlightTier.REDUCED:
+        return _highlighter_chain
+    if _reduced_chain is None:
+        _reduced_chain = get_registry().create_chain(config, categories=REDUCED_CATEGORIES)
+    return _reduced_chain
 
 
 def reset_highlighter_chain() -> None:
     """Reset the cached highlighter chain.
 
-    Used when configuration changes or for testing.
-    Also resets the _highlighters_registered flag so highlighters
+    Used when configuration changes or for testing. Bumps the format
+    generation so cached formatted entries are not reused. Also resets the _highlighters_registered flag so highlighters
     can be re-registered to a fresh registry.
     """
     global _highlighter_chain, _highlighting_config, _highlighters_registered
+    global _format_generation, _reduced_chain
     _highlighter_chain = None
+    _reduced_chain = None
     _highlighting_config = None
     _highlighters_registered = False
+    _format_generation += 1
+
+
+def get_format_generation() -> int:
+    """Return the highlighting generation.
+
+    The counter increases each time the highlighter chain is reset, which
+    every highlighting configuration change does. Caches of formatted
+    entries include it in their keys.
+
+    Returns:
+        Current generation number.
+    """
+    return _format_generation
 
 
 # =============================================================================
@@ -234,6 +275,8 @@ def format_entry_compact(
     theme: Theme | None = None,
     use_semantic_highlighting: bool = True,
     highlighting_config: HighlightingConfig | None = None,
+    theme_keys: bool = False,
+    tier: HighlightTier = HighlightTier.FULL,
 ) -> Text:
     """Convert LogEntry to styled Rich Text for Textual tail mode.
 
@@ -254,13 +297,22 @@ def format_entry_compact(
         use_semantic_highlighting: Whether to apply semantic highlighting.
         highlighting_config: Highlighting configuration with custom highlighters.
             If None, uses default config (no custom highlighters).
+        theme_keys: Leave highlight span styles as ThemeKey values, resolved
+            by a StyleTable when drawn, so the result serves every theme.
+            ``theme`` is then not used.
+        tier: Highlighting quality. Below full, the message gets fewer
+            highlighters (reduced), none (levels), or the whole line is
+            left unstyled (plain).
 
     Returns:
         Rich Text representation of the entry.
     """
+    if tier == HighlightTier.PLAIN:
+        return Text(format_entry_plain(entry))
+
     result = Text()
 
-    def append_part(part: str | Text, style: str | None = None) -> None:
+    def append_part(part: str | Text, style: Style | None = None) -> None:
         if result.plain:
             result.append(" ")
         if isinstance(part, Text):
@@ -271,28 +323,28 @@ def format_entry_compact(
     # T076: Source file indicator for multi-file mode (before timestamp)
     if entry.source_file:
         # Use magenta for source file to stand out
-        append_part(f"[{entry.source_file}]", style="magenta")
+        append_part(f"[{entry.source_file}]", style=_SOURCE_FILE_STYLE)
 
     # Timestamp (dim)
     if entry.timestamp:
         ts_str = entry.timestamp.strftime("%H:%M:%S.%f")[:-3]  # HH:MM:SS.mmm
-        append_part(ts_str, style="dim")
+        append_part(ts_str, style=_DIM_STYLE)
 
     # PID (dim) - escape brackets, pad to 5 digits for alignment
     if entry.pid:
         pid_str = str(entry.pid).ljust(5)  # Left-pad to 5 digits
-        append_part(f"[{pid_str}]", style="dim")
+        append_part(f"[{pid_str}]", style=_DIM_STYLE)
 
     # Level name with color (padded for alignment) + colon
     # Combined into one part so " ".join() doesn't add space between level and colon
-    level_style = LEVEL_MARKUP.get(entry.level, "")
+    level_style = _LEVEL_COMPACT_STYLES.get(entry.level)
     level_name = entry.level.name.ljust(7)
 
     if entry.sql_state:
         # Level + SQL state + colon
         level_part = Text()
         level_part.append(level_name, style=level_style)
-        level_part.append(entry.sql_state, style="cyan")
+        level_part.append(entry.sql_state, style=_SQL_STATE_STYLE)
         level_part.append(":")
         append_part(level_part)
     else:
@@ -303,9 +355,13 @@ def format_entry_compact(
         append_part(level_part)
 
     # Message - apply highlighting
-    if use_semantic_highlighting and theme is not None:
+    if tier == HighlightTier.LEVELS:
+        append_part(entry.message)
+    elif use_semantic_highlighting and (theme is not None or theme_keys):
         # Apply semantic highlighting via highlighter chain
-        highlighted_message = _highlight_message(entry.message, theme, highlighting_config)
+        highlighted_message = _highlight_message(
+            entry.message, None if theme_keys else theme, highlighting_config, tier
+        )
         append_part(highlighted_message)
     else:
         # Fallback: detect and highlight SQL content only
@@ -313,7 +369,7 @@ def format_entry_compact(
         if detection:
             # SQL detected: append prefix/suffix literally and SQL with spans.
             message = Text(detection.prefix)
-            message.append(highlight_sql_text(detection.sql, theme=theme))
+            message.append(highlight_sql_text(detection.sql, theme=theme, theme_keys=theme_keys))
             message.append(detection.suffix)
             append_part(message)
         else:
@@ -322,8 +378,65 @@ def format_entry_compact(
     return result
 
 
+def format_entry_plain(entry: LogEntry) -> str:
+    """Return the plain text format_entry_compact() would produce.
+
+    Highlighters only add style spans, so this matches ``.plain`` of the
+    styled result while skipping highlighting entirely. TailLog uses it to
+    size, search and copy rows that are formatted lazily on render.
+
+    Args:
+        entry: Parsed log entry to format.
+
+    Returns:
+        Plain text of the compact entry line.
+    """
+    return _entry_prefix(entry) + entry.message
+
+
+def _entry_prefix(entry: LogEntry) -> str:
+    """Return the text format_entry_plain() puts before the message."""
+    parts: list[str] = []
+    if entry.source_file:
+        parts.append(f"[{entry.source_file}]")
+    if entry.timestamp:
+        parts.append(entry.timestamp.strftime("%H:%M:%S.%f")[:-3])
+    if entry.pid:
+        parts.append(f"[{str(entry.pid).ljust(5)}]")
+    parts.append(f"{entry.level.name.ljust(7)}{entry.sql_state or ''}:")
+    return " ".join(parts) + " "
+
+
+def highlighted_columns(entry: LogEntry, row: int, max_length: int) -> int:
+    """Return how many leading columns of a display row the message highlighting covers.
+
+    format_entry_compact() highlights the first ``max_length`` characters of
+    the message, so the rest of a long message is left unstyled.
+
+    Args:
+        entry: Formatted entry.
+        row: Display row of the entry (its message split at newlines).
+        max_length: Depth limit of the highlighter chain.
+
+    Returns:
+        Columns of the row up to the end of the highlighted part, or 0.
+    """
+    if row == 0:
+        return len(_entry_prefix(entry)) + max_length
+    message = entry.message
+    pos = 0
+    for _ in range(row):
+        pos = message.find("\n", pos) + 1
+        if not pos or pos >= max_length:
+            return 0
+    return max_length - pos
+
+
 def _highlight_message(
-    message: str, theme: Theme, config: HighlightingConfig | None = None
+    message: str,
+    theme: Theme | None,
+    config: HighlightingConfig | None = None,
+    tier: HighlightTier = HighlightTier.FULL,
 ) -> Text:
     """Apply semantic highlighting to a log message.
 
@@ -333,14 +446,15 @@ def _highlight_message(
 
     Args:
         message: Log message to highlight.
-        theme: Current theme for style lookups.
+        theme: Current theme for style lookups, or None for ThemeKey styles.
         config: Highlighting configuration with custom highlighters.
+        tier: Highlighting quality selecting the chain.
 
     Returns:
         Rich Text with highlighting.
     """
     # Get highlighter chain (with custom highlighters from config)
-    chain = get_highlighter_chain(config)
+    chain = get_highlighter_chain(config, tier)
 
     # Apply semantic highlighting
     return chain.apply_rich_text(message, theme)
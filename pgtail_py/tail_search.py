@@ -0,0 +1,494 @@
+"""Incremental scrollback search for the tail mode log.
+
+This module provides the search model behind ``/pattern`` and the ``n``/``N``
+keys in tail mode. TailLog keeps a SearchIndex in lockstep with its line
+store: lines are indexed as they are written, dropped as the log prunes, and
+the match list of the active pattern is maintained incrementally so the
+status bar can show match counts without rescanning the scrollback.
+
+While a search is active, the index keeps a case-folded shadow of every
+line, grouped into fixed-size blocks whose joined text is built once when
+the block fills. The shadow is built by the first search and dropped when
+the search is cleared, so scrollback text is not held twice otherwise. A search first
+extracts the longest literal the pattern requires, then uses C-level
+substring search over whole blocks to skip the ones that cannot match.
+Only lines in candidate blocks are checked with the compiled regex.
+
+Classes:
+    SearchPattern: Parsed ``/pattern`` query with its required literal.
+    SearchIndex: Block index over scrollback lines with incremental matches.
+
+Functions:
+    parse_search: Parse a ``/pattern[/c]`` query from the command input.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+import sys
+from dataclasses import dataclass, field
+
+from pgtail_py.regex_filter import compile_pattern
+
+# Lines per index block. Blocks are the unit skipped by the literal
+# prefilter; the joined text of a block is built once when it fills.
+BLOCK_SIZE = 256
+
+# Characters that end a literal run in a regex pattern
+_REGEX_META = frozenset(".^$*+?{}[]()|\\")
+
+# Quantifiers that make the preceding character optional or repeatable
+_OPTIONAL_QUANTIFIERS = frozenset("*?{")
+
+# Hex digits following a character code escape
+_CODE_ESCAPE_DIGITS = {"x": 2, "u": 4, "U": 8}
+
+
+@dataclass(frozen=True)
+class SearchPattern:
+    """A parsed scrollback search query.
+
+    Matching is case-insensitive by default, consistent with regex filters.
+    A trailing ``/c`` makes the search case-sensitive.
+
+    Attributes:
+        pattern: The regex pattern text as entered.
+        case_sensitive: Whether matching is case-sensitive.
+        regex: Compiled regex used to confirm candidate lines.
+        literal: Case-folded literal every match must contain, or "" when
+            no literal could be extracted (every line is a candidate).
+    """
+
+    pattern: str
+    case_sensitive: bool = False
+    regex: re.Pattern[str] = field(init=False, repr=False, compare=False)
+    literal: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile the regex and extract the prefilter literal.
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression.
+        """
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        regex = compile_pattern(self.pattern, flags)
+        # Inline (?x) makes whitespace insignificant, so literal runs can't be trusted
+        literal = "" if regex.flags & re.VERBOSE else required_literal(self.pattern)
+        object.__setattr__(self, "regex", regex)
+        object.__setattr__(self, "literal", literal.casefold())
+
+    @property
+    def label(self) -> str:
+        """Pattern formatted for display, e.g. ``/timeout/`` or ``/Timeout/c``."""
+        suffix = "c" if self.case_sensitive else ""
+        return f"/{self.pattern}/{suffix}"
+
+
+def parse_search(text: str) -> SearchPattern | None:
+    """Parse a search query entered in the tail mode input.
+
+    Accepted forms are ``/pattern``, ``/pattern/`` and ``/pattern/c``
+    (case-sensitive). A bare ``/`` or ``//`` clears the search.
+
+    Args:
+        text: Input text starting with ``/``.
+
+    Returns:
+        Parsed SearchPattern, or None if the query is empty.
+
+    Raises:
+        re.error: If the pattern is not a valid regular expression.
+    """
+    body = text.strip()[1:]
+    case_sensitive = False
+    if body.endswith("/c"):
+        body = body[:-2]
+        case_sensitive = True
+    elif body.endswith("/"):
+        body = body[:-1]
+    if not body:
+        return None
+    return SearchPattern(body, case_sensitive)
+
+
+def _skip_escape_argument(pattern: str, i: int, escaped: str) -> int:
+    """Skip the characters a letter or digit escape consumes.
+
+    Args:
+        pattern: Regular expression source.
+        i: Index just past the escaped character.
+        escaped: The character after the backslash.
+
+    Returns:
+        Index of the first character not part of the escape.
+    """
+    n = len(pattern)
+    if escaped in _CODE_ESCAPE_DIGITS:
+        return min(n, i + _CODE_ESCAPE_DIGITS[escaped])
+    if escaped == "N" and i < n and pattern[i] == "{":
+        end = pattern.find("}", i)
+        return n if end < 0 else end + 1
+    if escaped.isdigit():
+        # Octal codes and group references; more digits than either takes only
+        # shortens the literal
+        while i < n and pattern[i].isdigit():
+            i += 1
+    return i
+
+
+def required_literal(pattern: str) -> str:
+    """Extract the longest literal substring every match of a pattern contains.
+
+    This is deliberately conservative: patterns with alternation yield no
+    literal, and only runs at group depth zero are considered. The result is
+    used only to skip lines, so returning "" is always safe.
+
+    Args:
+        pattern: Regular expression source.
+
+    Returns:
+        Longest required literal, or "" if none could be determined.
+    """
+    if "|" in pattern:
+        return ""
+
+    best = ""
+    run: list[str] = []
+    depth = 0
+    i = 0
+    n = len(pattern)
+
+    def flush() -> None:
+        nonlocal best
+        if len(run) > len(best):
+            best = "".join(run)
+        run.clear()
+
+    while i < n:
+        ch = pattern[i]
+        nxt = pattern[i + 1] if i + 1 < n else ""
+        if ch == "[":
+            flush()
+            # Skip the character class, honouring escapes and a leading ]
+            i += 1
+            if i < n and pattern[i] == "^":
+                i += 1
+            if i < n and pattern[i] == "]":
+                i += 1
+            while i < n and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+            continue
+        if ch == "(":
+            flush()
+            depth += 1
+        elif ch == ")":
+            flush()
+            depth = max(0, depth - 1)
+        elif ch == "\\":
+            escaped = nxt
+            i += 2
+            after = pattern[i] if i < n else ""
+            if depth == 0 and escaped and not escaped.isalnum():
+                if after in _OPTIONAL_QUANTIFIERS:
+                    flush()
+                else:
+                    run.append(escaped)
+            else:
+                flush()
+                i = _skip_escape_argument(pattern, i, escaped)
+            continue
+        elif ch in _REGEX_META:
+            flush()
+        elif depth == 0:
+            if nxt in _OPTIONAL_QUANTIFIERS:
+                flush()
+            else:
+                run.append(ch)
+        i += 1
+
+    flush()
+    return best
+
+
+class SearchIndex:
+    """Case-folded block index over scrollback lines.
+
+    Line positions are tracked as absolute ids, so pruning old lines just
+    advances ``_base`` and drops match ids below it. Without an active
+    pattern only the line count is tracked.
+
+    Attributes:
+        pattern: Active search pattern, or None when no search is active.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.pattern: SearchPattern | None = None
+        # Absolute id of the oldest line, and number of lines indexed
+        self._base = 0
+        self._size = 0
+        # Case-folded lines, parallel to the owning log's line store while
+        # a pattern is active, otherwise empty
+        self._folded: list[str] = []
+        # Joined text of each full block, keyed by block number
+        self._blocks: dict[int, str] = {}
+        # Bytes held by the strings in _folded and _blocks
+        self._text_bytes = 0
+        # Absolute ids of lines matching the active pattern, ascending
+        self._matches: list[int] = []
+
+    @property
+    def match_count(self) -> int:
+        """Number of lines matching the active pattern."""
+        return len(self._matches)
+
+    @property
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the case-folded shadow and match list."""
+        return (
+            self._text_bytes
+            + sys.getsizeof(self._folded)
+            + sys.getsizeof(self._blocks)
+            + sys.getsizeof(self._matches)
+        )
+
+    def append(self, lines: list[str]) -> None:
+        """Index newly written lines and match them against the active pattern.
+
+        Args:
+            lines: Plain text lines appended to the log.
+        """
+        start_id = self._base + self._size
+        self._size += len(lines)
+        if self.pattern is None:
+            return
+        folded = [line.casefold() for line in lines]
+        self._text_bytes += sum(map(sys.getsizeof, folded))
+        self._folded.extend(folded)
+        self._seal_blocks(start_id, start_id + len(lines))
+        self._matches.extend(self._scan(self.pattern, lines, start_id))
+
+    def prepend(self, lines: list[str]) -> None:
+        """Index lines inserted above the oldest line.
+
+        Only the inserted lines are scanned, and only the blocks they touch
+        are rebuilt.
+
+        Args:
+            lines: Plain text lines inserted at the top of the log.
+        """
+        if not lines:
+            return
+        old_base = self._base
+        self._base -= len(lines)
+        self._size += len(lines)
+        if self.pattern is None:
+            return
+        folded = [line.casefold() for line in lines]
+        self._text_bytes += sum(map(sys.getsizeof, folded))
+        self._folded[:0] = folded
+        self._seal_blocks(self._base, old_base)
+        self._matches[:0] = self._scan(self.pattern, lines, self._base)
+
+    def drop_last(self, count: int) -> None:
+        """Drop the newest lines after the owning log removed them.
+
+        Args:
+            count: Number of lines removed from the end of the log.
+        """
+        count = min(count, self._size)
+        if count <= 0:
+            return
+        self._size -= count
+        if self.pattern is None:
+            return
+        self._text_bytes -= sum(map(sys.getsizeof, self._folded[-count:]))
+        del self._folded[-count:]
+        end_id = self._base + self._size
+        # Blocks reaching past the new end are no longer full
+        for block in [b for b in self._blocks if (b + 1) * BLOCK_SIZE > end_id]:
+            self._drop_block(block)
+        del self._matches[bisect.bisect_left(self._matches, end_id) :]
+
+    def prune(self, count: int) -> None:
+        """Drop the oldest lines after the owning log pruned them.
+
+        Args:
+            count: Number of lines removed from the front of the log.
+        """
+        count = min(count, self._size)
+        if count <= 0:
+            return
+        self._text_bytes -= sum(map(sys.getsizeof, self._folded[:count]))
+        del self._folded[:count]
+        self._base += count
+        self._size -= count
+        first_live_block = self._base // BLOCK_SIZE
+        for block in [b for b in self._blocks if b < first_live_block]:
+            self._drop_block(block)
+        cut = bisect.bisect_left(self._matches, self._base)
+        if cut:
+            del self._matches[:cut]
+
+    def clear(self) -> None:
+        """Drop all indexed lines, keeping the active pattern."""
+        self._base += self._size
+        self._size = 0
+        self._folded.clear()
+        self._blocks.clear()
+        self._matches.clear()
+        self._text_bytes = 0
+
+    def search(self, pattern: SearchPattern | None, lines: list[str]) -> int:
+        """Set the active pattern and find all matching lines.
+
+        Args:
+            pattern: Pattern to search for, or None to clear the search.
+            lines: Plain text lines of the owning log, parallel to the index.
+
+        Returns:
+            Number of matching lines.
+        """
+        if pattern is None:
+            # Drop the shadow; the next search builds it again
+            self.pattern = None
+            self._folded = []
+            self._blocks = {}
+            self._matches = []
+            self._text_bytes = 0
+            return 0
+        if self.pattern is None:
+            self._folded = [line.casefold() for line in lines]
+            self._blocks = {}
+            self._text_bytes = sum(map(sys.getsizeof, self._folded))
+            self._seal_blocks(self._base, self._base + self._size)
+        self.pattern = pattern
+        self._matches = self._search_all(pattern, lines)
+        return len(self._matches)
+
+    def matches(self) -> list[int]:
+        """Return matching line indexes relative to the current log start."""
+        base = self._base
+        return [line_id - base for line_id in self._matches]
+
+    def next_match(self, line: int, forward: bool = True) -> int | None:
+        """Find the nearest match after (or before) a line, wrapping around.
+
+        Args:
+            line: Current line index relative to the log start.
+            forward: Search towards newer lines if True, older if False.
+
+        Returns:
+            Line index of the next match, or None if there are no matches.
+        """
+        matches = self._matches
+        if not matches:
+            return None
+        line_id = line + self._base
+        if forward:
+            pos = bisect.bisect_right(matches, line_id)
+            target = matches[pos] if pos < len(matches) else matches[0]
+        else:
+            pos = bisect.bisect_left(matches, line_id)
+            target = matches[pos - 1] if pos > 0 else matches[-1]
+        return target - self._base
+
+    def position(self, line: int) -> int:
+        """Return the 1-based ordinal of the match at or before a line.
+
+        Args:
+            line: Line index relative to the log start.
+
+        Returns:
+            Match ordinal, or 0 if no match is at or before the line.
+        """
+        return bisect.bisect_right(self._matches, line + self._base)
+
+    def _seal_blocks(self, start_id: int, end_id: int) -> None:
+        """Rebuild the joined text of the blocks overlapping ids ``[start_id, end_id)``.
+
+        Blocks that are not full are dropped, so a block's text never
+        misses a line indexed after it was built.
+
+        Args:
+            start_id: First absolute id whose lines changed.
+            end_id: Absolute id to stop before.
+        """
+        if start_id >= end_id:
+            return
+        base = self._base
+        folded = self._folded
+        blocks = self._blocks
+        for block in range(start_id // BLOCK_SIZE, (end_id - 1) // BLOCK_SIZE + 1):
+            lo = block * BLOCK_SIZE - base
+            self._drop_block(block)
+            if lo >= 0 and lo + BLOCK_SIZE <= len(folded):
+                text = "\n".join(folded[lo : lo + BLOCK_SIZE])
+                blocks[block] = text
+                self._text_bytes += sys.getsizeof(text)
+
+    def _drop_block(self, block: int) -> None:
+        """Drop the joined text of a block, if it was built.
+
+        Args:
+            block: Block number.
+        """
+        text = self._blocks.pop(block, None)
+        if text is not None:
+            self._text_bytes -= sys.getsizeof(text)
+
+    def _search_all(self, pattern: SearchPattern, lines: list[str]) -> list[int]:
+        """Find every matching line, skipping blocks without the literal.
+
+        Args:
+            pattern: Pattern to search for.
+            lines: Plain text lines parallel to the index.
+
+        Returns:
+            Ascending absolute ids of matching lines.
+        """
+        literal = pattern.literal
+        base = self._base
+        if not literal:
+            return self._scan(pattern, lines, base)
+
+        found: list[int] = []
+        folded = self._folded
+        search = pattern.regex.search
+        total = len(folded)
+        lo = 0
+        while lo < total:
+            block = (lo + base) // BLOCK_SIZE
+            hi = min(total, (block + 1) * BLOCK_SIZE - base)
+            block_text = self._blocks.get(block)
+            if block_text is None or literal in block_text:
+                for i in range(lo, hi):
+                    if literal in folded[i] and search(lines[i]):
+                        found.append(i + base)
+            lo = hi
+        return found
+
+    def _scan(self, pattern: SearchPattern, lines: list[str], start_id: int) -> list[int]:
+        """Match lines one by one, using the literal as a cheap first check.
+
+        Args:
+            pattern: Pattern to search for.
+            lines: Plain text lines to check.
+            start_id: Absolute id of ``lines[0]``.
+
+        Returns:
+            Ascending absolute ids of matching lines.
+        """
+        search = pattern.regex.search
+        literal = pattern.literal
+        if literal:
+            folded = self._folded
+            offset = start_id - self._base
+            return [
+                start_id + i
+                for i, line in enumerate(lines)
+                if literal in folded[offset + i] and search(line)
+            ]
+        return [start_id + i for i, line in enumerate(lines) if search(line)]
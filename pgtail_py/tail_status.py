@@ -32,9 +32,18 @@ class TailStatus:
         active_levels: Currently filtered log levels
         regex_pattern: Active regex filter pattern, or None
         time_filter_display: Human-readable time filter string
+        where_expression: Active ``where`` filter expression, or None
         slow_threshold: Slow query threshold in ms, or None
         pg_version: PostgreSQL major version
         pg_port: PostgreSQL port number
+        search_label: Active scrollback search (e.g. ``/timeout/``), or None
+        search_position: 1-based ordinal of the match at the cursor (0 if none)
+        search_matches: Number of lines matching the active search
+        memory_used: Approximate bytes held by buffered entries, their
+            display rows and the search index
+        memory_budget: Scrollback memory budget in bytes, or None
+        highlight_tier: Reduced highlighting tier (e.g. ``levels``), or None
+            while highlighting at full quality
     """
 
     error_count: int = 0
@@ -45,6 +54,7 @@ class TailStatus:
     active_levels: set[LogLevel] = field(default_factory=LogLevel.all_levels)
     regex_pattern: str | None = None
     time_filter_display: str | None = None
+    where_expression: str | None = None
     slow_threshold: int | None = None
     pg_version: str = ""
     pg_port: int = 5432
@@ -53,6 +63,12 @@ class TailStatus:
     file_unavailable: bool = False  # True when file is deleted/inaccessible
     file_permission_denied: bool = False  # True when file exists but permissions block reading
     detected_from_content: bool = False  # True if pg_version/pg_port detected from log content
+    search_label: str | None = None
+    search_position: int = 0
+    search_matches: int = 0
+    memory_used: int = 0
+    memory_budget: int | None = None
+    highlight_tier: str | None = None
 
     def update_from_entry(self, entry: LogEntry) -> None:
         """Update counts based on a new log entry.
@@ -79,6 +95,27 @@ class TailStatus:
         """
         self.total_lines = count
 
+    def set_memory(self, used: int, budget: int | None = None) -> None:
+        """Update scrollback memory usage.
+
+        Args:
+            used: Approximate bytes held by buffered entries, their
+                display rows and the search index
+            budget: Memory budget in bytes, or None if unbudgeted
+        """
+        self.memory_used = used
+        self.memory_budget = budget
+
+    def _format_lines(self) -> str:
+        """Format the line count with memory usage, e.g. ``1,024 lines 3.2/256MB``."""
+        text = f"{self.total_lines:,} lines"
+        if not self.memory_used:
+            return text
+        used_mb = self.memory_used / (1024 * 1024)
+        if self.memory_budget is None:
+            return f"{text} {used_mb:.1f}MB"
+        return f"{text} {used_mb:.1f}/{self.memory_budget / (1024 * 1024):.0f}MB"
+
     def set_follow_mode(self, following: bool, new_count: int = 0) -> None:
         """Update follow/paused mode state.
 
@@ -113,6 +150,14 @@ class TailStatus:
         """
         self.time_filter_display = display
 
+    def set_where_filter(self, expression: str | None) -> None:
+        """Update where expression filter display.
+
+        Args:
+            expression: Expression source text, or None if not active
+        """
+        self.where_expression = expression
+
     def set_slow_threshold(self, threshold: int | None) -> None:
         """Update slow query threshold for display.
 
@@ -172,6 +217,27 @@ class TailStatus:
         if version is not None or port is not None:
             self.detected_from_content = True
 
+    def set_search(self, label: str | None, position: int = 0, matches: int = 0) -> None:
+        """Update scrollback search display.
+
+        Args:
+            label: Search pattern for display, or None when no search is active
+            position: 1-based ordinal of the match at the cursor (0 if none)
+            matches: Number of matching lines
+        """
+        self.search_label = label
+        self.search_position = position if label else 0
+        self.search_matches = matches if label else 0
+
+    def set_highlight_tier(self, tier: str | None) -> None:
+        """Update the highlighting tier display.
+
+        Args:
+            tier: Name of the reduced tier highlighting has dropped to, or
+                None when it is back at full quality
+        """
+        self.highlight_tier = tier
+
     def reset_counts(self) -> None:
         """Reset error and warning counts to zero."""
         self.error_count = 0
@@ -208,7 +274,7 @@ class TailStatus:
         parts.append(("class:status.sep", " | "))
 
         # Total lines
-        parts.append(("class:status", f"{self.total_lines:,} lines"))
+        parts.append(("class:status", self._format_lines()))
 
         # Separator
         parts.append(("class:status.sep", " | "))
@@ -231,6 +297,10 @@ class TailStatus:
         if self.time_filter_display:
             filter_parts.append(self.time_filter_display)
 
+        # Where expression
+        if self.where_expression:
+            filter_parts.append(f"where:{self.where_expression}")
+
         # Slow query threshold
         if self.slow_threshold is not None:
             filter_parts.append(f"slow:>{self.slow_threshold}ms")
@@ -297,7 +367,7 @@ class TailStatus:
         parts.append("|")
 
         # Total lines
-        parts.append(f"{self.total_lines:,} lines")
+        parts.append(self._format_lines())
 
         # Separator
         parts.append("|")
@@ -320,12 +390,26 @@ class TailStatus:
         if self.time_filter_display:
             filter_parts.append(self.time_filter_display)
 
+        # Where expression
+        if self.where_expression:
+            filter_parts.append(f"where:{self.where_expression}")
+
         # Slow query threshold
         if self.slow_threshold is not None:
             filter_parts.append(f"slow:>{self.slow_threshold}ms")
 
         parts.append(" ".join(filter_parts))
 
+        # Scrollback search
+        if self.search_label:
+            parts.append("|")
+            parts.append(f"search:{self.search_label} {self.search_position}/{self.search_matches}")
+
+        # Highlighting reduced under load
+        if self.highlight_tier:
+            parts.append("|")
+            parts.append(f"hl:{self.highlight_tier}")
+
         # Separator
         parts.append("|")
 
@@ -390,7 +474,7 @@ class TailStatus:
         text.append(" | ", style="dim")
 
         # Total lines - standard text
-        text.append(f"{self.total_lines:,} lines")
+        text.append(self._format_lines())
 
         # Separator
         text.append(" | ", style="dim")
@@ -413,12 +497,29 @@ class TailStatus:
         if self.time_filter_display:
             filter_parts.append(self.time_filter_display)
 
+        # Where expression
+        if self.where_expression:
+            filter_parts.append(f"where:{self.where_expression}")
+
         # Slow query threshold
         if self.slow_threshold is not None:
             filter_parts.append(f"slow:>{self.slow_threshold}ms")
 
         text.append(" ".join(filter_parts), style="bright_cyan")
 
+        # Scrollback search - bright magenta to stand apart from filters
+        if self.search_label:
+            text.append(" | ", style="dim")
+            text.append(
+                f"search:{self.search_label} {self.search_position}/{self.search_matches}",
+                style="bright_magenta",
+            )
+
+        # Highlighting reduced under load - explains why colors changed
+        if self.highlight_tier:
+            text.append(" | ", style="dim")
+            text.append(f"hl:{self.highlight_tier}", style="bright_yellow")
+
         # Separator
         text.append(" | ", style="dim")
 
@@ -12,14 +12,18 @@ Classes:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import re
+import threading
+import time
 from collections.abc import Callable
 from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
+from rich.text import Span, Text
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding, BindingType
@@ -27,8 +31,11 @@ from textual.css.query import NoMatches
 from textual.widgets import Input, Rule, Static
 
 from pgtail_py.cli_tail_help import COMMAND_HELP
-from pgtail_py.config import SETTING_KEYS
+from pgtail_py.config import SETTING_KEYS, parse_memory_size
+from pgtail_py.entry_spill import EntrySpill
+from pgtail_py.entry_store import EntryStore
 from pgtail_py.filter import LogLevel
+from pgtail_py.filter_expression import CompiledFilter
 from pgtail_py.highlighter_registry import get_registry
 from pgtail_py.multi_tailer import GlobPattern, MultiFileTailer
 from pgtail_py.regex_filter import FilterState
@@ -38,7 +45,14 @@ from pgtail_py.tail_completion_data import TAIL_COMPLETION_DATA
 from pgtail_py.tail_history import TailCommandHistory, get_tail_history_path
 from pgtail_py.tail_input import TailInput
 from pgtail_py.tail_log import TailLog
-from pgtail_py.tail_rich import format_entry_compact
+from pgtail_py.tail_quality import DEFAULT_BUSY_SHARE, HighlightTier, QualityController
+from pgtail_py.tail_rich import (
+    format_entry_compact,
+    format_entry_plain,
+    get_format_generation,
+    get_highlighter_chain,
+    highlighted_columns,
+)
 from pgtail_py.tail_status import TailStatus
 from pgtail_py.tail_suggester import TailCommandSuggester
 from pgtail_py.tailer import LogTailer
@@ -56,6 +70,16 @@ PORT_PATTERN = re.compile(r"listening on .*port (\d+)")
 # Matches: "listening on Unix socket "/tmp/.s.PGSQL.5432""
 PORT_SOCKET_PATTERN = re.compile(r"\.s\.PGSQL\.(\d+)")
 
+# Default rate (Hz) at which accepted entries and status changes are drawn
+DEFAULT_FRAME_RATE = 30
+
+# Entries read per page when scrolling into spilled history
+HISTORY_PAGE_ENTRIES = 1000
+
+# Longest wait (seconds) for a rebuild's viewport rows to be drawn
+# before older rows are backfilled
+REBUILD_FIRST_FRAME_TIMEOUT = 0.1
+
 if TYPE_CHECKING:
     from pgtail_py.cli import AppState
     from pgtail_py.instance import Instance
@@ -86,6 +110,29 @@ class FilterAnchor:
     active_levels: set[LogLevel] | None = None
     regex_state: FilterState = field(default_factory=FilterState.empty)
     time_filter: TimeFilter = field(default_factory=TimeFilter.empty)
+    filter_expression: CompiledFilter | None = None
+
+
+@dataclass
+class RebuildTiming:
+    """How quickly a log rebuild became useful and how long it took.
+
+    Times are seconds since the rebuild was requested (e.g. by a filter
+    change), or None until that point is reached.
+    """
+
+    requested: float = field(default_factory=time.perf_counter)
+    first_frame: float | None = None
+    complete: float | None = None
+
+    def mark_first_frame(self) -> None:
+        """Record that a frame showing the rebuilt viewport was drawn."""
+        if self.first_frame is None:
+            self.first_frame = time.perf_counter() - self.requested
+
+    def mark_complete(self) -> None:
+        """Record that every entry has been replayed."""
+        self.complete = time.perf_counter() - self.requested
 
 
 class TailApp(App[None]):
@@ -169,6 +216,12 @@ class TailApp(App[None]):
         glob_pattern: str | None = None,
         stdin_mode: bool = False,
         stdin_data: str | None = None,
+        frame_rate: int = DEFAULT_FRAME_RATE,
+        max_memory: int | None = None,
+        spill: bool = False,
+        adaptive_highlighting: bool = True,
+        rehighlight: bool = True,
+        background_highlighting: bool = False,
     ) -> None:
         """Initialize TailApp.
 
@@ -182,6 +235,19 @@ class TailApp(App[None]):
             glob_pattern: Glob pattern for dynamic file watching (T089).
             stdin_mode: True to read from stdin pipe instead of file (T080).
             stdin_data: Pre-buffered stdin data (read before Textual starts) (T080).
+            frame_rate: Display updates per second; entries arriving between
+                frames are written together.
+            max_memory: Scrollback memory budget in bytes, or None to limit
+                by ``max_lines`` only.
+            spill: Write entries evicted from memory to disk, so scrolling
+                up past the oldest row pages older entries back in.
+            adaptive_highlighting: Step highlighting quality down while
+                entries arrive faster than rows can be highlighted.
+            rehighlight: Redraw visible rows when highlighting quality
+                steps back up.
+            background_highlighting: Format and highlight rows in a worker
+                thread instead of while drawing them, so key handling never
+                waits for highlighting.
         """
         super().__init__()
         self._state: AppState = state
@@ -193,8 +259,18 @@ class TailApp(App[None]):
         self._stdin_reader: StdinReader | None = None  # T080: Stdin pipe support
         self._status: TailStatus | None = None
         self._running: bool = False
-        # Store all entries for filter-based rebuilding
-        self._entries: list[LogEntry] = []
+        # Store all entries for filter-based rebuilding; shared with the reader,
+        # which appends each entry before queueing it
+        self._entries = EntryStore(
+            max_lines, max_bytes=max_memory, spill=EntrySpill() if spill else None
+        )
+        # Oldest store sequence number the log widget has been pruned to
+        self._pruned_seq: int = 0
+        # Entries below this sequence number were written by the last rebuild
+        self._replayed_seq: int = 0
+        # Sequence range [start, stop) shown while browsing spilled history;
+        # None while the log shows the live tail
+        self._history_range: tuple[int, int] | None = None
         # Anchor stores initial filter state for reset behavior
         self._anchor: FilterAnchor | None = None
         # Explicit pause flag - prevents auto-follow when user issues pause command
@@ -221,6 +297,29 @@ class TailApp(App[None]):
         # so that the chronological ordering of the visible log is preserved.
         self._rebuilding: bool = False
         self._rebuild_pending: list[LogEntry] = []
+        # Time to first frame and to completion of the latest rebuild
+        self._rebuild_timing: RebuildTiming | None = None
+        # Entries accepted since the last frame, written together by _flush_frame
+        self._frame_interval: float = 1 / frame_rate
+        self._frame_pending: list[LogEntry] = []
+        # Highlighting tier chosen from per-frame load, or None for always full
+        self._quality: QualityController | None = (
+            QualityController(busy_limit=self._frame_interval * DEFAULT_BUSY_SHARE)
+            if adaptive_highlighting
+            else None
+        )
+        self._rehighlight: bool = rehighlight
+        # Bumped when the tier steps up, so visible rows are formatted again
+        self._quality_epoch: int = 0
+        # Seconds spent formatting rows since the last frame, and when it ended
+        self._format_seconds: float = 0.0
+        self._frame_started: float = time.perf_counter()
+        self._background_highlighting: bool = background_highlighting
+        # Held while highlighting or running a command, so the background
+        # formatter never shares the highlighter caches with the UI thread
+        self._highlight_lock = threading.RLock()
+        # Header and status bar need re-rendering on the next frame
+        self._status_dirty: bool = False
         # Command history for Up/Down recall (024: T003, T024)
         self._history = TailCommandHistory(
             max_entries=500,
@@ -294,6 +393,13 @@ class TailApp(App[None]):
             glob_pattern=glob_pattern,
             stdin_mode=stdin_mode,
             stdin_data=stdin_data,
+            frame_rate=state.config.display.frame_rate,
+            max_lines=state.config.buffer.tail_log_max,
+            max_memory=parse_memory_size(state.config.buffer.max_memory),
+            spill=state.config.buffer.spill,
+            adaptive_highlighting=state.config.display.adaptive_highlighting,
+            rehighlight=state.config.display.rehighlight,
+            background_highlighting=state.config.display.background_highlighting,
         )
         app.run()
 
@@ -314,7 +420,16 @@ class TailApp(App[None]):
         """
         yield Static(id="header")
         yield Rule()
-        yield TailLog(max_lines=self._max_lines, auto_scroll=True, id="log")
+        yield TailLog(
+            max_lines=self._max_lines,
+            auto_scroll=True,
+            entry_formatter=self._format_entry,
+            entry_plain=format_entry_plain,
+            format_key=self._format_key,
+            highlight_window=self._highlight_window,
+            format_in_background=self._background_highlighting,
+            id="log",
+        )
         yield Rule()
         yield TailInput(history=self._history, suggester=self._suggester)
         yield Rule()
@@ -337,8 +452,11 @@ class TailApp(App[None]):
             time_filter=(
                 deepcopy(self._state.time_filter) if self._state.time_filter else TimeFilter.empty()
             ),
+            filter_expression=self._state.filter_expression,
         )
 
+        self._restyle_log()
+
         # Load command history and compact if needed (024: T024)
         self._history.load()
         self._history.compact()
@@ -369,6 +487,9 @@ class TailApp(App[None]):
         if self._state.time_filter and self._state.time_filter.is_active():
             self._status.set_time_filter(self._state.time_filter.format_description())
 
+        if self._state.filter_expression is not None:
+            self._status.set_where_filter(self._state.filter_expression.source)
+
         if self._state.slow_query_config and self._state.slow_query_config.enabled:
             self._status.set_slow_threshold(int(self._state.slow_query_config.warning_ms))
 
@@ -386,9 +507,11 @@ class TailApp(App[None]):
                 regex_state=self._state.regex_state,
                 time_filter=self._state.time_filter,
                 field_filter=self._state.field_filter,
+                filter_expression=self._state.filter_expression,
                 on_entry=self._on_raw_entry,
                 on_eof=self._on_stdin_eof,
                 stdin=stdin_stream,
+                store=self._entries,
             )
             # Expose for export/pipe commands
             self._state.tailer = None  # Stdin doesn't use LogTailer
@@ -402,7 +525,9 @@ class TailApp(App[None]):
                 regex_state=self._state.regex_state,
                 time_filter=self._state.time_filter,
                 field_filter=self._state.field_filter,
+                filter_expression=self._state.filter_expression,
                 on_entry=self._on_raw_entry,
+                store=self._entries,
             )
             # Expose for export/pipe commands
             self._state.tailer = None  # Multi-file doesn't use LogTailer
@@ -414,9 +539,11 @@ class TailApp(App[None]):
                 regex_state=self._state.regex_state,
                 time_filter=self._state.time_filter,
                 field_filter=self._state.field_filter,
+                filter_expression=self._state.filter_expression,
                 on_entry=self._on_raw_entry,
                 data_dir=data_dir,
                 log_directory=self._log_path.parent if self._log_path else None,
+                store=self._entries,
             )
             # Expose tailer on state for export/pipe commands to access buffer
             self._state.tailer = self._tailer
@@ -430,6 +557,7 @@ class TailApp(App[None]):
         else:
             self._tailer.start()
         self._start_consumer()
+        self.set_interval(self._frame_interval, self._flush_frame, name="frame")
 
         # Check for permission issues and show warning if file is not readable
         self._check_initial_file_access()
@@ -452,6 +580,8 @@ class TailApp(App[None]):
             self._multi_tailer.stop()
         if self._stdin_reader:
             self._stdin_reader.stop()
+        if self._entries.spill is not None:
+            self._entries.spill.close()
 
     def _check_initial_file_access(self) -> None:
         """Check if log file is accessible and show warning if not.
@@ -564,6 +694,36 @@ class TailApp(App[None]):
             self._status.set_follow_mode(True, 0)
             self._update_status()
 
+    @on(TailLog.ExpandRequested)
+    def on_expand_requested(self, event: TailLog.ExpandRequested) -> None:
+        """Show the full entry at the cursor in a detail pane (e key).
+
+        Args:
+            event: ExpandRequested event.
+        """
+        from pgtail_py.tail_detail import DetailScreen
+
+        entry = event.entry
+        if entry is None:
+            title = "Line"
+        else:
+            parts = [entry.level.name]
+            if entry.timestamp:
+                parts.insert(0, entry.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3])
+            if entry.pid:
+                parts.append(f"[{entry.pid}]")
+            title = " ".join(parts)
+        self.push_screen(DetailScreen(event.text, title))
+
+    @on(TailLog.SearchUpdated)
+    def on_search_updated(self, event: TailLog.SearchUpdated) -> None:
+        """Refresh the status bar match counter after a search change (/, n, N).
+
+        Args:
+            event: SearchUpdated event.
+        """
+        self._update_status()
+
     # Background worker
 
     def _on_stdin_eof(self) -> None:
@@ -583,6 +743,7 @@ class TailApp(App[None]):
         Does NOT auto-exit - user can browse data and quit with 'q'.
         """
         # Show completion message in log
+        self._flush_frame()
         log_widget = self.query_one("#log", TailLog)
         lines_read = self._stdin_reader.lines_read if self._stdin_reader else 0
         log_widget.write_markup_line(
@@ -749,10 +910,9 @@ class TailApp(App[None]):
         Args:
             entry: Parsed log entry to display.
         """
-        # Store entry for filter-based rebuilding (limit to max_lines)
-        self._entries.append(entry)
-        if len(self._entries) > self._max_lines:
-            self._entries.pop(0)
+        # Entries from the reader are already in the shared store
+        if entry.seq is None:
+            self._entries.append(entry)
 
         # T016: Detect instance info from log content (file-only mode)
         # Only scan first 50 entries and only if no instance provided
@@ -768,12 +928,16 @@ class TailApp(App[None]):
                 # If we found version, we can mark detection as complete
                 if detected.version:
                     self._instance_detected = True
-                self._update_status()
+                self._status_dirty = True
 
         # Note: Global stats (error_stats, connection_stats) and notifications
         # are handled in _on_raw_entry() which is called for ALL entries before
         # filtering, matching stream mode behavior.
 
+        # Stored before the last rebuild took its snapshot, so already shown
+        if entry.seq is not None and entry.seq < self._replayed_seq:
+            return
+
         # During rebuild, buffer new entries instead of writing to TailLog
         # to preserve chronological ordering of the visible log.
         if self._rebuilding:
@@ -789,31 +953,288 @@ class TailApp(App[None]):
             if self._status:
                 self._status.update_from_entry(entry)
                 self._status.set_follow_mode(False, self._status.new_since_pause + 1)
-                self._update_status()
+                self._status_dirty = True
             return
 
-        log_widget = self.query_one("#log", TailLog)
+        # Written on the next frame together with other arrivals
+        self._frame_pending.append(entry)
 
-        # Format entry with current theme and highlighting config
-        formatted = format_entry_compact(
-            entry,
-            theme=self._state.theme_manager.current_theme,
-            highlighting_config=self._state.highlighting_config,
-        )
+    def _flush_frame(self) -> None:
+        """Write entries accepted since the last frame and redraw the status.
+
+        Runs on a timer at the configured frame rate, so the cost of updating
+        the log widget, header and status bar per second stays constant
+        however fast entries arrive. Also called before anything else writes
+        to the log, to keep entries ahead of later messages.
+        """
+        pending = self._frame_pending
+        if self._quality is not None:
+            self._adapt_quality(len(pending))
+        if pending:
+            try:
+                log_widget = self.query_one("#log", TailLog)
+            except NoMatches:
+                return
+            self._frame_pending = []
+
+            # Track if we were at end (for FOLLOW mode)
+            was_at_end = log_widget.is_vertical_scroll_end
+
+            # Add to log; highlighting is deferred until the rows are rendered
+            log_widget.write_entries(pending)
+
+            # Update status counts (only for displayed entries)
+            if self._status:
+                for entry in pending:
+                    self._status.update_from_entry(entry)
+                self._status.set_total_lines(log_widget.line_count)
+                new_count = 0 if was_at_end else self._status.new_since_pause + len(pending)
+                self._status.set_follow_mode(was_at_end, new_count)
+                self._status_dirty = True
+
+        # Hold entries and the rows and search index showing them to the
+        # memory budget, let go of rows whose entries the store evicted, then
+        # report usage. Rows paged in from spilled history are kept while
+        # browsing it.
+        store = self._entries
+        try:
+            log_widget = self.query_one("#log", TailLog)
+        except NoMatches:
+            return
+        if self._history_range is None:
+            self._prune_evicted_rows(log_widget)
+            budget = store.max_bytes
+            if budget is not None:
+                excess = store.memory_usage + log_widget.memory_usage - budget
+                if excess > 0 and store.release(excess, log_widget.front_entry_bytes(excess)):
+                    self._prune_evicted_rows(log_widget)
+        status = self._status
+        memory_used = store.memory_usage + log_widget.memory_usage
+        if status and (status.memory_used, status.memory_budget) != (memory_used, store.max_bytes):
+            status.set_memory(memory_used, store.max_bytes)
+            self._status_dirty = True
+
+        if store.spill is not None and not self._rebuilding:
+            self._page_history()
+
+        if self._status_dirty:
+            self._status_dirty = False
+            self._update_status()
+
+    def _prune_evicted_rows(self, log_widget: TailLog) -> None:
+        """Drop rows whose entries the store has evicted since the last call.
+
+        Args:
+            log_widget: The log widget.
+        """
+        store = self._entries
+        if store.first_seq == self._pruned_seq:
+            return
+        self._pruned_seq = store.first_seq
+        if log_widget.prune_entries_before(store.first_seq) and self._status:
+            self._status.set_total_lines(log_widget.line_count)
+            self._status_dirty = True
 
-        # Track if we were at end (for FOLLOW mode)
-        was_at_end = log_widget.is_vertical_scroll_end
+    def _page_history(self) -> None:
+        """Page spilled history in when the log is scrolled to either end.
 
-        # Add to log
-        log_widget.write_text_line(formatted)
+        Scrolling to the top loads the page of entries before the oldest
+        row. While browsing history the live tail is paused, and scrolling
+        to the bottom loads the next page until the live tail is reached.
+        """
+        try:
+            log_widget = self.query_one("#log", TailLog)
+        except NoMatches:
+            return
+        if log_widget.max_scroll_y <= 0:
+            return
+        if log_widget.scroll_y <= 0:
+            self._load_older_history(log_widget)
+        elif self._history_range is not None and log_widget.is_vertical_scroll_end:
+            self._load_newer_history(log_widget)
+
+    def _load_older_history(self, log_widget: TailLog) -> None:
+        """Insert the page of entries before the oldest row, pausing the tail.
 
-        # Update status counts (only for displayed entries)
+        Rows beyond ``max_lines`` are dropped from the bottom.
+
+        Args:
+            log_widget: Log to page into.
+        """
+        store = self._entries
+        if self._history_range is None:
+            first = log_widget.first_entry_seq
+            last = log_widget.last_entry_seq
+            if first is None or last is None:
+                return
+            start, stop = first, last + 1
+        else:
+            start, stop = self._history_range
+        if start <= store.oldest_seq:
+            return
+
+        page_start = max(store.oldest_seq, start - HISTORY_PAGE_ENTRIES)
+        page = store.entries(page_start, start, self._state.time_filter)
+        if self._history_range is None:
+            self._paused = True
+            if self._status:
+                self._status.set_follow_mode(False, 0)
+        log_widget.prepend_entries(e for e in page if self._entry_matches_filters(e))
+
+        excess = log_widget.line_count - self._max_lines
+        if excess > 0:
+            log_widget.remove_last_rows(excess)
+            last = log_widget.last_entry_seq
+            stop = last + 1 if last is not None else page_start
+        self._history_range = (page_start, stop)
         if self._status:
-            self._status.update_from_entry(entry)
             self._status.set_total_lines(log_widget.line_count)
-            new_count = 0 if was_at_end else self._status.new_since_pause + 1
-            self._status.set_follow_mode(was_at_end, new_count)
-            self._update_status()
+        self._status_dirty = True
+
+    def _load_newer_history(self, log_widget: TailLog, limit: int = HISTORY_PAGE_ENTRIES) -> None:
+        """Append the page of entries after the newest row of browsed history.
+
+        Rows beyond ``max_lines`` are dropped from the top. Once the page
+        reaches the live tail, following resumes.
+
+        Args:
+            log_widget: Log to page into.
+            limit: Maximum number of entries to read.
+        """
+        if self._history_range is None:
+            return
+        store = self._entries
+        start, stop = self._history_range
+        page_stop = min(store.next_seq, stop + limit)
+        page = store.entries(stop, page_stop, self._state.time_filter)
+        log_widget.write_entries(
+            (e for e in page if self._entry_matches_filters(e)), scroll_end=False
+        )
+        # Entries still queued in the reader were written by this page
+        self._replayed_seq = max(self._replayed_seq, page_stop)
+
+        first = log_widget.first_entry_seq
+        if first is not None and first > start:
+            start = first
+        if page_stop >= store.next_seq:
+            self._history_range = None
+            self._paused = False
+            if self._status:
+                self._status.set_follow_mode(True, 0)
+        else:
+            self._history_range = (start, page_stop)
+        if self._status:
+            self._status.set_total_lines(log_widget.line_count)
+        self._status_dirty = True
+
+    def _adapt_quality(self, lines: int) -> None:
+        """Feed the last frame's load to the quality controller.
+
+        Stepping down only affects rows formatted from now on. Stepping up
+        also redraws the visible rows at the better tier when
+        ``rehighlight`` is set.
+
+        Args:
+            lines: Entries about to be written this frame.
+        """
+        assert self._quality is not None
+        now = time.perf_counter()
+        # Explicit flushes between timer ticks still count as a full frame
+        elapsed = max(now - self._frame_started, self._frame_interval)
+        busy = self._format_seconds
+        self._frame_started = now
+        self._format_seconds = 0.0
+
+        previous = self._quality.tier
+        tier = self._quality.observe(lines, elapsed, busy)
+        if tier is None:
+            return
+        if tier < previous and self._rehighlight:
+            self._quality_epoch += 1
+            with contextlib.suppress(NoMatches):
+                self.query_one("#log", TailLog).reformat()
+        if self._status:
+            self._status.set_highlight_tier(None if tier == HighlightTier.FULL else tier.label)
+            self._status_dirty = True
+
+    @property
+    def _highlight_tier(self) -> HighlightTier:
+        """Highlighting tier rows are formatted at."""
+        return self._quality.tier if self._quality is not None else HighlightTier.FULL
+
+    def _format_entry(self, entry: LogEntry) -> Text:
+        """Format an entry for TailLog with the current highlighting.
+
+        Args:
+            entry: Log entry to format.
+
+        Returns:
+            Styled compact entry line.
+        """
+        with self._highlight_lock:
+            started = time.perf_counter()
+            text = format_entry_compact(
+                entry,
+                highlighting_config=self._state.highlighting_config,
+                theme_keys=True,
+                tier=self._highlight_tier,
+            )
+            self._format_seconds += time.perf_counter() - started
+        return text
+
+    def _highlight_window(self, entry: LogEntry, row: int, text: str, start: int) -> Text:
+        """Highlight a slice of a long TailLog row past what its formatting covered.
+
+        Columns within the chain's depth limit were highlighted by
+        format_entry_compact() with the whole message as context and are
+        left alone, so colors do not change while scrolling.
+
+        Args:
+            entry: Entry the row belongs to.
+            row: Display row of the entry.
+            text: Plain text of the slice.
+            start: Column of the row at which the slice starts.
+
+        Returns:
+            Text of the slice with ThemeKey span styles.
+        """
+        result = Text(text)
+        tier = self._highlight_tier
+        if tier >= HighlightTier.LEVELS:
+            return result
+        with self._highlight_lock:
+            started = time.perf_counter()
+            chain = get_highlighter_chain(self._state.highlighting_config, tier)
+            skip = max(0, highlighted_columns(entry, row, chain.max_length) - start)
+            if skip < len(text):
+                highlighted = chain.apply_rich_text(text[skip:], None)
+                result.spans.extend(
+                    Span(span.start + skip, span.end + skip, span.style)
+                    for span in highlighted.spans
+                )
+            self._format_seconds += time.perf_counter() - started
+        return result
+
+    def _format_key(self) -> tuple[int, int]:
+        """Identify the current formatting for TailLog's formatted-row cache.
+
+        Formatted rows carry ThemeKey styles, so the theme is not part of
+        the key; TailLog resolves them with its style table. The tier is
+        not part of it either: rows formatted at a lower tier are reused
+        until the tier steps up and the quality epoch changes.
+
+        Returns:
+            Highlighting generation and quality epoch.
+        """
+        return get_format_generation(), self._quality_epoch
+
+    def _restyle_log(self) -> None:
+        """Give TailLog the style table of the current theme."""
+        from pgtail_py.highlighter import get_style_table
+
+        theme = self._state.theme_manager.current_theme
+        log_widget = self.query_one("#log", TailLog)
+        log_widget.set_style_table(get_style_table(theme) if theme is not None else None)
 
     def _entry_matches_filters(self, entry: LogEntry) -> bool:
         """Check if an entry matches current filter settings.
@@ -828,6 +1249,10 @@ class TailApp(App[None]):
         if self._state.active_levels is not None and entry.level not in self._state.active_levels:
             return False
 
+        # Time filter (epoch comparison, cheaper than the regex below)
+        if self._state.time_filter and not self._state.time_filter.matches(entry):
+            return False
+
         # Regex filter
         if (
             self._state.regex_state
@@ -836,11 +1261,9 @@ class TailApp(App[None]):
         ):
             return False
 
-        # Time filter
-        if self._state.time_filter and self._state.time_filter.is_active():
-            return self._state.time_filter.matches(entry)
-
-        return True
+        # Where expression
+        expression = self._state.filter_expression
+        return expression is None or expression.matches(entry)
 
     def _make_command_context(self) -> TailCommandContext:
         """Create a TailCommandContext for command handler delegation."""
@@ -874,8 +1297,14 @@ class TailApp(App[None]):
                 (e.g. to write feedback messages that shouldn't be erased).
         """
         self._rebuild_on_complete = on_complete
+        self._rebuild_timing = RebuildTiming()
         self._rebuild_log_async()
 
+    @property
+    def rebuild_timing(self) -> RebuildTiming | None:
+        """Timing of the latest log rebuild, or None if there was none."""
+        return self._rebuild_timing
+
     # Batch size: number of entries processed between event-loop yields.
     _REBUILD_BATCH_SIZE: ClassVar[int] = 200
 
@@ -891,6 +1320,8 @@ class TailApp(App[None]):
 
         self._rebuilding = True
         self._rebuild_pending = []
+        # Entries waiting for a frame are already in _entries and are replayed
+        self._frame_pending = []
 
         try:
             # Clear log and reset status counts
@@ -899,42 +1330,41 @@ class TailApp(App[None]):
                 self._status.error_count = 0
                 self._status.warning_count = 0
 
-            # Snapshot entries so iteration is safe if new entries arrive
-            entries_snapshot = list(self._entries)
-
-            # Re-add entries that match current filters, yielding periodically
-            for i, entry in enumerate(entries_snapshot):
-                if self._entry_matches_filters(entry):
-                    formatted = format_entry_compact(
-                        entry,
-                        theme=self._state.theme_manager.current_theme,
-                        highlighting_config=self._state.highlighting_config,
-                    )
-                    log_widget.write_text_line(formatted)
-                    if self._status:
-                        self._status.update_from_entry(entry)
-
-                # Yield to event loop every batch to keep UI responsive
-                if (i + 1) % self._REBUILD_BATCH_SIZE == 0:
+            self._history_range = None
+            history_start = self._spilled_time_filter_start()
+            if history_start is not None:
+                # The time filter reaches into spilled history: page forward
+                # from its first candidate and show the oldest rows
+                self._paused = True
+                if self._status:
+                    self._status.set_follow_mode(False, 0)
+                self._history_range = (history_start, history_start)
+                while self._history_range is not None and log_widget.line_count < self._max_lines:
+                    room = self._max_lines - log_widget.line_count
+                    self._load_newer_history(log_widget, min(room, HISTORY_PAGE_ENTRIES))
                     await asyncio.sleep(0)
+                if self._history_range is not None:
+                    log_widget.scroll_home(animate=False, immediate=True)
+                else:
+                    log_widget.scroll_end(animate=False, immediate=True)
+                await self._await_rebuild_first_frame()
+            else:
+                await self._replay_live_entries(log_widget)
 
             # Drain entries that arrived while the rebuild was in progress.
             # No await here, so no new entries can interleave.
             pending = list(self._rebuild_pending)
             self._rebuild_pending = []
             for entry in pending:
+                if entry.seq is not None and entry.seq < self._replayed_seq:
+                    continue
                 if self._entry_matches_filters(entry):
                     if self._paused:
                         if self._status:
                             self._status.update_from_entry(entry)
                             self._status.set_follow_mode(False, self._status.new_since_pause + 1)
                     else:
-                        formatted = format_entry_compact(
-                            entry,
-                            theme=self._state.theme_manager.current_theme,
-                            highlighting_config=self._state.highlighting_config,
-                        )
-                        log_widget.write_text_line(formatted)
+                        log_widget.write_entries((entry,))
                         if self._status:
                             self._status.update_from_entry(entry)
 
@@ -947,9 +1377,100 @@ class TailApp(App[None]):
             if self._rebuild_on_complete is not None:
                 self._rebuild_on_complete()
                 self._rebuild_on_complete = None
+
+            timing = self._rebuild_timing
+            if timing is not None:
+                timing.mark_complete()
+                logger.debug(
+                    "Log rebuild: first frame %.1f ms, complete %.1f ms",
+                    (timing.first_frame or 0.0) * 1000,
+                    timing.complete * 1000,
+                )
         finally:
             self._rebuilding = False
 
+    async def _replay_live_entries(self, log_widget: TailLog) -> None:
+        """Write the entries in memory that match the current filters.
+
+        Works from the newest entry back: the entries that fill the viewport
+        are written first, and backfill waits until they are on screen.
+        Older entries are then prepended above them in batches, keeping the
+        scroll position, until ``max_lines`` rows are shown. Older entries
+        beyond that are only counted.
+
+        Args:
+            log_widget: Cleared log to write to.
+        """
+        # Snapshot the store, including entries still queued in the reader;
+        # _add_entry skips those when they arrive. With a time filter,
+        # blocks whose timestamps are all outside it are skipped.
+        self._replayed_seq = self._entries.next_seq
+        candidates = self._entries.entries(
+            stop_seq=self._replayed_seq, time_filter=self._state.time_filter
+        )
+        matches = self._entry_matches_filters
+        status = self._status
+
+        # Fill the viewport from the newest entries (each is at least one row)
+        height = max(log_widget.scrollable_content_region.height, 1)
+        visible: list[LogEntry] = []
+        i = len(candidates)
+        while i > 0 and len(visible) < height:
+            i -= 1
+            if matches(candidates[i]):
+                visible.append(candidates[i])
+        visible.reverse()
+        log_widget.write_entries(visible)
+        if status:
+            for entry in visible:
+                status.update_from_entry(entry)
+        await self._await_rebuild_first_frame()
+
+        # Backfill older entries above the viewport, yielding between batches
+        batch_size = self._REBUILD_BATCH_SIZE
+        while i > 0:
+            start = max(0, i - batch_size)
+            older = [entry for entry in candidates[start:i] if matches(entry)]
+            i = start
+            if log_widget.line_count < self._max_lines:
+                log_widget.prepend_entries(older, max_rows=self._max_lines)
+            if status:
+                for entry in older:
+                    status.update_from_entry(entry)
+            await asyncio.sleep(0)
+
+    async def _await_rebuild_first_frame(self) -> None:
+        """Wait for a frame showing the rows written so far.
+
+        Records the rebuild's first-frame time. Waits at most
+        ``REBUILD_FIRST_FRAME_TIMEOUT`` seconds, in case no refresh comes.
+        """
+        timing = self._rebuild_timing
+        drawn = asyncio.Event()
+
+        def on_refresh() -> None:
+            if timing is not None:
+                timing.mark_first_frame()
+            drawn.set()
+
+        self.call_after_refresh(on_refresh)
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(drawn.wait(), REBUILD_FIRST_FRAME_TIMEOUT)
+
+    def _spilled_time_filter_start(self) -> int | None:
+        """Find where the active time filter's matches start, if spilled.
+
+        Returns:
+            Sequence number of the first spilled block overlapping the time
+            filter, or None without a spill, time filter or spilled match.
+        """
+        store = self._entries
+        time_filter = self._state.time_filter
+        if store.spill is None or time_filter is None or not time_filter.is_active():
+            return None
+        start = store.first_candidate_seq(time_filter)
+        return start if start is not None and start < store.first_seq else None
+
     def _reset_to_anchor(self) -> None:
         """Reset filters to the initial anchor state.
 
@@ -965,11 +1486,13 @@ class TailApp(App[None]):
         )
         self._state.regex_state = deepcopy(self._anchor.regex_state)
         self._state.time_filter = deepcopy(self._anchor.time_filter)
+        self._state.filter_expression = self._anchor.filter_expression
 
         # Update tailer with restored filters
         self._tailer.update_levels(self._state.active_levels)
         self._tailer.update_regex_state(self._state.regex_state)
         self._tailer.update_time_filter(self._state.time_filter)
+        self._tailer.update_filter_expression(self._state.filter_expression)
 
         # Update status bar
         if self._status:
@@ -989,6 +1512,9 @@ class TailApp(App[None]):
             else:
                 self._status.set_time_filter(None)
 
+            expression = self._state.filter_expression
+            self._status.set_where_filter(expression.source if expression else None)
+
         # Rebuild log with restored filters
         self._rebuild_log()
 
@@ -1000,6 +1526,7 @@ class TailApp(App[None]):
         try:
             header_widget = self.query_one("#header", Static)
             status_widget = self.query_one("#status", Static)
+            log_widget = self.query_one("#log", TailLog)
         except NoMatches:
             # Background workers and timers (the consumer loop, rebuilds) can
             # reach here while the widgets aren't in the DOM -- before compose
@@ -1007,6 +1534,14 @@ class TailApp(App[None]):
             # There is nothing to update in that window.
             return
 
+        # Search match counts are maintained incrementally by the log widget
+        pattern = log_widget.search_pattern
+        self._status.set_search(
+            pattern.label if pattern else None,
+            log_widget.search_position,
+            log_widget.search_match_count,
+        )
+
         # Update header with keybinding hints
         header_widget.update(self._status.format_header())
         # Update status bar with mode, counts, filters
@@ -1021,5 +1556,7 @@ class TailApp(App[None]):
         Args:
             command_text: The command text entered by the user.
         """
+        self._flush_frame()
         ctx = self._make_command_context()
-        handle_command(command_text, ctx)
+        with self._highlight_lock:
+            handle_command(command_text, ctx)
@@ -6,15 +6,17 @@ import os
 import sys
 import threading
 import time
-from collections import deque
 from collections.abc import Callable
 from pathlib import Path
 from queue import Empty, Queue
 
 from pgtail_py.colors import print_log_entry
 from pgtail_py.detector import find_latest_log, read_current_logfiles
+from pgtail_py.entry_store import EntryStore
 from pgtail_py.field_filter import FieldFilterState
 from pgtail_py.filter import LogLevel
+from pgtail_py.filter_expression import CompiledFilter
+from pgtail_py.filter_plan import FilterPlan, build_filter_plan
 from pgtail_py.format_detector import LogFormat, detect_format
 from pgtail_py.parser import LogEntry, parse_log_line
 from pgtail_py.regex_filter import FilterState
@@ -50,6 +52,8 @@ class LogTailer:
         log_directory: Path | None = None,
         on_file_change: Callable[[Path], None] | None = None,
         buffer_max_size: int = DEFAULT_BUFFER_MAX_SIZE,
+        filter_expression: CompiledFilter | None = None,
+        store: EntryStore | None = None,
     ) -> None:
         """Initialize the log tailer.
 
@@ -66,12 +70,20 @@ class LogTailer:
             on_file_change: Callback when switching to a new log file.
             buffer_max_size: Maximum number of entries to store in buffer.
                 Oldest entries are discarded when limit is reached. Default 10000.
+            filter_expression: Compiled ``where`` expression. None means no
+                expression filtering.
+            store: Entry store to append shown entries to, shared with the
+                consumer. None creates one holding ``buffer_max_size`` entries.
         """
         self._log_path = log_path
         self._active_levels = active_levels
         self._regex_state = regex_state
         self._time_filter = time_filter
         self._field_filter = field_filter
+        self._filter_expression = filter_expression
+        self._filter_plan = build_filter_plan(
+            active_levels, regex_state, time_filter, field_filter, filter_expression
+        )
         self._poll_interval = poll_interval
         self._position = 0
         self._inode: int | None = None
@@ -82,7 +94,7 @@ class LogTailer:
         self._queue: Queue[LogEntry] = Queue()
         self._stop_event = threading.Event()
         self._poll_thread: threading.Thread | None = None
-        self._buffer: deque[LogEntry] = deque(maxlen=buffer_max_size)
+        self._store = store if store is not None else EntryStore(buffer_max_size)
         self._detected_format: LogFormat | None = None
         self._format_callback: Callable[[LogFormat], None] | None = None
         self._on_entry = on_entry
@@ -275,8 +287,8 @@ class LogTailer:
                         if self._on_entry:
                             self._on_entry(entry)
                         if self._should_show(entry):
+                            self._store.append(entry)
                             self._queue.put(entry)
-                            self._buffer.append(entry)
                 self._position = f.tell()
 
             # File is available - clear unavailability tracking
@@ -323,31 +335,33 @@ class LogTailer:
     def _should_show(self, entry: LogEntry) -> bool:
         """Check if a log entry should be displayed based on filters.
 
-        Filter order (cheapest first):
-        1. Time filter - datetime comparison is O(1)
-        2. Level filter - set membership is O(1)
-        3. Field filter - string equality is O(1)
-        4. Regex filter - regex match is O(n) where n = line length
-        """
-        # Check time filter first (cheapest comparison)
-        if self._time_filter is not None and not self._time_filter.matches(entry):
-            return False
-
-        # Check level filter
-        if self._active_levels is not None and entry.level not in self._active_levels:
-            return False
+        Delegates to the filter plan, which orders the filters by observed
+        rejection rate per unit of cost and keeps per-filter counters.
 
-        # Check field filter
-        if self._field_filter is not None and not self._field_filter.matches(entry):
-            return False
+        Args:
+            entry: Log entry to check.
 
-        # Check regex filter (applied to raw line)
-        return not (
-            self._regex_state is not None
-            and self._regex_state.has_filters()
-            and not self._regex_state.should_show(entry.raw)
+        Returns:
+            True if entry passes all filters.
+        """
+        return self._filter_plan.should_show(entry)
+
+    def _rebuild_filter_plan(self) -> None:
+        """Rebuild the filter plan after a filter setting changed."""
+        self._filter_plan = build_filter_plan(
+            self._active_levels,
+            self._regex_state,
+            self._time_filter,
+            self._field_filter,
+            self._filter_expression,
+            previous=self._filter_plan,
         )
 
+    @property
+    def filter_plan(self) -> FilterPlan:
+        """Filter plan with per-filter hit-rate counters."""
+        return self._filter_plan
+
     def _poll_loop(self) -> None:
         """Background thread that polls the file for changes."""
         while not self._stop_event.is_set():
@@ -432,6 +446,7 @@ class LogTailer:
             levels: New set of levels to display. None means all.
         """
         self._active_levels = levels
+        self._rebuild_filter_plan()
 
     def update_regex_state(self, regex_state: FilterState | None) -> None:
         """Update the regex filter state.
@@ -440,6 +455,7 @@ class LogTailer:
             regex_state: New regex filter state. None means no regex filtering.
         """
         self._regex_state = regex_state
+        self._rebuild_filter_plan()
 
     def update_time_filter(self, time_filter: TimeFilter | None) -> None:
         """Update the time filter.
@@ -448,6 +464,7 @@ class LogTailer:
             time_filter: New time filter. None means no time filtering.
         """
         self._time_filter = time_filter
+        self._rebuild_filter_plan()
 
     def update_field_filter(self, field_filter: FieldFilterState | None) -> None:
         """Update the field filter state.
@@ -456,6 +473,16 @@ class LogTailer:
             field_filter: New field filter state. None means no field filtering.
         """
         self._field_filter = field_filter
+        self._rebuild_filter_plan()
+
+    def update_filter_expression(self, filter_expression: CompiledFilter | None) -> None:
+        """Update the ``where`` expression filter.
+
+        Args:
+            filter_expression: New compiled expression. None means no expression filtering.
+        """
+        self._filter_expression = filter_expression
+        self._rebuild_filter_plan()
 
     @property
     def is_running(self) -> bool:
@@ -488,21 +515,26 @@ class LogTailer:
             Note: Buffer has a maximum size (default 10000). Older entries
             are discarded when the limit is reached.
         """
-        return list(self._buffer)
+        return self._store.entries()
 
     def clear_buffer(self) -> None:
         """Clear the buffer of collected entries."""
-        self._buffer.clear()
+        self._store.clear()
+
+    @property
+    def store(self) -> EntryStore:
+        """Entry store holding the buffered entries."""
+        return self._store
 
     @property
     def buffer_size(self) -> int:
         """Get the current number of entries in the buffer."""
-        return len(self._buffer)
+        return len(self._store)
 
     @property
     def buffer_max_size(self) -> int | None:
         """Get the maximum buffer size. None means unlimited."""
-        return self._buffer.maxlen
+        return self._store.capacity
 
     @property
     def file_unavailable(self) -> bool:
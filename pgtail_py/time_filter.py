@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, time, timedelta, timezone
 from typing import TYPE_CHECKING
 
@@ -17,6 +17,9 @@ _RELATIVE_TIME_PATTERN = re.compile(r"^(\d+)([smhd])$", re.IGNORECASE)
 # Time-only patterns: HH:MM or HH:MM:SS
 _TIME_ONLY_PATTERN = re.compile(r"^(\d{2}):(\d{2})(?::(\d{2}))?$")
 
+# Entries per TimeBlockIndex block
+TIME_BLOCK_SIZE = 256
+
 
 def _now_utc() -> datetime:
     """Return current time in UTC with timezone info."""
@@ -187,25 +190,34 @@ class TimeFilter:
         since: Include entries at or after this time. None means no lower bound.
         until: Include entries at or before this time. None means no upper bound.
         original_input: Original user input string for display purposes.
+        since_epoch: ``since`` as a POSIX timestamp, or None.
+        until_epoch: ``until`` as a POSIX timestamp, or None.
     """
 
     since: datetime | None = None
     until: datetime | None = None
     original_input: str = ""
 
+    # Bounds as POSIX timestamps, compiled once in __post_init__
+    since_epoch: float | None = field(default=None, init=False, repr=False, compare=False)
+    until_epoch: float | None = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
-        """Validate that since <= until when both are set."""
+        """Validate that since <= until and compile the numeric bounds."""
         if self.since is not None and self.until is not None and self.since > self.until:
             raise ValueError(
                 f"Start time ({self.since.strftime('%H:%M:%S')}) must be "
                 f"before end time ({self.until.strftime('%H:%M:%S')})"
             )
+        # datetime.timestamp() treats naive times as local, matching _to_utc()
+        self.since_epoch = self.since.timestamp() if self.since is not None else None
+        self.until_epoch = self.until.timestamp() if self.until is not None else None
 
     def matches(self, entry: LogEntry) -> bool:
         """Check if a log entry falls within the time filter.
 
-        Handles both naive and timezone-aware timestamps by normalizing
-        to UTC for comparison.
+        Compares the entry's precomputed epoch against the compiled bounds,
+        so no datetime arithmetic happens per entry.
 
         Args:
             entry: Log entry to check.
@@ -214,30 +226,32 @@ class TimeFilter:
             True if entry matches filter, False otherwise.
             Entries without timestamps return False when any time filter is active.
         """
+        since = self.since_epoch
+        until = self.until_epoch
         # If no filter is active, all entries match
-        if not self.is_active():
+        if since is None and until is None:
             return True
 
         # Entries without timestamps are filtered out when time filter is active
-        if entry.timestamp is None:
+        epoch = entry.epoch
+        if epoch is None:
             return False
 
-        # Normalize entry timestamp to UTC for comparison
-        entry_ts = _to_utc(entry.timestamp)
+        return (since is None or epoch >= since) and (until is None or epoch <= until)
 
-        # Check lower bound (self.since is already UTC-aware from parse_time)
-        if self.since is not None:
-            since_utc = _to_utc(self.since) if self.since.tzinfo is None else self.since
-            if entry_ts < since_utc:
-                return False
+    def overlaps(self, first: float, last: float) -> bool:
+        """Check if any time in [first, last] can match the filter.
 
-        # Check upper bound (self.until is already UTC-aware from parse_time)
-        if self.until is not None:
-            until_utc = _to_utc(self.until) if self.until.tzinfo is None else self.until
-            if entry_ts > until_utc:
-                return False
+        Args:
+            first: Earliest epoch timestamp in a range of entries.
+            last: Latest epoch timestamp in the range.
 
-        return True
+        Returns:
+            True if the range intersects the filter window.
+        """
+        return (self.since_epoch is None or last >= self.since_epoch) and (
+            self.until_epoch is None or first <= self.until_epoch
+        )
 
     def is_active(self) -> bool:
         """Check if any time constraint is set."""
@@ -251,3 +265,98 @@ class TimeFilter:
     def empty(cls) -> TimeFilter:
         """Return an empty (inactive) time filter."""
         return cls()
+
+
+class TimeBlockIndex:
+    """First/last timestamps of fixed-size blocks of an entry list.
+
+    Kept in lockstep with a list of entries that is appended at the end and
+    pruned from the front. A time-filtered scan asks for the index ranges of
+    blocks overlapping the filter window and never touches entries in the
+    other blocks. Blocks keep the min/max epoch rather than the first/last
+    entry's, so out-of-order timestamps (merged files, stdin) stay correct.
+    Entries without a timestamp never match an active time filter and are
+    not recorded.
+    """
+
+    def __init__(self, block_size: int = TIME_BLOCK_SIZE) -> None:
+        """Initialize an empty index.
+
+        Args:
+            block_size: Entries per block.
+        """
+        self._block_size = block_size
+        # Absolute id of the first live entry and of the next appended entry
+        self._base = 0
+        self._end = 0
+        # Block number of _first[0] / _last[0]
+        self._first_block = 0
+        # Min/max epoch per block; inf/-inf for blocks with no timestamps
+        self._first: list[float] = []
+        self._last: list[float] = []
+
+    def append(self, epoch: float | None) -> None:
+        """Record the epoch of an entry appended to the list.
+
+        Args:
+            epoch: Entry epoch timestamp, or None if it has no timestamp.
+        """
+        block = self._end // self._block_size - self._first_block
+        if block == len(self._first):
+            self._first.append(float("inf"))
+            self._last.append(float("-inf"))
+        self._end += 1
+        if epoch is not None:
+            if epoch < self._first[block]:
+                self._first[block] = epoch
+            if epoch > self._last[block]:
+                self._last[block] = epoch
+
+    def prune(self, count: int = 1) -> None:
+        """Drop entries removed from the front of the list.
+
+        Args:
+            count: Number of entries removed.
+        """
+        self._base = min(self._base + count, self._end)
+        dead = self._base // self._block_size - self._first_block
+        if dead > 0:
+            del self._first[:dead]
+            del self._last[:dead]
+            self._first_block += dead
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._base = self._end
+        self._first_block = self._end // self._block_size
+        self._first.clear()
+        self._last.clear()
+
+    def candidate_ranges(self, time_filter: TimeFilter) -> list[tuple[int, int]]:
+        """Find the list slices that may contain entries matching a filter.
+
+        Adjacent candidate blocks are merged into one slice.
+
+        Args:
+            time_filter: Active time filter.
+
+        Returns:
+            (start, stop) index pairs relative to the current list start.
+        """
+        ranges: list[tuple[int, int]] = []
+        size = self._block_size
+        base = self._base
+        overlaps = time_filter.overlaps
+        for i, (first, last) in enumerate(zip(self._first, self._last, strict=True)):
+            if first > last or not overlaps(first, last):
+                continue
+            block_start = (self._first_block + i) * size
+            start = max(block_start, base) - base
+            stop = min(block_start + size, self._end) - base
+            if start >= stop:
+                continue
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], stop)
+            else:
+                ranges.append((start, stop))
+        return ranges
@@ -6,6 +6,7 @@ Tests cover:
 - Highlighter name validation with suggestions
 - Configuration persistence
 - highlight preview command
+- highlight stats command
 """
 
 from __future__ import annotations
@@ -20,6 +21,7 @@ from rich.text import Text
 from pgtail_py.cli_highlight import (
     format_highlight_list,
     format_highlight_list_rich,
+    format_highlight_stats_rich,
     get_all_highlighter_names,
     handle_highlight_command,
     handle_highlight_disable,
@@ -28,6 +30,7 @@ from pgtail_py.cli_highlight import (
     handle_highlight_on,
     validate_highlighter_name,
 )
+from pgtail_py.highlighter import HighlighterProfile, SpanLayers
 from pgtail_py.highlighting_config import HighlightingConfig
 
 # =============================================================================
@@ -75,6 +78,8 @@ def mock_registry() -> Generator[MagicMock, None, None]:
             "pid": "structural",
             "duration": "performance",
         }.get(name)  # type: ignore[arg-type]
+        registry.span_layers = SpanLayers()
+        registry.profile = HighlighterProfile()
 
         mock.return_value = registry
         yield registry
@@ -182,6 +187,19 @@ class TestHighlightList:
 
         assert "disabled" in text
 
+    def test_format_list_shows_cache_counters(
+        self, mock_registry: MagicMock, highlighting_config: HighlightingConfig
+    ) -> None:
+        """List ends with the match cache's template hit and miss counts."""
+        mock_registry.span_layers.hits = 1500
+        mock_registry.span_layers.misses = 500
+
+        text = "".join(t[1] for t in format_highlight_list(highlighting_config))
+        rich = format_highlight_list_rich(highlighting_config).plain
+
+        for output in (text, rich):
+            assert "1,500 template hits, 500 misses (75.0% hit rate)" in output
+
 
 # =============================================================================
 # Test Highlight Enable/Disable Commands
@@ -350,6 +368,73 @@ class TestHighlightCommandDispatcher:
         assert "Unknown subcommand" in message
 
 
+# =============================================================================
+# Test Highlight Stats
+# =============================================================================
+
+
+class TestHighlightStats:
+    """Tests for the highlight stats subcommand."""
+
+    def test_stats_without_timings_explains_recording(
+        self, mock_registry: MagicMock, highlighting_config: HighlightingConfig
+    ) -> None:
+        """With nothing recorded, stats says how to start recording."""
+        success, result = handle_highlight_command(["stats"], highlighting_config)
+
+        assert success is True
+        text = "".join(t[1] for t in result)
+        assert "recording off, budget none" in text
+        assert "highlight stats on" in text
+
+    def test_stats_on_off(
+        self, mock_registry: MagicMock, highlighting_config: HighlightingConfig
+    ) -> None:
+        """'stats on' and 'stats off' toggle recording."""
+        handle_highlight_command(["stats", "on"], highlighting_config)
+        assert mock_registry.profile.recording is True
+        handle_highlight_command(["stats", "off"], highlighting_config)
+        assert mock_registry.profile.recording is False
+
+        success, message = handle_highlight_command(["stats", "bogus"], highlighting_config)
+        assert success is False
+        assert "Usage:" in message
+
+    def test_stats_table_ranks_by_time(self, mock_registry: MagicMock) -> None:
+        """Highlighters are listed slowest first, marking those over budget."""
+        profile = mock_registry.profile
+        profile.set_budget(1)
+        for _ in range(4):
+            profile.record("timestamp", 10_000)
+        profile.record("slow_custom", 3_000_000)
+        profile.count("timestamp", 4, 1)
+        profile.over_budget["slow_custom"] = 3e6
+
+        lines = format_highlight_stats_rich().plain.splitlines()
+
+        assert lines[0] == "Highlighter profile (recording off, budget 1 ms per line)"
+        rows = [line.split() for line in lines if line.startswith("  ")]
+        assert [row[0] for row in rows] == ["Name", "slow_custom", "timestamp"]
+        assert rows[2][1:] == ["4", "0.0", "10.0", "4", "1"]
+        assert any(line.startswith("  slow_custom") and "over budget" in line for line in lines)
+
+    def test_stats_reset_restores_over_budget(
+        self, mock_registry: MagicMock, highlighting_config: HighlightingConfig
+    ) -> None:
+        """'stats reset' clears timings and re-enables over-budget highlighters."""
+        profile = mock_registry.profile
+        profile.record("slow_custom", 3_000_000)
+        profile.over_budget["slow_custom"] = 3e6
+
+        with patch("pgtail_py.tail_rich.reset_highlighter_chain") as reset_chain:
+            success, message = handle_highlight_command(["stats", "reset"], highlighting_config)
+
+        assert success is True
+        assert "re-enabled slow_custom" in message
+        reset_chain.assert_called_once()
+        assert profile.stats == {} and profile.over_budget == {}
+
+
 # =============================================================================
 # Test Custom Highlighters
 # =============================================================================
@@ -530,6 +615,24 @@ class TestHighlightAddCommand:
         success, message = handle_highlight_add(["my-pattern", r"TEST-\d+"], highlighting_config)
         assert success is False
 
+    def test_add_warns_on_nested_quantifier(
+        self, mock_registry: MagicMock, highlighting_config: HighlightingConfig
+    ) -> None:
+        """Nested quantifiers are added with a warning, not rejected."""
+        from pgtail_py.cli_highlight import handle_highlight_add
+
+        warnings: list[str] = []
+        with patch("pgtail_py.cli_highlight.save_highlighting_config"):
+            success, _message = handle_highlight_add(
+                ["nested", r"(x+)+y"], highlighting_config, warnings.append
+            )
+            handle_highlight_add(["version", r"v\d+(\.\d+)+"], highlighting_config, warnings.append)
+
+        assert success is True
+        assert len(highlighting_config.custom_highlighters) == 2
+        assert len(warnings) == 1
+        assert "nested quantifiers" in warnings[0]
+
     def test_add_via_dispatcher(
         self, mock_registry: MagicMock, highlighting_config: HighlightingConfig
     ) -> None:
@@ -1227,6 +1330,33 @@ style = "yellow"
         assert success is False
         assert "zero-length" in message.lower()
 
+    def test_validate_warns_on_nested_quantifier(
+        self, mock_registry: MagicMock, highlighting_config: HighlightingConfig, tmp_path
+    ) -> None:
+        """Import accepts nested quantifiers with a warning."""
+        from pgtail_py.cli_highlight import handle_highlight_import
+
+        file_path = tmp_path / "nested.toml"
+        file_path.write_text("""
+[highlighting]
+enabled = true
+
+[[highlighting.custom]]
+name = "nested"
+pattern = "(x+)+y"
+style = "yellow"
+""")
+
+        warnings: list[str] = []
+        with patch("pgtail_py.cli_highlight.save_highlighting_config"):
+            success, _message = handle_highlight_import(
+                [str(file_path)], highlighting_config, warnings.append
+            )
+
+        assert success is True
+        assert highlighting_config.custom_highlighters[0].name == "nested"
+        assert any("'nested' has nested quantifiers" in warning for warning in warnings)
+
     def test_validate_rejects_builtin_name_conflict(
         self, mock_registry: MagicMock, highlighting_config: HighlightingConfig, tmp_path
     ) -> None:
@@ -0,0 +1,103 @@
+"""Tests for pgtail_py.entry_spill module."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pgtail_py.entry_spill import EntrySpill
+from pgtail_py.entry_store import EntryStore
+from pgtail_py.filter import LogLevel
+from pgtail_py.parser import LogEntry
+from pgtail_py.time_filter import TimeFilter
+
+
+def _entry(i: int) -> LogEntry:
+    """Build a LogEntry numbered i, timestamped i seconds after the epoch."""
+    return LogEntry(
+        timestamp=datetime.fromtimestamp(i, timezone.utc),
+        level=LogLevel.LOG,
+        message=str(i),
+        raw=str(i),
+        pid=i,
+    )
+
+
+def _messages(entries: list[LogEntry]) -> list[str]:
+    return [e.message for e in entries]
+
+
+class TestEntrySpill:
+    """Tests for EntrySpill."""
+
+    def test_round_trip_across_sealed_segments(self, tmp_path: Path) -> None:
+        """Test entries read back equal across sealed and open segments."""
+        spill = EntrySpill(tmp_path, segment_bytes=1024)
+        store = EntryStore(5, spill=spill)
+        entries = [_entry(i) for i in range(100)]
+        for entry in entries:
+            store.append(entry)
+
+        assert (spill.first_seq, spill.next_seq) == (0, 95)
+        assert store.oldest_seq == 0
+        assert spill.get(42) == entries[42]
+        assert spill.get(42).seq == 42
+        assert _messages(spill.entries(10, 13)) == ["10", "11", "12"]
+        assert len(spill.entries()) == 95
+        spill.close()
+
+    def test_store_reads_spilled_entries(self, tmp_path: Path) -> None:
+        """Test EntryStore serves spilled entries before first_seq."""
+        spill = EntrySpill(tmp_path)
+        store = EntryStore(3, spill=spill)
+        for i in range(6):
+            store.append(_entry(i))
+
+        assert store.get(1).message == "1"
+        assert _messages(store.entries(1, 5)) == ["1", "2", "3", "4"]
+        # Without a start, only live entries are returned
+        assert _messages(store.entries()) == ["3", "4", "5"]
+        spill.close()
+
+    def test_time_filter_candidates(self, tmp_path: Path) -> None:
+        """Test time-filtered reads and the first candidate reach into the spill."""
+        spill = EntrySpill(tmp_path)
+        store = EntryStore(100, spill=spill)
+        for i in range(1000):
+            store.append(_entry(i))
+        time_filter = TimeFilter(
+            since=datetime.fromtimestamp(300, timezone.utc),
+            until=datetime.fromtimestamp(310, timezone.utc),
+        )
+
+        first = store.first_candidate_seq(time_filter)
+        assert first is not None and first <= 300
+        candidates = store.entries(0, time_filter=time_filter)
+        assert len(candidates) < 900
+        assert _messages([e for e in candidates if time_filter.matches(e)]) == [
+            str(i) for i in range(300, 311)
+        ]
+        spill.close()
+
+    def test_clear_and_close_remove_files(self, tmp_path: Path) -> None:
+        """Test clearing the store clears the spill and close removes its directory."""
+        spill = EntrySpill(tmp_path, segment_bytes=256)
+        store = EntryStore(2, spill=spill)
+        for i in range(20):
+            store.append(_entry(i))
+        assert spill.disk_usage > 0
+        assert any(spill.directory.iterdir())
+
+        store.clear()
+        assert len(spill) == 0
+        assert list(spill.directory.iterdir()) == []
+
+        # A new history starts at the next evicted sequence number
+        for i in range(20, 25):
+            store.append(_entry(i))
+        assert (spill.first_seq, store.get(20).message) == (20, "20")
+
+        spill.close()
+        assert not spill.directory.exists()
+        spill.append(_entry(99))
+        assert len(spill) == 0
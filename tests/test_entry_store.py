@@ -0,0 +1,148 @@
+"""Tests for pgtail_py.entry_store module."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from pgtail_py.entry_store import EntryStore, entry_size
+from pgtail_py.filter import LogLevel
+from pgtail_py.parser import LogEntry
+from pgtail_py.time_filter import TimeFilter
+
+
+def _entry(i: int, epoch: float | None = None) -> LogEntry:
+    """Build a LogEntry numbered i, optionally timestamped at epoch."""
+    timestamp = datetime.fromtimestamp(epoch, timezone.utc) if epoch is not None else None
+    return LogEntry(timestamp=timestamp, level=LogLevel.LOG, message=str(i), raw=str(i))
+
+
+def _messages(entries: list[LogEntry]) -> list[str]:
+    return [e.message for e in entries]
+
+
+class TestEntryStore:
+    """Tests for EntryStore."""
+
+    def test_append_assigns_sequence_numbers(self) -> None:
+        """Test entries get increasing sequence numbers."""
+        store = EntryStore(4)
+        entries = [_entry(i) for i in range(3)]
+        assert [store.append(e) for e in entries] == [0, 1, 2]
+        assert [e.seq for e in entries] == [0, 1, 2]
+        assert store.get(1) is entries[1]
+        assert len(store) == 3
+
+    def test_wraps_and_evicts_oldest(self) -> None:
+        """Test a full store overwrites the oldest entry."""
+        store = EntryStore(3)
+        for i in range(5):
+            store.append(_entry(i))
+        assert _messages(store.entries()) == ["2", "3", "4"]
+        assert (store.first_seq, store.next_seq) == (2, 5)
+        assert store.get(1) is None
+        assert store.get(4) is not None
+
+    def test_entries_range(self) -> None:
+        """Test slicing by sequence number across the wrap point."""
+        store = EntryStore(4)
+        for i in range(6):
+            store.append(_entry(i))
+        assert _messages(store.entries(3, 5)) == ["3", "4"]
+        assert _messages(store.entries(0, 4)) == ["2", "3"]
+        assert store.entries(5, 3) == []
+
+    def test_clear_keeps_sequence_increasing(self) -> None:
+        """Test clear() drops entries without reusing sequence numbers."""
+        store = EntryStore(4)
+        store.append(_entry(0))
+        store.clear()
+        assert len(store) == 0
+        assert store.append(_entry(1)) == 1
+        assert _messages(list(store)) == ["1"]
+
+    def test_time_filter_skips_blocks(self) -> None:
+        """Test time-filtered snapshots only include overlapping blocks."""
+        store = EntryStore(2000)
+        for i in range(1000):
+            store.append(_entry(i, float(i)))
+        time_filter = TimeFilter(since=datetime.fromtimestamp(900, timezone.utc))
+        candidates = store.entries(time_filter=time_filter)
+        assert len(candidates) < 1000
+        assert [e for e in candidates if time_filter.matches(e)] == [
+            e for e in store.entries() if time_filter.matches(e)
+        ]
+
+    def test_byte_budget_evicts_oldest(self) -> None:
+        """Test entries are evicted while the store is over its byte budget."""
+        size = entry_size(_entry(0))
+        store = EntryStore(100, max_bytes=size * 3)
+        for i in range(5):
+            store.append(_entry(i))
+        assert _messages(store.entries()) == ["2", "3", "4"]
+        assert store.memory_usage == sum(entry_size(e) for e in store)
+
+    def test_byte_budget_keeps_newest(self) -> None:
+        """Test an entry larger than the budget is still kept."""
+        store = EntryStore(10, max_bytes=1)
+        store.append(_entry(0))
+        store.append(_entry(1))
+        assert _messages(store.entries()) == ["1"]
+
+    def test_lowering_budget_evicts(self) -> None:
+        """Test setting max_bytes evicts down to the new budget."""
+        store = EntryStore(10)
+        for i in range(4):
+            store.append(_entry(i))
+        store.max_bytes = entry_size(_entry(0)) * 2
+        assert _messages(store.entries()) == ["2", "3"]
+        store.clear()
+        assert store.memory_usage == 0
+
+    def test_release_frees_entry_and_charged_bytes(self) -> None:
+        """Test release() evicts oldest entries until entry and charged bytes are freed."""
+        size = entry_size(_entry(0))
+        store = EntryStore(10)
+        for i in range(6):
+            store.append(_entry(i))
+
+        assert store.release(size + 1) == 2
+        assert store.first_seq == 2
+        assert store.release(1, {2: size * 10}) == 1
+        assert store.first_seq == 3
+        assert store.release(0) == 0
+        # The newest entry is kept
+        assert store.release(size * 100) == 2
+        assert _messages(store.entries()) == ["5"]
+        assert store.memory_usage == size
+
+    def test_entry_size_counts_strings(self) -> None:
+        """Test longer messages measure larger."""
+        short = LogEntry(timestamp=None, level=LogLevel.LOG, message="x", raw="x")
+        long = LogEntry(timestamp=None, level=LogLevel.LOG, message="x" * 4096, raw="x")
+        assert entry_size(long) - entry_size(short) >= 4095
+
+    def test_invalid_capacity(self) -> None:
+        """Test capacity must be positive."""
+        with pytest.raises(ValueError):
+            EntryStore(0)
+
+
+class TestReaderStore:
+    """Tests for readers sharing an EntryStore."""
+
+    def test_tailer_uses_given_store(self, tmp_path: Path) -> None:
+        """Test LogTailer buffers into the store it was given."""
+        from pgtail_py.tailer import LogTailer
+
+        store = EntryStore(5)
+        tailer = LogTailer(tmp_path / "x.log", store=store)
+        assert tailer.store is store
+        assert tailer.buffer_max_size == 5
+
+        store.append(_entry(0))
+        assert _messages(tailer.get_buffer()) == ["0"]
+        tailer.clear_buffer()
+        assert len(store) == 0
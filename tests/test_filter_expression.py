@@ -0,0 +1,216 @@
+"""Tests for pgtail_py.filter_expression module."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from pgtail_py.export import get_filtered_entries
+from pgtail_py.filter import LogLevel
+from pgtail_py.filter_expression import (
+    PUSHDOWN_COST,
+    BoolOp,
+    CompiledFilter,
+    FilterExpressionError,
+    Not,
+    node_cost,
+    parse_expression,
+)
+from pgtail_py.format_detector import LogFormat
+from pgtail_py.parser import LogEntry
+from pgtail_py.regex_filter import FilterState
+
+
+def _entry(
+    message: str = "statement: SELECT 1",
+    level: LogLevel = LogLevel.LOG,
+    **fields: object,
+) -> LogEntry:
+    """Build a LogEntry for tests."""
+    return LogEntry(
+        timestamp=fields.pop("timestamp", datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)),  # type: ignore[arg-type]
+        level=level,
+        message=message,
+        raw=f"2024-01-15 10:00:00 UTC [1] {level.name}:  {message}",
+        pid=1,
+        format=LogFormat.TEXT,
+        **fields,  # type: ignore[arg-type]
+    )
+
+
+class TestParseExpression:
+    """Tests for parse_expression()."""
+
+    def test_precedence_and_binds_tighter_than_or(self) -> None:
+        """Test a or b and c parses as a or (b and c)."""
+        tree = parse_expression("level=ERROR or level=LOG and app=psql")
+        assert isinstance(tree, BoolOp)
+        assert tree.op == "or"
+        assert isinstance(tree.operands[1], BoolOp)
+        assert tree.operands[1].op == "and"
+
+    def test_not_and_parentheses(self) -> None:
+        """Test not applies to a parenthesized group."""
+        tree = parse_expression("not (level=ERROR or level=FATAL)")
+        assert isinstance(tree, Not)
+        assert isinstance(tree.operand, BoolOp)
+
+    @pytest.mark.parametrize(
+        ("source", "message"),
+        [
+            ("", "Empty"),
+            ("bogus=1", "Unknown field"),
+            ("level~ERR", "not supported"),
+            ("level=NOPE", "level"),
+            ("duration>fast", "duration"),
+            ("level=ERROR and", "Expected"),
+            ("(level=ERROR", "Expected"),
+            ("message ~ /foo(/", "Invalid value"),
+        ],
+    )
+    def test_errors(self, source: str, message: str) -> None:
+        """Test invalid expressions raise FilterExpressionError."""
+        with pytest.raises(FilterExpressionError, match=f"(?i){message}"):
+            parse_expression(source)
+
+
+class TestCompiledFilter:
+    """Tests for CompiledFilter matching."""
+
+    def test_level_comparison_uses_severity(self) -> None:
+        """Test level>=ERROR matches ERROR and more severe levels."""
+        flt = CompiledFilter.parse("level>=ERROR")
+        assert flt.matches(_entry(level=LogLevel.ERROR))
+        assert flt.matches(_entry(level=LogLevel.PANIC))
+        assert not flt.matches(_entry(level=LogLevel.WARNING))
+
+    def test_level_in_list(self) -> None:
+        """Test level in (...) matches any listed level."""
+        flt = CompiledFilter.parse("level in (error, fatal)")
+        assert flt.matches(_entry(level=LogLevel.FATAL))
+        assert not flt.matches(_entry(level=LogLevel.LOG))
+
+    def test_duration_with_units(self) -> None:
+        """Test duration comparisons parse units and read the message."""
+        flt = CompiledFilter.parse("duration > 1s")
+        assert flt.matches(_entry("duration: 1500.000 ms  statement: SELECT 1"))
+        assert not flt.matches(_entry("duration: 20.000 ms  statement: SELECT 1"))
+        assert not flt.matches(_entry("connection received"))
+
+    def test_field_equality_is_case_insensitive(self) -> None:
+        """Test string equality ignores case."""
+        flt = CompiledFilter.parse("app=PSQL and db in (prod, staging)")
+        assert flt.matches(_entry(application_name="psql", database_name="Prod"))
+        assert not flt.matches(_entry(application_name="psql", database_name="dev"))
+
+    def test_missing_field_negations_match(self) -> None:
+        """Test != and !~ match entries that lack the field."""
+        assert CompiledFilter.parse("app != psql").matches(_entry())
+        assert CompiledFilter.parse("query !~ /vacuum/").matches(_entry())
+        assert not CompiledFilter.parse("app = psql").matches(_entry())
+
+    def test_regex_match(self) -> None:
+        """Test ~ searches the field with a regex."""
+        flt = CompiledFilter.parse(r'message ~ /dead\w+/ and not message ~ "retry"')
+        assert flt.matches(_entry("deadlock detected"))
+        assert not flt.matches(_entry("deadlock detected, retry"))
+
+    def test_time_bound(self) -> None:
+        """Test time comparisons against absolute timestamps."""
+        flt = CompiledFilter.parse("time >= 2024-01-15T10:00:00Z")
+        assert flt.matches(_entry())
+        early = datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc)
+        assert not flt.matches(_entry(timestamp=early))
+
+    def test_pushdown_residual_split(self) -> None:
+        """Test cheap top-level terms are pushed down and costly ones are residual."""
+        flt = CompiledFilter.parse("message ~ /timeout/ and level>=ERROR and duration>10ms")
+        assert node_cost(parse_expression("level>=ERROR")) <= PUSHDOWN_COST
+        assert flt.pushdown is not None
+        assert flt.residual is not None
+
+        entry = _entry("duration: 50 ms timeout", level=LogLevel.LOG)
+        assert not flt.matches_pushdown(entry)
+        assert flt.matches_residual(entry)
+
+    def test_or_is_not_split(self) -> None:
+        """Test a top-level OR with a regex term is entirely residual."""
+        flt = CompiledFilter.parse("level=ERROR or message ~ /x/")
+        assert flt.pushdown is None
+        assert flt.residual is not None
+
+
+class TestExpressionConsumers:
+    """Tests for expression use in export and the command handlers."""
+
+    def test_get_filtered_entries_applies_expression(self) -> None:
+        """Test export filtering uses the compiled expression."""
+        entries = [
+            _entry("deadlock detected", level=LogLevel.ERROR),
+            _entry("checkpoint complete", level=LogLevel.LOG),
+            _entry("duplicate key", level=LogLevel.ERROR),
+        ]
+        flt = CompiledFilter.parse("level=ERROR and message ~ /dead/")
+
+        result = list(get_filtered_entries(entries, None, FilterState(), expression=flt))
+
+        assert [e.message for e in result] == ["deadlock detected"]
+
+    def test_tailer_should_show(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Test LogTailer applies the expression and can update it."""
+        from pgtail_py.tailer import LogTailer
+
+        tailer = LogTailer(tmp_path / "x.log", filter_expression=CompiledFilter.parse("level=LOG"))
+        assert tailer._should_show(_entry(level=LogLevel.LOG))
+        assert not tailer._should_show(_entry(level=LogLevel.ERROR))
+
+        tailer.update_filter_expression(None)
+        assert tailer._should_show(_entry(level=LogLevel.ERROR))
+
+    def test_tail_where_command(self) -> None:
+        """Test the tail mode where handler sets and clears the expression."""
+        from pgtail_py.cli_tail_filters import handle_where_command
+
+        state = MagicMock()
+        state.filter_expression = None
+        status = MagicMock()
+        tailer = MagicMock()
+        log_widget = MagicMock()
+
+        assert handle_where_command("level>=ERROR", status, state, tailer, log_widget)
+        assert state.filter_expression.source == "level>=ERROR"
+        tailer.update_filter_expression.assert_called_with(state.filter_expression)
+        status.set_where_filter.assert_called_with("level>=ERROR")
+
+        handle_where_command("clear", status, state, tailer, log_widget)
+        assert state.filter_expression is None
+        status.set_where_filter.assert_called_with(None)
+
+    def test_tail_where_command_invalid(self) -> None:
+        """Test an invalid expression keeps the previous one."""
+        from pgtail_py.cli_tail_filters import handle_where_command
+
+        state = MagicMock()
+        previous = CompiledFilter.parse("level=LOG")
+        state.filter_expression = previous
+
+        handle_where_command("level=", MagicMock(), state, MagicMock(), MagicMock())
+
+        assert state.filter_expression is previous
+
+    def test_repl_where_command(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test the REPL where command parses and reports errors."""
+        from pgtail_py.cli_filter import where_command
+
+        state = MagicMock()
+        state.filter_expression = None
+        state.tailer = None
+
+        where_command(state, "app=psql")
+        assert state.filter_expression.source == "app=psql"
+
+        where_command(state, "app ~")
+        assert "Invalid expression" in capsys.readouterr().out
+        assert state.filter_expression.source == "app=psql"
@@ -0,0 +1,159 @@
+"""Tests for pgtail_py.filter_plan module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from pgtail_py.field_filter import FieldFilterState
+from pgtail_py.filter import LogLevel
+from pgtail_py.filter_plan import (
+    REORDER_INTERVAL,
+    SAMPLE_INTERVAL,
+    FilterPlan,
+    FilterStage,
+    build_filter_plan,
+    format_filter_stats,
+)
+from pgtail_py.parser import LogEntry
+from pgtail_py.regex_filter import FilterState, FilterType, RegexFilter
+
+
+def _entry(message: str, level: LogLevel = LogLevel.LOG) -> LogEntry:
+    """Build a LogEntry for tests."""
+    return LogEntry(timestamp=None, level=level, message=message, raw=message)
+
+
+class TestFilterPlan:
+    """Tests for FilterPlan evaluation and reordering."""
+
+    def test_counts_evaluations_and_rejections(self) -> None:
+        """Test each stage counts what it saw and rejected."""
+        first = FilterStage("first", lambda e: e.level == LogLevel.LOG)
+        second = FilterStage("second", lambda e: "keep" in e.message)
+        plan = FilterPlan([first, second])
+
+        results = [
+            plan.should_show(_entry("keep")),
+            plan.should_show(_entry("drop")),
+            plan.should_show(_entry("keep", LogLevel.ERROR)),
+        ]
+
+        assert results == [True, False, False]
+        assert (first.evaluations, first.rejections) == (3, 1)
+        assert (second.evaluations, second.rejections) == (2, 1)
+        assert plan.entries == 3
+
+    def test_samples_timing(self) -> None:
+        """Test one entry in SAMPLE_INTERVAL is timed."""
+        stage = FilterStage("all", lambda e: True)
+        plan = FilterPlan([stage])
+        for _ in range(SAMPLE_INTERVAL * 4):
+            plan.should_show(_entry("x"))
+        assert stage.sampled == 4
+        assert stage.avg_ns is not None
+
+    def test_reorders_by_rejection_rate(self) -> None:
+        """Test a highly selective stage moves ahead of a weak one."""
+        weak = FilterStage("weak", lambda e: True)
+        selective = FilterStage("selective", lambda e: e.message == "rare")
+        plan = FilterPlan([weak, selective])
+
+        shown = sum(
+            plan.should_show(_entry("rare" if i % 100 == 0 else "common"))
+            for i in range(REORDER_INTERVAL + 1)
+        )
+
+        assert plan.stages[0] is selective
+        assert plan.reorders == 1
+        assert shown == (REORDER_INTERVAL + 1 + 99) // 100
+
+    def test_reset_stats(self) -> None:
+        """Test reset_stats() zeroes counters."""
+        stage = FilterStage("s", lambda e: False)
+        plan = FilterPlan([stage])
+        plan.should_show(_entry("x"))
+        plan.reset_stats()
+        assert (stage.evaluations, stage.rejections, plan.entries) == (0, 0, 0)
+
+
+class TestBuildFilterPlan:
+    """Tests for build_filter_plan()."""
+
+    def test_stage_selection_and_static_order(self) -> None:
+        """Test stages are built for active filters in static cost order."""
+        plan = build_filter_plan({LogLevel.ERROR}, FilterState.empty(), None, None, None)
+        assert [s.name for s in plan.stages] == ["level", "regex"]
+
+    def test_regex_stage_sees_in_place_changes(self) -> None:
+        """Test the regex stage follows filters added after the plan was built."""
+        regex_state = FilterState.empty()
+        plan = build_filter_plan(None, regex_state, None, None, None)
+        assert plan.should_show(_entry("noise"))
+
+        regex_state.add_filter(RegexFilter.create("deadlock", FilterType.INCLUDE))
+        assert not plan.should_show(_entry("noise"))
+        assert plan.should_show(_entry("deadlock detected"))
+
+    def test_rebuild_carries_unchanged_stages(self) -> None:
+        """Test counters survive a rebuild when the filter object is unchanged."""
+        field_filter = FieldFilterState()
+        old = build_filter_plan({LogLevel.LOG}, None, None, field_filter, None)
+        old.should_show(_entry("x", LogLevel.ERROR))
+        old.should_show(_entry("x"))
+
+        new = build_filter_plan({LogLevel.ERROR}, None, None, field_filter, None, previous=old)
+
+        by_name = {s.name: s for s in new.stages}
+        assert by_name["field"].evaluations == 1
+        assert by_name["level"].evaluations == 0
+
+    def test_format_stats(self) -> None:
+        """Test stats table lists stages in evaluation order."""
+        plan = build_filter_plan({LogLevel.ERROR}, None, None, None, None)
+        plan.should_show(_entry("x"))
+        lines = format_filter_stats(plan)
+        assert "1 entries checked" in lines[0]
+        assert lines[2].split()[:3] == ["level", "1", "1"]
+        assert format_filter_stats(FilterPlan()) == ["No filters active"]
+
+
+class TestFilterStatsCommands:
+    """Tests for the filter stats command in the REPL and tail mode."""
+
+    def test_tailer_update_rebuilds_plan(self, tmp_path: Path) -> None:
+        """Test LogTailer filter updates rebuild its plan."""
+        from pgtail_py.tailer import LogTailer
+
+        tailer = LogTailer(tmp_path / "x.log")
+        assert tailer.filter_plan.stages == ()
+        tailer.update_levels({LogLevel.ERROR})
+        assert [s.name for s in tailer.filter_plan.stages] == ["level"]
+        assert not tailer._should_show(_entry("x"))
+
+    def test_repl_filter_stats(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test 'filter stats' prints the tailer's plan."""
+        from pgtail_py.cli_filter import filter_command
+        from pgtail_py.tailer import LogTailer
+
+        state = MagicMock()
+        state.tailer = LogTailer(tmp_path / "x.log", active_levels={LogLevel.ERROR})
+
+        filter_command(state, ["stats"])
+
+        assert "level" in capsys.readouterr().out
+
+    def test_tail_filter_stats_does_not_rebuild(self) -> None:
+        """Test 'filter stats' in tail mode writes stats without a rebuild."""
+        from pgtail_py.tail_command_handler import handle_command
+
+        ctx = MagicMock()
+        ctx.tailer.filter_plan = build_filter_plan({LogLevel.ERROR}, None, None, None, None)
+
+        handle_command("filter stats", ctx)
+
+        ctx.rebuild_log.assert_not_called()
+        written = [c.args[0] for c in ctx.log_widget.write_line.call_args_list]
+        assert any("level" in line for line in written)
@@ -13,17 +13,30 @@ Tests cover:
 from __future__ import annotations
 
 import os
+import re
+import time
 
 import pytest
+from rich.style import Style
 
 from pgtail_py.highlighter import (
+    PROFILE_MIN_CALLS,
     GroupedRegexHighlighter,
     HighlighterChain,
+    HighlighterProfile,
+    HighlightSpans,
     KeywordHighlighter,
+    KeywordIndex,
     Match,
     OccupancyTracker,
     RegexHighlighter,
+    SpanLayers,
+    ThemeKey,
+    get_style_table,
     is_color_disabled,
+    is_template_safe,
+    template_key,
+    uses_base_keyword_scan,
 )
 from pgtail_py.theme import ColorStyle, Theme
 
@@ -195,7 +208,7 @@ class TestHighlighterChain:
 
         result = chain.apply_rich_text("value: 123", mock_theme)
         assert result.plain == "value: 123"
-        assert "[blue bold]123" in result.markup
+        assert "[bold blue]123" in result.markup
 
     def test_overlap_prevention_priority(self, mock_theme: Theme) -> None:
         """Higher priority (lower number) should win on overlap."""
@@ -224,7 +237,7 @@ class TestHighlighterChain:
         result = chain.apply_rich_text("hello world today", mock_theme)
         # "hello world" should be blue bold (hl_test), not green (hl_test2)
         assert result.plain == "hello world today"
-        assert "[blue bold]hello world" in result.markup
+        assert "[bold blue]hello world" in result.markup
         assert "[green]world" not in result.markup
 
     def test_non_overlapping_matches(self, mock_theme: Theme) -> None:
@@ -252,7 +265,7 @@ class TestHighlighterChain:
         result = chain.apply_rich_text("abc 123", mock_theme)
         assert result.plain == "abc 123"
         assert "[green]abc" in result.markup
-        assert "[blue bold]123" in result.markup
+        assert "[bold blue]123" in result.markup
 
     def test_depth_limiting(self, mock_theme: Theme) -> None:
         """Max length should truncate highlighting."""
@@ -272,7 +285,7 @@ class TestHighlighterChain:
         result = chain.apply_rich_text(text, mock_theme)
 
         # "123" is within first 10 chars, "456" is beyond
-        assert "[blue bold]123" in result.markup
+        assert "[bold blue]123" in result.markup
         # The "456" should appear but not be highlighted
         assert "456" in result.plain
 
@@ -293,6 +306,31 @@ class TestHighlighterChain:
         with pytest.raises(KeyError, match="not found"):
             chain.unregister("unknown")
 
+    def test_sql_highlighters_use_token_spans(self) -> None:
+        """SQL highlighting skips comments and quoted identifiers in the SQL only."""
+        from pgtail_py.highlighters.sql import get_sql_highlighters
+
+        text = 'select from log; statement: SELECT "from" FROM t -- where $1'
+        for layers in (None, SpanLayers()):
+            chain = HighlighterChain(get_sql_highlighters(), layers=layers)
+            spans = [
+                (s.start, s.end, str(s.style)) for s in chain.apply_rich_text(text, None).spans
+            ]
+            start = text.index("SELECT")
+            assert spans == [
+                (start, start + 6, "sql_keyword"),
+                (start + 14, start + 18, "sql_keyword"),
+            ]
+
+    def test_custom_sql_highlighter_limited_to_region(self) -> None:
+        """SQL highlighters without a TOKEN_TYPE still only match inside the SQL."""
+        chain = HighlighterChain(
+            [RegexHighlighter(name="sql_t", priority=700, pattern=r"\bt\b", style="hl_test")]
+        )
+        text = "t statement: SELECT 1 FROM t"
+        spans = [(s.start, s.end) for s in chain.apply_rich_text(text, None).spans]
+        assert spans == [(len(text) - 1, len(text))]
+
 
 # =============================================================================
 # Test Rich Text round-trips
@@ -322,6 +360,336 @@ class TestRichTextRoundTrip:
         assert result.plain == text
 
 
+# =============================================================================
+# Test theme-independent spans
+# =============================================================================
+
+
+class TestThemeKeySpans:
+    """Tests for ThemeKey spans and StyleTable resolution."""
+
+    def test_chain_without_theme_keeps_keys(self, mock_theme: Theme) -> None:
+        """Highlighting without a theme leaves style keys unresolved."""
+        chain = HighlighterChain()
+        chain.register(RegexHighlighter("test", 100, r"\d+", "hl_test"))
+
+        result = chain.apply_rich_text("took 42 ms", None)
+        assert [(s.start, s.end, s.style) for s in result.spans] == [(5, 7, "hl_test")]
+        assert isinstance(result.spans[0].style, ThemeKey)
+
+    def test_spans_share_theme_keys(self) -> None:
+        """Every span with the same style key holds the same ThemeKey object."""
+        chain = HighlighterChain()
+        chain.register(RegexHighlighter("test", 100, r"\d+", "hl_test"))
+
+        first = chain.apply_rich_text("took 42 ms", None).spans[0].style
+        second = chain.apply_rich_text("took 7 ms", None).spans[0].style
+        assert first is second
+
+    def test_control_characters_keep_spans_aligned(self) -> None:
+        """Spans still cover the matched text when Rich drops control characters."""
+        chain = HighlighterChain()
+        chain.register(RegexHighlighter("test", 100, r"\d+", "hl_test"))
+
+        result = chain.apply_rich_text("a\r 42 b", None)
+        assert result.plain == "a 42 b"
+        assert [result.plain[s.start : s.end] for s in result.spans] == ["42"]
+
+    def test_style_table_resolves_per_theme(self, mock_theme: Theme) -> None:
+        """A StyleTable maps keys to the theme's styles, leaving literal styles."""
+        chain = HighlighterChain()
+        chain.register(RegexHighlighter("test", 100, r"\d+", "hl_test"))
+        text = chain.apply_rich_text("took 42 ms", None)
+        text.stylize("dim", 0, 4)
+
+        table = get_style_table(mock_theme)
+        assert get_style_table(mock_theme) is table
+        table.resolve(text)
+        styles = [s.style for s in text.spans]
+        assert styles[0] == table["hl_test"]
+        assert str(styles[0]) == "bold blue"
+        assert styles[1] == "dim"
+
+    def test_theme_styles_compiled_up_front(self, mock_theme: Theme) -> None:
+        """Theme keys are parsed when the table is built and reused by chains."""
+        table = get_style_table(mock_theme)
+        assert set(mock_theme.ui) <= set(table)
+        assert table.markup("hl_test") == "blue bold"
+        assert table.prompt_toolkit("hl_test") == "class:hl_test"
+        assert table.prompt_toolkit("bold magenta") == "bold fg:ansimagenta"
+
+        chain = HighlighterChain()
+        chain.register(RegexHighlighter("test", 100, r"\d+", "hl_test"))
+        result = chain.apply_rich_text("took 42 ms", mock_theme)
+        assert result.spans[0].style is table["hl_test"]
+
+    def test_reloaded_theme_gets_new_table(self, mock_theme: Theme) -> None:
+        """A theme reloaded under the same name is not served stale styles."""
+        table = get_style_table(mock_theme)
+        reloaded = Theme(name=mock_theme.name, ui={"hl_test": ColorStyle(fg="red")})
+
+        assert get_style_table(reloaded) is not table
+        assert str(get_style_table(reloaded)["hl_test"]) == "red"
+
+    def test_unknown_key_resolves_to_null_style(self, mock_theme: Theme) -> None:
+        """Keys that are neither theme keys nor Rich styles are unstyled."""
+        table = get_style_table(mock_theme)
+        assert table["not_a_theme_key"] == Style.null()
+        assert table["magenta"] == Style.parse("magenta")
+
+
+# =============================================================================
+# Test SpanLayers
+# =============================================================================
+
+
+class CountingHighlighter(RegexHighlighter):
+    """RegexHighlighter that counts find_matches calls."""
+
+    def __init__(self, name: str, priority: int, pattern: str, style: str) -> None:
+        super().__init__(name, priority, pattern, style)
+        self.scans = 0
+
+    def find_matches(self, text: str, theme: Theme) -> list[Match]:
+        self.scans += 1
+        return super().find_matches(text, theme)
+
+
+class TestSpanLayers:
+    """Tests for per-highlighter match layers shared between chains."""
+
+    def test_toggling_highlighter_scans_only_new_layer(self, mock_theme: Theme) -> None:
+        """Chains reuse cached layers and only run highlighters new to a text."""
+        digits = CountingHighlighter("digits", 100, r"\d+", "hl_test")
+        words = CountingHighlighter("words", 200, r"[a-z]+", "hl_test2")
+        layers = SpanLayers()
+        text = "took 42 ms"
+
+        chain = HighlighterChain([digits], layers=layers)
+        first = chain.apply_rich_text(text, mock_theme)
+        chain.apply_rich_text(text, mock_theme)
+        assert digits.scans == 1
+
+        # Enabling a highlighter runs only that one
+        both = HighlighterChain([digits, words], layers=layers)
+        result = both.apply_rich_text(text, mock_theme)
+        assert (digits.scans, words.scans) == (1, 1)
+
+        # Disabling it again resolves overlaps from the cached layers alone
+        assert HighlighterChain([digits], layers=layers).apply_rich_text(text, mock_theme) == first
+        assert (digits.scans, words.scans) == (1, 1)
+
+        assert result == HighlighterChain([digits, words]).apply_rich_text(text, mock_theme)
+
+    def test_template_layers_shared_across_numbers(self, mock_theme: Theme) -> None:
+        """Messages differing only in digits reuse template-safe layers."""
+        words = RegexHighlighter("words", 100, r"[a-z]+=\d+", "hl_test")
+        ranged = CountingHighlighter("ranged", 200, r"\b[1-5]\b", "hl_test2")
+        layers = SpanLayers()
+        chain = HighlighterChain([words, ranged], layers=layers)
+
+        chain.apply_rich_text("pid=123 took 7 ms", mock_theme)
+        second = chain.apply_rich_text("pid=456 took 3 ms", mock_theme)
+
+        assert (layers.hits, layers.misses) == (1, 1)
+        # The digit-sensitive highlighter still ran on both messages
+        assert ranged.scans == 2
+        assert second == HighlighterChain([words, ranged]).apply_rich_text(
+            "pid=456 took 3 ms", mock_theme
+        )
+
+    def test_template_key_keeps_positions(self) -> None:
+        """Template keys replace digits with 0 and keep the length."""
+        assert template_key("pid=123 at 10:45") == "pid=000 at 00:00"
+
+    def test_template_safe_highlighters(self) -> None:
+        """Overrides of find_matches must declare DIGIT_INVARIANT."""
+        from pgtail_py.highlighters.connection import ConnectionHighlighter, IPHighlighter
+        from pgtail_py.highlighters.performance import DurationHighlighter
+
+        assert is_template_safe(RegexHighlighter("n", 100, r"\d+", "hl_test"))
+        assert is_template_safe(ConnectionHighlighter())
+        # Octet ranges tell digits apart
+        assert not is_template_safe(IPHighlighter())
+        # Threshold styles depend on the value
+        assert not is_template_safe(DurationHighlighter())
+        assert not is_template_safe(CountingHighlighter("c", 100, r"\d+", "hl_test"))
+        assert not is_template_safe(KeywordHighlighter("k", 100, {"utf8": "hl_test"}))
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Layers beyond capacity are dropped oldest-use first."""
+        layers = SpanLayers(capacity=2)
+        layers.set("a", frozenset(), {})
+        layers.set("b", frozenset(), {})
+        layers.get("a")
+        layers.set("c", frozenset(), {})
+        assert len(layers) == 2
+        assert layers.get("b") is None
+        assert layers.get("a") is not None
+
+
+# =============================================================================
+# Test HighlighterProfile
+# =============================================================================
+
+
+class SlowHighlighter(RegexHighlighter):
+    """RegexHighlighter that takes at least a given time per scan."""
+
+    def __init__(self, name: str, priority: int, pattern: str, delay: float) -> None:
+        super().__init__(name, priority, pattern, "hl_test")
+        self.delay = delay
+
+    def find_matches(self, text: str, theme: Theme) -> list[Match]:
+        time.sleep(self.delay)
+        return super().find_matches(text, theme)
+
+
+class TestHighlighterProfile:
+    """Tests for per-highlighter instrumentation in HighlighterChain."""
+
+    def test_records_scans_matches_and_discards(self, mock_theme: Theme) -> None:
+        """Recording counts scans, matches and overlap losses per highlighter."""
+        profile = HighlighterProfile(recording=True)
+        digits = RegexHighlighter("digits", 100, r"\d+", "hl_test")
+        words = RegexHighlighter("words", 200, r"\w+", "hl_test2")
+        layers = SpanLayers()
+        chain = HighlighterChain([digits, words], layers=layers, profile=profile)
+
+        chain.apply_rich_text("took 42 ms", mock_theme)
+        chain.apply("took 42 ms", mock_theme)
+
+        stats = profile.stats
+        # The second line reuses the cached layers: no new scans
+        assert (stats["digits"].calls, stats["words"].calls) == (1, 1)
+        assert stats["digits"].ns > 0
+        assert (stats["digits"].matches, stats["digits"].discarded) == (2, 0)
+        # "42" is claimed by the higher-priority digits highlighter
+        assert (stats["words"].matches, stats["words"].discarded) == (6, 2)
+
+    def test_counts_highlighters_sharing_a_priority_apart(self, mock_theme: Theme) -> None:
+        """Custom highlighters with the same priority keep their own counts."""
+        profile = HighlighterProfile(recording=True)
+        first = RegexHighlighter("custom_a", 1051, r"\d+", "hl_test")
+        second = RegexHighlighter("custom_b", 1051, r"ms", "hl_test2")
+        chain = HighlighterChain([first, second], profile=profile)
+
+        chain.apply("took 42 ms and 7 ms", mock_theme)
+
+        stats = profile.stats
+        assert (stats["custom_a"].matches, stats["custom_a"].discarded) == (2, 0)
+        assert (stats["custom_b"].matches, stats["custom_b"].discarded) == (2, 0)
+
+    def test_inactive_profile_records_nothing(self, mock_theme: Theme) -> None:
+        """Without recording or a budget, chains do not time highlighters."""
+        profile = HighlighterProfile()
+        chain = HighlighterChain(
+            [RegexHighlighter("digits", 100, r"\d+", "hl_test")], profile=profile
+        )
+        result = chain.apply_rich_text("took 42 ms", mock_theme)
+
+        assert not profile.active
+        assert profile.stats == {}
+        assert result == HighlighterChain(chain.highlighters).apply_rich_text(
+            "took 42 ms", mock_theme
+        )
+
+    def test_over_budget_highlighter_is_dropped(self, mock_theme: Theme) -> None:
+        """A highlighter averaging more than the budget is unregistered."""
+        profile = HighlighterProfile(budget_ms=1)
+        fast = RegexHighlighter("fast", 100, r"\d+", "hl_test")
+        slow = SlowHighlighter("slow", 200, r"[a-z]+", 0.002)
+        chain = HighlighterChain([fast, slow], profile=profile)
+
+        for i in range(PROFILE_MIN_CALLS):
+            chain.apply_rich_text(f"took {i} ms", mock_theme)
+
+        assert list(profile.over_budget) == ["slow"]
+        assert profile.over_budget["slow"] >= 2_000_000
+        assert [h.name for h in chain.highlighters] == ["fast"]
+        assert profile.stats["slow"].calls == PROFILE_MIN_CALLS
+
+        profile.clear()
+        assert profile.over_budget == {} and profile.stats == {}
+
+
+# =============================================================================
+# Test HighlightSpans
+# =============================================================================
+
+
+class TestHighlightSpans:
+    """Tests for highlighting once and rendering to each output format."""
+
+    @staticmethod
+    def _chain() -> tuple[HighlighterChain, CountingHighlighter]:
+        digits = CountingHighlighter("digits", 100, r"\d+", "hl_test")
+        return HighlighterChain([digits]), digits
+
+    def test_one_result_serves_every_format(self, mock_theme: Theme) -> None:
+        """prompt_toolkit, Rich and ANSI output all come from the same spans."""
+        chain, digits = self._chain()
+        spans = chain.highlight("took 42 ms", mock_theme)
+        assert spans == HighlightSpans("took 42 ms", ((5, 7, "hl_test"),))
+
+        assert spans.to_formatted_text(mock_theme) == [
+            ("", "took "),
+            ("class:hl_test", "42"),
+            ("", " ms"),
+        ]
+        rich_text = spans.to_rich_text(mock_theme)
+        assert [(s.start, s.end, str(s.style)) for s in rich_text.spans] == [(5, 7, "bold blue")]
+        ansi = spans.to_ansi(mock_theme)
+        assert ansi.startswith("took \x1b[") and ansi.endswith("42\x1b[0m ms")
+        assert digits.scans == 1
+
+    def test_repeated_text_is_not_rescanned(self, mock_theme: Theme) -> None:
+        """Switching output format or theme reuses the cached result."""
+        chain, digits = self._chain()
+        other = Theme(name="other", ui={"hl_test": ColorStyle(fg="red")})
+
+        chain.apply("took 42 ms", mock_theme)
+        rich_text = chain.apply_rich_text("took 42 ms", other)
+        chain.apply_rich_text("took 42 ms", None)
+
+        assert digits.scans == 1
+        assert str(rich_text.spans[0].style) == "red"
+
+    def test_registry_change_clears_results(self, mock_theme: Theme) -> None:
+        """Registering a highlighter rescans texts seen before."""
+        chain, digits = self._chain()
+        chain.highlight("took 42 ms", mock_theme)
+        chain.register(RegexHighlighter("units", 200, r"ms", "hl_test2"))
+
+        spans = chain.highlight("took 42 ms", mock_theme)
+        assert digits.scans == 2
+        assert spans.spans == ((5, 7, "hl_test"), (8, 10, "hl_test2"))
+
+    def test_least_recently_used_text_evicted(self, mock_theme: Theme) -> None:
+        """Only cache_size texts are kept, dropping the least recently used."""
+        digits = CountingHighlighter("digits", 100, r"\d+", "hl_test")
+        chain = HighlighterChain([digits], cache_size=2)
+        for text in ("a 1", "b 2", "a 1", "c 3", "a 1", "b 2"):
+            chain.highlight(text, mock_theme)
+        assert digits.scans == 4
+
+    def test_spans_stop_at_max_length(self, mock_theme: Theme) -> None:
+        """Text past the depth limit is kept but not highlighted."""
+        chain = HighlighterChain([RegexHighlighter("d", 100, r"\d+", "hl_test")], max_length=6)
+        spans = chain.highlight("a 1 b 22", mock_theme)
+        assert spans.spans == ((2, 3, "hl_test"),)
+        assert spans.to_rich_text(mock_theme).plain == "a 1 b 22"
+
+    def test_texts_past_max_length_not_cached(self, mock_theme: Theme) -> None:
+        """Texts longer than max_length are highlighted each time, not kept alive."""
+        digits = CountingHighlighter("digits", 100, r"\d+", "hl_test")
+        chain = HighlighterChain([digits], max_length=6)
+        for _ in range(2):
+            chain.highlight("a 1 b 22", mock_theme)
+            chain.highlight("a 1", mock_theme)
+        assert digits.scans == 3
+
+
 # =============================================================================
 # Test RegexHighlighter
 # =============================================================================
@@ -345,6 +713,15 @@ class TestRegexHighlighter:
         assert matches[0].end == 10
         assert matches[0].text == "123"
 
+    def test_find_spans_matches_find_matches(self, mock_theme: Theme) -> None:
+        """find_spans returns find_matches' spans as tuples with the priority."""
+        highlighter = RegexHighlighter(name="test", priority=100, pattern=r"\d+", style="hl_test")
+
+        text = "a:1 b:22 c:333"
+        assert highlighter.find_spans(text) == [
+            (m.start, m.end, m.style, 100) for m in highlighter.find_matches(text, mock_theme)
+        ]
+
     def test_multiple_matches(self, mock_theme: Theme) -> None:
         """Pattern should find all matches."""
         highlighter = RegexHighlighter(
@@ -393,6 +770,27 @@ class TestRegexHighlighter:
                 style="hl_test",
             )
 
+    def test_first_chars_keeps_matches(self, mock_theme: Theme) -> None:
+        """A first_chars guard does not change what the pattern matches."""
+        text = "On off TRUE x-on 1on"
+        plain = RegexHighlighter("b", 100, r"\b(on|off|true)\b", "hl_test", flags=re.IGNORECASE)
+        guarded = RegexHighlighter(
+            "b", 100, r"\b(on|off|true)\b", "hl_test", flags=re.IGNORECASE, first_chars="ot"
+        )
+
+        assert guarded.find_matches(text, mock_theme) == plain.find_matches(text, mock_theme)
+        assert [m.text for m in guarded.find_matches(text, mock_theme)] == [
+            "On",
+            "off",
+            "TRUE",
+            "on",
+        ]
+
+    def test_first_chars_still_rejects_zero_length(self) -> None:
+        """The zero-length check applies to the unguarded pattern."""
+        with pytest.raises(ValueError, match="zero-length"):
+            RegexHighlighter("test", 100, r"a*", "hl_test", first_chars="a")
+
 
 # =============================================================================
 # Test GroupedRegexHighlighter
@@ -503,6 +901,75 @@ class TestKeywordHighlighter:
         assert len(matches) == 3
 
 
+class TestKeywordIndex:
+    """Tests for the merged keyword automaton."""
+
+    @staticmethod
+    def _highlighters() -> list[KeywordHighlighter]:
+        return [
+            KeywordHighlighter(
+                name="locks",
+                priority=100,
+                keywords={"RowShareLock": "hl_lock", "ShareLock": "hl_lock_share"},
+                case_sensitive=True,
+            ),
+            KeywordHighlighter(
+                name="errors",
+                priority=200,
+                keywords={"deadlock": "hl_error", "Deadlock_Detected": "hl_error_name"},
+            ),
+            KeywordHighlighter(
+                name="states",
+                priority=300,
+                # Shares "deadlock" with errors; "Idle" and "idle" fold together
+                keywords={"deadlock": "hl_state", "Idle": "hl_a", "idle": "hl_b"},
+                word_boundary=False,
+            ),
+        ]
+
+    def test_layers_match_each_highlighter(self) -> None:
+        """Each layer from one pass equals the highlighter's own find_spans."""
+        highlighters = self._highlighters()
+        index = KeywordIndex(highlighters)
+        text = "DEADLOCK deadlock_detected sharelock ShareLock RowShareLock idler deadlocks"
+
+        layers = index.scan(text, highlighters)
+
+        for h in highlighters:
+            assert layers.get(h, []) == h.find_spans(text), h.name
+        assert "hl_b" in {style for _, _, style, _ in layers[highlighters[2]]}
+
+    def test_scan_only_requested_highlighters(self) -> None:
+        """Highlighters not asked for get no layer."""
+        highlighters = self._highlighters()
+        index = KeywordIndex(highlighters)
+
+        layers = index.scan("deadlock ShareLock", highlighters[:1])
+
+        assert list(layers) == [highlighters[0]]
+        assert index.scan("", highlighters) == {}
+
+    def test_chain_uses_index(self, mock_theme: Theme) -> None:
+        """A chain with an index renders the same text as one without."""
+        highlighters = self._highlighters()
+        plain = HighlighterChain(highlighters)
+        indexed = HighlighterChain(highlighters, keywords=KeywordIndex(highlighters))
+        text = "deadlock detected waiting for ShareLock while idle"
+
+        assert indexed.apply_rich_text(text, mock_theme) == plain.apply_rich_text(text, mock_theme)
+
+    def test_overriding_highlighters_not_indexable(self) -> None:
+        """Only keyword highlighters using the base scan can be indexed."""
+
+        class Filtered(KeywordHighlighter):
+            def find_spans(self, text: str) -> list[tuple[int, int, str, int]]:
+                return super().find_spans(text)[:1]
+
+        assert uses_base_keyword_scan(self._highlighters()[0])
+        assert not uses_base_keyword_scan(Filtered("f", 1, {"a": "hl_a"}))
+        assert not uses_base_keyword_scan(RegexHighlighter("r", 1, r"a", "hl_a"))
+
+
 # =============================================================================
 # Test Regex Compilation (FR-004, T175)
 # =============================================================================
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import pytest
 
-from pgtail_py.highlighter import RegexHighlighter
+from pgtail_py.highlighter import KeywordHighlighter, RegexHighlighter
 from pgtail_py.highlighter_registry import (
     HighlighterRegistry,
     get_registry,
@@ -293,6 +293,20 @@ class TestCreateChain:
         # All highlighters should be filtered out due to global toggle
         assert len(chain.highlighters) == 0
 
+    def test_create_chain_shares_keyword_index(self) -> None:
+        """Chains share one keyword index, rebuilt when registrations change."""
+        registry = get_registry()
+        words = KeywordHighlighter(name="words", priority=100, keywords={"idle": "hl_state"})
+        registry.register(words, "structural")
+        registry.register(make_highlighter("h1"), "diagnostic")
+
+        index = registry.keyword_index
+        assert words in index and len(index) == 1
+        assert registry.create_chain(HighlightingConfig())._keywords is index
+
+        registry.unregister("words")
+        assert len(registry.keyword_index) == 0
+
     def test_create_chain_with_custom_highlighter(self) -> None:
         """create_chain should include enabled custom highlighters."""
         registry = get_registry()
@@ -341,3 +355,34 @@ class TestCreateChain:
 
         chain = registry.create_chain(config)
         assert chain.max_length == 5000
+
+    def test_chains_share_span_layers(self) -> None:
+        """Reconfigured chains share layers and reuse configured instances."""
+        registry = get_registry()
+        registry.register(make_highlighter("h1"), "structural")
+
+        config = HighlightingConfig()
+        config.custom_highlighters.append(
+            CustomHighlighter(name="custom_test", pattern=r"TEST-\d+", style="yellow")
+        )
+        first = registry.create_chain(config)
+        config.enabled_highlighters["h1"] = False
+        second = registry.create_chain(config)
+
+        assert first.layers is not None and first.layers is second.layers
+        assert first.highlighters[-1] is second.highlighters[-1]
+
+    def test_chains_leave_out_over_budget_highlighters(self) -> None:
+        """Highlighters over the profile's budget stay out until it is cleared."""
+        registry = get_registry()
+        registry.register(make_highlighter("h1"), "structural")
+        registry.register(make_highlighter("h2"), "diagnostic")
+        registry.profile.over_budget["h2"] = 5e6
+
+        config = HighlightingConfig()
+        chain = registry.create_chain(config)
+        assert chain.profile is registry.profile
+        assert [h.name for h in chain.highlighters] == ["h1"]
+
+        registry.profile.clear()
+        assert [h.name for h in registry.create_chain(config).highlighters] == ["h1", "h2"]
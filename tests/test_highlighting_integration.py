@@ -451,7 +451,7 @@ class TestNonOverlapping:
             name="test_high_priority",
             priority=100,
             pattern=r"test",
-            style="hl_timestamp_date",
+            style="hl_pid",
         )
 
         # Higher priority (500) loses
@@ -468,7 +468,7 @@ class TestNonOverlapping:
         result = chain.apply_rich_text(text, test_theme)
 
         # Should have style from h1 (lower priority number)
-        assert _has_style(result, "gray")  # hl_timestamp_date is gray in test_theme
+        assert _has_style(result, "cyan")  # hl_pid is cyan in test_theme
 
     def test_nested_pattern_handling(self, test_theme: Theme) -> None:
         """Should handle nested patterns (schema.table within relation)."""
@@ -15,6 +15,7 @@ For benchmarking: pytest tests/test_performance.py --benchmark-only
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
@@ -324,3 +325,180 @@ class TestAutoScrollStress:
             max_scroll = log.virtual_size.height - log.scrollable_content_region.height
             # Should be close to bottom (within 5 lines)
             assert max_scroll - scroll_y <= 5, "Auto-scroll should keep view near bottom"
+
+
+@pytest.mark.performance
+class TestHighlightScanCost:
+    """Per-line cost of highlighter regex scans over a realistic corpus.
+
+    Compares the patterns guarded with ``first_chars`` against the same
+    patterns without the guard, and SQL highlighting scoped to one lexer
+    pass over the detected SQL against whole-line scans, and chains with
+    and without the per-template match cache. Also measures, with
+    tracemalloc, the memory a highlighted line keeps.
+    """
+
+    CORPUS = [
+        "duration: 150.234 ms  statement: SELECT * FROM users WHERE id = $1 AND name = 'x'",
+        'duplicate key value violates unique constraint "users_pkey"',
+        "checkpoint complete: wrote 1234 buffers (7.5%); 0 WAL file(s) added, 0 removed, "
+        "3 recycled; write=0.123 s, sync=0.002 s, total=0.130 s",
+        "connection received: host=127.0.0.1 port=54321",
+        "connection authorized: user=postgres database=postgres application_name=psql",
+        'automatic vacuum of table "postgres.public.users": index scans: 1 '
+        "pages: 0 removed, 123 remain, 0 skipped due to pins",
+        "process 1234 still waiting for ShareLock on transaction 5678 after 1000.123 ms",
+        'could not open file "/var/lib/postgresql/16/main/base/5/1234": No such file',
+        "redo starts at 0/1234ABCD",
+        'temporary file: path "base/pgsql_tmp/pgsql_tmp1234.0", size 10485760',
+        'parameter "work_mem" changed to "64MB"',
+        "database system is ready to accept connections",
+    ]
+
+    @staticmethod
+    def _per_line_us(collectors: list[Callable[[str], object]], lines: list[str]) -> list[float]:
+        """Best-of-seven cost of each collector over every line, in microseconds.
+
+        Collectors are timed in alternation so that load changes affect
+        them alike.
+        """
+        best = [float("inf")] * len(collectors)
+        for _ in range(7):
+            for i, collect in enumerate(collectors):
+                start = time.perf_counter()
+                for line in lines:
+                    collect(line)
+                best[i] = min(best[i], time.perf_counter() - start)
+        return [b / len(lines) * 1e6 for b in best]
+
+    def test_first_chars_guard_per_line_cost(self) -> None:
+        """Guarded patterns find the same matches at a lower per-line cost."""
+        import re
+
+        from pgtail_py.highlighter import RegexHighlighter
+        from pgtail_py.tail_rich import get_highlighter_chain
+
+        highlighters = [
+            h
+            for h in get_highlighter_chain().highlighters
+            if isinstance(h, RegexHighlighter) and h._pattern.pattern != h.PATTERN  # type: ignore[attr-defined]
+        ]
+        guarded = [h._pattern for h in highlighters]
+        plain = [re.compile(h.PATTERN, h._pattern.flags) for h in highlighters]  # type: ignore[attr-defined]
+        assert len(guarded) >= 10
+
+        for line in self.CORPUS:
+            for before, after in zip(plain, guarded, strict=True):
+                assert [m.span() for m in before.finditer(line)] == [
+                    m.span() for m in after.finditer(line)
+                ]
+
+        def scan_plain(text: str) -> None:
+            for pattern in plain:
+                pattern.findall(text)
+
+        def scan_guarded(text: str) -> None:
+            for pattern in guarded:
+                pattern.findall(text)
+
+        before, after = self._per_line_us([scan_plain, scan_guarded], self.CORPUS * 50)
+        assert after < before, f"{after:.1f}us/line guarded vs {before:.1f}us/line"
+
+    def test_scoped_sql_scan_on_long_statements(self) -> None:
+        """Lexing only the SQL once beats scanning whole multi-KB lines per highlighter."""
+        from pgtail_py.highlighter import _scan_sql_region
+        from pgtail_py.highlighters.sql import detect_sql_content
+        from pgtail_py.tail_rich import get_highlighter_chain
+
+        values = ", ".join(
+            f"({i}, 'name {i}', {i}.5::numeric, $%d)" % (i % 9 + 1) for i in range(150)
+        )
+        lines = [
+            f"duration: 12.345 ms  statement: INSERT INTO t (a, b, c, d) VALUES {values}",
+            f"execute S_1: SELECT * FROM t WHERE (a, b, c, d) IN ({values}) ORDER BY a",
+        ]
+        assert all(len(line) > 4096 for line in lines)
+        highlighters = [
+            h for h in get_highlighter_chain().highlighters if h.name.startswith("sql_")
+        ]
+        assert all(hasattr(h, "TOKEN_TYPE") for h in highlighters)
+
+        def scan_whole(text: str) -> None:
+            result = detect_sql_content(text)
+            assert result is not None
+            lo = len(result.prefix)
+            hi = lo + len(result.sql)
+            for h in highlighters:
+                [m for m in h.find_matches(text, None) if m.start >= lo and m.end <= hi]  # type: ignore[arg-type]
+
+        def scan_scoped(text: str) -> None:
+            _scan_sql_region(text, None, highlighters)
+
+        for line in lines:
+            layers = _scan_sql_region(line, None, highlighters)
+            assert {h.name for h in layers} == {h.name for h in highlighters}
+
+        before, after = self._per_line_us([scan_whole, scan_scoped], lines * 5)
+        assert after < before, f"{after:.1f}us/line scoped vs {before:.1f}us/line"
+
+    def test_template_cache_on_repeated_shapes(self) -> None:
+        """Messages repeating a shape with new numbers skip template-safe highlighters."""
+        import random
+
+        from pgtail_py.highlighter import HighlighterChain, SpanLayers
+        from pgtail_py.tail_rich import get_highlighter_chain
+
+        highlighters = get_highlighter_chain().highlighters
+        rng = random.Random(0)
+        lines = [
+            "".join(str(rng.randrange(10)) if c.isdigit() else c for c in line)
+            for line in self.CORPUS * 50
+        ]
+        assert len(set(lines)) > len(lines) // 2
+        # Too small to keep exact texts between runs, large enough for the templates
+        layers = SpanLayers(capacity=64)
+        plain = HighlighterChain(highlighters, cache_size=0)
+        cached = HighlighterChain(highlighters, layers=layers, cache_size=0)
+
+        for line in lines[:100]:
+            assert cached.apply_rich_text(line, None) == plain.apply_rich_text(line, None)
+
+        before, after = self._per_line_us(
+            [lambda t: plain.apply_rich_text(t, None), lambda t: cached.apply_rich_text(t, None)],
+            lines,
+        )
+        assert layers.hits > 10 * layers.misses
+        assert after < before, f"{after:.1f}us/line cached vs {before:.1f}us/line"
+
+    def test_highlighted_line_keeps_only_spans(self) -> None:
+        """A highlighted line holds its text plus one shared-style Span per match."""
+        import tracemalloc
+
+        from rich.text import Text
+
+        from pgtail_py.highlighter import HighlighterChain
+        from pgtail_py.tail_rich import get_highlighter_chain
+
+        # Without the chain's result cache, only the Text objects are retained
+        chain = HighlighterChain(get_highlighter_chain().highlighters, cache_size=0)
+        lines = [f"{line} #{i}" for i in range(50) for line in self.CORPUS]
+        for line in self.CORPUS:
+            chain.apply_rich_text(line, None)
+
+        def retained(build: Callable[[str], Text]) -> tuple[list[Text], int]:
+            tracemalloc.start()
+            try:
+                before = tracemalloc.get_traced_memory()[0]
+                kept = [build(line) for line in lines]
+                return kept, tracemalloc.get_traced_memory()[0] - before
+            finally:
+                tracemalloc.stop()
+
+        _, plain_bytes = retained(Text)
+        highlighted, highlighted_bytes = retained(lambda t: chain.apply_rich_text(t, None))
+        spans = sum(len(t.spans) for t in highlighted)
+        assert spans > len(lines)
+        # A Span and its share of the span list, about 100 bytes; a substring
+        # and style string per match would triple that
+        per_span = (highlighted_bytes - plain_bytes) / spans
+        assert per_span < 150, f"{per_span:.0f} bytes kept per span"
@@ -4,12 +4,18 @@ import re
 
 import pytest
 
+from pgtail_py import regex_filter
 from pgtail_py.regex_filter import (
     FilterState,
     FilterType,
     Highlight,
     RegexFilter,
+    compile_pattern,
+    get_match_budget,
+    has_nested_quantifier,
+    is_digit_invariant,
     parse_filter_arg,
+    set_match_budget,
 )
 
 
@@ -360,3 +366,156 @@ class TestParseFilterArg:
         """Error if case-sensitive pattern is empty."""
         with pytest.raises(ValueError, match="Empty pattern not allowed"):
             parse_filter_arg("//c")
+
+
+class TestCompilePattern:
+    """Tests for the shared compiled-pattern cache."""
+
+    def test_same_key_returns_cached_pattern(self) -> None:
+        """Same (pattern, flags) returns the same compiled object."""
+        assert compile_pattern("dead+lock", re.IGNORECASE) is compile_pattern(
+            "dead+lock", re.IGNORECASE
+        )
+
+    def test_flags_are_part_of_key(self) -> None:
+        """Different flags compile separately."""
+        assert compile_pattern("x") is not compile_pattern("x", re.IGNORECASE)
+
+    def test_filters_share_compiled_pattern(self) -> None:
+        """Re-creating a filter reuses the compiled regex."""
+        first = RegexFilter.create("timeout", FilterType.INCLUDE)
+        second = RegexFilter.create("timeout", FilterType.EXCLUDE)
+        assert first.compiled is second.compiled
+
+
+class TestHasNestedQuantifier:
+    """Tests for the nested quantifier analyser."""
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"(a+)+",
+            r"(?:\w+\s?)*x",
+            r"(?:a|b+)*",
+            r"((a+){2})+",
+            r"(?=(a+)+)",
+            r"(.+,)+",
+            r"([^,]+x)+",
+            r"(?i)(a+A)+",
+        ],
+    )
+    def test_flags_nested(self, pattern: str) -> None:
+        """Unbounded repeats of unbounded repeats are flagged."""
+        assert has_nested_quantifier(pattern)
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [r"(a|b)+", r"(\d+)-(\d+)", r"(a{1,3})+", r"(?>a+)+", r"(a*+)+", r"a++"],
+    )
+    def test_safe_patterns(self, pattern: str) -> None:
+        """Bounded, single, possessive and atomic repeats are not flagged."""
+        assert not has_nested_quantifier(pattern)
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"\d+(\.\d+)*",
+            r"v\d+(\.\d+)+",
+            r"(\d+\.)+\d+",
+            r"(?:[a-z]+,)*x",
+            r"(?i)(?:[a-z]+[,;])*x",
+            r"((\d+\.)+x)*",
+        ],
+    )
+    def test_delimited_repeats_not_flagged(self, pattern: str) -> None:
+        """A mandatory delimiter the inner repeats can't match keeps the split unique."""
+        assert not has_nested_quantifier(pattern)
+
+    def test_custom_highlighter_validation_allows_nested(self) -> None:
+        """validate_custom_pattern leaves nested quantifiers to a warning."""
+        from pgtail_py.highlighter import validate_custom_pattern
+
+        assert validate_custom_pattern(r"(x+)+y") == (True, None)
+        assert validate_custom_pattern(r"(?>x+)+y") == (True, None)
+
+
+class TestIsDigitInvariant:
+    """Tests for the digit invariance analyser."""
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [r"\d+", r"[0-9a-f]+", r"\bpid=\w+", r"[^a-z]", r".\S", r"(?=[0-9A-Z])(?:[0-9A-Z]{5})"],
+    )
+    def test_invariant_patterns(self, pattern: str) -> None:
+        """Patterns that accept every digit or none at each step are invariant."""
+        assert is_digit_invariant(pattern)
+
+    @pytest.mark.parametrize("pattern", [r"0x[0-9]", r"[1-5]", r"[^5]", r"25[0-5]", r"(\d)\1"])
+    def test_digit_sensitive_patterns(self, pattern: str) -> None:
+        """Digit literals, partial digit classes and backreferences are flagged."""
+        assert not is_digit_invariant(pattern)
+
+
+class TestMatchBudget:
+    """Tests for the per-line match time budget."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_budget(self):  # type: ignore[no-untyped-def]
+        yield
+        set_match_budget(None)
+
+    def test_budget_setting(self) -> None:
+        """Budget is stored in milliseconds."""
+        set_match_budget(50)
+        assert get_match_budget() == 50
+        set_match_budget(None)
+        assert get_match_budget() is None
+
+    def test_fast_matches_unaffected(self) -> None:
+        """Matches under budget behave normally."""
+        set_match_budget(1000)
+        state = FilterState.empty()
+        state.add_filter(RegexFilter.create("error", FilterType.INCLUDE))
+        assert state.should_show("ERROR: boom")
+        assert not state.should_show("LOG: fine")
+        assert state.budget_skip_counts() == []
+
+    def test_one_slow_line_does_not_hide_later_lines(self) -> None:
+        """A single overrun fails only its own line, for includes and excludes."""
+        set_match_budget(1)
+        include = FilterState.empty()
+        include.add_filter(RegexFilter.create(r"(a+)+$", FilterType.INCLUDE))
+        exclude = FilterState.empty()
+        exclude.add_filter(RegexFilter.create(r"(a+)+$", FilterType.EXCLUDE))
+        evil = "a" * 20 + "!"
+
+        # Over budget counts as no match: hidden by the include, shown by the exclude
+        assert not include.should_show(evil)
+        assert exclude.should_show(evil)
+        # Lines as long or longer are still matched
+        for line in ("a" * 21, "a" * 40):
+            assert include.should_show(line)
+            assert not exclude.should_show(line)
+        assert include.budget_skip_counts() == [(r"(a+)+$", 1)]
+        assert exclude.budget_skip_counts() == [(r"(a+)+$", 1)]
+
+    def test_repeated_overruns_skip_long_lines_for_a_window(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Repeated overruns skip lines at least as long until the window ends."""
+        monkeypatch.setattr(regex_filter, "BUDGET_WINDOW_LINES", 10)
+        set_match_budget(1)
+        state = FilterState.empty()
+        state.add_filter(RegexFilter.create(r"(a+)+$", FilterType.EXCLUDE))
+        evil = "a" * 18 + "!"
+
+        for _ in range(regex_filter.BUDGET_OVERRUNS):
+            assert state.should_show(evil)
+        # Skipped without running: shown although the exclude would match
+        assert state.should_show("a" * 30)
+        assert not state.should_show("a" * 5)
+        assert state.budget_skip_counts() == [(r"(a+)+$", regex_filter.BUDGET_OVERRUNS + 1)]
+
+        for _ in range(10):
+            state.should_show("short line")
+        assert not state.should_show("a" * 30)
@@ -316,3 +316,32 @@ class TestDetectSQLContentEdgeCases:
         assert result is not None
         assert "$$" in result.sql
         assert "SELECT 1" in result.sql
+
+    def test_literal_without_prefix_is_skipped(self) -> None:
+        """Occurrences of a literal that do not start a prefix should be skipped."""
+        message = "could not execute plan; execute fetch_rows: SELECT 1"
+        result = detect_sql_content(message)
+        assert result is not None
+        assert result.prefix == "could not execute plan; execute fetch_rows: "
+        assert result.sql == "SELECT 1"
+
+    def test_earlier_pattern_wins_over_earlier_position(self) -> None:
+        """A statement prefix should win over an execute prefix before it."""
+        message = "execute s1: x statement: SELECT 1"
+        result = detect_sql_content(message)
+        assert result is not None
+        assert result.sql == "SELECT 1"
+
+    def test_case_insensitive_prefix(self) -> None:
+        """Prefixes should match in any case."""
+        result = detect_sql_content("LOG:  Statement: SELECT 1")
+        assert result is not None
+        assert result.sql == "SELECT 1"
+
+    def test_length_changing_lowercase(self) -> None:
+        """Characters that grow when lowercased should not shift the prefix."""
+        message = "İİ statement: SELECT 1"
+        result = detect_sql_content(message)
+        assert result is not None
+        assert result.prefix == "İİ statement: "
+        assert result.sql == "SELECT 1"
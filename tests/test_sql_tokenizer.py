@@ -26,6 +26,7 @@ class TestSQLTokenType:
             "quoted_identifier",
             "string",
             "number",
+            "param",
             "operator",
             "comment",
             "function",
@@ -1012,3 +1013,63 @@ class TestSQLTokenizerMalformedSQL:
         # Should reconstruct
         reconstructed = "".join(t.text for t in tokens)
         assert reconstructed == problematic
+
+
+class TestSQLTokenizerParamsAndSpans:
+    """Test parameter tokens and one-pass token spans."""
+
+    @pytest.fixture
+    def tokenizer(self) -> SQLTokenizer:
+        """Create a tokenizer instance."""
+        return SQLTokenizer()
+
+    def test_param_token(self, tokenizer: SQLTokenizer) -> None:
+        """$1 should be one PARAM token."""
+        tokens = tokenizer.tokenize("id = $12")
+        assert (tokens[-1].type, tokens[-1].text) == (SQLTokenType.PARAM, "$12")
+
+    def test_hex_and_exponent_numbers(self, tokenizer: SQLTokenizer) -> None:
+        """Hex and scientific literals should be single NUMBER tokens."""
+        tokens = tokenizer.tokenize("0x1F 1.5e-3")
+        numbers = [t.text for t in tokens if t.type == SQLTokenType.NUMBER]
+        assert numbers == ["0x1F", "1.5e-3"]
+
+    def test_geometric_and_json_operators(self, tokenizer: SQLTokenizer) -> None:
+        """@ and # should be operators."""
+        tokens = tokenizer.tokenize("a @ b # c")
+        operators = [t.text for t in tokens if t.type == SQLTokenType.OPERATOR]
+        assert operators == ["@", "#"]
+
+    def test_token_spans_within_region(self, tokenizer: SQLTokenizer) -> None:
+        """Spans should cover only the given region, in text positions."""
+        text = "select: SELECT a FROM t WHERE b = $1 AND c = 'x' -- where"
+        start = text.index("SELECT")
+        spans = tokenizer.token_spans(text, start)
+
+        def texts(token_type: SQLTokenType) -> list[str]:
+            return [text[s:e] for s, e in spans[token_type]]
+
+        assert texts(SQLTokenType.KEYWORD) == ["SELECT", "FROM", "WHERE", "AND"]
+        assert texts(SQLTokenType.PARAM) == ["$1"]
+        assert texts(SQLTokenType.STRING) == ["'x'"]
+        assert texts(SQLTokenType.OPERATOR) == ["=", "="]
+        assert texts(SQLTokenType.NUMBER) == []
+
+    def test_token_spans_keyword_before_paren(self, tokenizer: SQLTokenizer) -> None:
+        """Keywords followed by ( should still be keyword spans."""
+        spans = tokenizer.token_spans("COALESCE(a, 0)")
+        assert spans[SQLTokenType.KEYWORD] == [(0, 8)]
+
+    def test_token_spans_match_tokenize(self, tokenizer: SQLTokenizer) -> None:
+        """Spans should agree with tokenize() for strings, params, numbers, operators."""
+        sql = "SELECT $tag$ a'b $tag$, 'it''s', 3.14 FROM \"t-1\" WHERE x <> $2 /* 'no' */"
+        spans = tokenizer.token_spans(sql)
+        tokens = tokenizer.tokenize(sql)
+        for token_type in (
+            SQLTokenType.STRING,
+            SQLTokenType.PARAM,
+            SQLTokenType.NUMBER,
+            SQLTokenType.OPERATOR,
+        ):
+            expected = [(t.start, t.end) for t in tokens if t.type == token_type]
+            assert spans[token_type] == expected
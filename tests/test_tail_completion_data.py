@@ -357,7 +357,7 @@ class TestStaticValueLists:
 
 
 class TestHighlightSubcommands:
-    """The highlight command must have all 11 required subcommands."""
+    """The highlight command must have all 12 required subcommands."""
 
     _REQUIRED_SUBCOMMANDS = {
         "list",
@@ -371,6 +371,7 @@ class TestHighlightSubcommands:
         "import",
         "preview",
         "reset",
+        "stats",
     }
 
     def test_highlight_has_subcommands(self) -> None:
@@ -378,21 +379,21 @@ class TestHighlightSubcommands:
         assert TAIL_COMPLETION_DATA["highlight"].subcommands is not None
 
     def test_all_required_subcommands_present(self) -> None:
-        """All 11 required highlight subcommands are present."""
+        """All 12 required highlight subcommands are present."""
         actual = set(TAIL_COMPLETION_DATA["highlight"].subcommands.keys())
         missing = self._REQUIRED_SUBCOMMANDS - actual
         assert missing == set(), f"Missing highlight subcommands: {missing}"
 
     def test_no_extra_subcommands(self) -> None:
-        """No unexpected subcommands beyond the required 11."""
+        """No unexpected subcommands beyond the required 12."""
         actual = set(TAIL_COMPLETION_DATA["highlight"].subcommands.keys())
         extra = actual - self._REQUIRED_SUBCOMMANDS
         assert extra == set(), f"Unexpected extra highlight subcommands: {extra}"
 
-    def test_highlight_subcommand_count_is_eleven(self) -> None:
-        """highlight must have exactly 11 subcommands."""
+    def test_highlight_subcommand_count_is_twelve(self) -> None:
+        """highlight must have exactly 12 subcommands."""
         count = len(TAIL_COMPLETION_DATA["highlight"].subcommands)
-        assert count == 11, f"Expected 11 highlight subcommands, got {count}"
+        assert count == 12, f"Expected 12 highlight subcommands, got {count}"
 
     def test_highlight_no_args_subcommands(self) -> None:
         """list, on, off, preview, reset are no-arg subcommands."""
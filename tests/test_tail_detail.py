@@ -0,0 +1,42 @@
+"""Tests for pgtail_py.tail_detail module."""
+
+from __future__ import annotations
+
+import pytest
+from textual.app import App
+from textual.widgets import Log
+
+from pgtail_py.tail_detail import DetailScreen, chunk_lines
+
+
+class TestChunkLines:
+    """Tests for chunk_lines()."""
+
+    def test_splits_newlines_and_long_lines(self) -> None:
+        """Test lines are split at newlines, then every width characters."""
+        assert chunk_lines("ab\ncdefgh\n", 3) == ["ab", "cde", "fgh", ""]
+
+    def test_short_text_unchanged(self) -> None:
+        """Test text narrower than the width is one row."""
+        assert chunk_lines("select 1", 80) == ["select 1"]
+
+
+class TestDetailScreen:
+    """Tests for DetailScreen."""
+
+    @pytest.mark.asyncio
+    async def test_shows_wrapped_text_and_dismisses(self) -> None:
+        """Test the whole text is shown in rows and Escape closes the pane."""
+        text = "x" * 10_000
+        app: App[None] = App()
+        async with app.run_test(size=(80, 24)) as pilot:
+            await app.push_screen(DetailScreen(text, title="LOG"))
+            await pilot.pause()
+
+            log = app.screen.query_one("#detail-log", Log)
+            assert "".join(log.lines) == text
+            assert max(len(line) for line in log.lines) < 80
+
+            await pilot.press("escape")
+            await pilot.pause()
+            assert not isinstance(app.screen, DetailScreen)
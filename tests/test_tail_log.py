@@ -6,6 +6,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from pgtail_py.filter import LogLevel
+from pgtail_py.parser import LogEntry
 from pgtail_py.tail_log import TailLog
 
 
@@ -475,3 +477,419 @@ class TestRenderLineCache:
             # With selection active, result should be freshly rendered
             # (not the same object as the cached clean strip)
             assert result is not cached_strip
+
+
+class TestEntryRows:
+    """Tests for lazily formatted entry rows written with write_entries()."""
+
+    @staticmethod
+    def _entries(count: int) -> list[LogEntry]:
+        return [
+            LogEntry(timestamp=None, level=LogLevel.LOG, message=f"line {i}", raw="")
+            for i in range(count)
+        ]
+
+    def test_requires_formatter(self) -> None:
+        """write_entries() without a formatter raises."""
+        with pytest.raises(RuntimeError):
+            TailLog().write_entries(self._entries(1))
+
+    @pytest.mark.asyncio
+    async def test_formats_only_rendered_rows(self) -> None:
+        """Entries scrolled out of view are never formatted."""
+        from rich.text import Text
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.tail_rich import format_entry_plain
+
+        formatted: list[str] = []
+
+        def formatter(entry: LogEntry) -> Text:
+            formatted.append(entry.message)
+            return Text(format_entry_plain(entry), style="green")
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(id="log", entry_formatter=formatter, entry_plain=format_entry_plain)
+
+        app = TestApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            log = app.query_one("#log", TailLog)
+            log.write_entries(self._entries(1000))
+            await pilot.pause()
+
+            assert log.line_count == 1000
+            assert log._lines[0] == "LOG    : line 0"
+            assert 0 < len(formatted) < 100
+            assert "line 999" in formatted
+            assert "line 0" not in formatted
+
+    @pytest.mark.asyncio
+    async def test_multiline_entry_and_row_cache(self) -> None:
+        """A multi-line entry spans rows and is formatted once."""
+        from rich.text import Text
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.tail_rich import format_entry_plain
+
+        calls: list[LogEntry] = []
+
+        def formatter(entry: LogEntry) -> Text:
+            calls.append(entry)
+            return Text(format_entry_plain(entry))
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(id="log", entry_formatter=formatter, entry_plain=format_entry_plain)
+
+        app = TestApp()
+        async with app.run_test() as pilot:
+            log = app.query_one("#log", TailLog)
+            entry = LogEntry(timestamp=None, level=LogLevel.LOG, message="a\nb", raw="")
+            log.write_entries([entry])
+            await pilot.pause()
+
+            assert log._lines == ["LOG    : a", "b"]
+            assert len(calls) == 1
+
+            # Strip cache dropped (as on prune): rows come from the formatted-row LRU
+            log._render_line_cache.clear()
+            from rich.style import Style
+
+            log._render_line_strip(1, Style())
+            assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_long_row_renders_visible_window(self) -> None:
+        """A huge row is measured by length and styled only around the view."""
+        from rich.text import Text
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.tail_log import LONG_LINE_CHARS, LONG_LINE_MARGIN
+        from pgtail_py.tail_rich import format_entry_plain
+
+        windows: list[str] = []
+
+        def highlight_window(entry: LogEntry, row: int, text: str, start: int) -> Text:
+            windows.append(text)
+            return Text(text)
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(
+                    id="log",
+                    entry_formatter=lambda e: Text(format_entry_plain(e)),
+                    entry_plain=format_entry_plain,
+                    highlight_window=highlight_window,
+                )
+
+        message = "".join(str(i % 10) for i in range(LONG_LINE_CHARS * 5))
+        entry = LogEntry(timestamp=None, level=LogLevel.LOG, message=message, raw="")
+        app = TestApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            log = app.query_one("#log", TailLog)
+            log.write_entries([entry])
+            await pilot.pause()
+
+            row = log._lines[0]
+            assert log.virtual_size.width >= len(row)
+
+            width = log.scrollable_content_region.width
+            strip = log._render_line(0, 30_000, width)
+            assert strip.text == row[30_000 : 30_000 + width]
+            assert all(len(w) <= width + 2 * LONG_LINE_MARGIN for w in windows)
+
+    @pytest.mark.asyncio
+    async def test_expand_posts_full_entry(self) -> None:
+        """The e key asks for the whole entry at the cursor."""
+        from rich.text import Text
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.tail_rich import format_entry_plain
+
+        requests: list[TailLog.ExpandRequested] = []
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(
+                    id="log",
+                    entry_formatter=lambda e: Text(format_entry_plain(e)),
+                    entry_plain=format_entry_plain,
+                )
+
+            def on_tail_log_expand_requested(self, event: TailLog.ExpandRequested) -> None:
+                requests.append(event)
+
+        entry = LogEntry(timestamp=None, level=LogLevel.LOG, message="a\nb", raw="")
+        app = TestApp()
+        async with app.run_test() as pilot:
+            log = app.query_one("#log", TailLog)
+            log.write_entries([entry])
+            log.focus()
+            log._cursor_line = 1
+            await pilot.press("e")
+            await pilot.pause()
+
+            assert len(requests) == 1
+            assert requests[0].entry is entry
+            assert requests[0].text == "LOG    : a\nb"
+
+    @pytest.mark.asyncio
+    async def test_prune_entries_before(self) -> None:
+        """Rows of entries evicted from the store are dropped."""
+        from rich.text import Text
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.entry_store import EntryStore
+        from pgtail_py.tail_rich import format_entry_plain
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(
+                    id="log",
+                    entry_formatter=lambda e: Text(format_entry_plain(e)),
+                    entry_plain=format_entry_plain,
+                )
+
+        app = TestApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            log = app.query_one("#log", TailLog)
+            store = EntryStore(10)
+            entries = self._entries(4)
+            for entry in entries:
+                store.append(entry)
+            log.write_entries(entries)
+            await pilot.pause()
+
+            assert log.prune_entries_before(2) == 2
+            assert log._lines == ["LOG    : line 2", "LOG    : line 3"]
+            assert log.prune_entries_before(2) == 0
+
+    @pytest.mark.asyncio
+    async def test_memory_usage_follows_rows(self) -> None:
+        """Row bytes are tracked as rows come and go, and charged to their entries."""
+        from rich.text import Text
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.entry_store import EntryStore
+        from pgtail_py.tail_rich import format_entry_plain
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(
+                    id="log",
+                    entry_formatter=lambda e: Text(format_entry_plain(e)),
+                    entry_plain=format_entry_plain,
+                )
+
+        app = TestApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            log = app.query_one("#log", TailLog)
+            empty = log.memory_usage
+            store = EntryStore(10)
+            entries = self._entries(4)
+            for entry in entries:
+                store.append(entry)
+            log.write_line("started")
+            log.write_entries(entries)
+            await pilot.pause()
+
+            full = log.memory_usage
+            assert full > empty + sum(map(len, log._lines))
+            charged = log.front_entry_bytes(1)
+            # The message row is charged to the entry after it
+            assert list(charged) == [0]
+            assert charged[0] > 2 * len(log._lines[1])
+            assert sum(log.front_entry_bytes(full).values()) <= full
+
+            log.prune_entries_before(2)
+            assert log.memory_usage < full
+            log.remove_last_rows(2)
+            log.clear()
+            assert log.memory_usage == empty
+
+    @pytest.mark.asyncio
+    async def test_prepend_and_remove_last_rows(self) -> None:
+        """Prepended rows keep the view in place and stay searchable."""
+        from rich.text import Text
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.entry_store import EntryStore
+        from pgtail_py.tail_rich import format_entry_plain
+        from pgtail_py.tail_search import parse_search
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(
+                    id="log",
+                    entry_formatter=lambda e: Text(format_entry_plain(e)),
+                    entry_plain=format_entry_plain,
+                )
+
+        app = TestApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            log = app.query_one("#log", TailLog)
+            store = EntryStore(100)
+            entries = self._entries(60)
+            for entry in entries:
+                store.append(entry)
+            log.write_entries(entries[30:])
+            log.search(parse_search("/line 1"))
+            log.scroll_to(y=5, animate=False, immediate=True)
+            await pilot.pause()
+            y = log.scroll_y
+
+            assert log.prepend_entries(entries[:30]) == 30
+            assert log.scroll_y == y + 30
+            assert (log.first_entry_seq, log.last_entry_seq) == (0, 59)
+            assert log.search_match_count == 11
+
+            log.remove_last_rows(50)
+            assert log.line_count == 10
+            assert log.last_entry_seq == 9
+            assert log.search_match_count == 1
+
+            # max_rows drops the oldest inserted rows that do not fit
+            log.clear()
+            log.write_entries(entries[10:15])
+            assert log.prepend_entries(entries[:10], max_rows=8) == 3
+            assert (log.first_entry_seq, log.line_count) == (7, 8)
+
+    @pytest.mark.asyncio
+    async def test_format_key_cache_survives_clear(self) -> None:
+        """Rewritten entries reuse formatting until the format key changes."""
+        from rich.text import Text
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.entry_store import EntryStore
+        from pgtail_py.tail_rich import format_entry_plain
+
+        calls: list[str] = []
+        theme = ["dark"]
+
+        def formatter(entry: LogEntry) -> Text:
+            calls.append(entry.message)
+            return Text(format_entry_plain(entry))
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(
+                    id="log",
+                    entry_formatter=formatter,
+                    entry_plain=format_entry_plain,
+                    format_key=lambda: theme[0],
+                )
+
+        app = TestApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            log = app.query_one("#log", TailLog)
+            store = EntryStore(10)
+            entries = self._entries(5)
+            for entry in entries:
+                store.append(entry)
+            log.write_entries(entries)
+            await pilot.pause()
+            assert len(calls) == 5
+
+            # A filter rebuild clears and rewrites the same entries
+            log.clear()
+            log.write_entries(entries)
+            await pilot.pause()
+            assert len(calls) == 5
+
+            theme[0] = "light"
+            log.clear()
+            log.write_entries(entries)
+            await pilot.pause()
+            assert len(calls) == 10
+
+    @pytest.mark.asyncio
+    async def test_style_table_restyles_without_reformatting(self) -> None:
+        """Switching style tables redraws rows from the same formatted spans."""
+        from rich.style import Style
+        from rich.text import Text
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.highlighter import StyleTable, ThemeKey
+        from pgtail_py.tail_rich import format_entry_plain
+        from pgtail_py.theme import ColorStyle, Theme
+
+        calls: list[str] = []
+
+        def formatter(entry: LogEntry) -> Text:
+            calls.append(entry.message)
+            text = Text(format_entry_plain(entry))
+            text.stylize(ThemeKey("hl_test"))
+            return text
+
+        def table(fg: str) -> StyleTable:
+            theme = Theme(name=fg, description="", ui={"hl_test": ColorStyle(fg=fg)})
+            return StyleTable(theme)
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(id="log", entry_formatter=formatter, entry_plain=format_entry_plain)
+
+        app = TestApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            log = app.query_one("#log", TailLog)
+            log.set_style_table(table("red"))
+            log.write_entries(self._entries(3))
+            await pilot.pause()
+            assert len(calls) == 3
+            first = next(iter(log._render_line_strip(0, Style())))
+            assert first.style.color.name == "red"
+
+            log.set_style_table(table("blue"))
+            assert 0 not in log._render_line_cache
+            await pilot.pause()
+            first = next(iter(log._render_line_strip(0, Style())))
+            assert first.style.color.name == "blue"
+            assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_background_formatting(self) -> None:
+        """Rows are drawn plain, formatted off the UI thread, then redrawn styled."""
+        import threading
+
+        from rich.style import Style
+        from rich.text import Text
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.tail_rich import format_entry_plain
+
+        threads: set[int] = set()
+        release = threading.Event()
+
+        def formatter(entry: LogEntry) -> Text:
+            release.wait(5)
+            threads.add(threading.get_ident())
+            return Text(format_entry_plain(entry), style="green")
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(
+                    id="log",
+                    entry_formatter=formatter,
+                    entry_plain=format_entry_plain,
+                    format_in_background=True,
+                )
+
+        app = TestApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            log = app.query_one("#log", TailLog)
+            log.write_entries(self._entries(5))
+            await pilot.pause()
+
+            # Drawn plain and not cached while the formatter is busy
+            first = next(iter(log._render_line_strip(0, Style())))
+            assert first.style is None or first.style.color is None
+            assert 0 not in log._render_line_cache
+
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert threads and threading.get_ident() not in threads
+            first = next(iter(log._render_line_strip(0, Style())))
+            assert first.style.color.name == "green"
+            assert log._format_queued == set()
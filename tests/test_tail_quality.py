@@ -0,0 +1,74 @@
+"""Tests for pgtail_py.tail_quality module."""
+
+from __future__ import annotations
+
+from pgtail_py.tail_quality import HighlightTier, QualityController
+from pgtail_py.tail_status import TailStatus
+
+
+def _controller() -> QualityController:
+    """Controller with a 10ms busy limit, 1000 lines/s and short streaks."""
+    return QualityController(busy_limit=0.01, ingest_limit=1000, down_frames=2, up_frames=3)
+
+
+class TestQualityController:
+    """Tests for QualityController."""
+
+    def test_steps_down_one_tier_per_overloaded_streak(self) -> None:
+        """Sustained ingest above the limit lowers the tier a step at a time."""
+        controller = _controller()
+
+        assert controller.observe(100, 0.05, 0.0) is None
+        assert controller.observe(100, 0.05, 0.0) == HighlightTier.REDUCED
+        assert controller.observe(100, 0.05, 0.0) is None
+        assert controller.observe(100, 0.05, 0.0) == HighlightTier.LEVELS
+
+    def test_slow_formatting_counts_as_overload(self) -> None:
+        """Formatting time over the budget lowers the tier at a low ingest rate."""
+        controller = _controller()
+        controller.observe(1, 0.05, 0.02)
+        assert controller.observe(1, 0.05, 0.02) == HighlightTier.REDUCED
+
+    def test_steps_up_after_calm_streak(self) -> None:
+        """The tier rises only after enough calm frames in a row."""
+        controller = _controller()
+        for _ in range(8):
+            controller.observe(100, 0.05, 0.0)
+        assert controller.tier == HighlightTier.PLAIN
+
+        # Between half the limit and the limit is neither calm nor overloaded
+        controller.observe(0, 0.05, 0.0)
+        controller.observe(0, 0.05, 0.0)
+        controller.observe(40, 0.05, 0.0)
+        assert controller.observe(0, 0.05, 0.0) is None
+        assert controller.observe(0, 0.05, 0.0) is None
+        assert controller.observe(0, 0.05, 0.0) == HighlightTier.LEVELS
+
+    def test_tier_stays_within_bounds(self) -> None:
+        """The tier never drops below plain or rises above full."""
+        controller = _controller()
+        for _ in range(20):
+            controller.observe(0, 0.05, 0.0)
+        assert controller.tier == HighlightTier.FULL
+        for _ in range(20):
+            controller.observe(100, 0.05, 0.0)
+        assert controller.tier == HighlightTier.PLAIN
+
+        controller.reset()
+        assert controller.tier == HighlightTier.FULL
+
+
+class TestTierInStatusBar:
+    """Tests for the highlighting tier in TailStatus."""
+
+    def test_reduced_tier_shown(self) -> None:
+        """A reduced tier appears in the status bar and disappears at full."""
+        status = TailStatus()
+        assert "hl:" not in status.format_rich().plain
+
+        status.set_highlight_tier(HighlightTier.LEVELS.label)
+        assert "hl:levels" in status.format_rich().plain
+        assert "hl:levels" in status.format_plain()
+
+        status.set_highlight_tier(None)
+        assert "hl:" not in status.format_plain()
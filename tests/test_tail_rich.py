@@ -9,10 +9,15 @@ from rich.text import Text
 
 from pgtail_py.filter import LogLevel
 from pgtail_py.parser import LogEntry
+from pgtail_py.tail_quality import HighlightTier
 from pgtail_py.tail_rich import (
     LEVEL_STYLES,
     format_entry_as_rich,
     format_entry_compact,
+    format_entry_plain,
+    get_format_generation,
+    highlighted_columns,
+    reset_highlighter_chain,
 )
 
 
@@ -174,6 +179,108 @@ class TestFormatEntryCompact:
 # =============================================================================
 
 
+class TestFormatEntryPlain:
+    """Tests for format_entry_plain()."""
+
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            LogEntry(
+                timestamp=datetime(2024, 1, 15, 10, 30, 45, 123000),
+                pid=42,
+                level=LogLevel.ERROR,
+                message="duration: 12.5 ms  statement: SELECT * FROM t WHERE id = 1",
+                sql_state="23505",
+                source_file="pg.log",
+                raw="",
+            ),
+            LogEntry(timestamp=None, level=LogLevel.LOG, message="", raw=""),
+            LogEntry(timestamp=None, level=LogLevel.WARNING, message="a\n\tb\n", raw=""),
+        ],
+    )
+    @pytest.mark.parametrize("semantic", [True, False])
+    def test_matches_compact_plain(self, entry: LogEntry, semantic: bool) -> None:
+        """Plain text equals the styled compact line's plain text."""
+        from pgtail_py.themes import BUILTIN_THEMES
+
+        formatted = format_entry_compact(
+            entry, theme=BUILTIN_THEMES["dark"], use_semantic_highlighting=semantic
+        )
+        assert format_entry_plain(entry) == formatted.plain
+
+    def test_highlighted_columns_per_row(self) -> None:
+        """The depth limit maps to the row columns it ends at."""
+        entry = LogEntry(timestamp=None, level=LogLevel.LOG, message="abcd\nefgh\nijkl", raw="")
+        prefix = len("LOG    : ")
+        assert highlighted_columns(entry, 0, 7) == prefix + 7
+        # Row 1 starts at message offset 5, row 2 past the limit
+        assert highlighted_columns(entry, 1, 7) == 2
+        assert highlighted_columns(entry, 2, 7) == 0
+
+
+class TestFormatGeneration:
+    """Tests for get_format_generation()."""
+
+    def test_reset_bumps_generation(self) -> None:
+        """Resetting the highlighter chain starts a new generation."""
+        before = get_format_generation()
+        reset_highlighter_chain()
+        assert get_format_generation() == before + 1
+
+
+class TestFormatEntryCompactTiers:
+    """Tests for format_entry_compact() at reduced highlighting tiers."""
+
+    ENTRY = LogEntry(
+        timestamp=None,
+        level=LogLevel.LOG,
+        message="duration: 12.5 ms  statement: SELECT 1 FROM t",
+        raw="",
+    )
+
+    @staticmethod
+    def _styles(text: Text) -> list[str]:
+        return [str(span.style) for span in text.spans]
+
+    def test_each_tier_drops_more_styling(self) -> None:
+        """Reduced keeps SQL, levels keeps the level color, plain keeps nothing."""
+        full, reduced, levels, plain = (
+            format_entry_compact(self.ENTRY, theme_keys=True, tier=tier) for tier in HighlightTier
+        )
+
+        assert "hl_duration_fast" in self._styles(full)
+        assert "hl_duration_fast" not in self._styles(reduced)
+        assert "sql_keyword" in self._styles(reduced)
+        assert self._styles(levels) == [LEVEL_STYLES[LogLevel.LOG]]
+        assert plain.spans == []
+        assert {t.plain for t in (full, reduced, levels, plain)} == {format_entry_plain(self.ENTRY)}
+
+
+class TestFormatEntryCompactStyles:
+    """Tests for pre-parsed styles in format_entry_compact()."""
+
+    def test_spans_carry_parsed_styles(self) -> None:
+        """Every span of a themed compact row is a Style, not a string to parse."""
+        from rich.style import Style
+
+        from pgtail_py.themes import BUILTIN_THEMES
+
+        entry = LogEntry(
+            timestamp=datetime(2024, 1, 15, 10, 30, 45, 123000),
+            level=LogLevel.ERROR,
+            message="duration: 12.5 ms  statement: SELECT 1 FROM t",
+            raw="",
+            pid=42,
+            sql_state="42P01",
+            source_file="pg.log",
+        )
+
+        text = format_entry_compact(entry, theme=BUILTIN_THEMES["dark"])
+
+        assert len(text.spans) > 5
+        assert all(isinstance(span.style, Style) for span in text.spans)
+
+
 class TestFormatEntryCompactSqlHighlighting:
     """Tests for SQL highlighting in format_entry_compact() - T014."""
 
@@ -279,6 +386,31 @@ class TestFormatEntryCompactThemeSwitch:
         assert "SELECT" in result_dark
         assert "SELECT" in result_monokai
 
+    def test_theme_keys_resolve_per_theme(self) -> None:
+        """Entries formatted with theme keys resolve to each theme's colors."""
+        from pgtail_py.highlighter import ThemeKey, get_style_table
+        from pgtail_py.themes import BUILTIN_THEMES
+
+        entry = LogEntry(
+            raw="LOG: statement: SELECT id FROM users",
+            timestamp=None,
+            level=LogLevel.LOG,
+            message="statement: SELECT id FROM users",
+        )
+        for semantic in (True, False):
+            result = format_entry_compact(
+                entry, use_semantic_highlighting=semantic, theme_keys=True
+            )
+            assert result.plain == format_entry_plain(entry)
+            keyed = [s for s in result.spans if isinstance(s.style, ThemeKey)]
+            assert keyed
+
+            dark, monokai = result.copy(), result.copy()
+            get_style_table(BUILTIN_THEMES["dark"]).resolve(dark)
+            get_style_table(BUILTIN_THEMES["monokai"]).resolve(monokai)
+            assert not any(isinstance(s.style, ThemeKey) for s in dark.spans)
+            assert dark.spans != monokai.spans
+
 
 class TestFormatEntryCompactNoColor:
     """Tests for NO_COLOR handling in format_entry_compact() - T032."""
@@ -0,0 +1,433 @@
+"""Tests for pgtail_py.tail_search module."""
+
+from __future__ import annotations
+
+import re
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from pgtail_py.tail_search import (
+    BLOCK_SIZE,
+    SearchIndex,
+    SearchPattern,
+    parse_search,
+    required_literal,
+)
+
+
+class TestParseSearch:
+    """Tests for parse_search()."""
+
+    def test_plain_pattern(self) -> None:
+        """Test /pattern is case-insensitive by default."""
+        pattern = parse_search("/timeout")
+        assert pattern == SearchPattern("timeout")
+        assert pattern.regex.search("Connection TIMEOUT")
+
+    def test_trailing_slash(self) -> None:
+        """Test /pattern/ strips the closing slash."""
+        assert parse_search("/timeout/") == SearchPattern("timeout")
+
+    def test_case_sensitive_suffix(self) -> None:
+        """Test /pattern/c is case-sensitive."""
+        pattern = parse_search("/Timeout/c")
+        assert pattern is not None
+        assert pattern.case_sensitive is True
+        assert pattern.regex.search("Timeout")
+        assert not pattern.regex.search("timeout")
+
+    def test_inner_slashes_kept(self) -> None:
+        """Test slashes inside the pattern are part of it."""
+        pattern = parse_search("/var/lib")
+        assert pattern is not None
+        assert pattern.pattern == "var/lib"
+
+    def test_empty_clears(self) -> None:
+        """Test bare / and // yield no pattern."""
+        assert parse_search("/") is None
+        assert parse_search("//") is None
+
+    def test_invalid_regex_raises(self) -> None:
+        """Test invalid regex raises re.error."""
+        with pytest.raises(re.error):
+            parse_search("/foo(")
+
+    def test_label(self) -> None:
+        """Test label formatting for the status bar."""
+        assert SearchPattern("x").label == "/x/"
+        assert SearchPattern("x", case_sensitive=True).label == "/x/c"
+
+
+class TestRequiredLiteral:
+    """Tests for required_literal()."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("timeout", "timeout"),
+            ("dur.*ms", "dur"),
+            (r"user_\d+ failed", " failed"),
+            ("colou?r", "colo"),
+            (r"x\.y", "x.y"),
+            ("[abc]def", "def"),
+            ("(foo)bar", "bar"),
+            ("abc+", "abc"),
+            (r"\x41BC", "BC"),
+            (r"\u0041BC", "BC"),
+            (r"\U00000041BC", "BC"),
+            (r"\N{LATIN CAPITAL LETTER A}BC", "BC"),
+            (r"\101x", "x"),
+            (r"(a)\1 23", " 23"),
+            (r"\0123", ""),
+            (r"ab\tcd", "ab"),
+        ],
+    )
+    def test_extracts_longest_literal(self, pattern: str, expected: str) -> None:
+        """Test literal extraction for common pattern shapes."""
+        assert required_literal(pattern) == expected
+
+    @pytest.mark.parametrize(
+        "pattern", [r"\x41BC", r"\u0041BC", r"\N{LATIN CAPITAL LETTER A}BC", r"\101BC"]
+    )
+    def test_escape_literal_never_misses_a_match(self, pattern: str) -> None:
+        """Test character code escapes don't make the prefilter skip matching lines."""
+        lines = ["ERROR: ABC happened"]
+        index = SearchIndex()
+        index.append(lines)
+        assert index.search(parse_search(f"/{pattern}"), lines) == 1
+
+    def test_alternation_has_no_literal(self) -> None:
+        """Test alternation disables the prefilter."""
+        assert required_literal("deadlock|timeout") == ""
+
+    def test_verbose_flag_disables_literal(self) -> None:
+        """Test inline (?x) patterns don't use a literal."""
+        assert SearchPattern("(?x) dead lock").literal == ""
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex."""
+
+    def _lines(self, count: int) -> list[str]:
+        return [f"line {i} {'ERROR deadlock' if i % 100 == 7 else 'ok'}" for i in range(count)]
+
+    def test_search_finds_matches_across_blocks(self) -> None:
+        """Test matches are found in sealed and unsealed blocks."""
+        lines = self._lines(BLOCK_SIZE * 3 + 10)
+        index = SearchIndex()
+        index.append(lines)
+
+        count = index.search(SearchPattern("deadlock"), lines)
+
+        expected = [i for i, line in enumerate(lines) if "deadlock" in line]
+        assert count == len(expected)
+        assert index.matches() == expected
+
+    def test_regex_without_literal(self) -> None:
+        """Test alternation patterns still match via full scan."""
+        lines = ["alpha", "beta", "gamma"]
+        index = SearchIndex()
+        index.append(lines)
+        assert index.search(SearchPattern("alpha|gamma"), lines) == 2
+
+    def test_case_sensitive_confirmed_by_regex(self) -> None:
+        """Test the case-folded prefilter doesn't leak case-insensitive hits."""
+        lines = ["ERROR here", "error there"]
+        index = SearchIndex()
+        index.append(lines)
+        assert index.search(SearchPattern("ERROR", case_sensitive=True), lines) == 1
+        assert index.matches() == [0]
+
+    def test_incremental_append(self) -> None:
+        """Test lines written after the search are matched incrementally."""
+        index = SearchIndex()
+        lines = ["a", "b"]
+        index.append(lines)
+        index.search(SearchPattern("needle"), lines)
+        assert index.match_count == 0
+
+        index.append(["x needle", "y"])
+        assert index.match_count == 1
+        assert index.matches() == [2]
+
+    def test_prune_drops_old_matches(self) -> None:
+        """Test pruning shifts positions and removes pruned matches."""
+        lines = ["needle 0", "b", "needle 2", "c"]
+        index = SearchIndex()
+        index.append(lines)
+        index.search(SearchPattern("needle"), lines)
+
+        index.prune(1)
+        assert index.matches() == [1]
+
+        index.prune(BLOCK_SIZE)
+        assert index.matches() == []
+
+    def test_prune_then_search(self) -> None:
+        """Test searching after pruning past block boundaries."""
+        lines = self._lines(BLOCK_SIZE * 2 + 50)
+        index = SearchIndex()
+        index.append(lines)
+        index.prune(BLOCK_SIZE + 20)
+        remaining = lines[BLOCK_SIZE + 20 :]
+
+        index.search(SearchPattern("deadlock"), remaining)
+
+        assert index.matches() == [i for i, line in enumerate(remaining) if "deadlock" in line]
+
+    def test_prepend_and_drop_last_match_full_rebuild(self) -> None:
+        """Test incremental edits at both ends leave the index as a fresh build would."""
+        import random
+
+        rng = random.Random(0)
+        lines = self._lines(BLOCK_SIZE * 3)
+        index = SearchIndex()
+        index.append(lines)
+        index.search(SearchPattern("deadlock"), lines)
+        counter = len(lines)
+
+        def fresh(count: int) -> list[str]:
+            nonlocal counter
+            counter += count
+            return [
+                f"new {i} {'deadlock' if rng.random() < 0.1 else 'ok'}"
+                for i in range(counter - count, counter)
+            ]
+
+        for _ in range(60):
+            op = rng.randrange(4)
+            count = rng.randrange(1, BLOCK_SIZE + 20)
+            if op == 0:
+                added = fresh(count)
+                lines[:0] = added
+                index.prepend(added)
+            elif op == 1:
+                count = min(count, len(lines))
+                del lines[len(lines) - count :]
+                index.drop_last(count)
+            elif op == 2:
+                added = fresh(count)
+                lines.extend(added)
+                index.append(added)
+            else:
+                count = min(count, len(lines))
+                del lines[:count]
+                index.prune(count)
+
+            expected = [i for i, line in enumerate(lines) if "deadlock" in line]
+            assert index.matches() == expected
+            assert index._text_bytes == sum(map(sys.getsizeof, index._folded)) + sum(
+                map(sys.getsizeof, index._blocks.values())
+            )
+            # A new search goes through the block prefilter
+            index.search(SearchPattern("DEADLOCK"), lines)
+            assert index.matches() == expected
+
+    def test_prepend_into_pruned_block(self) -> None:
+        """Test lines prepended into a partly pruned block aren't skipped by its old text."""
+        lines = ["ok"] * (BLOCK_SIZE * 2)
+        index = SearchIndex()
+        index.append(lines)
+        index.prune(10)
+        added = ["x", "deadlock", "x"]
+        index.prepend(added)
+        lines = added + lines[10:]
+
+        assert index.search(SearchPattern("deadlock"), lines) == 1
+        assert index.matches() == [1]
+
+    def test_shadow_kept_only_while_searching(self) -> None:
+        """Test case-folded lines and blocks exist only while a search is active."""
+        lines = self._lines(BLOCK_SIZE * 2 + 5)
+        index = SearchIndex()
+        index.append(lines[:BLOCK_SIZE])
+        index.prune(3)
+        index.append(lines[BLOCK_SIZE:])
+        assert (index._folded, index._blocks) == ([], {})
+
+        remaining = lines[3:BLOCK_SIZE] + lines[BLOCK_SIZE:]
+        count = index.search(SearchPattern("deadlock"), remaining)
+        assert count == sum("deadlock" in line for line in remaining)
+        assert len(index._folded) == len(remaining) and index._blocks
+
+        index.search(None, remaining)
+        assert (index._folded, index._blocks) == ([], {})
+
+    def test_memory_usage_counts_shadow(self) -> None:
+        """Test memory usage grows with the shadow and drops when the search is cleared."""
+        lines = self._lines(BLOCK_SIZE * 4)
+        index = SearchIndex()
+        index.append(lines)
+        idle = index.memory_usage
+        assert idle < 1024
+
+        index.search(SearchPattern("deadlock"), lines)
+        # Folded lines plus the joined block text hold the scrollback text twice
+        assert index.memory_usage > idle + 2 * sum(map(len, lines))
+        searching = index.memory_usage
+        index.prune(BLOCK_SIZE)
+        assert index.memory_usage < searching
+
+        index.search(None, lines)
+        assert index.memory_usage == idle
+
+    def test_clear_keeps_pattern(self) -> None:
+        """Test clear() drops lines but keeps the active pattern."""
+        index = SearchIndex()
+        index.append(["needle"])
+        index.search(SearchPattern("needle"), ["needle"])
+        index.clear()
+
+        assert index.match_count == 0
+        assert index.pattern == SearchPattern("needle")
+        index.append(["needle again"])
+        assert index.matches() == [0]
+
+    def test_next_match_wraps(self) -> None:
+        """Test next_match() navigates and wraps in both directions."""
+        lines = ["x", "hit", "x", "hit", "x"]
+        index = SearchIndex()
+        index.append(lines)
+        index.search(SearchPattern("hit"), lines)
+
+        assert index.next_match(0) == 1
+        assert index.next_match(1) == 3
+        assert index.next_match(3) == 1
+        assert index.next_match(3, forward=False) == 1
+        assert index.next_match(1, forward=False) == 3
+
+    def test_next_match_none_without_matches(self) -> None:
+        """Test next_match() returns None when nothing matches."""
+        index = SearchIndex()
+        assert index.next_match(0) is None
+
+    def test_position(self) -> None:
+        """Test position() reports the ordinal of the match at the cursor."""
+        lines = ["x", "hit", "x", "hit"]
+        index = SearchIndex()
+        index.append(lines)
+        index.search(SearchPattern("hit"), lines)
+
+        assert index.position(0) == 0
+        assert index.position(1) == 1
+        assert index.position(3) == 2
+
+
+class TestTailLogSearch:
+    """Tests for search integration in TailLog."""
+
+    @pytest.mark.asyncio
+    async def test_search_and_navigate(self) -> None:
+        """Test /pattern jumps to the newest match and n/N navigate."""
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.tail_log import TailLog
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(id="log")
+
+        app = TestApp()
+        async with app.run_test() as pilot:
+            log = app.query_one("#log", TailLog)
+            log.write_lines(["ok", "deadlock 1", "ok", "deadlock 2", "ok"])
+            assert log.search(SearchPattern("deadlock")) == 2
+            assert log.cursor_line == 3
+            assert log.search_position == 2
+
+            log.focus()
+            await pilot.press("N")
+            assert log.cursor_line == 1
+            await pilot.press("n")
+            assert log.cursor_line == 3
+
+    @pytest.mark.asyncio
+    async def test_prune_keeps_index_in_sync(self) -> None:
+        """Test max_lines pruning drops matches from the index."""
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.tail_log import TailLog
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(max_lines=3, id="log")
+
+        app = TestApp()
+        async with app.run_test():
+            log = app.query_one("#log", TailLog)
+            log.search(SearchPattern("hit"))
+            log.write_lines(["hit 0", "x", "x", "hit 3"])
+
+            assert log.line_count == 3
+            assert log.search_match_count == 1
+            assert log._search_index.matches() == [2]
+
+    @pytest.mark.asyncio
+    async def test_no_match_feedback_is_not_indexed(self) -> None:
+        """Test a search without matches doesn't add a line that matches it."""
+        from textual.app import App, ComposeResult
+
+        from pgtail_py.tail_command_handler import handle_search_command
+        from pgtail_py.tail_log import TailLog
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield TailLog(id="log")
+
+        app = TestApp()
+        async with app.run_test() as pilot:
+            log = app.query_one("#log", TailLog)
+            log.write_lines(["ok", "ok"])
+            ctx = MagicMock()
+            ctx.log_widget = log
+            handle_search_command("/no match", ctx)
+            await pilot.pause()
+
+            assert log.line_count == 2
+            assert log.search_match_count == 0
+
+
+class TestHandleSearchCommand:
+    """Tests for /pattern in tail_command_handler.handle_command()."""
+
+    def test_slash_pattern_sets_search(self) -> None:
+        """Test /pattern is routed to the log widget search."""
+        from pgtail_py.tail_command_handler import handle_command
+
+        ctx = MagicMock()
+        handle_command(r"/dur\w+ \d+", ctx)
+
+        ctx.log_widget.search.assert_called_once_with(SearchPattern(r"dur\w+ \d+"))
+
+    def test_bare_slash_clears_search(self) -> None:
+        """Test bare / clears the search."""
+        from pgtail_py.tail_command_handler import handle_command
+
+        ctx = MagicMock()
+        handle_command("/", ctx)
+
+        ctx.log_widget.search.assert_called_once_with(None)
+
+    def test_no_matches_not_written_to_log(self) -> None:
+        """Test a search without matches is reported without adding a log line."""
+        from pgtail_py.tail_command_handler import handle_command
+
+        ctx = MagicMock()
+        ctx.log_widget.search.return_value = 0
+        handle_command("/no match", ctx)
+
+        ctx.log_widget.write_text_line.assert_not_called()
+        ctx.log_widget.notify.assert_called_once()
+        assert "No matches" in ctx.log_widget.notify.call_args.args[0]
+
+    def test_invalid_pattern_reports_error(self) -> None:
+        """Test invalid regex writes an error instead of searching."""
+        from pgtail_py.tail_command_handler import handle_command
+
+        ctx = MagicMock()
+        handle_command("/foo(", ctx)
+
+        ctx.log_widget.search.assert_not_called()
+        ctx.log_widget.write_text_line.assert_called_once()
@@ -48,6 +48,7 @@ def mock_state() -> MagicMock:
     state.regex_state = None
     state.time_filter = None
     state.field_filter = None
+    state.filter_expression = None
     state.slow_query_config = None
     state.error_stats = MagicMock()
     state.connection_stats = MagicMock()
@@ -228,6 +229,45 @@ class TestTailAppHelpOverlay:
                 assert len(app.screen_stack) == 1
 
 
+class TestTailAppDetailPane:
+    """Tests for the expand detail pane."""
+
+    @pytest.mark.asyncio
+    async def test_expand_request_shows_detail_screen(
+        self, mock_instance: Instance, mock_state: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test an expand request from the log pushes the detail pane."""
+        from pgtail_py.tail_detail import DetailScreen
+
+        log_file = tmp_path / "postgresql.log"
+        log_file.write_text("")
+
+        app = TailApp(
+            state=mock_state,
+            instance=mock_instance,
+            log_path=log_file,
+        )
+
+        with patch("pgtail_py.tail_textual.LogTailer") as mock_tailer_class:
+            mock_tailer = MagicMock()
+            mock_tailer.get_entry = MagicMock(return_value=None)
+            mock_tailer.file_unavailable = False
+            mock_tailer.file_permission_denied = False
+            mock_tailer_class.return_value = mock_tailer
+
+            async with app.run_test() as pilot:
+                entry = LogEntry(
+                    timestamp=None, level=LogLevel.ERROR, message="x" * 50_000, raw="", pid=42
+                )
+                log = app.query_one("#log", TailLog)
+                log.post_message(TailLog.ExpandRequested("x" * 50_000, entry))
+                await pilot.pause()
+
+                screen = app.screen_stack[-1]
+                assert isinstance(screen, DetailScreen)
+                assert screen._title == "ERROR [42]"
+
+
 class TestTailAppFocusManagement:
     """Tests for focus management between log and input widgets."""
 
@@ -901,6 +941,62 @@ class TestAsyncRebuildLog:
                 # All entries should eventually be rendered
                 assert log_widget.line_count == 500
 
+    @pytest.mark.asyncio
+    async def test_rebuild_shows_viewport_first(
+        self, mock_instance: Instance, rebuild_state: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test the newest entries are drawn before older ones are backfilled."""
+        log_file = tmp_path / "postgresql.log"
+        log_file.write_text("")
+
+        app = TailApp(state=rebuild_state, instance=mock_instance, log_path=log_file)
+
+        with patch("pgtail_py.tail_textual.LogTailer") as mock_tailer_class:
+            mock_tailer = MagicMock()
+            mock_tailer.get_entry = MagicMock(return_value=None)
+            mock_tailer.file_unavailable = False
+            mock_tailer.file_permission_denied = False
+            mock_tailer_class.return_value = mock_tailer
+
+            async with app.run_test() as pilot:
+                log_widget = app.query_one("#log", TailLog)
+                for i in range(1000):
+                    app._entries.append(
+                        LogEntry(
+                            raw=f"line {i}",
+                            timestamp=None,
+                            pid=1000,
+                            level=LogLevel.LOG,
+                            message=f"msg {i}",
+                        )
+                    )
+
+                first_rows: list[int] = []
+                real_wait = app._await_rebuild_first_frame
+
+                async def await_first_frame() -> None:
+                    first_rows.append(log_widget.line_count)
+                    await real_wait()
+
+                with patch.object(app, "_await_rebuild_first_frame", await_first_frame):
+                    app._rebuild_log()
+                    await pilot.pause()
+                    while app._rebuilding:
+                        await pilot.pause()
+
+                # Only a viewport's worth of rows was written before the first frame
+                height = log_widget.scrollable_content_region.height
+                assert first_rows == [height]
+                assert log_widget.line_count == 1000
+                assert log_widget._lines[0].endswith("msg 0")
+                assert log_widget._lines[-1].endswith("msg 999")
+                assert log_widget.is_vertical_scroll_end
+
+                timing = app.rebuild_timing
+                assert timing is not None
+                assert timing.first_frame is not None and timing.complete is not None
+                assert timing.first_frame <= timing.complete
+
     @pytest.mark.asyncio
     async def test_add_entry_buffers_during_rebuild(
         self, mock_instance: Instance, rebuild_state: MagicMock, tmp_path: Path
@@ -1031,6 +1127,291 @@ class TestAsyncRebuildLog:
                 assert "late arrival" in last_line
 
 
+class TestFrameCoalescing:
+    """Tests for writing entries and status once per display frame."""
+
+    @pytest.fixture
+    def frame_app(self, mock_instance: Instance, mock_state: MagicMock, tmp_path: Path) -> TailApp:
+        """TailApp with a slow frame timer so tests flush frames explicitly."""
+        from pgtail_py.highlighting_config import HighlightingConfig
+        from pgtail_py.theme import ThemeManager
+
+        mock_state.theme_manager = ThemeManager()
+        mock_state.highlighting_config = HighlightingConfig()
+        log_file = tmp_path / "postgresql.log"
+        log_file.write_text("")
+        return TailApp(state=mock_state, instance=mock_instance, log_path=log_file, frame_rate=1)
+
+    @staticmethod
+    def _entry(i: int) -> LogEntry:
+        return LogEntry(
+            raw=f"msg {i}", timestamp=None, pid=1000, level=LogLevel.LOG, message=f"msg {i}"
+        )
+
+    @pytest.mark.asyncio
+    async def test_entries_written_once_per_frame(self, frame_app: TailApp) -> None:
+        """Entries between frames are written in one call with one status redraw."""
+        with patch("pgtail_py.tail_textual.LogTailer") as mock_tailer_class:
+            mock_tailer = MagicMock()
+            mock_tailer.get_entry = MagicMock(return_value=None)
+            mock_tailer.file_unavailable = False
+            mock_tailer.file_permission_denied = False
+            mock_tailer_class.return_value = mock_tailer
+
+            async with frame_app.run_test():
+                log_widget = frame_app.query_one("#log", TailLog)
+                for i in range(100):
+                    frame_app._add_entry(self._entry(i))
+                assert log_widget.line_count == 0
+
+                with (
+                    patch.object(log_widget, "write_entries", wraps=log_widget.write_entries) as w,
+                    patch.object(frame_app, "_update_status") as update_status,
+                ):
+                    frame_app._flush_frame()
+                    frame_app._flush_frame()
+
+                assert w.call_count == 1
+                assert update_status.call_count == 1
+                assert log_widget.line_count == 100
+                assert frame_app.status is not None
+                assert frame_app.status.total_lines == 100
+
+    @pytest.mark.asyncio
+    async def test_highlighting_adapts_to_load(self, frame_app: TailApp) -> None:
+        """A burst lowers the tier; calm restores it and redraws visible rows."""
+        with patch("pgtail_py.tail_textual.LogTailer") as mock_tailer_class:
+            mock_tailer = MagicMock()
+            mock_tailer.get_entry = MagicMock(return_value=None)
+            mock_tailer.file_unavailable = False
+            mock_tailer.file_permission_denied = False
+            mock_tailer_class.return_value = mock_tailer
+
+            async with frame_app.run_test():
+                from pgtail_py.tail_quality import HighlightTier
+
+                assert frame_app._quality is not None and frame_app.status is not None
+                frame_app._quality.down_frames = frame_app._quality.up_frames = 1
+                key = frame_app._format_key()
+
+                frame_app._adapt_quality(100_000)
+                assert frame_app._highlight_tier == HighlightTier.REDUCED
+                assert frame_app.status.highlight_tier == "reduced"
+                # Rows already formatted at full quality stay cached
+                assert frame_app._format_key() == key
+
+                frame_app._adapt_quality(0)
+                assert frame_app._highlight_tier == HighlightTier.FULL
+                assert frame_app.status.highlight_tier is None
+                assert frame_app._format_key() != key
+
+    @pytest.mark.asyncio
+    async def test_background_highlighting(
+        self, mock_instance: Instance, mock_state: MagicMock, tmp_path: Path
+    ) -> None:
+        """With background highlighting, rows are formatted off the UI thread."""
+        import threading
+
+        from rich.text import Text
+
+        from pgtail_py.highlighting_config import HighlightingConfig
+        from pgtail_py.theme import ThemeManager
+
+        mock_state.theme_manager = ThemeManager()
+        mock_state.highlighting_config = HighlightingConfig()
+        log_file = tmp_path / "postgresql.log"
+        log_file.write_text("")
+        app = TailApp(
+            state=mock_state,
+            instance=mock_instance,
+            log_path=log_file,
+            frame_rate=1,
+            background_highlighting=True,
+        )
+        threads: set[int] = set()
+        format_entry = app._format_entry
+
+        def recording_format(entry: LogEntry) -> Text:
+            threads.add(threading.get_ident())
+            return format_entry(entry)
+
+        app._format_entry = recording_format  # type: ignore[method-assign]
+        with patch("pgtail_py.tail_textual.LogTailer") as mock_tailer_class:
+            mock_tailer = MagicMock()
+            mock_tailer.get_entry = MagicMock(return_value=None)
+            mock_tailer.file_unavailable = False
+            mock_tailer.file_permission_denied = False
+            mock_tailer_class.return_value = mock_tailer
+
+            async with app.run_test() as pilot:
+                log_widget = app.query_one("#log", TailLog)
+                for i in range(5):
+                    app._add_entry(self._entry(i))
+                app._flush_frame()
+                for _ in range(100):
+                    await pilot.pause(0.01)
+                    if len(log_widget._formatted_rows) == 5:
+                        break
+
+                assert threads and threading.get_ident() not in threads
+                assert len(log_widget._formatted_rows) == 5
+
+    @pytest.mark.asyncio
+    async def test_memory_budget_counts_rows_and_search_index(
+        self, mock_instance: Instance, mock_state: MagicMock, tmp_path: Path
+    ) -> None:
+        """Entries are evicted until they, their rows and the search index fit the budget."""
+        from pgtail_py.entry_store import entry_size
+        from pgtail_py.highlighting_config import HighlightingConfig
+        from pgtail_py.tail_search import SearchPattern
+        from pgtail_py.theme import ThemeManager
+
+        mock_state.theme_manager = ThemeManager()
+        mock_state.highlighting_config = HighlightingConfig()
+        log_file = tmp_path / "postgresql.log"
+        log_file.write_text("")
+        budget = entry_size(self._entry(0)) * 50
+        app = TailApp(
+            state=mock_state,
+            instance=mock_instance,
+            log_path=log_file,
+            frame_rate=1,
+            max_memory=budget,
+        )
+        with patch("pgtail_py.tail_textual.LogTailer") as mock_tailer_class:
+            mock_tailer = MagicMock()
+            mock_tailer.get_entry = MagicMock(return_value=None)
+            mock_tailer.file_unavailable = False
+            mock_tailer.file_permission_denied = False
+            mock_tailer_class.return_value = mock_tailer
+
+            async with app.run_test():
+                log_widget = app.query_one("#log", TailLog)
+                store = app._entries
+                for i in range(200):
+                    app._add_entry(self._entry(i))
+                app._flush_frame()
+
+                kept = len(store)
+                assert kept < 50
+                # Only as many entries as needed are evicted
+                used = store.memory_usage + log_widget.memory_usage
+                assert budget - 2 * entry_size(self._entry(0)) < used <= budget
+                assert log_widget.first_entry_seq == store.first_seq
+                assert app._status is not None
+                assert app._status.memory_used == store.memory_usage + log_widget.memory_usage
+
+                # The search shadow counts against the same budget
+                log_widget.search(SearchPattern("msg"))
+                app._flush_frame()
+                assert len(store) < kept
+                assert store.memory_usage + log_widget.memory_usage <= budget
+                assert log_widget.line_count == len(store)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_skips_entries_still_queued(self, frame_app: TailApp) -> None:
+        """Entries stored by the reader but consumed after a rebuild aren't shown twice."""
+        with patch("pgtail_py.tail_textual.LogTailer") as mock_tailer_class:
+            mock_tailer = MagicMock()
+            mock_tailer.get_entry = MagicMock(return_value=None)
+            mock_tailer.file_unavailable = False
+            mock_tailer.file_permission_denied = False
+            mock_tailer_class.return_value = mock_tailer
+
+            async with frame_app.run_test() as pilot:
+                log_widget = frame_app.query_one("#log", TailLog)
+                # The reader stores an entry before it reaches the consumer
+                queued = self._entry(0)
+                frame_app._entries.append(queued)
+
+                frame_app._rebuild_log()
+                await pilot.pause()
+                frame_app._add_entry(queued)
+                frame_app._flush_frame()
+
+                assert log_widget.line_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rebuild_drops_pending_frame(self, frame_app: TailApp) -> None:
+        """A rebuild replays pending entries from storage without duplicating them."""
+        with patch("pgtail_py.tail_textual.LogTailer") as mock_tailer_class:
+            mock_tailer = MagicMock()
+            mock_tailer.get_entry = MagicMock(return_value=None)
+            mock_tailer.file_unavailable = False
+            mock_tailer.file_permission_denied = False
+            mock_tailer_class.return_value = mock_tailer
+
+            async with frame_app.run_test() as pilot:
+                log_widget = frame_app.query_one("#log", TailLog)
+                for i in range(3):
+                    frame_app._add_entry(self._entry(i))
+
+                frame_app._rebuild_log()
+                await pilot.pause()
+                frame_app._flush_frame()
+
+                assert log_widget.line_count == 3
+
+    @pytest.mark.asyncio
+    async def test_long_row_window_keeps_row_highlighting(self, frame_app: TailApp) -> None:
+        """Scrolling across the depth limit only adds highlighting past it."""
+        from pgtail_py.tail_log import _slice_text
+        from pgtail_py.tail_rich import get_highlighter_chain, highlighted_columns
+
+        # A window starting mid-token sees "00000", which full-line highlighting rejects
+        message = " ".join(f"key_{i:08d} took {i} ms" for i in range(2000))
+        entry = LogEntry(raw=message, timestamp=None, pid=1000, level=LogLevel.LOG, message=message)
+        with patch("pgtail_py.tail_textual.LogTailer") as mock_tailer_class:
+            mock_tailer = MagicMock()
+            mock_tailer.get_entry = MagicMock(return_value=None)
+            mock_tailer.file_unavailable = False
+            mock_tailer.file_permission_denied = False
+            mock_tailer_class.return_value = mock_tailer
+
+            async with frame_app.run_test(size=(80, 24)) as pilot:
+                log_widget = frame_app.query_one("#log", TailLog)
+                frame_app._add_entry(entry)
+                frame_app._flush_frame()
+                await pilot.pause()
+
+                formatted = frame_app._format_entry(entry)
+                chain = get_highlighter_chain(frame_app._state.highlighting_config)
+                limit = highlighted_columns(entry, 0, chain.max_length)
+                row = log_widget._lines[0]
+                assert len(row) > limit + 2000
+
+                for start in range(limit - 1500, limit + 1500, 97):
+                    stop = start + 300
+                    window = log_widget._row_window(0, start, stop)
+                    spans = [(sp.start, sp.end, sp.style) for sp in window.spans]
+                    expected = [
+                        (sp.start, sp.end, sp.style)
+                        for sp in _slice_text(formatted, start, stop).spans
+                    ]
+                    boundary = limit - start
+                    assert [sp for sp in spans if sp[0] < boundary] == expected
+                    if boundary < 0:
+                        assert spans
+
+
+class TestRunTailMode:
+    """Tests for TailApp.run_tail_mode()."""
+
+    def test_applies_buffer_config(self, mock_instance: Instance, mock_state: MagicMock) -> None:
+        """Buffer settings from the config size the tail mode scrollback."""
+        from pgtail_py.config import ConfigSchema
+
+        mock_state.config = ConfigSchema()
+        mock_state.config.buffer.tail_log_max = 500
+        mock_state.config.buffer.max_memory = "1MB"
+        with patch.object(TailApp, "run", autospec=True) as run:
+            TailApp.run_tail_mode(mock_state, mock_instance, mock_instance.log_path)
+
+        app = run.call_args.args[0]
+        assert app._max_lines == 500
+        assert app._entries.max_bytes == 1024 * 1024
+
+
 class TestHighlightFeedbackCorrectness:
     """Tests that highlight/set commands only report success when config changes."""
 
@@ -1046,6 +1427,7 @@ class TestHighlightFeedbackCorrectness:
         state.active_levels = None
         state.regex_filter = None
         state.time_filter = None
+        state.filter_expression = None
         return state
 
     @pytest.mark.asyncio
@@ -1211,3 +1593,91 @@ class TestHighlightFeedbackCorrectness:
                 # The error message should be visible
                 output = "\n".join(log_widget._lines)
                 assert "Invalid" in output or "invalid" in output
+
+
+class TestHistoryPaging:
+    """Tests for paging spilled history into tail mode."""
+
+    @pytest.fixture
+    def spill_app(self, mock_instance: Instance, mock_state: MagicMock, tmp_path: Path) -> TailApp:
+        """TailApp keeping 50 entries in memory and the rest on disk."""
+        from pgtail_py.highlighting_config import HighlightingConfig
+        from pgtail_py.theme import ThemeManager
+
+        mock_state.theme_manager = ThemeManager()
+        mock_state.highlighting_config = HighlightingConfig()
+        log_file = tmp_path / "postgresql.log"
+        log_file.write_text("")
+        return TailApp(
+            state=mock_state,
+            instance=mock_instance,
+            log_path=log_file,
+            max_lines=50,
+            frame_rate=1,
+            spill=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_scroll_pages_history_in_and_out(self, spill_app: TailApp) -> None:
+        """Scrolling to the top pages spilled entries in; the bottom resumes following."""
+        with patch("pgtail_py.tail_textual.LogTailer") as mock_tailer_class:
+            mock_tailer = MagicMock()
+            mock_tailer.get_entry = MagicMock(return_value=None)
+            mock_tailer.file_unavailable = False
+            mock_tailer.file_permission_denied = False
+            mock_tailer_class.return_value = mock_tailer
+
+            async with spill_app.run_test(size=(80, 24)):
+                log_widget = spill_app.query_one("#log", TailLog)
+                for i in range(200):
+                    spill_app._add_entry(TestFrameCoalescing._entry(i))
+                spill_app._flush_frame()
+                assert (log_widget.first_entry_seq, log_widget.last_entry_seq) == (150, 199)
+
+                log_widget.scroll_home(animate=False, immediate=True)
+                spill_app._flush_frame()
+                assert (log_widget.first_entry_seq, log_widget.last_entry_seq) == (0, 49)
+                assert spill_app._paused
+                assert log_widget.scroll_y > 0
+
+                log_widget.scroll_end(animate=False, immediate=True)
+                spill_app._flush_frame()
+                assert (log_widget.first_entry_seq, log_widget.last_entry_seq) == (150, 199)
+                assert not spill_app._paused
+                assert spill_app._history_range is None
+            assert spill_app._entries.spill is not None
+            assert not spill_app._entries.spill.directory.exists()
+
+    @pytest.mark.asyncio
+    async def test_time_filter_jumps_into_history(self, spill_app: TailApp) -> None:
+        """A time filter matching spilled entries rebuilds from the first match."""
+        from datetime import datetime, timezone
+
+        from pgtail_py.time_filter import TimeFilter
+
+        with patch("pgtail_py.tail_textual.LogTailer") as mock_tailer_class:
+            mock_tailer = MagicMock()
+            mock_tailer.get_entry = MagicMock(return_value=None)
+            mock_tailer.file_unavailable = False
+            mock_tailer.file_permission_denied = False
+            mock_tailer_class.return_value = mock_tailer
+
+            async with spill_app.run_test(size=(80, 24)) as pilot:
+                log_widget = spill_app.query_one("#log", TailLog)
+                for i in range(200):
+                    entry = TestFrameCoalescing._entry(i)
+                    entry.timestamp = datetime.fromtimestamp(i, timezone.utc)
+                    entry.epoch = float(i)
+                    spill_app._add_entry(entry)
+                spill_app._flush_frame()
+
+                spill_app._state.time_filter = TimeFilter(
+                    since=datetime.fromtimestamp(20, timezone.utc)
+                )
+                spill_app._rebuild_log()
+                await pilot.pause()
+
+                assert log_widget.first_entry_seq == 20
+                assert log_widget.line_count == 50
+                assert spill_app._paused
+                assert log_widget.scroll_y == 0
@@ -0,0 +1,114 @@
+"""Tests for pgtail_py.time_filter module."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from pgtail_py.filter import LogLevel
+from pgtail_py.parser import LogEntry
+from pgtail_py.time_filter import TimeBlockIndex, TimeFilter
+
+_BASE = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+
+
+def _entry(timestamp: datetime | None) -> LogEntry:
+    """Build a LogEntry with the given timestamp."""
+    return LogEntry(timestamp=timestamp, level=LogLevel.LOG, message="x", raw="x")
+
+
+class TestEpoch:
+    """Tests for precomputed epoch timestamps."""
+
+    def test_entry_epoch(self) -> None:
+        """Test LogEntry computes its epoch from the timestamp."""
+        assert _entry(_BASE).epoch == _BASE.timestamp()
+        assert _entry(None).epoch is None
+
+    def test_filter_bounds_compiled(self) -> None:
+        """Test TimeFilter compiles since/until to epoch bounds."""
+        flt = TimeFilter(since=_BASE, until=_BASE + timedelta(hours=1))
+        assert flt.since_epoch == _BASE.timestamp()
+        assert flt.until_epoch == _BASE.timestamp() + 3600
+
+
+class TestTimeFilterMatches:
+    """Tests for TimeFilter.matches()."""
+
+    def test_inclusive_bounds(self) -> None:
+        """Test both bounds are inclusive."""
+        flt = TimeFilter(since=_BASE, until=_BASE + timedelta(minutes=5))
+        assert flt.matches(_entry(_BASE))
+        assert flt.matches(_entry(_BASE + timedelta(minutes=5)))
+        assert not flt.matches(_entry(_BASE - timedelta(seconds=1)))
+        assert not flt.matches(_entry(_BASE + timedelta(minutes=6)))
+
+    def test_naive_entry_timestamp_is_local(self) -> None:
+        """Test naive entry timestamps are compared as local time."""
+        naive = _BASE.astimezone().replace(tzinfo=None)
+        flt = TimeFilter(since=_BASE)
+        assert flt.matches(_entry(naive))
+        assert not flt.matches(_entry(naive - timedelta(seconds=1)))
+
+    def test_missing_timestamp(self) -> None:
+        """Test entries without timestamps only match an inactive filter."""
+        assert TimeFilter().matches(_entry(None))
+        assert not TimeFilter(since=_BASE).matches(_entry(None))
+
+    def test_overlaps(self) -> None:
+        """Test range overlap against the filter window."""
+        flt = TimeFilter(since=_BASE, until=_BASE + timedelta(minutes=1))
+        start = _BASE.timestamp()
+        assert flt.overlaps(start - 100, start)
+        assert flt.overlaps(start + 10, start + 20)
+        assert not flt.overlaps(start - 100, start - 1)
+        assert not flt.overlaps(start + 61, start + 100)
+
+
+class TestTimeBlockIndex:
+    """Tests for TimeBlockIndex."""
+
+    def _index(self, epochs: list[float | None], block_size: int = 4) -> TimeBlockIndex:
+        index = TimeBlockIndex(block_size)
+        for epoch in epochs:
+            index.append(epoch)
+        return index
+
+    def test_skips_blocks_outside_window(self) -> None:
+        """Test only overlapping blocks are returned, merged when adjacent."""
+        index = self._index([float(i) for i in range(16)])
+        flt = TimeFilter(
+            since=datetime.fromtimestamp(5, timezone.utc),
+            until=datetime.fromtimestamp(9, timezone.utc),
+        )
+        assert index.candidate_ranges(flt) == [(4, 12)]
+
+    def test_out_of_order_timestamps(self) -> None:
+        """Test blocks use min/max so unordered entries are not skipped."""
+        index = self._index([100.0, 1.0, 2.0, 3.0, 10.0, 11.0, 12.0, 13.0])
+        flt = TimeFilter(since=datetime.fromtimestamp(50, timezone.utc))
+        assert index.candidate_ranges(flt) == [(0, 4)]
+
+    def test_blocks_without_timestamps_skipped(self) -> None:
+        """Test a block of untimestamped entries is never a candidate."""
+        index = self._index([None, None, None, None, 5.0])
+        flt = TimeFilter(since=datetime.fromtimestamp(0, timezone.utc))
+        assert index.candidate_ranges(flt) == [(4, 5)]
+
+    def test_prune_shifts_ranges(self) -> None:
+        """Test ranges are relative to the list start after pruning."""
+        index = self._index([float(i) for i in range(12)])
+        index.prune(6)
+        flt = TimeFilter(since=datetime.fromtimestamp(8, timezone.utc))
+        assert index.candidate_ranges(flt) == [(2, 6)]
+
+        flt_all = TimeFilter(since=datetime.fromtimestamp(0, timezone.utc))
+        assert index.candidate_ranges(flt_all) == [(0, 6)]
+
+    def test_clear(self) -> None:
+        """Test clear() drops all blocks and appends continue."""
+        index = self._index([1.0, 2.0, 3.0])
+        index.clear()
+        flt = TimeFilter(since=datetime.fromtimestamp(0, timezone.utc))
+        assert index.candidate_ranges(flt) == []
+        index.append(4.0)
+        assert index.candidate_ranges(flt) == [(0, 1)]